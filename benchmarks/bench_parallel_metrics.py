@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Parallel Metrics Scaling Benchmark
+
+Times analysis.parallel_metrics.calculate_metrics_parallel on a synthetic
+cleaned sales fact table for 1..N worker processes and reports speedup and
+parallel efficiency. Every run is checked against the single-process result.
+
+Usage:
+    python benchmarks/bench_parallel_metrics.py
+    python benchmarks/bench_parallel_metrics.py --rows 5000000 --max-workers 8 --shard-by date
+"""
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Add src to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from analysis.parallel_metrics import calculate_metrics_parallel
+
+CATEGORIES = ["Women's Apparel", "Men's Apparel", 'Accessories', 'Footwear', 'Kids']
+REGIONS = ['Kanto', 'Kansai', 'Hokkaido', 'Tohoku', 'Chubu', 'Chugoku', 'Kyushu']
+
+
+def make_synthetic_sales(num_rows, num_stores, num_days, seed):
+    """
+    Build a cleaned-schema sales table with categorical string columns.
+
+    Args:
+        num_rows: Number of transactions
+        num_stores: Number of stores (S001, S002, ...)
+        num_days: Number of consecutive days starting 2024-01-01
+        seed: Random seed
+
+    Returns:
+        Tuple of (sales_df, stores_df)
+    """
+    rng = np.random.default_rng(seed)
+    store_ids = [f'S{i:03d}' for i in range(1, num_stores + 1)]
+
+    # Skewed store sizes, like a real chain with a few flagship stores
+    store_weights = rng.pareto(2.0, num_stores) + 1
+    store_codes = rng.choice(num_stores, size=num_rows, p=store_weights / store_weights.sum())
+
+    dates = pd.Timestamp('2024-01-01') + pd.to_timedelta(
+        rng.integers(0, num_days, size=num_rows), unit='D'
+    )
+    sales_df = pd.DataFrame({
+        'date': dates,
+        'store_id': pd.Categorical.from_codes(store_codes, store_ids),
+        'product_category': pd.Categorical.from_codes(
+            rng.integers(0, len(CATEGORIES), size=num_rows), CATEGORIES
+        ),
+        # Whole yen as int64, the dtype cleaner.to_whole_units gives the pipeline
+        'sales_amount': (rng.integers(1, 6, size=num_rows)
+                         * rng.integers(2000, 25000, size=num_rows)).astype('int64'),
+    })
+    sales_df['day_of_week'] = sales_df['date'].dt.day_name().astype('category')
+    sales_df['is_weekend'] = sales_df['date'].dt.dayofweek.isin([5, 6])
+
+    stores_df = pd.DataFrame({
+        'store_id': store_ids,
+        'store_name_en': [f'Store {i}' for i in range(1, num_stores + 1)],
+        'region': [REGIONS[i % len(REGIONS)] for i in range(num_stores)],
+    })
+
+    return sales_df, stores_df
+
+
+def assert_same_results(results, baseline):
+    """Check a parallel run produced the same tables as the 1-worker run."""
+    for key, expected in baseline.items():
+        actual = results[key]
+        if key == 'weekend_vs_weekday':
+            pd.testing.assert_frame_equal(actual[0], expected[0])
+            assert actual[1] == expected[1]
+        elif isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(actual, expected, check_categorical=False)
+        else:
+            assert actual == expected, f"{key} differs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50_000_000)
+    parser.add_argument('--stores', type=int, default=300)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--shard-by', choices=['store_id', 'date'], default='store_id')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("PARALLEL METRICS SCALING BENCHMARK")
+    print("=" * 70)
+    print(f"Rows: {args.rows:,} | Stores: {args.stores} | Days: {args.days} | "
+          f"Shard by: {args.shard_by}")
+
+    start = time.perf_counter()
+    sales_df, stores_df = make_synthetic_sales(args.rows, args.stores, args.days, args.seed)
+    print(f"Synthetic data built in {time.perf_counter() - start:.1f}s "
+          f"({sales_df.memory_usage(deep=True).sum() / 1024**2:,.0f} MB)\n")
+
+    print(f"{'Workers':>7} | {'Seconds':>8} | {'Speedup':>7} | {'Efficiency':>10}")
+    print("-" * 42)
+
+    baseline = None
+    baseline_seconds = None
+    for workers in range(1, args.max_workers + 1):
+        start = time.perf_counter()
+        results = calculate_metrics_parallel(
+            sales_df, stores_df, max_workers=workers, shard_by=args.shard_by
+        )
+        seconds = time.perf_counter() - start
+
+        if baseline is None:
+            baseline, baseline_seconds = results, seconds
+        else:
+            assert_same_results(results, baseline)
+
+        speedup = baseline_seconds / seconds
+        print(f"{workers:>7} | {seconds:>8.2f} | {speedup:>6.2f}x | {speedup / workers:>9.0%}")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+End-to-End Pipeline Benchmark Suite
+
+Times every stage of the build - loading, combining, each cleaning step,
+validation, each metrics function, each chart and each report renderer - and
+measures its peak traced memory (tracemalloc) at several synthetic data
+scales. Each run is appended as one JSON line to a history file, and the
+compare command flags stages that regressed beyond a tolerance.
+
+Usage:
+    python benchmarks/bench_pipeline.py run --scales small medium
+    python benchmarks/bench_pipeline.py run --scales small --compare --tolerance 0.2
+    python benchmarks/bench_pipeline.py compare --tolerance 0.15
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import math
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pandas as pd
+
+# Add src to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from data_pipeline.loader import load_all_store_files, combine_raw_data
+from data_pipeline.cleaner import get_cleaning_steps
+from data_pipeline.validator import validate_all
+from data_pipeline.synthetic_data import generate_synthetic_raw_data, create_synthetic_store_metadata
+from analysis import metrics
+from analysis import visualizations
+from analysis.chart_cache import chart_cache_disabled
+
+
+# Data scales: stores x months x average rows per store per weekday
+SCALES = {
+    'small': {'stores': 10, 'months': 1, 'rows_per_day': 4},      # ~1.2K rows, like data/raw
+    'medium': {'stores': 50, 'months': 3, 'rows_per_day': 20},    # ~85K rows
+    'large': {'stores': 200, 'months': 12, 'rows_per_day': 40},   # ~2.7M rows
+}
+
+SYNTHETIC_DIR = PROJECT_ROOT / 'data' / 'synthetic'
+HISTORY_FILE = PROJECT_ROOT / 'benchmarks' / 'results' / 'history.jsonl'
+REPORT_MARKDOWN = PROJECT_ROOT / 'reports' / 'analysis_report.md'
+
+DEFAULT_TOLERANCE = 0.10
+DEFAULT_MIN_SECONDS = 0.05
+DEFAULT_MIN_PEAK_MB = 1.0
+
+
+# ============================================
+# MEASUREMENT
+# ============================================
+
+def measure_stage(func, repeat=1, trace_memory=True):
+    """
+    Time a stage and measure its peak traced memory.
+
+    The stage runs `repeat` times untraced (best wall time is kept) and once
+    more under tracemalloc, so tracing overhead never inflates the timings.
+
+    Args:
+        func: Zero-argument callable running the stage
+        repeat: Number of timed runs
+        trace_memory: If False, skip the tracemalloc run
+
+    Returns:
+        Tuple of (stage result, measurement dict)
+    """
+    best_seconds = math.inf
+    result = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best_seconds = min(best_seconds, time.perf_counter() - start)
+
+    measurement = {'status': 'ok', 'seconds': round(best_seconds, 6)}
+
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        measurement['peak_mb'] = round(peak / 1024 ** 2, 3)
+
+    if isinstance(result, pd.DataFrame):
+        measurement['rows'] = len(result)
+
+    return result, measurement
+
+
+def run_stage(results, name, func, repeat, trace_memory, skip_on=(ImportError, OSError)):
+    """
+    Measure one stage, record it under `name` and return its result.
+
+    A stage whose optional dependency (a module or an external tool) is
+    missing is recorded as skipped; any other error fails the benchmark.
+
+    Args:
+        skip_on: Exception types recorded as skipped. The PDF renderers
+                 report a missing WeasyPrint/Pango with sys.exit(1), so their
+                 stages also pass SystemExit.
+    """
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            result, measurement = measure_stage(func, repeat, trace_memory)
+    except skip_on as e:
+        # A renderer that exits prints its reason ("❌ Error ...") first
+        reason = next((line.strip() for line in output.getvalue().splitlines() if '❌' in line), e)
+        result, measurement = None, {'status': 'skipped', 'error': f'{type(e).__name__}: {reason}'}
+
+    results[name] = measurement
+
+    status = (f"{measurement['seconds']:>9.3f}s  {measurement.get('peak_mb', 0):>9.1f} MB"
+              if measurement['status'] == 'ok' else f"skipped ({measurement['error'][:60]})")
+    print(f"    {name:<45} {status}")
+
+    return result
+
+
+# ============================================
+# STAGES
+# ============================================
+
+def prepare_raw_data(scale_name, scale, seed):
+    """Generate (or reuse) the synthetic raw files for a scale."""
+    raw_dir = SYNTHETIC_DIR / f"{scale_name}_seed{seed}"
+    marker = raw_dir / '.complete'
+
+    if not marker.exists():
+        print(f"  Generating synthetic raw data in {raw_dir}...")
+        shutil.rmtree(raw_dir, ignore_errors=True)
+        generate_synthetic_raw_data(
+            str(raw_dir), scale['stores'], scale['months'], scale['rows_per_day'], seed
+        )
+        marker.write_text(json.dumps(scale))
+
+    return raw_dir
+
+
+def benchmark_scale(scale_name, scale, seed, repeat, trace_memory):
+    """
+    Run every pipeline, analysis and reporting stage at one data scale.
+
+    Returns:
+        Dict mapping stage name to its measurement
+    """
+    raw_dir = prepare_raw_data(scale_name, scale, seed)
+    periods = pd.period_range('2024-01', periods=scale['months'], freq='M')
+    start_date = str(periods[0].start_time.date())
+    end_date = str(periods[-1].end_time.date())
+
+    results = {}
+
+    # Data pipeline
+    all_data = run_stage(results, 'load_all_store_files',
+                         lambda: load_all_store_files(str(raw_dir)), repeat, trace_memory)
+    df = run_stage(results, 'combine_raw_data',
+                   lambda: combine_raw_data(all_data), repeat, trace_memory)
+    raw_rows = len(df)
+
+    for step_name, step in get_cleaning_steps(start_date, end_date):
+        step_input = df
+        df = run_stage(results, f'clean_raw_data.{step_name}',
+                       lambda: step(step_input), repeat, trace_memory)
+    sales_df = df
+    results['combine_raw_data']['rows'] = raw_rows
+
+    stores_df = create_synthetic_store_metadata(scale['stores'])
+    run_stage(results, 'validate_all',
+              lambda: validate_all(sales_df, stores_df), repeat, trace_memory)
+
+    # Metrics
+    metric_calls = {
+        'calculate_revenue_by_store': lambda: metrics.calculate_revenue_by_store(sales_df, stores_df),
+        'calculate_revenue_by_region': lambda: metrics.calculate_revenue_by_region(sales_df, stores_df),
+        'calculate_revenue_by_category': lambda: metrics.calculate_revenue_by_category(sales_df),
+        'calculate_daily_revenue': lambda: metrics.calculate_daily_revenue(sales_df),
+        'calculate_day_of_week_metrics': lambda: metrics.calculate_day_of_week_metrics(sales_df),
+        'calculate_weekend_vs_weekday': lambda: metrics.calculate_weekend_vs_weekday(sales_df),
+        'calculate_key_metrics': lambda: metrics.calculate_key_metrics(sales_df),
+        'calculate_category_mix_by_store': lambda: metrics.calculate_category_mix_by_store(sales_df, stores_df),
+        'calculate_revenue_per_customer': lambda: metrics.calculate_revenue_per_customer(sales_df, 'store_id'),
+    }
+    outputs = {}
+    for name, call in metric_calls.items():
+        outputs[name] = run_stage(results, f'metrics.{name}', call, repeat, trace_memory)
+
+    store_revenue = outputs['calculate_revenue_by_store']
+    run_stage(results, 'metrics.calculate_performance_gap',
+              lambda: metrics.calculate_performance_gap(store_revenue), repeat, trace_memory)
+
+    # Charts and reports render into a scratch copy of the reports directory
+    with tempfile.TemporaryDirectory() as scratch:
+        reports_dir = Path(scratch)
+        assets_dir = reports_dir / 'assets'
+        assets_dir.mkdir()
+        markdown_path = reports_dir / 'analysis_report.md'
+        shutil.copy(REPORT_MARKDOWN, markdown_path)
+
+        visualizations.setup_plot_style()
+
+        def chart(plot, data, filename, **kwargs):
+            def render():
+                # Always measure a real render, never a chart cache hit
+                with chart_cache_disabled():
+                    plot(data, save_path=assets_dir / filename, **kwargs)
+                plt.close('all')
+            return render
+
+        weekend_comparison = outputs['calculate_weekend_vs_weekday'][0] if outputs['calculate_weekend_vs_weekday'] else None
+        chart_calls = {
+            'plot_daily_revenue_trend': chart(visualizations.plot_daily_revenue_trend,
+                                              outputs['calculate_daily_revenue'], 'daily_revenue_trend.png'),
+            'plot_revenue_by_store': chart(visualizations.plot_revenue_by_store,
+                                           store_revenue, 'revenue_by_store.png'),
+            'plot_revenue_by_region': chart(visualizations.plot_revenue_by_region,
+                                            outputs['calculate_revenue_by_region'], 'revenue_by_region.png'),
+            'plot_revenue_by_category': chart(visualizations.plot_revenue_by_category,
+                                              outputs['calculate_revenue_by_category'], 'revenue_by_category.png'),
+            'plot_day_of_week_revenue': chart(visualizations.plot_day_of_week_revenue,
+                                              outputs['calculate_day_of_week_metrics'], 'revenue_by_day_of_week.png'),
+            'plot_weekend_vs_weekday': chart(visualizations.plot_weekend_vs_weekday,
+                                             weekend_comparison, 'weekend_vs_weekday.png'),
+            'plot_category_mix_by_store': chart(visualizations.plot_category_mix_by_store,
+                                                outputs['calculate_category_mix_by_store'], 'category_mix_by_store.png'),
+            'plot_top_bottom_stores': chart(visualizations.plot_top_bottom_stores,
+                                            store_revenue, 'top_bottom_stores.png'),
+        }
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for name, call in chart_calls.items():
+                run_stage(results, f'charts.{name}', call, repeat, trace_memory)
+
+        # Report renderers (imported lazily: their dependencies are optional here)
+        def render_word():
+            from reporting.md_to_word import convert_markdown_to_docx
+            convert_markdown_to_docx(markdown_path, reports_dir / 'detailed_report.docx', reports_dir)
+
+        def render_detailed_pdf():
+            from reporting import md_to_pdf_detailed as detailed
+            from reporting.markdown_document import load_document
+            section_bodies = detailed.convert_markdown_to_html(load_document(markdown_path))
+            detailed.generate_pdf(detailed.create_html_documents(section_bodies),
+                                  reports_dir / 'detailed_report.pdf', reports_dir)
+
+        def render_slides_pdf():
+            from reporting import md_to_pdf_slides as slides
+            slides.generate_pdf(slides.create_slides_html(),
+                                reports_dir / 'executive_slides.pdf', reports_dir)
+
+        def render_pptx():
+            from reporting.md_to_pptx import generate_powerpoint
+            generate_powerpoint(reports_dir / 'executive_slides.pptx', assets_dir, sales_df)
+
+        def render_pptx_pdf():
+            from reporting.pptx_to_pdf import convert_pptx_to_pdf_using_images
+            convert_pptx_to_pdf_using_images(reports_dir / 'executive_slides.pptx',
+                                             reports_dir / 'executive_slides_from_pptx.pdf')
+
+        renderer_calls = {
+            'md_to_word': render_word,
+            'md_to_pdf_detailed': render_detailed_pdf,
+            'md_to_pdf_slides': render_slides_pdf,
+            'md_to_pptx': render_pptx,
+            'pptx_to_pdf': render_pptx_pdf,
+        }
+        for name, call in renderer_calls.items():
+            skip_on = (ImportError, OSError, SystemExit) if name.startswith('md_to_pdf') else (ImportError, OSError)
+            run_stage(results, f'reports.{name}', call, repeat, trace_memory, skip_on)
+
+    return results
+
+
+# ============================================
+# HISTORY
+# ============================================
+
+def git_commit():
+    """Return the short commit hash of the working tree, if available."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(history_file):
+    """Load all benchmark runs from a JSON Lines history file."""
+    if not Path(history_file).exists():
+        return []
+    with open(history_file, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(history_file, run):
+    """Append one benchmark run to the JSON Lines history file."""
+    Path(history_file).parent.mkdir(parents=True, exist_ok=True)
+    with open(history_file, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run, ensure_ascii=False) + '\n')
+
+
+def compare_runs(baseline, candidate, tolerance, min_seconds, min_peak_mb):
+    """
+    Compare two benchmark runs stage by stage.
+
+    A stage regresses when its time or peak memory grows by more than
+    `tolerance` (a fraction) and by more than the absolute noise floor.
+
+    Returns:
+        List of regression dicts (scale, stage, metric, baseline, candidate, change)
+    """
+    regressions = []
+
+    for scale_name, stages in candidate['scales'].items():
+        baseline_stages = baseline['scales'].get(scale_name, {})
+
+        for stage, measurement in stages.items():
+            before = baseline_stages.get(stage)
+            if not before or before.get('status') != 'ok' or measurement.get('status') != 'ok':
+                continue
+
+            for metric, noise_floor in [('seconds', min_seconds), ('peak_mb', min_peak_mb)]:
+                if metric not in before or metric not in measurement:
+                    continue
+                old, new = before[metric], measurement[metric]
+                if new - old > noise_floor and new > old * (1 + tolerance):
+                    regressions.append({
+                        'scale': scale_name, 'stage': stage, 'metric': metric,
+                        'baseline': old, 'candidate': new,
+                        'change': (new - old) / old if old else math.inf,
+                    })
+
+    return regressions
+
+
+def command_compare(args):
+    """Compare two runs from the history and report regressions."""
+    history = load_history(args.history)
+    if len(history) < 2:
+        print(f"Need at least 2 runs in {args.history} to compare (found {len(history)})")
+        return 0
+
+    baseline, candidate = history[args.baseline], history[args.candidate]
+    print(f"\nBaseline:  {baseline['timestamp']} ({baseline.get('commit')})")
+    print(f"Candidate: {candidate['timestamp']} ({candidate.get('commit')})")
+    print(f"Tolerance: {args.tolerance:.0%} (noise floor {args.min_seconds}s / {args.min_peak_mb} MB)\n")
+
+    regressions = compare_runs(baseline, candidate, args.tolerance, args.min_seconds, args.min_peak_mb)
+
+    if not regressions:
+        print("✓ No regressions")
+        return 0
+
+    print(f"✗ {len(regressions)} regression(s):")
+    for r in regressions:
+        print(f"  [{r['scale']}] {r['stage']:<45} {r['metric']:<8} "
+              f"{r['baseline']:>10.3f} -> {r['candidate']:>10.3f} ({r['change']:+.0%})")
+    return 1
+
+
+def command_run(args):
+    """Run the benchmark at the requested scales and record it in the history."""
+    logging.disable(logging.WARNING)
+
+    run = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'scales': {},
+    }
+
+    print("=" * 80)
+    print("PIPELINE BENCHMARK")
+    print("=" * 80)
+
+    for scale_name in args.scales:
+        print(f"\n[{scale_name}] {SCALES[scale_name]}")
+        run['scales'][scale_name] = benchmark_scale(
+            scale_name, SCALES[scale_name], args.seed, args.repeat, not args.no_memory
+        )
+
+    append_history(args.history, run)
+    print(f"\n✓ Results appended to {args.history}")
+
+    if args.compare:
+        return command_compare(args)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end pipeline benchmark suite')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_compare_options(sub):
+        sub.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                         help='Allowed relative growth before flagging (0.10 = 10%%)')
+        sub.add_argument('--min-seconds', type=float, default=DEFAULT_MIN_SECONDS,
+                         help='Ignore time increases smaller than this')
+        sub.add_argument('--min-peak-mb', type=float, default=DEFAULT_MIN_PEAK_MB,
+                         help='Ignore memory increases smaller than this')
+        sub.add_argument('--baseline', type=int, default=-2, help='History index of the baseline run')
+        sub.add_argument('--candidate', type=int, default=-1, help='History index of the candidate run')
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmark and append to the history')
+    run_parser.add_argument('--scales', nargs='+', choices=list(SCALES), default=['small', 'medium'])
+    run_parser.add_argument('--seed', type=int, default=42)
+    run_parser.add_argument('--repeat', type=int, default=1, help='Timed runs per stage (best is kept)')
+    run_parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass')
+    run_parser.add_argument('--compare', action='store_true', help='Compare with the previous run afterwards')
+    run_parser.add_argument('--history', default=str(HISTORY_FILE))
+    add_compare_options(run_parser)
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two runs from the history')
+    compare_parser.add_argument('--history', default=str(HISTORY_FILE))
+    add_compare_options(compare_parser)
+
+    args = parser.parse_args()
+    command = command_run if args.command == 'run' else command_compare
+    sys.exit(command(args))
+
+
+if __name__ == "__main__":
+    main()
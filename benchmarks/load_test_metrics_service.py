@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Metrics Service Load Test
+
+Sends concurrent GET requests to the metrics service (src/metrics_service.py)
+and reports latency percentiles (p50/p95/p99/max), throughput and how the
+responses were served (X-Cache: miss, coalesced or hit).
+
+Two phases are run:
+- cold: every worker requests every distinct query at the same moment, so
+  each query is computed once and the other workers' requests are coalesced
+- mixed: workers send random queries from the same set (cache hits)
+
+Without --url a service is started in this process on a free port.
+
+Usage:
+    python benchmarks/load_test_metrics_service.py
+    python benchmarks/load_test_metrics_service.py --requests 5000 --concurrency 32
+    python benchmarks/load_test_metrics_service.py --url http://127.0.0.1:8050
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+ENDPOINTS = [
+    'kpis', 'stores', 'regions', 'categories', 'daily', 'day-of-week', 'weekend', 'category-mix',
+    'revenue',
+]
+
+# Filter sets a dashboard would use: whole month, each week, a few store groups
+FILTERS = [
+    '',
+    'start=2024-01-01&end=2024-01-07',
+    'start=2024-01-08&end=2024-01-14',
+    'start=2024-01-15&end=2024-01-21',
+    'start=2024-01-22&end=2024-01-31',
+    'stores=S01,S02,S03',
+    'stores=S10',
+    'start=2024-01-15&end=2024-01-31&stores=S04,S05',
+]
+
+
+def build_queries():
+    """Return every endpoint x filter combination as a path with query string."""
+    return [f'/metrics/{endpoint}' + (f'?{query}' if query else '')
+            for endpoint in ENDPOINTS for query in FILTERS]
+
+
+def fetch(base_url, path):
+    """
+    GET one path.
+
+    Returns:
+        tuple: (latency in seconds, HTTP status, X-Cache header)
+    """
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(base_url + path, timeout=30) as response:
+            response.read()
+            status, cache = response.status, response.headers.get('X-Cache', '')
+    except urllib.error.HTTPError as e:
+        status, cache = e.code, e.headers.get('X-Cache', '')
+    return time.perf_counter() - start, status, cache
+
+
+def run_phase(base_url, schedules):
+    """
+    Run one request list per worker thread, all workers starting together.
+
+    Args:
+        base_url: Service URL without a trailing slash
+        schedules: One list of paths per worker
+
+    Returns:
+        dict: latencies (seconds), statuses, cache outcomes and wall time
+    """
+    barrier = threading.Barrier(len(schedules))
+
+    def worker(paths):
+        barrier.wait()
+        return [fetch(base_url, path) for path in paths]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(schedules)) as pool:
+        results = [item for items in pool.map(worker, schedules) for item in items]
+    return {
+        'latencies': np.array([latency for latency, _, _ in results]),
+        'statuses': Counter(status for _, status, _ in results),
+        'cache': Counter(cache for _, _, cache in results),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def print_phase(name, result):
+    """Print one row of the latency table."""
+    latencies_ms = result['latencies'] * 1000
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+    errors = sum(count for status, count in result['statuses'].items() if status != 200)
+    print(f"{name:<6} | {len(latencies_ms):>8,} | {len(latencies_ms) / result['seconds']:>7,.0f} | "
+          f"{p50:>7.2f} | {p95:>7.2f} | {p99:>7.2f} | {latencies_ms.max():>7.2f} | {errors:>6} | "
+          f"{', '.join(f'{outcome} {count}' for outcome, count in sorted(result['cache'].items()))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', help='Running service (default: start one in this process)')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests in the mixed phase')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent client threads')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url.rstrip('/') if args.url else None
+    if base_url is None:
+        from metrics_service import create_server
+        server = create_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = 'http://{}:{}'.format(*server.server_address[:2])
+
+    queries = build_queries()
+    rng = random.Random(args.seed)
+    per_worker = max(1, args.requests // args.concurrency)
+
+    print("=" * 96)
+    print("METRICS SERVICE LOAD TEST")
+    print("=" * 96)
+    print(f"Service: {base_url} | Distinct queries: {len(queries)} | Concurrency: {args.concurrency}\n")
+    print(f"{'Phase':<6} | {'Requests':>8} | {'Req/s':>7} | {'p50 ms':>7} | {'p95 ms':>7} | "
+          f"{'p99 ms':>7} | {'Max ms':>7} | {'Errors':>6} | X-Cache")
+    print("-" * 96)
+
+    # Cold: all workers ask for the same queries in the same order
+    print_phase('cold', run_phase(base_url, [queries] * args.concurrency))
+
+    # Mixed: random queries, now served from the response cache
+    schedules = [[rng.choice(queries) for _ in range(per_worker)] for _ in range(args.concurrency)]
+    print_phase('mixed', run_phase(base_url, schedules))
+    print("=" * 96)
+
+    if server is not None:
+        stats = server.service.stats
+        print(f"Computations: {stats['computations']} for {len(FILTERS)} filter sets "
+              f"({stats['requests']:,} requests)")
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
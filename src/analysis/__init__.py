@@ -3,9 +3,40 @@ Analysis module for multi-store fashion retail sales analysis.
 
 This module provides reusable functions for calculating KPIs and generating
 visualizations for retail sales data analysis.
+
+Submodules are imported on first use, so `from analysis.metrics import ...`
+does not load matplotlib and seaborn. Names are still available on the
+package (e.g. `analysis.calculate_all_metrics`), looked up in the submodules
+in the order below.
 """
 
-from .metrics import *
-from .visualizations import *
+import importlib
 
 __version__ = "1.0.0"
+
+# Submodules whose public names are exported by the package, cheapest first
+_EXPORTING_SUBMODULES = (
+    'metrics', 'query', 'chunked_metrics', 'parallel_metrics', 'visualizations', 'chart_rendering'
+)
+_SUBMODULES = _EXPORTING_SUBMODULES + (
+    'chart_cache', 'create_updated_report', 'generate_report', 'run_complete_eda', 'sql_metrics',
+)
+
+
+def __getattr__(name):
+    """Import a submodule, or find a public name in the exporting submodules."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    if not name.startswith('_'):
+        for submodule in _EXPORTING_SUBMODULES:
+            module = importlib.import_module(f'.{submodule}', __name__)
+            if hasattr(module, name):
+                value = getattr(module, name)
+                globals()[name] = value
+                return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Package names plus the submodules (without importing them)."""
+    return sorted(set(globals()) | set(_SUBMODULES))
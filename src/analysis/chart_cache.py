@@ -0,0 +1,222 @@
+"""
+Content-hash cache for rendered charts.
+
+A chart's cache key is a hash of its plot function (name and source code),
+its input aggregate tables and parameters, and the active matplotlib style
+(rcParams). When the PNG recorded for a key still exists unchanged, the chart
+is not rendered again. Keys are recorded in a JSON manifest next to the PNGs:
+
+    {"charts": {"<key>": {"file": "revenue_by_store.png", "sha256": "...",
+                          "plot_func": "analysis.visualizations.plot_revenue_by_store"}}}
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import logging
+import functools
+import matplotlib
+import matplotlib.pyplot as plt
+import pandas as pd
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'chart_manifest.json'
+
+# Names of the output path parameter in plot functions
+PATH_PARAMETERS = ('save_path', 'output_path')
+
+# rcParams that do not affect the rendered PNG
+_IGNORED_RCPARAMS = ('backend', 'backend_fallback', 'interactive')
+
+_CACHE_ENABLED = True
+
+
+def set_chart_cache_enabled(enabled: bool) -> None:
+    """Globally enable or disable chart caching (e.g. to force a re-render)."""
+    global _CACHE_ENABLED
+    _CACHE_ENABLED = enabled
+
+
+@contextmanager
+def chart_cache_disabled():
+    """Context manager rendering every chart regardless of the cache."""
+    global _CACHE_ENABLED
+    previous = _CACHE_ENABLED
+    _CACHE_ENABLED = False
+    try:
+        yield
+    finally:
+        _CACHE_ENABLED = previous
+
+
+def _update_hash(digest, value) -> None:
+    """Feed a plot argument into the digest in a stable, content-based way."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(type(value).__name__.encode())
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr(list(value.columns)).encode())
+        digest.update(repr(value.dtypes if isinstance(value, pd.DataFrame) else value.dtype).encode())
+        digest.update(repr(list(value.index.names)).encode())
+        try:
+            digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+        except TypeError:
+            digest.update(value.to_csv().encode())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f'{type(value).__name__}[{len(value)}]'.encode())
+        for item in value:
+            _update_hash(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f'dict[{len(value)}]'.encode())
+        for key in sorted(value, key=repr):
+            _update_hash(digest, key)
+            _update_hash(digest, value[key])
+    elif isinstance(value, Path):
+        digest.update(f'Path({value})'.encode())
+    else:
+        digest.update(repr(value).encode())
+    digest.update(b'|')
+
+
+def style_fingerprint() -> str:
+    """Return a hash of the matplotlib version and the current rcParams."""
+    digest = hashlib.sha256(matplotlib.__version__.encode())
+    for key in sorted(plt.rcParams):
+        if key not in _IGNORED_RCPARAMS:
+            digest.update(f'{key}={plt.rcParams[key]!r};'.encode())
+    return digest.hexdigest()
+
+
+def compute_chart_key(plot_func: Callable, args: tuple = (), kwargs: Optional[Dict] = None) -> str:
+    """
+    Compute the cache key of one chart.
+
+    Args:
+        plot_func: Plot function (decorated or not)
+        args: Positional arguments (aggregate tables, output path, ...)
+        kwargs: Keyword arguments
+
+    Returns:
+        Hex SHA-256 key
+    """
+    func = inspect.unwrap(plot_func)
+    digest = hashlib.sha256(f'{func.__module__}.{func.__qualname__}'.encode())
+    try:
+        digest.update(inspect.getsource(func).encode())
+    except (OSError, TypeError):
+        pass
+    _update_hash(digest, tuple(args))
+    _update_hash(digest, dict(kwargs or {}))
+    digest.update(style_fingerprint().encode())
+    return digest.hexdigest()
+
+
+def get_output_path(plot_func: Callable, args: tuple = (), kwargs: Optional[Dict] = None) -> Optional[Path]:
+    """Return the PNG path a plot call saves to, or None if it only displays."""
+    try:
+        bound = inspect.signature(inspect.unwrap(plot_func)).bind(*args, **(kwargs or {}))
+    except TypeError:
+        return None
+    for name in PATH_PARAMETERS:
+        if bound.arguments.get(name):
+            return Path(bound.arguments[name])
+    return None
+
+
+def _file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def load_manifest(assets_dir: Path) -> Dict[str, Dict[str, str]]:
+    """Load the key -> chart entries of a directory's manifest (empty if none)."""
+    manifest_path = Path(assets_dir) / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        return {}
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('charts', {})
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable chart manifest {manifest_path}: {e}")
+        return {}
+
+
+def save_manifest(assets_dir: Path, charts: Dict[str, Dict[str, str]]) -> None:
+    """Write a directory's manifest atomically."""
+    manifest_path = Path(assets_dir) / MANIFEST_FILENAME
+    tmp_path = manifest_path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'charts': charts}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def is_chart_cached(key: str, output_path: Path) -> bool:
+    """Return True if the manifest maps key to output_path and the file is unchanged."""
+    output_path = Path(output_path)
+    entry = load_manifest(output_path.parent).get(key)
+    return (
+        entry is not None
+        and entry['file'] == output_path.name
+        and output_path.exists()
+        and entry['sha256'] == _file_sha256(output_path)
+    )
+
+
+def record_charts(entries: Dict[str, Tuple[Path, Callable]]) -> None:
+    """
+    Record freshly rendered charts in their directories' manifests.
+
+    Args:
+        entries: Mapping of key -> (output_path, plot_func)
+    """
+    by_dir: Dict[Path, Dict[str, Tuple[Path, Callable]]] = {}
+    for key, (output_path, plot_func) in entries.items():
+        by_dir.setdefault(Path(output_path).parent, {})[key] = (Path(output_path), plot_func)
+
+    for assets_dir, dir_entries in by_dir.items():
+        charts = load_manifest(assets_dir)
+        for key, (output_path, plot_func) in dir_entries.items():
+            if not output_path.exists():
+                continue
+            # A file belongs to exactly one key: drop entries for its old content
+            charts = {k: v for k, v in charts.items() if v['file'] != output_path.name}
+            func = inspect.unwrap(plot_func)
+            charts[key] = {
+                'file': output_path.name,
+                'sha256': _file_sha256(output_path),
+                'plot_func': f'{func.__module__}.{func.__qualname__}',
+            }
+        save_manifest(assets_dir, charts)
+
+
+def cached_chart(plot_func: Callable) -> Callable:
+    """
+    Decorator skipping a plot function when its saved PNG is up to date.
+
+    Only calls that save to a file (save_path/output_path set) are cached;
+    on a cache hit the function returns None without drawing anything.
+
+    Example:
+        >>> @cached_chart
+        ... def plot_revenue_by_store(store_revenue_df, save_path=None): ...
+    """
+    @functools.wraps(plot_func)
+    def wrapper(*args, **kwargs):
+        output_path = get_output_path(plot_func, args, kwargs) if _CACHE_ENABLED else None
+        if output_path is None:
+            return plot_func(*args, **kwargs)
+
+        key = compute_chart_key(plot_func, args, kwargs)
+        if is_chart_cached(key, output_path):
+            logger.info(f"Chart up to date, skipped: {output_path.name}")
+            return None
+
+        result = plot_func(*args, **kwargs)
+        record_charts({key: (output_path, plot_func)})
+        return result
+
+    return wrapper
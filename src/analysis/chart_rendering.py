@@ -0,0 +1,129 @@
+"""
+Parallel chart rendering for retail sales analysis.
+
+Each chart is an independent render job: a module-level plot function plus
+the small precomputed aggregate tables it draws (never the full sales frame).
+Jobs run in a process pool whose workers use the non-interactive Agg
+backend, so rendering all charts takes about as long as the slowest one.
+Jobs whose PNG is up to date in the chart cache (analysis.chart_cache) are
+skipped before dispatch.
+"""
+
+import os
+import time
+import multiprocessing
+import matplotlib
+import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .chart_cache import (
+    chart_cache_disabled,
+    compute_chart_key,
+    get_output_path,
+    is_chart_cached,
+    record_charts,
+    set_chart_cache_enabled,
+)
+
+
+class ChartJob(NamedTuple):
+    """One chart to render: plot_func(*args, **kwargs) saves the figure itself."""
+    name: str
+    plot_func: Callable
+    args: tuple = ()
+    kwargs: Optional[Dict[str, Any]] = None
+
+
+def _init_render_worker(style_setup: Optional[Callable[[], None]]) -> None:
+    """Worker initializer: switch to the Agg backend and apply the plot style."""
+    matplotlib.use('Agg', force=True)
+    # The parent process checks and records the chart cache
+    set_chart_cache_enabled(False)
+    if style_setup is not None:
+        style_setup()
+
+
+def _render_job(job: ChartJob) -> float:
+    """Render one chart, close its figures and return the seconds taken."""
+    start = time.perf_counter()
+    try:
+        job.plot_func(*job.args, **(job.kwargs or {}))
+    finally:
+        plt.close('all')
+    return time.perf_counter() - start
+
+
+def render_charts(
+    jobs: List[ChartJob],
+    max_workers: Optional[int] = None,
+    style_setup: Optional[Callable[[], None]] = None,
+    use_cache: bool = True
+) -> Dict[str, Optional[float]]:
+    """
+    Render independent chart jobs, in parallel when more than one worker is used.
+
+    Args:
+        jobs: Chart jobs; plot functions must be module-level (picklable) and
+              their arguments small aggregate tables
+        max_workers: Number of worker processes (defaults to min(CPU count,
+                     number of jobs)); 1 renders sequentially in this process
+        style_setup: Optional function applying rcParams/seaborn style in
+                     each worker before rendering (e.g. setup_plot_style, or
+                     functools.partial(setup_plot_style, 'draft'))
+        use_cache: If True, skip jobs whose saved PNG is up to date and record
+                   rendered ones in the chart manifest
+
+    Returns:
+        Dictionary mapping job name to render seconds (None if the chart
+        was up to date), in job order
+
+    Example:
+        >>> jobs = [ChartJob('revenue_by_store', plot_revenue_by_store,
+        ...                  (store_revenue,), {'save_path': assets_dir / 'revenue_by_store.png'})]
+        >>> timings = render_charts(jobs, style_setup=setup_plot_style)
+    """
+    # Apply the style here too: it is part of every chart's cache key
+    if style_setup is not None:
+        style_setup()
+
+    timings: Dict[str, Optional[float]] = {job.name: None for job in jobs}
+    cache_entries = {}
+    pending = []
+    for job in jobs:
+        output_path = get_output_path(job.plot_func, job.args, job.kwargs) if use_cache else None
+        if output_path is not None:
+            key = compute_chart_key(job.plot_func, job.args, job.kwargs)
+            if is_chart_cached(key, output_path):
+                continue
+            cache_entries[key] = (output_path, job.plot_func)
+        pending.append(job)
+
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, len(pending))
+
+    if max_workers <= 1 or len(pending) <= 1:
+        with chart_cache_disabled():
+            for job in pending:
+                timings[job.name] = _render_job(job)
+    else:
+        # Fork reuses the already imported plotting stack; other platforms spawn
+        if 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context('fork')
+        else:
+            mp_context = None
+
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(pending)),
+            mp_context=mp_context,
+            initializer=_init_render_worker,
+            initargs=(style_setup,)
+        ) as executor:
+            futures = {job.name: executor.submit(_render_job, job) for job in pending}
+            for name, future in futures.items():
+                timings[name] = future.result()
+
+    if cache_entries:
+        record_charts(cache_entries)
+
+    return timings
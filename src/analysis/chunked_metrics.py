@@ -0,0 +1,358 @@
+"""
+Out-of-core metrics calculation for sales datasets larger than memory.
+
+This module streams the processed sales dataset in chunks sized to a
+configurable memory budget, reduces each chunk to small partial aggregates
+(sums, counts, distinct dates, value counts), merges the partials and then
+finalizes them into the same DataFrames returned by the functions in
+``analysis.metrics``.
+"""
+
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from data_pipeline.store_offsets import matches, store_starts
+
+
+# Default memory budget for a chunked run (in megabytes)
+DEFAULT_MEMORY_BUDGET_MB = 256
+
+# Working memory per chunk is a multiple of its raw size (parsing buffers,
+# groupby temporaries), so chunks are sized at budget / overhead factor
+CHUNK_OVERHEAD_FACTOR = 4
+
+# Rows sampled from the dataset to estimate the in-memory size of one row
+SAMPLE_ROWS = 1000
+
+# Only the columns the metrics need are read from disk
+METRIC_COLUMNS = [
+    'date', 'store_id', 'product_category', 'sales_amount',
+    'day_of_week', 'is_weekend'
+]
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def estimate_chunk_rows(
+    sales_path: Union[str, Path],
+    memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB
+) -> int:
+    """
+    Estimate how many rows fit in one chunk under the given memory budget.
+
+    Args:
+        sales_path: Path to the processed sales CSV
+        memory_budget_mb: Memory budget for the whole chunked run, in MB
+
+    Returns:
+        Number of rows to read per chunk (at least 1)
+
+    Example:
+        >>> rows = estimate_chunk_rows('data/processed/sales_clean.csv', memory_budget_mb=64)
+    """
+    sample = pd.read_csv(
+        sales_path, usecols=METRIC_COLUMNS,
+        parse_dates=['date'], nrows=SAMPLE_ROWS
+    )
+    if sample.empty:
+        return 1
+
+    bytes_per_row = sample.memory_usage(deep=True, index=False).sum() / len(sample)
+    budget_bytes = memory_budget_mb * 1024 * 1024
+
+    return max(1, int(budget_bytes / (bytes_per_row * CHUNK_OVERHEAD_FACTOR)))
+
+
+def iter_sales_chunks(
+    sales_path: Union[str, Path],
+    memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+    chunk_rows: Optional[int] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream the processed sales dataset in memory-bounded chunks.
+
+    Args:
+        sales_path: Path to the processed sales CSV
+        memory_budget_mb: Memory budget used to size the chunks, in MB
+        chunk_rows: Optional explicit chunk size (overrides the budget)
+
+    Yields:
+        DataFrames holding the metric columns of consecutive rows
+
+    Example:
+        >>> for chunk in iter_sales_chunks('data/processed/sales_clean.csv'):
+        ...     print(len(chunk))
+    """
+    if chunk_rows is None:
+        chunk_rows = estimate_chunk_rows(sales_path, memory_budget_mb)
+
+    reader = pd.read_csv(
+        sales_path, usecols=METRIC_COLUMNS,
+        parse_dates=['date'], chunksize=chunk_rows
+    )
+    with reader:
+        for chunk in reader:
+            yield chunk
+
+
+def compute_partial_aggregates(
+    sales_df: pd.DataFrame,
+    offsets: Optional[Dict[str, object]] = None
+) -> Dict[str, object]:
+    """
+    Reduce a slice of sales transactions to mergeable partial aggregates.
+
+    Args:
+        sales_df: DataFrame with (a subset of) sales transactions
+        offsets: Optional offset index of sales_df (data_pipeline.store_offsets);
+                 store totals are then summed over contiguous row ranges
+
+    Returns:
+        Dictionary of partial aggregates. Sums and counts are additive;
+        distinct days and the median are kept as per-date groups and
+        value counts so they can be merged exactly.
+
+    Example:
+        >>> partial = compute_partial_aggregates(chunk)
+    """
+    amount = sales_df['sales_amount']
+
+    def sum_count(keys) -> pd.DataFrame:
+        return amount.groupby(keys, sort=False, observed=True).agg(['sum', 'count'])
+
+    if matches(offsets, sales_df):
+        # Rows are clustered by store: one reduceat over the store boundaries
+        starts = store_starts(offsets)
+        store = pd.DataFrame({
+            'sum': np.add.reduceat(amount.to_numpy(), starts) if len(starts) else [],
+            'count': [stop - start for start, stop in offsets['stores'].values()],
+        }, index=pd.Index(list(offsets['stores']), name='store_id'))
+    else:
+        store = sum_count(sales_df['store_id'])
+
+    return {
+        'rows': len(sales_df),
+        'store': store,
+        'category': sum_count(sales_df['product_category']),
+        'date': sum_count([sales_df['date'], sales_df['is_weekend']]),
+        'day_of_week': sum_count(sales_df['day_of_week']),
+        'store_category': amount.groupby(
+            [sales_df['store_id'], sales_df['product_category']],
+            sort=False, observed=True
+        ).sum(),
+        'amount_counts': amount.value_counts(sort=False),
+    }
+
+
+def merge_partial_aggregates(partials: Iterable[Dict[str, object]]) -> Dict[str, object]:
+    """
+    Merge partial aggregates computed over disjoint slices of the dataset.
+
+    Args:
+        partials: Iterable of dictionaries from compute_partial_aggregates
+
+    Returns:
+        Single partial aggregate dictionary covering all slices
+
+    Example:
+        >>> merged = merge_partial_aggregates(compute_partial_aggregates(c) for c in chunks)
+    """
+    partials = list(partials)
+    if not partials:
+        raise ValueError("No partial aggregates to merge")
+
+    merged = {'rows': sum(p['rows'] for p in partials)}
+
+    for key in ['store', 'category', 'date', 'day_of_week', 'store_category', 'amount_counts']:
+        combined = pd.concat([p[key] for p in partials])
+        levels = list(range(combined.index.nlevels))
+        merged[key] = combined.groupby(level=levels, sort=False, observed=True).sum()
+
+    return merged
+
+
+def _sum_count_frame(sum_count: pd.DataFrame, key_names: List[str]) -> pd.DataFrame:
+    """Sort a sum/count partial by its keys and add the mean column."""
+    frame = sum_count.sort_index().reset_index()
+    frame.columns = key_names + ['total_revenue', 'num_transactions']
+    frame['avg_transaction'] = frame['total_revenue'] / frame['num_transactions']
+    return frame[key_names + ['total_revenue', 'avg_transaction', 'num_transactions']]
+
+
+def _add_share_and_sort(frame: pd.DataFrame) -> pd.DataFrame:
+    """Add revenue_share_pct and sort by revenue, as analysis.metrics does."""
+    frame['revenue_share_pct'] = (
+        frame['total_revenue'] / frame['total_revenue'].sum() * 100
+    ).round(2)
+    return frame.sort_values('total_revenue', ascending=False)
+
+
+def _median_from_counts(amount_counts: pd.Series) -> float:
+    """Exact median of a column given the merged value counts of its values."""
+    counts = amount_counts.sort_index()
+    total = counts.sum()
+    if total == 0:
+        return np.nan
+
+    cumulative = counts.cumsum().to_numpy()
+    values = counts.index.to_numpy()
+    lower = values[np.searchsorted(cumulative, (total + 1) // 2)]
+    upper = values[np.searchsorted(cumulative, total // 2 + 1)]
+
+    return (lower + upper) / 2
+
+
+def finalize_metrics(
+    partial: Dict[str, object],
+    stores_df: pd.DataFrame
+) -> Dict[str, object]:
+    """
+    Turn merged partial aggregates into the analysis.metrics outputs.
+
+    Args:
+        partial: Merged partial aggregates (from merge_partial_aggregates)
+        stores_df: DataFrame with store metadata
+
+    Returns:
+        Dictionary with keys key_metrics, revenue_by_store, revenue_by_region,
+        revenue_by_category, daily_revenue, day_of_week_metrics,
+        weekend_vs_weekday (tuple of DataFrame and lift) and
+        category_mix_by_store, matching the in-memory functions
+
+    Example:
+        >>> results = finalize_metrics(merged, stores_df)
+    """
+    store_meta = stores_df[['store_id', 'store_name_en', 'region']]
+
+    # Store and region revenue (inner-joined like the groupby on merged keys)
+    store_totals = partial['store'].rename_axis('store_id').reset_index()
+    store_totals = store_totals.merge(store_meta, on='store_id', how='left')
+
+    store_revenue = _sum_count_frame(
+        store_totals.groupby(['store_id', 'store_name_en', 'region'])[['sum', 'count']].sum(),
+        ['store_id', 'store_name', 'region']
+    )
+    store_revenue = _add_share_and_sort(store_revenue)
+
+    region_groups = store_totals.groupby('region')
+    region_revenue = _sum_count_frame(
+        region_groups[['sum', 'count']].sum(), ['region']
+    )
+    region_revenue['num_stores'] = region_groups['store_id'].nunique().to_numpy()
+    region_revenue = _add_share_and_sort(region_revenue)
+
+    category_revenue = _add_share_and_sort(
+        _sum_count_frame(partial['category'], ['category'])
+    )
+
+    # Temporal metrics
+    by_date = partial['date'].reset_index()
+    by_date.columns = ['date', 'is_weekend', 'sum', 'count']
+
+    daily_revenue = by_date.groupby('date')['sum'].sum().reset_index()
+    daily_revenue.columns = ['date', 'revenue']
+
+    dow_revenue = _sum_count_frame(partial['day_of_week'], ['day_of_week'])
+    dow_revenue['day_of_week'] = pd.Categorical(
+        dow_revenue['day_of_week'], categories=DAY_ORDER, ordered=True
+    )
+    dow_revenue = dow_revenue.sort_values('day_of_week')
+
+    weekend_comparison = _sum_count_frame(
+        by_date.groupby('is_weekend')[['sum', 'count']].sum(), ['is_weekend']
+    )
+    weekend_comparison['period'] = weekend_comparison['is_weekend'].map({
+        True: 'Weekend',
+        False: 'Weekday'
+    })
+    calendar_days = by_date['date'].dt.normalize()
+    days_per_period = calendar_days.groupby(by_date['is_weekend']).nunique()
+    weekend_comparison['avg_revenue_per_day'] = (
+        weekend_comparison['total_revenue']
+        / weekend_comparison['is_weekend'].map(days_per_period)
+    )
+    if weekend_comparison['is_weekend'].nunique() == 2:
+        weekend_avg = weekend_comparison[weekend_comparison['is_weekend']]['avg_revenue_per_day'].values[0]
+        weekday_avg = weekend_comparison[~weekend_comparison['is_weekend']]['avg_revenue_per_day'].values[0]
+        weekend_lift = ((weekend_avg - weekday_avg) / weekday_avg * 100)
+    else:
+        # Only weekdays or only weekends (e.g. a date-filtered subset)
+        weekend_lift = np.nan
+
+    # Category mix (store name x category revenue matrix)
+    store_category = partial['store_category'].rename('sales_amount').reset_index()
+    store_category.columns = ['store_id', 'product_category', 'sales_amount']
+    store_category = store_category.merge(store_meta, on='store_id', how='left')
+    category_mix = store_category.pivot_table(
+        values='sales_amount',
+        index='store_name_en',
+        columns='product_category',
+        aggfunc='sum',
+        fill_value=0,
+        observed=True
+    )
+
+    total_revenue = partial['store']['sum'].sum()
+    key_metrics = {
+        'total_revenue': total_revenue,
+        'total_transactions': partial['rows'],
+        'avg_transaction_value': total_revenue / partial['rows'],
+        'median_transaction_value': _median_from_counts(partial['amount_counts']),
+        'num_stores': len(partial['store']),
+        'num_days': calendar_days.nunique(),
+        'date_range_start': by_date['date'].min(),
+        'date_range_end': by_date['date'].max()
+    }
+
+    return {
+        'key_metrics': key_metrics,
+        'revenue_by_store': store_revenue,
+        'revenue_by_region': region_revenue,
+        'revenue_by_category': category_revenue,
+        'daily_revenue': daily_revenue,
+        'day_of_week_metrics': dow_revenue,
+        'weekend_vs_weekday': (weekend_comparison, weekend_lift),
+        'category_mix_by_store': category_mix,
+    }
+
+
+def calculate_metrics_chunked(
+    sales_path: Union[str, Path],
+    stores_df: pd.DataFrame,
+    memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+    chunk_rows: Optional[int] = None
+) -> Dict[str, object]:
+    """
+    Calculate all standard metrics without loading the full dataset into memory.
+
+    Args:
+        sales_path: Path to the processed sales CSV
+        stores_df: DataFrame with store metadata
+        memory_budget_mb: Memory budget used to size the chunks, in MB
+        chunk_rows: Optional explicit chunk size (overrides the budget)
+
+    Returns:
+        Dictionary of metric results (see finalize_metrics)
+
+    Note:
+        Sales amounts are int64 yen, so revenue sums are exact and the
+        results are identical to the in-memory functions in analysis.metrics.
+
+    Example:
+        >>> results = calculate_metrics_chunked('data/processed/sales_clean.csv', stores_df,
+        ...                                     memory_budget_mb=512)
+        >>> store_revenue = results['revenue_by_store']
+    """
+    merged = None
+
+    # Fold each chunk into the running aggregate so only one chunk is held at a time
+    for chunk in iter_sales_chunks(sales_path, memory_budget_mb, chunk_rows):
+        partial = compute_partial_aggregates(chunk)
+        merged = partial if merged is None else merge_partial_aggregates([merged, partial])
+
+    if merged is None:
+        raise ValueError(f"No sales rows found in {sales_path}")
+
+    return finalize_metrics(merged, stores_df)
@@ -4,16 +4,43 @@ Create Updated Analysis Report for 10-Store Dataset
 Comprehensive Markdown report generation
 """
 
-import pandas as pd
+import sys
 from pathlib import Path
 
-def generate_complete_report():
-    """Generate complete analysis report with all sections"""
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-    # Load summary data
-    store_df = pd.read_csv('reports/store_performance_summary.csv')
-    region_df = pd.read_csv('reports/region_performance_summary.csv')
-    category_df = pd.read_csv('reports/category_performance_summary.csv')
+from data_pipeline.artifacts import read_csv_cached
+
+SUMMARY_DIR = Path(__file__).parent.parent.parent / 'reports'
+
+
+def load_summary_tables(summary_dir=SUMMARY_DIR):
+    """Load the store, region and category summary tables written by the EDA."""
+    return (
+        read_csv_cached(Path(summary_dir) / 'store_performance_summary.csv'),
+        read_csv_cached(Path(summary_dir) / 'region_performance_summary.csv'),
+        read_csv_cached(Path(summary_dir) / 'category_performance_summary.csv'),
+    )
+
+
+def generate_complete_report(store_df=None, region_df=None, category_df=None):
+    """
+    Generate complete analysis report with all sections.
+
+    Args:
+        store_df: Store performance summary (revenue_by_store); the three
+            tables are loaded from reports/*_performance_summary.csv when
+            not given
+        region_df: Region performance summary (revenue_by_region)
+        category_df: Category performance summary (revenue_by_category)
+
+    Returns:
+        str: Markdown report
+    """
+    # Load summary data unless passed in memory
+    if store_df is None or region_df is None or category_df is None:
+        store_df, region_df, category_df = load_summary_tables()
 
     # Calculate metrics
     total_revenue = store_df['total_revenue'].sum()
@@ -335,12 +362,18 @@ All charts in `reports/assets/` at 300 DPI:
 
     return report
 
-if __name__ == "__main__":
+
+def main(output_path=SUMMARY_DIR / 'analysis_report.md'):
+    """
+    Generate the Markdown report from the summary tables on disk.
+
+    Args:
+        output_path: Report file (defaults to reports/analysis_report.md)
+    """
     print("Generating comprehensive 10-store analysis report...")
     report_content = generate_complete_report()
 
     # Write to file
-    output_path = Path('reports/analysis_report.md')
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(report_content)
 
@@ -355,3 +388,7 @@ if __name__ == "__main__":
     print("  - Visual analysis (8 charts)")
     print("  - Key insights and recommendations")
     print("  - Next steps and conclusion")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,26 +7,10 @@ For 10-Store Dataset - January 2024
 import pandas as pd
 from pathlib import Path
 
-# Load summary data
-store_df = pd.read_csv('reports/store_performance_summary.csv')
-region_df = pd.read_csv('reports/region_performance_summary.csv')
-category_df = pd.read_csv('reports/category_performance_summary.csv')
-
-# Calculate aggregate metrics
-total_revenue = store_df['total_revenue'].sum()
-total_transactions = store_df['num_transactions'].sum()
-avg_transaction = total_revenue / total_transactions
-num_regions = region_df['region'].nunique()
-
-print(f"Generating comprehensive analysis report for 10-store dataset...")
-print(f"Total Revenue: ¥{total_revenue:,.0f}")
-print(f"Total Transactions: {total_transactions:,}")
-print(f"Regions: {num_regions}")
+SUMMARY_DIR = Path(__file__).parent.parent.parent / 'reports'
 
 # The complete report will be written in sections
-# This script validates the data and provides templates
-
-report_sections = {
+REPORT_SECTIONS = {
     'executive_summary': True,
     'project_overview': True,
     'data_overview': True,
@@ -41,10 +25,41 @@ report_sections = {
     'appendix': True
 }
 
-print(f"\nReport sections to be included: {sum(report_sections.values())} sections")
-print("Report generation template ready")
-print("\nKey findings to highlight:")
-print(f"1. Fukuoka (S10) ranks #{store_df[store_df['store_id']=='S10'].index[0]+1} nationally")
-print(f"2. Kyushu region contributes {region_df[region_df['region']=='Kyushu']['revenue_share_pct'].values[0]}%")
-print(f"3. Kanto dominance at {region_df[region_df['region']=='Kanto']['revenue_share_pct'].values[0]}%")
-print(f"4. Footwear category leads at {category_df.iloc[0]['revenue_share_pct']}%")
+
+def summarize_report_inputs(store_df, region_df, category_df):
+    """
+    Validate the summary tables and print the report outline and key findings.
+
+    Args:
+        store_df: Store performance summary (ranked by revenue)
+        region_df: Region performance summary
+        category_df: Category performance summary
+    """
+    # Calculate aggregate metrics
+    total_revenue = store_df['total_revenue'].sum()
+    total_transactions = store_df['num_transactions'].sum()
+    avg_transaction = total_revenue / total_transactions
+    num_regions = region_df['region'].nunique()
+
+    print(f"Generating comprehensive analysis report for 10-store dataset...")
+    print(f"Total Revenue: ¥{total_revenue:,.0f}")
+    print(f"Total Transactions: {total_transactions:,}")
+    print(f"Regions: {num_regions}")
+
+    # This script validates the data and provides templates
+    print(f"\nReport sections to be included: {sum(REPORT_SECTIONS.values())} sections")
+    print("Report generation template ready")
+    print("\nKey findings to highlight:")
+    print(f"1. Fukuoka (S10) ranks #{store_df['store_id'].tolist().index('S10')+1} nationally")
+    print(f"2. Kyushu region contributes {region_df[region_df['region']=='Kyushu']['revenue_share_pct'].values[0]}%")
+    print(f"3. Kanto dominance at {region_df[region_df['region']=='Kanto']['revenue_share_pct'].values[0]}%")
+    print(f"4. Footwear category leads at {category_df.iloc[0]['revenue_share_pct']}%")
+
+
+if __name__ == "__main__":
+    # Load summary data
+    store_df = pd.read_csv(SUMMARY_DIR / 'store_performance_summary.csv')
+    region_df = pd.read_csv(SUMMARY_DIR / 'region_performance_summary.csv')
+    category_df = pd.read_csv(SUMMARY_DIR / 'category_performance_summary.csv')
+
+    summarize_report_inputs(store_df, region_df, category_df)
@@ -7,12 +7,61 @@ and business metrics from sales transaction data.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple, Optional
+from pathlib import Path
+from typing import Dict, Iterable, Tuple, Optional, Union
+
+from data_pipeline.revenue_cube import cube_matches, is_whole_day, range_totals
+from data_pipeline.store_offsets import matches, store_starts
+from .chunked_metrics import compute_partial_aggregates, finalize_metrics
+from .query import SalesQuery, share_pct
+
+
+# Per-group revenue aggregations shared by the grouped metrics
+REVENUE_AGGREGATIONS = {
+    'total_revenue': ('sales_amount', 'sum'),
+    'avg_transaction': ('sales_amount', 'mean'),
+    'num_transactions': ('sales_amount', 'count'),
+}
+
+
+def get_store_sales(
+    sales_df: pd.DataFrame,
+    store_id: str,
+    offsets: Optional[Dict[str, object]] = None,
+    day: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Return the transactions of one store (optionally of one day).
+
+    Args:
+        sales_df: DataFrame with sales transactions
+        store_id: Store to select
+        offsets: Optional offset index of sales_df (data_pipeline.store_offsets);
+                 the store's rows are then a positional slice instead of a scan
+        day: Optional day ('YYYY-MM-DD') within the store
+
+    Returns:
+        DataFrame with the selected transactions
+
+    Example:
+        >>> shibuya = get_store_sales(sales_df, 'S01', offsets)
+    """
+    if matches(offsets, sales_df):
+        ranges = offsets['dates'] if day is not None else offsets['stores']
+        start, stop = (ranges.get(store_id, {}).get(day) if day is not None
+                       else ranges.get(store_id)) or (0, 0)
+        return sales_df.iloc[start:stop]
+
+    selected = sales_df['store_id'] == store_id
+    if day is not None:
+        selected &= sales_df['date'].dt.normalize() == pd.Timestamp(day)
+    return sales_df[selected]
 
 
 def calculate_revenue_by_store(
     sales_df: pd.DataFrame,
-    stores_df: pd.DataFrame
+    stores_df: pd.DataFrame,
+    offsets: Optional[Dict[str, object]] = None
 ) -> pd.DataFrame:
     """
     Calculate revenue metrics aggregated by store.
@@ -20,6 +69,8 @@ def calculate_revenue_by_store(
     Args:
         sales_df: DataFrame with sales transactions
         stores_df: DataFrame with store metadata
+        offsets: Optional offset index of sales_df (data_pipeline.store_offsets);
+                 store totals are then summed over contiguous row ranges
 
     Returns:
         DataFrame with columns: store_id, store_name, region, total_revenue,
@@ -29,30 +80,39 @@ def calculate_revenue_by_store(
         >>> store_metrics = calculate_revenue_by_store(sales_df, stores_df)
         >>> print(store_metrics.head())
     """
-    # Merge sales with store information
-    sales_with_stores = sales_df.merge(stores_df, on='store_id', how='left')
-
-    # Aggregate by store
-    store_revenue = sales_with_stores.groupby(
-        ['store_id', 'store_name_en', 'region']
-    ).agg({
-        'sales_amount': ['sum', 'mean', 'count']
-    }).reset_index()
-
-    store_revenue.columns = [
-        'store_id', 'store_name', 'region',
-        'total_revenue', 'avg_transaction', 'num_transactions'
-    ]
-
-    # Calculate revenue share percentage
-    store_revenue['revenue_share_pct'] = (
-        store_revenue['total_revenue'] / store_revenue['total_revenue'].sum() * 100
-    ).round(2)
-
-    # Sort by revenue descending
-    store_revenue = store_revenue.sort_values('total_revenue', ascending=False)
-
-    return store_revenue
+    if matches(offsets, sales_df):
+        # Rows are clustered by store: one reduceat over the store boundaries
+        starts = store_starts(offsets)
+        totals = np.add.reduceat(sales_df['sales_amount'].to_numpy(), starts) if len(starts) else []
+        counts = [stop - start for start, stop in offsets['stores'].values()]
+        store_revenue = pd.DataFrame({
+            'store_id': list(offsets['stores']),
+            'sum': totals,
+            'count': counts,
+        })
+        store_revenue.insert(2, 'mean', store_revenue['sum'] / store_revenue['count'])
+        # Inner join: stores without metadata are dropped, as by the groupby below
+        store_revenue = store_revenue.merge(stores_df, on='store_id', how='inner')[
+            ['store_id', 'store_name_en', 'region', 'sum', 'mean', 'count']
+        ]
+        store_revenue.columns = [
+            'store_id', 'store_name', 'region',
+            'total_revenue', 'avg_transaction', 'num_transactions'
+        ]
+        store_revenue['revenue_share_pct'] = share_pct('total_revenue')(store_revenue)
+        return store_revenue.sort_values('total_revenue', ascending=False)
+
+    # Aggregate by store, with store information joined
+    return (
+        SalesQuery(sales_df)
+        .join(stores_df, on='store_id')
+        .group_by('store_id', 'store_name_en', 'region')
+        .agg(**REVENUE_AGGREGATIONS)
+        .derive(revenue_share_pct=share_pct('total_revenue'))
+        .rename(store_name_en='store_name')
+        .sort('total_revenue', descending=True)
+        .collect()
+    )
 
 
 def calculate_revenue_by_region(
@@ -73,29 +133,16 @@ def calculate_revenue_by_region(
     Example:
         >>> region_metrics = calculate_revenue_by_region(sales_df, stores_df)
     """
-    # Merge sales with store information
-    sales_with_stores = sales_df.merge(stores_df, on='store_id', how='left')
-
-    # Aggregate by region
-    region_revenue = sales_with_stores.groupby('region').agg({
-        'sales_amount': ['sum', 'mean', 'count'],
-        'store_id': 'nunique'
-    }).reset_index()
-
-    region_revenue.columns = [
-        'region', 'total_revenue', 'avg_transaction',
-        'num_transactions', 'num_stores'
-    ]
-
-    # Calculate revenue share percentage
-    region_revenue['revenue_share_pct'] = (
-        region_revenue['total_revenue'] / region_revenue['total_revenue'].sum() * 100
-    ).round(2)
-
-    # Sort by revenue descending
-    region_revenue = region_revenue.sort_values('total_revenue', ascending=False)
-
-    return region_revenue
+    # Aggregate by region, with store information joined
+    return (
+        SalesQuery(sales_df)
+        .join(stores_df, on='store_id')
+        .group_by('region')
+        .agg(**REVENUE_AGGREGATIONS, num_stores=('store_id', 'nunique'))
+        .derive(revenue_share_pct=share_pct('total_revenue'))
+        .sort('total_revenue', descending=True)
+        .collect()
+    )
 
 
 def calculate_revenue_by_category(
@@ -115,23 +162,15 @@ def calculate_revenue_by_category(
         >>> category_metrics = calculate_revenue_by_category(sales_df)
     """
     # Aggregate by category
-    category_revenue = sales_df.groupby('product_category').agg({
-        'sales_amount': ['sum', 'mean', 'count']
-    }).reset_index()
-
-    category_revenue.columns = [
-        'category', 'total_revenue', 'avg_transaction', 'num_transactions'
-    ]
-
-    # Calculate revenue share percentage
-    category_revenue['revenue_share_pct'] = (
-        category_revenue['total_revenue'] / category_revenue['total_revenue'].sum() * 100
-    ).round(2)
-
-    # Sort by revenue descending
-    category_revenue = category_revenue.sort_values('total_revenue', ascending=False)
-
-    return category_revenue
+    return (
+        SalesQuery(sales_df)
+        .group_by('product_category')
+        .agg(**REVENUE_AGGREGATIONS)
+        .derive(revenue_share_pct=share_pct('total_revenue'))
+        .rename(product_category='category')
+        .sort('total_revenue', descending=True)
+        .collect()
+    )
 
 
 def calculate_daily_revenue(
@@ -149,10 +188,7 @@ def calculate_daily_revenue(
     Example:
         >>> daily_rev = calculate_daily_revenue(sales_df)
     """
-    daily_revenue = sales_df.groupby('date')['sales_amount'].sum().reset_index()
-    daily_revenue.columns = ['date', 'revenue']
-
-    return daily_revenue
+    return SalesQuery(sales_df).group_by('date').agg(revenue=('sales_amount', 'sum')).collect()
 
 
 def calculate_day_of_week_metrics(
@@ -174,24 +210,16 @@ def calculate_day_of_week_metrics(
     # Define proper day order
     day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
-    # Aggregate by day of week
-    dow_revenue = sales_df.groupby('day_of_week').agg({
-        'sales_amount': ['sum', 'mean', 'count']
-    }).reset_index()
-
-    dow_revenue.columns = [
-        'day_of_week', 'total_revenue', 'avg_transaction', 'num_transactions'
-    ]
-
-    # Sort by day order
-    dow_revenue['day_of_week'] = pd.Categorical(
-        dow_revenue['day_of_week'],
-        categories=day_order,
-        ordered=True
+    # Aggregate by day of week, then sort by day order
+    return (
+        SalesQuery(sales_df)
+        .group_by('day_of_week')
+        .agg(**REVENUE_AGGREGATIONS)
+        .derive(day_of_week=lambda dow_revenue: pd.Categorical(
+            dow_revenue['day_of_week'], categories=day_order, ordered=True))
+        .sort('day_of_week')
+        .collect()
     )
-    dow_revenue = dow_revenue.sort_values('day_of_week')
-
-    return dow_revenue
 
 
 def calculate_weekend_vs_weekday(
@@ -213,28 +241,17 @@ def calculate_weekend_vs_weekday(
         >>> comparison, lift = calculate_weekend_vs_weekday(sales_df)
         >>> print(f"Weekend lift: {lift:.1f}%")
     """
-    # Aggregate by weekend flag
-    weekend_comparison = sales_df.groupby('is_weekend').agg({
-        'sales_amount': ['sum', 'mean', 'count']
-    }).reset_index()
-
-    weekend_comparison.columns = [
-        'is_weekend', 'total_revenue', 'avg_transaction', 'num_transactions'
-    ]
-
-    # Add period label
-    weekend_comparison['period'] = weekend_comparison['is_weekend'].map({
-        True: 'Weekend',
-        False: 'Weekday'
-    })
-
-    # Calculate average per day
-    weekend_days = sales_df[sales_df['is_weekend']]['date'].dt.date.nunique()
-    weekday_days = sales_df[~sales_df['is_weekend']]['date'].dt.date.nunique()
-
-    weekend_comparison['avg_revenue_per_day'] = weekend_comparison.apply(
-        lambda row: row['total_revenue'] / (weekend_days if row['is_weekend'] else weekday_days),
-        axis=1
+    # Aggregate by weekend flag, with the calendar days of each period
+    weekend_comparison = (
+        SalesQuery(sales_df)
+        .group_by('is_weekend')
+        .agg(**REVENUE_AGGREGATIONS, num_days=('date', lambda dates: dates.dt.normalize().nunique()))
+        .derive(
+            period=lambda frame: frame['is_weekend'].map({True: 'Weekend', False: 'Weekday'}),
+            avg_revenue_per_day=lambda frame: frame['total_revenue'] / frame['num_days'],
+        )
+        .select('is_weekend', *REVENUE_AGGREGATIONS, 'period', 'avg_revenue_per_day')
+        .collect()
     )
 
     # Calculate weekend lift
@@ -297,16 +314,15 @@ def calculate_category_mix_by_store(
     Example:
         >>> mix = calculate_category_mix_by_store(sales_df, stores_df, percentage=True)
     """
-    # Merge with store info
-    sales_with_stores = sales_df.merge(stores_df, on='store_id', how='left')
-
-    # Pivot to get category x store matrix
-    category_by_store = sales_with_stores.pivot_table(
-        values='sales_amount',
-        index='store_name_en',
-        columns='product_category',
-        aggfunc='sum',
-        fill_value=0
+    # Revenue per store and category, pivoted to a store x category matrix
+    category_by_store = (
+        SalesQuery(sales_df)
+        .join(stores_df, on='store_id')
+        .group_by('store_name_en', 'product_category')
+        .agg(sales_amount=('sales_amount', 'sum'))
+        .collect()
+        .set_index(['store_name_en', 'product_category'])['sales_amount']
+        .unstack(fill_value=0)
     )
 
     if percentage:
@@ -383,23 +399,162 @@ def calculate_revenue_per_customer(
     Example:
         >>> rpc = calculate_revenue_per_customer(sales_df, groupby_column='store_id')
     """
+    query = SalesQuery(sales_df)
     if groupby_column:
         # Group by specified column
-        metrics = sales_df.groupby(groupby_column).agg({
-            'sales_amount': ['sum', 'mean'],
-            'transaction_id': 'count'
-        }).reset_index()
-
-        metrics.columns = [
-            groupby_column, 'total_revenue',
-            'avg_transaction', 'num_transactions'
-        ]
+        query = query.group_by(groupby_column)
+        num_transactions = ('transaction_id', 'count')
     else:
         # Overall metrics
-        metrics = pd.DataFrame({
-            'total_revenue': [sales_df['sales_amount'].sum()],
-            'avg_transaction': [sales_df['sales_amount'].mean()],
-            'num_transactions': [len(sales_df)]
+        num_transactions = ('sales_amount', 'size')
+
+    return query.agg(
+        total_revenue=('sales_amount', 'sum'),
+        avg_transaction=('sales_amount', 'mean'),
+        num_transactions=num_transactions,
+    ).collect()
+
+
+def calculate_range_revenue(
+    sales_df: pd.DataFrame,
+    start=None,
+    end=None,
+    by: str = 'store_id',
+    stores: Optional[Iterable[str]] = None,
+    cube: Optional[Dict[str, np.ndarray]] = None
+) -> pd.DataFrame:
+    """
+    Calculate revenue metrics for a date range, grouped by store or category.
+
+    With a revenue cube (data_pipeline.revenue_cube) built from the same
+    sales, ranges that start and end on whole days are answered from the
+    cube's prefix sums in constant time per store/category cell; other
+    ranges filter and aggregate the transactions.
+
+    Args:
+        sales_df: DataFrame with sales transactions
+        start: First day (inclusive); None for no lower bound
+        end: Last day (inclusive); None for no upper bound
+        by: 'store_id' or 'product_category'
+        stores: Store IDs to include (None: all stores)
+        cube: Optional revenue cube of sales_df
+
+    Returns:
+        DataFrame with columns: <by>, total_revenue, avg_transaction,
+        num_transactions, revenue_share_pct (sorted by revenue, descending)
+
+    Example:
+        >>> week = calculate_range_revenue(sales_df, '2024-01-08', '2024-01-14', cube=cube)
+    """
+    if by not in ('store_id', 'product_category'):
+        raise ValueError(f"by must be 'store_id' or 'product_category', not {by!r}")
+
+    # The cube must describe the same sales (row count, revenue total, date range)
+    if is_whole_day(start) and is_whole_day(end) and cube_matches(cube, sales_df):
+        revenue, count = range_totals(cube, start, end)
+        if stores is not None:
+            selected = np.isin(cube['stores'], list(stores))
+            revenue, count = revenue[selected], count[selected]
+            store_labels = cube['stores'][selected]
+        else:
+            store_labels = cube['stores']
+        axis, labels = (1, store_labels) if by == 'store_id' else (0, cube['categories'])
+        range_revenue = pd.DataFrame({
+            by: labels,
+            'total_revenue': revenue.sum(axis=axis),
+            'num_transactions': count.sum(axis=axis),
         })
+        range_revenue = range_revenue[range_revenue['num_transactions'] > 0]
+        range_revenue.insert(2, 'avg_transaction',
+                             range_revenue['total_revenue'] / range_revenue['num_transactions'])
+    else:
+        store_filter = {} if stores is None else {'store_id': list(stores)}
+        range_revenue = (
+            SalesQuery(sales_df)
+            .filter(start, end, **store_filter)
+            .group_by(by)
+            .agg(**REVENUE_AGGREGATIONS)
+            .collect()
+        )
+
+    range_revenue['revenue_share_pct'] = share_pct('total_revenue')(range_revenue)
 
-    return metrics
+    return range_revenue.sort_values('total_revenue', ascending=False).reset_index(drop=True)
+
+
+def calculate_all_metrics(
+    sales_df: pd.DataFrame,
+    stores_df: pd.DataFrame,
+    offsets: Optional[Dict[str, object]] = None
+) -> Dict[str, object]:
+    """
+    Calculate all standard metrics from a single aggregation pass.
+
+    The sales frame is scanned once into additive partial aggregates; store
+    metadata is joined onto the small aggregates only. Results are identical
+    to calling the individual calculate_* functions.
+
+    Args:
+        sales_df: DataFrame with sales transactions
+        stores_df: DataFrame with store metadata
+        offsets: Optional offset index of sales_df (data_pipeline.store_offsets);
+                 store totals are then summed over contiguous row ranges
+
+    Returns:
+        Dictionary with keys: key_metrics, revenue_by_store, revenue_by_region,
+        revenue_by_category, daily_revenue, day_of_week_metrics,
+        weekend_vs_weekday (comparison DataFrame, lift) and
+        category_mix_by_store
+
+    Example:
+        >>> results = calculate_all_metrics(sales_df, stores_df)
+        >>> store_revenue = results['revenue_by_store']
+    """
+    return finalize_metrics(compute_partial_aggregates(sales_df, offsets), stores_df)
+
+
+def calculate_filtered_metrics(
+    sales_path: Union[str, Path],
+    stores_df: pd.DataFrame,
+    start=None,
+    end=None,
+    stores: Optional[Iterable[str]] = None,
+    regions: Optional[Iterable[str]] = None,
+    categories: Optional[Iterable[str]] = None
+) -> Dict[str, object]:
+    """
+    Calculate all standard metrics for a subset of sales read from disk.
+
+    Only the row groups whose zone map statistics can match the filters are
+    read (data_pipeline.zone_maps.read_sales); each call is recorded in the
+    query plan log (format_query_plan).
+
+    Args:
+        sales_path: Processed sales CSV (with its zone map)
+        stores_df: DataFrame with store metadata
+        start: First date (inclusive)
+        end: Last date (inclusive)
+        stores: Store IDs to include
+        regions: Regions to include (combined with stores, if both are given)
+        categories: Product categories to include
+
+    Returns:
+        Dictionary of metric results (see calculate_all_metrics)
+
+    Raises:
+        ValueError: No sales match the filters
+
+    Example:
+        >>> results = calculate_filtered_metrics(path, stores_df, '2024-01-01', '2024-01-31',
+        ...                                      regions=['Kanto'])
+    """
+    filters = {'store_id': stores, 'region': regions, 'product_category': categories}
+    sales_df = (
+        SalesQuery(sales_path, call='calculate_filtered_metrics')
+        .join(stores_df, on='store_id')
+        .filter(start, end, **{column: values for column, values in filters.items() if values is not None})
+        .collect()
+    )
+    if sales_df.empty:
+        raise ValueError("No sales match the filters")
+    return calculate_all_metrics(sales_df, stores_df)
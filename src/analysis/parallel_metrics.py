@@ -0,0 +1,149 @@
+"""
+Multi-core metrics calculation for retail sales analysis.
+
+This module shards the sales fact table by store or by calendar day, computes
+partial aggregates for each shard in a process pool and merges them on the
+coordinator. Non-additive results (revenue shares, distinct-day averages, the
+median) are derived only after merging, via ``analysis.chunked_metrics``.
+
+With the offset index of the store-clustered processed data
+(``data_pipeline.store_offsets``), store shards are contiguous row ranges:
+workers slice their rows instead of filtering (and copying) them.
+"""
+
+import os
+import multiprocessing
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from data_pipeline.store_offsets import contiguous_shards, matches
+from .chunked_metrics import (
+    compute_partial_aggregates,
+    merge_partial_aggregates,
+    finalize_metrics,
+)
+
+
+SHARD_KEYS = ('store_id', 'date')
+
+# Sales frame and shard labels (or row ranges) shared with forked workers (copy-on-write)
+_SHARED_SALES_DF: Optional[pd.DataFrame] = None
+_SHARED_SHARD_LABELS: Optional[np.ndarray] = None
+_SHARED_SHARD_RANGES: Optional[list] = None
+
+
+def assign_shards(
+    sales_df: pd.DataFrame,
+    num_shards: int,
+    shard_by: str = 'store_id'
+) -> np.ndarray:
+    """
+    Assign every transaction to a shard, keeping each store (or day) in one shard.
+
+    Groups are placed largest-first onto the currently smallest shard, so
+    shards stay balanced even when a few stores dominate the row count.
+
+    Args:
+        sales_df: DataFrame with sales transactions
+        num_shards: Number of shards to create
+        shard_by: 'store_id' or 'date' (calendar day)
+
+    Returns:
+        Integer array of shard labels, one per row of sales_df
+
+    Example:
+        >>> labels = assign_shards(sales_df, num_shards=4, shard_by='store_id')
+    """
+    if shard_by not in SHARD_KEYS:
+        raise ValueError(f"shard_by must be one of {SHARD_KEYS}, got '{shard_by}'")
+
+    keys = sales_df['store_id'] if shard_by == 'store_id' else sales_df['date'].dt.normalize()
+    codes, uniques = pd.factorize(keys)
+    group_sizes = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+    shard_of_group = np.zeros(len(uniques), dtype=np.int64)
+    shard_loads = np.zeros(num_shards, dtype=np.int64)
+    for group in np.argsort(group_sizes)[::-1]:
+        shard = int(np.argmin(shard_loads))
+        shard_of_group[group] = shard
+        shard_loads[shard] += group_sizes[group]
+
+    return shard_of_group[codes]
+
+
+def _partial_for_shared_shard(shard: int) -> Dict[str, object]:
+    """Worker: aggregate one shard of the sales frame inherited from the parent."""
+    if _SHARED_SHARD_RANGES is not None:
+        start, stop = _SHARED_SHARD_RANGES[shard]
+        return compute_partial_aggregates(_SHARED_SALES_DF.iloc[start:stop])
+    return compute_partial_aggregates(_SHARED_SALES_DF[_SHARED_SHARD_LABELS == shard])
+
+
+def calculate_metrics_parallel(
+    sales_df: pd.DataFrame,
+    stores_df: pd.DataFrame,
+    max_workers: Optional[int] = None,
+    shard_by: str = 'store_id',
+    offsets: Optional[Dict[str, object]] = None
+) -> Dict[str, object]:
+    """
+    Calculate all standard metrics using a process pool over sharded data.
+
+    Args:
+        sales_df: DataFrame with sales transactions
+        stores_df: DataFrame with store metadata
+        max_workers: Number of worker processes (defaults to the CPU count);
+                     1 computes in the current process
+        shard_by: Partition key - 'store_id' or 'date'
+        offsets: Optional offset index of sales_df; store shards are then
+                 contiguous row ranges (no filtering or copying of rows)
+
+    Returns:
+        Dictionary of metric results with the same keys and values as
+        analysis.chunked_metrics.finalize_metrics
+
+    Note:
+        On platforms with fork, workers read the sales frame inherited from
+        the parent process, so shards are never pickled. Elsewhere each shard
+        is sent to its worker.
+
+    Example:
+        >>> results = calculate_metrics_parallel(sales_df, stores_df, max_workers=8)
+        >>> region_revenue = results['revenue_by_region']
+    """
+    global _SHARED_SALES_DF, _SHARED_SHARD_LABELS, _SHARED_SHARD_RANGES
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers <= 1:
+        return finalize_metrics(compute_partial_aggregates(sales_df), stores_df)
+
+    if shard_by == 'store_id' and matches(offsets, sales_df):
+        labels, ranges = None, contiguous_shards(offsets, max_workers)
+        shards = list(range(len(ranges)))
+    else:
+        labels, ranges = assign_shards(sales_df, max_workers, shard_by), None
+        shards = [shard for shard in range(max_workers) if (labels == shard).any()]
+
+    if 'fork' in multiprocessing.get_all_start_methods():
+        _SHARED_SALES_DF, _SHARED_SHARD_LABELS, _SHARED_SHARD_RANGES = sales_df, labels, ranges
+        try:
+            with ProcessPoolExecutor(
+                max_workers=len(shards),
+                mp_context=multiprocessing.get_context('fork')
+            ) as executor:
+                partials = list(executor.map(_partial_for_shared_shard, shards))
+        finally:
+            _SHARED_SALES_DF, _SHARED_SHARD_LABELS, _SHARED_SHARD_RANGES = None, None, None
+    else:
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            partials = list(executor.map(
+                compute_partial_aggregates,
+                [sales_df.iloc[slice(*ranges[shard])] if ranges else sales_df[labels == shard]
+                 for shard in shards]
+            ))
+
+    return finalize_metrics(merge_partial_aggregates(partials), stores_df)
@@ -0,0 +1,330 @@
+"""
+Lazy query builder over the sales fact table.
+
+A SalesQuery describes filter -> join -> group by -> aggregate -> derive ->
+sort/top-n steps without running them. Nothing is read or computed until
+``collect()``, which then:
+
+- pushes date, store and category predicates down to the storage layer
+  (``data_pipeline.zone_maps.read_sales`` skips row groups that cannot
+  match); predicates on joined dimension columns, such as region, are
+  turned into store_id predicates first
+- reads only the columns the query references (column pruning)
+- filters, joins and aggregates the remaining rows in pandas
+
+The source is either the processed sales CSV (a path) or a DataFrame that
+is already in memory; the same query runs on both. ``explain()`` shows
+what will be pushed down and which columns will be read.
+
+Example:
+    >>> top_stores = (
+    ...     SalesQuery('data/processed/sales_clean.csv')
+    ...     .join(stores_df, on='store_id')
+    ...     .filter(start='2024-01-08', end='2024-01-14', region='Kanto')
+    ...     .group_by('store_id', 'store_name_en')
+    ...     .agg(total_revenue=('sales_amount', 'sum'), num_transactions=('sales_amount', 'count'))
+    ...     .derive(revenue_share_pct=share_pct('total_revenue'))
+    ...     .sort('total_revenue', descending=True)
+    ...     .head(3)
+    ...     .collect()
+    ... )
+"""
+
+import copy
+import pandas as pd
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from data_pipeline.zone_maps import read_sales
+
+
+# Fact columns read_sales can prune row groups on: column -> read_sales argument
+PUSHDOWN_COLUMNS = {'store_id': 'stores', 'product_category': 'categories'}
+
+
+def share_pct(column: str, decimals: int = 2) -> Callable[[pd.DataFrame], pd.Series]:
+    """
+    Return a derive() function computing each row's share of a column total, in percent.
+
+    Args:
+        column: Column to take shares of (e.g. 'total_revenue')
+        decimals: Rounding of the percentage
+
+    Returns:
+        Function of the aggregated frame
+    """
+    return lambda frame: (frame[column] / frame[column].sum() * 100).round(decimals)
+
+
+def _as_values(value) -> List[object]:
+    """Return a filter value as a list of allowed values."""
+    if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+        return [value]
+    return list(value)
+
+
+class SalesQuery:
+    """
+    An immutable, lazily evaluated query; every method returns a new query.
+
+    Args:
+        source: Processed sales CSV path, or a sales DataFrame
+        call: Name recorded in the query plan log when reading from a path
+    """
+
+    def __init__(self, source: Union[str, Path, pd.DataFrame], call: str = 'SalesQuery'):
+        self.source = source if isinstance(source, pd.DataFrame) else Path(source)
+        self.call = call
+        self._plan = {
+            'start': None,
+            'end': None,
+            'filters': {},
+            'joins': [],
+            'keys': None,
+            'aggregations': None,
+            'derived': {},
+            'renamed': {},
+            'sort': None,
+            'limit': None,
+            'columns': None,
+        }
+
+    def _with(self, **changes) -> 'SalesQuery':
+        query = copy.copy(self)
+        query._plan = {**copy.deepcopy({k: v for k, v in self._plan.items() if k != 'joins'}),
+                       'joins': list(self._plan['joins']), **changes}
+        return query
+
+    # ----------------------------------------
+    # Building
+    # ----------------------------------------
+
+    def filter(self, start=None, end=None, **values) -> 'SalesQuery':
+        """
+        Keep rows in a date range and/or with given column values.
+
+        Args:
+            start: First date or time (inclusive)
+            end: Last date (inclusive, whole day) or time (inclusive)
+            **values: column=value or column=[values]; fact columns or
+                      columns of a joined dimension (e.g. region='Kanto')
+
+        Returns:
+            New query (repeated filters are combined with AND)
+        """
+        plan = self._plan
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+        filters = dict(plan['filters'])
+        for column, value in values.items():
+            allowed = _as_values(value)
+            if column in filters:
+                allowed = [item for item in filters[column] if item in allowed]
+            filters[column] = allowed
+
+        return self._with(
+            start=max([value for value in (plan['start'], start) if value is not None], default=None),
+            end=min([value for value in (plan['end'], end) if value is not None], default=None),
+            filters=filters,
+        )
+
+    def join(self, dimension_df: pd.DataFrame, on: str = 'store_id') -> 'SalesQuery':
+        """
+        Left-join a dimension table (e.g. store metadata) on a key column.
+
+        Only the dimension columns the query references are joined.
+        """
+        return self._with(joins=self._plan['joins'] + [(dimension_df, on)])
+
+    def group_by(self, *keys: str) -> 'SalesQuery':
+        """Group by fact and/or joined dimension columns (sorted by key, as pandas does)."""
+        return self._with(keys=list(keys))
+
+    def agg(self, **aggregations: Tuple[str, str]) -> 'SalesQuery':
+        """
+        Aggregate per group (or over all rows without group_by).
+
+        Args:
+            **aggregations: output name=(column, function), e.g.
+                            total_revenue=('sales_amount', 'sum')
+        """
+        return self._with(aggregations=dict(aggregations))
+
+    def derive(self, **columns: Callable[[pd.DataFrame], object]) -> 'SalesQuery':
+        """Add or replace columns computed from the aggregated frame (e.g. share_pct)."""
+        return self._with(derived={**self._plan['derived'], **columns})
+
+    def rename(self, **names: str) -> 'SalesQuery':
+        """Rename result columns (old=new)."""
+        return self._with(renamed={**self._plan['renamed'], **names})
+
+    def sort(self, by: Union[str, List[str]], descending: bool = False) -> 'SalesQuery':
+        """Sort the result (after renaming) by one or more columns."""
+        return self._with(sort=(by, descending))
+
+    def head(self, n: int) -> 'SalesQuery':
+        """Keep the first n result rows (top-n after sort)."""
+        return self._with(limit=n)
+
+    def select(self, *columns: str) -> 'SalesQuery':
+        """Return only these columns (of the rows without aggregation, or of the result)."""
+        return self._with(columns=list(columns))
+
+    # ----------------------------------------
+    # Planning
+    # ----------------------------------------
+
+    def _dimension_columns(self) -> Dict[str, Tuple[pd.DataFrame, str]]:
+        """Map each joined dimension column (other than the key) to its (table, key)."""
+        columns = {}
+        for dimension_df, on in self._plan['joins']:
+            for column in dimension_df.columns:
+                if column != on:
+                    columns.setdefault(column, (dimension_df, on))
+        return columns
+
+    def _fact_filters(self) -> Dict[str, List[object]]:
+        """Return the filters on fact columns, with dimension filters turned into key filters."""
+        dimensions = self._dimension_columns()
+        filters = {}
+
+        def restrict(column, allowed):
+            if column in filters:
+                allowed = [item for item in filters[column] if item in set(allowed)]
+            filters[column] = list(allowed)
+
+        for column, allowed in self._plan['filters'].items():
+            if column in dimensions:
+                dimension_df, on = dimensions[column]
+                restrict(on, dimension_df.loc[dimension_df[column].isin(allowed), on].unique())
+            else:
+                restrict(column, allowed)
+        return filters
+
+    def _referenced_columns(self) -> Optional[List[str]]:
+        """Return the fact columns to read, or None for all of them."""
+        plan = self._plan
+        if plan['keys'] is None and plan['aggregations'] is None and plan['columns'] is None:
+            return None
+
+        dimensions = self._dimension_columns()
+        referenced = list(plan['keys'] or [])
+        referenced += [column for column, _ in (plan['aggregations'] or {}).values()]
+        if plan['aggregations'] is None:
+            referenced += plan['columns'] or []
+        referenced += [on for _, on in plan['joins']]
+        referenced += list(self._fact_filters())
+        if plan['start'] is not None or plan['end'] is not None:
+            referenced.append('date')
+
+        return list(dict.fromkeys(column for column in referenced if column not in dimensions))
+
+    def explain(self) -> str:
+        """
+        Describe how the query will run: pushed-down predicates, columns read and steps.
+
+        Returns:
+            Multi-line plan description
+        """
+        plan = self._plan
+        filters = self._fact_filters()
+        pushed = {PUSHDOWN_COLUMNS[column]: values for column, values in filters.items()
+                  if column in PUSHDOWN_COLUMNS}
+        if plan['start'] is not None or plan['end'] is not None:
+            pushed['dates'] = [value.date().isoformat() if value is not None else '...'
+                               for value in (plan['start'], plan['end'])]
+        columns = self._referenced_columns()
+        source = 'DataFrame' if isinstance(self.source, pd.DataFrame) else str(self.source)
+
+        lines = [
+            f"Scan: {source}",
+            f"  Pushed-down predicates: {pushed or 'none'}",
+            f"  Row filters: {{{', '.join(f'{c}: {v}' for c, v in filters.items() if c not in PUSHDOWN_COLUMNS)}}}",
+            f"  Columns read: {'all' if columns is None else ', '.join(columns)}",
+        ]
+        lines += [f"Join: {sorted(set(df.columns) - {on})} on {on}" for df, on in plan['joins']]
+        if plan['keys'] is not None or plan['aggregations'] is not None:
+            lines.append(f"Aggregate: {plan['aggregations']} by {plan['keys'] or '(all rows)'}")
+        if plan['derived']:
+            lines.append(f"Derive: {', '.join(plan['derived'])}")
+        if plan['sort'] is not None:
+            lines.append(f"Sort: {plan['sort'][0]} {'descending' if plan['sort'][1] else 'ascending'}")
+        if plan['limit'] is not None:
+            lines.append(f"Limit: {plan['limit']}")
+        return '\n'.join(lines)
+
+    # ----------------------------------------
+    # Execution
+    # ----------------------------------------
+
+    def _scan(self) -> pd.DataFrame:
+        """Read (or select) the filtered fact rows with the referenced columns only."""
+        plan = self._plan
+        filters = self._fact_filters()
+        columns = self._referenced_columns()
+        start, end = plan['start'], plan['end']
+
+        if isinstance(self.source, pd.DataFrame):
+            frame = self.source
+            remaining = filters
+        else:
+            frame = read_sales(
+                self.source, start, end,
+                stores=filters.get('store_id'), categories=filters.get('product_category'),
+                call=self.call, columns=columns,
+            )
+            remaining = {column: values for column, values in filters.items()
+                         if column not in PUSHDOWN_COLUMNS}
+
+        # read_sales selects whole days; a time of day on start or end applies here
+        mask = pd.Series(True, index=frame.index)
+        if start is not None:
+            mask &= frame['date'] >= start
+        if end is not None:
+            mask &= (frame['date'] < end + pd.Timedelta(days=1) if end == end.normalize()
+                     else frame['date'] <= end)
+        for column, allowed in remaining.items():
+            mask &= frame[column].isin(allowed)
+        if not mask.all():
+            frame = frame[mask]
+        return frame if columns is None else frame[columns]
+
+    def collect(self) -> pd.DataFrame:
+        """
+        Run the query.
+
+        Returns:
+            Result DataFrame
+        """
+        plan = self._plan
+        frame = self._scan()
+
+        # Join only the dimension columns the query uses
+        used = set(plan['keys'] or []) | set(plan['columns'] or [])
+        used |= {column for column, _ in (plan['aggregations'] or {}).values()}
+        for dimension_df, on in plan['joins']:
+            columns = [column for column in dimension_df.columns if column != on and column in used]
+            if columns:
+                frame = frame.merge(dimension_df[[on] + columns], on=on, how='left')
+
+        if plan['keys'] is not None:
+            frame = frame.groupby(plan['keys']).agg(**plan['aggregations']).reset_index()
+        elif plan['aggregations'] is not None:
+            frame = pd.DataFrame({name: [frame[column].agg(function)]
+                                  for name, (column, function) in plan['aggregations'].items()})
+        elif plan['columns'] is not None:
+            frame = frame[plan['columns']]
+
+        # assign() copies: row-level rows may be the caller's (or a cached) DataFrame
+        if plan['derived']:
+            frame = frame.assign(**plan['derived'])
+        if plan['renamed']:
+            frame = frame.rename(columns=plan['renamed'])
+        if plan['sort'] is not None:
+            by, descending = plan['sort']
+            frame = frame.sort_values(by, ascending=not descending)
+        if plan['limit'] is not None:
+            frame = frame.head(plan['limit'])
+        if plan['columns'] is not None and (plan['keys'] is not None or plan['aggregations'] is not None):
+            frame = frame[plan['columns']]
+        return frame
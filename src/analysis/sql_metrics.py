@@ -0,0 +1,197 @@
+"""
+SQL metrics backend for the SQLite mirror of the processed dataset.
+
+The standard metrics are computed with their group-bys pushed down to
+SQLite (data_pipeline.sqlite_mirror): sums and counts come from the daily
+rollup table, the exact median from a value count over the indexed fact
+table. Only the small aggregates reach pandas, so memory use does not grow
+with the number of transactions, and filtered queries read only the
+matching index ranges.
+
+The SQL aggregates have the same shape as chunked_metrics partial
+aggregates and are finalized by the same code, so results are identical
+to ``analysis.metrics.calculate_all_metrics`` on the same rows.
+"""
+
+import sqlite3
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .chunked_metrics import finalize_metrics
+
+
+ROLLUP_TABLE = 'daily_store_category_sales'
+FACT_TABLE = 'sales'
+
+
+def connect(db_path: Union[str, Path]) -> sqlite3.Connection:
+    """
+    Open the SQLite mirror read-only.
+
+    Args:
+        db_path: Path to the database written by write_sqlite_mirror
+
+    Returns:
+        sqlite3.Connection
+
+    Raises:
+        FileNotFoundError: The database does not exist
+    """
+    db_path = Path(db_path)
+    if not db_path.exists():
+        raise FileNotFoundError(f"SQLite mirror not found: {db_path} (run the pipeline with --sqlite)")
+    return sqlite3.connect(f'{db_path.resolve().as_uri()}?mode=ro', uri=True)
+
+
+def build_where(
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    stores: Optional[Iterable[str]] = None,
+    categories: Optional[Iterable[str]] = None
+) -> Tuple[str, List[object]]:
+    """
+    Build a parameterized WHERE clause for the sales and rollup tables.
+
+    Args:
+        start: First date (inclusive, 'YYYY-MM-DD')
+        end: Last date (inclusive, 'YYYY-MM-DD')
+        stores: Store IDs to include (an empty list selects no rows)
+        categories: Product categories to include (likewise)
+
+    Returns:
+        Tuple of (WHERE clause or '', parameters)
+
+    Example:
+        >>> build_where(start='2024-01-08', stores=['S01'])
+        ('WHERE date >= ? AND store_id IN (?)', ['2024-01-08', 'S01'])
+    """
+    conditions, params = [], []
+    if start:
+        conditions.append('date >= ?')
+        params.append(str(pd.Timestamp(start).date()))
+    if end:
+        conditions.append('date <= ?')
+        params.append(str(pd.Timestamp(end).date()))
+    for column, values in (('store_id', stores), ('product_category', categories)):
+        if values is not None:
+            values = list(values)
+            conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+
+    return ('WHERE ' + ' AND '.join(conditions)) if conditions else '', params
+
+
+def read_sql(
+    db_path: Union[str, Path],
+    sql: str,
+    params: Iterable[object] = ()
+) -> pd.DataFrame:
+    """
+    Run an ad-hoc query against the SQLite mirror.
+
+    Args:
+        db_path: Path to the database
+        sql: SELECT statement (with ? placeholders)
+        params: Placeholder values
+
+    Returns:
+        DataFrame with the query result
+
+    Example:
+        >>> read_sql(db_path, 'SELECT region, SUM(revenue) FROM daily_store_sales '
+        ...          'JOIN stores USING (store_id) GROUP BY region')
+    """
+    conn = connect(db_path)
+    try:
+        return pd.read_sql_query(sql, conn, params=list(params))
+    finally:
+        conn.close()
+
+
+def compute_partial_aggregates_sql(
+    conn: sqlite3.Connection,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    stores: Optional[Iterable[str]] = None,
+    categories: Optional[Iterable[str]] = None
+) -> Dict[str, object]:
+    """
+    Compute the partial aggregates of the selected sales in SQL.
+
+    Args:
+        conn: Connection to the SQLite mirror
+        start, end, stores, categories: Filters (see build_where)
+
+    Returns:
+        Dictionary in the format of chunked_metrics.compute_partial_aggregates
+    """
+    where, params = build_where(start, end, stores, categories)
+
+    def sum_count(keys: List[str]) -> pd.DataFrame:
+        frame = pd.read_sql_query(
+            f"SELECT {', '.join(keys)}, SUM(revenue) AS sum, SUM(transactions) AS count "
+            f"FROM {ROLLUP_TABLE} {where} GROUP BY {', '.join(keys)}",
+            conn, params=params
+        )
+        return frame.set_index(keys)
+
+    by_date = sum_count(['date', 'is_weekend']).reset_index()
+    by_date['date'] = pd.to_datetime(by_date['date'])
+    by_date['is_weekend'] = by_date['is_weekend'].astype(bool)
+
+    store_category = sum_count(['store_id', 'product_category'])['sum']
+    amount_counts = pd.read_sql_query(
+        f"SELECT sales_amount, COUNT(*) AS count FROM {FACT_TABLE} {where} GROUP BY sales_amount",
+        conn, params=params
+    ).set_index('sales_amount')['count']
+
+    return {
+        'rows': int(amount_counts.sum()),
+        'store': sum_count(['store_id']).rename_axis(None),
+        'category': sum_count(['product_category']).rename_axis(None),
+        'date': by_date.set_index(['date', 'is_weekend']),
+        'day_of_week': sum_count(['day_of_week']).rename_axis(None),
+        'store_category': store_category,
+        'amount_counts': amount_counts,
+    }
+
+
+def calculate_all_metrics_sql(
+    db_path: Union[str, Path],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    stores: Optional[Iterable[str]] = None,
+    categories: Optional[Iterable[str]] = None
+) -> Dict[str, object]:
+    """
+    Calculate all standard metrics in SQL, optionally for a subset of sales.
+
+    Args:
+        db_path: Path to the SQLite mirror
+        start: First date (inclusive)
+        end: Last date (inclusive)
+        stores: Store IDs to include
+        categories: Product categories to include
+
+    Returns:
+        Dictionary of metric results (see chunked_metrics.finalize_metrics)
+
+    Raises:
+        ValueError: No sales match the filters
+
+    Example:
+        >>> results = calculate_all_metrics_sql('data/processed/sales.sqlite',
+        ...                                     start='2024-01-08', end='2024-01-14')
+        >>> results['revenue_by_category']
+    """
+    conn = connect(db_path)
+    try:
+        partial = compute_partial_aggregates_sql(conn, start, end, stores, categories)
+        stores_df = pd.read_sql_query('SELECT * FROM stores', conn)
+    finally:
+        conn.close()
+
+    if partial['rows'] == 0:
+        raise ValueError("No sales match the filters")
+    return finalize_metrics(partial, stores_df)
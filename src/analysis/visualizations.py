@@ -2,7 +2,8 @@
 Reusable visualization functions for retail sales analysis.
 
 This module provides functions to create professional, high-quality charts
-for presenting retail sales insights.
+for presenting retail sales insights. Charts saved to a file are skipped when
+the PNG is already up to date (see analysis.chart_cache).
 """
 
 import pandas as pd
@@ -12,33 +13,87 @@ import seaborn as sns
 from pathlib import Path
 from typing import Optional, Tuple, List
 
+from .chart_cache import cached_chart
+
 
 # Default visualization settings
 DEFAULT_DPI = 300
+DRAFT_DPI = 72
 DEFAULT_FIGSIZE = (10, 6)
 DEFAULT_COLOR_PALETTE = 'Set2'
 
+# Render profiles: 'publication' is the print-quality output used in reports;
+# 'draft' skips the extra layout/draw passes of tight_layout and the tight
+# bounding box for fast previews while iterating on a report.
+RENDER_PROFILES = {
+    'publication': {'dpi': DEFAULT_DPI, 'tight_layout': True, 'bbox_inches': 'tight'},
+    'draft': {'dpi': DRAFT_DPI, 'tight_layout': False, 'bbox_inches': None},
+}
+DEFAULT_RENDER_PROFILE = 'publication'
+
+# Fixed margins used instead of tight_layout in draft mode
+DRAFT_MARGINS = {'left': 0.15, 'right': 0.82, 'bottom': 0.18, 'top': 0.88, 'wspace': 0.35}
+
+_active_profile = DEFAULT_RENDER_PROFILE
 
-def setup_plot_style():
+
+def setup_plot_style(profile: str = DEFAULT_RENDER_PROFILE):
     """
     Configure matplotlib and seaborn with professional styling for reports.
 
+    Args:
+        profile: Render profile for subsequent plots - 'publication' (300 DPI,
+                 tight layout, byte-identical report charts) or 'draft'
+                 (72 DPI, fixed margins, no tight bounding box)
+
     Example:
         >>> setup_plot_style()
         >>> # Now all subsequent plots will use these settings
+        >>> setup_plot_style('draft')  # fast previews
     """
-    plt.rcParams['figure.dpi'] = DEFAULT_DPI
-    plt.rcParams['savefig.dpi'] = DEFAULT_DPI
+    global _active_profile
+    _active_profile = _resolve_profile(profile)
+
+    plt.rcParams['figure.dpi'] = RENDER_PROFILES[_active_profile]['dpi']
+    plt.rcParams['savefig.dpi'] = RENDER_PROFILES[_active_profile]['dpi']
     plt.rcParams['font.size'] = 10
     plt.rcParams['figure.figsize'] = DEFAULT_FIGSIZE
     sns.set_style('whitegrid')
     sns.set_palette(DEFAULT_COLOR_PALETTE)
 
 
+def _resolve_profile(profile: Optional[str]) -> str:
+    """Return the render profile name to use (the active one if None)."""
+    if profile is None:
+        return _active_profile
+    if profile not in RENDER_PROFILES:
+        raise ValueError(f"profile must be one of {list(RENDER_PROFILES)}, got '{profile}'")
+    return profile
+
+
+def _apply_layout(profile: Optional[str]) -> None:
+    """Lay out the current figure: tight_layout, or fixed margins in draft mode."""
+    if RENDER_PROFILES[_resolve_profile(profile)]['tight_layout']:
+        plt.tight_layout()
+    else:
+        plt.gcf().subplots_adjust(**DRAFT_MARGINS)
+
+
+def _save_chart(save_path: Path, profile: Optional[str]) -> None:
+    """Save the current figure with the DPI and bounding box of the render profile."""
+    settings = RENDER_PROFILES[_resolve_profile(profile)]
+    if settings['bbox_inches']:
+        plt.savefig(save_path, dpi=settings['dpi'], bbox_inches=settings['bbox_inches'])
+    else:
+        plt.savefig(save_path, dpi=settings['dpi'])
+
+
+@cached_chart
 def plot_daily_revenue_trend(
     daily_revenue_df: pd.DataFrame,
     save_path: Optional[Path] = None,
-    show_average: bool = True
+    show_average: bool = True,
+    profile: Optional[str] = None
 ) -> None:
     """
     Create a line chart showing daily revenue trend over time.
@@ -47,6 +102,8 @@ def plot_daily_revenue_trend(
         daily_revenue_df: DataFrame with columns 'date' and 'revenue'
         save_path: Optional path to save the chart (PNG file)
         show_average: If True, shows average daily revenue as horizontal line
+        profile: Render profile ('publication' or 'draft'); defaults to the one
+                 set by setup_plot_style
 
     Example:
         >>> plot_daily_revenue_trend(daily_revenue, save_path=Path('reports/assets/trend.png'))
@@ -81,18 +138,20 @@ def plot_daily_revenue_trend(
     ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'¥{x/1000:.0f}K'))
 
     plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
+    _apply_layout(profile)
 
     if save_path:
-        plt.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+        _save_chart(save_path, profile)
 
     plt.show()
 
 
+@cached_chart
 def plot_revenue_by_store(
     store_revenue_df: pd.DataFrame,
     save_path: Optional[Path] = None,
-    show_percentages: bool = True
+    show_percentages: bool = True,
+    profile: Optional[str] = None
 ) -> None:
     """
     Create a horizontal bar chart showing revenue by store.
@@ -101,6 +160,8 @@ def plot_revenue_by_store(
         store_revenue_df: DataFrame with store revenue metrics (from calculate_revenue_by_store)
         save_path: Optional path to save the chart
         show_percentages: If True, shows revenue share percentages on bars
+        profile: Render profile ('publication' or 'draft'); defaults to the one
+                 set by setup_plot_style
 
     Example:
         >>> plot_revenue_by_store(store_revenue, save_path=Path('reports/assets/store_revenue.png'))
@@ -139,17 +200,19 @@ def plot_revenue_by_store(
     ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'¥{x/1000000:.1f}M'))
     ax.grid(True, alpha=0.3, axis='x')
 
-    plt.tight_layout()
+    _apply_layout(profile)
 
     if save_path:
-        plt.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+        _save_chart(save_path, profile)
 
     plt.show()
 
 
+@cached_chart
 def plot_revenue_by_region(
     region_revenue_df: pd.DataFrame,
-    save_path: Optional[Path] = None
+    save_path: Optional[Path] = None,
+    profile: Optional[str] = None
 ) -> None:
     """
     Create a bar chart showing revenue by geographic region.
@@ -157,6 +220,8 @@ def plot_revenue_by_region(
     Args:
         region_revenue_df: DataFrame with regional revenue metrics
         save_path: Optional path to save the chart
+        profile: Render profile ('publication' or 'draft'); defaults to the one
+                 set by setup_plot_style
 
     Example:
         >>> plot_revenue_by_region(region_revenue, save_path=Path('reports/assets/region.png'))
@@ -196,18 +261,20 @@ def plot_revenue_by_region(
     ax.grid(True, alpha=0.3, axis='y')
 
     plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
+    _apply_layout(profile)
 
     if save_path:
-        plt.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+        _save_chart(save_path, profile)
 
     plt.show()
 
 
+@cached_chart
 def plot_revenue_by_category(
     category_revenue_df: pd.DataFrame,
     save_path: Optional[Path] = None,
-    chart_type: str = 'bar'
+    chart_type: str = 'bar',
+    profile: Optional[str] = None
 ) -> None:
     """
     Create a chart showing revenue by product category.
@@ -216,6 +283,8 @@ def plot_revenue_by_category(
         category_revenue_df: DataFrame with category revenue metrics
         save_path: Optional path to save the chart
         chart_type: Type of chart - 'bar' or 'pie'
+        profile: Render profile ('publication' or 'draft'); defaults to the one
+                 set by setup_plot_style
 
     Example:
         >>> plot_revenue_by_category(category_revenue, chart_type='bar')
@@ -269,18 +338,20 @@ def plot_revenue_by_category(
         ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'¥{x/1000000:.1f}M'))
         ax.grid(True, alpha=0.3, axis='x')
 
-    plt.tight_layout()
+    _apply_layout(profile)
 
     if save_path:
-        plt.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+        _save_chart(save_path, profile)
 
     plt.show()
 
 
+@cached_chart
 def plot_day_of_week_revenue(
     dow_revenue_df: pd.DataFrame,
     save_path: Optional[Path] = None,
-    highlight_weekend: bool = True
+    highlight_weekend: bool = True,
+    profile: Optional[str] = None
 ) -> None:
     """
     Create a bar chart showing revenue by day of week.
@@ -289,6 +360,8 @@ def plot_day_of_week_revenue(
         dow_revenue_df: DataFrame with day-of-week revenue metrics
         save_path: Optional path to save the chart
         highlight_weekend: If True, colors weekend bars differently
+        profile: Render profile ('publication' or 'draft'); defaults to the one
+                 set by setup_plot_style
 
     Example:
         >>> plot_day_of_week_revenue(dow_revenue, highlight_weekend=True)
@@ -339,17 +412,19 @@ def plot_day_of_week_revenue(
         ax.legend(handles=legend_elements, loc='upper left')
 
     plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
+    _apply_layout(profile)
 
     if save_path:
-        plt.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+        _save_chart(save_path, profile)
 
     plt.show()
 
 
+@cached_chart
 def plot_weekend_vs_weekday(
     weekend_comparison_df: pd.DataFrame,
-    save_path: Optional[Path] = None
+    save_path: Optional[Path] = None,
+    profile: Optional[str] = None
 ) -> None:
     """
     Create a comparison chart showing weekend vs weekday performance.
@@ -357,6 +432,8 @@ def plot_weekend_vs_weekday(
     Args:
         weekend_comparison_df: DataFrame with weekend vs weekday metrics
         save_path: Optional path to save the chart
+        profile: Render profile ('publication' or 'draft'); defaults to the one
+                 set by setup_plot_style
 
     Example:
         >>> plot_weekend_vs_weekday(comparison_df)
@@ -417,18 +494,20 @@ def plot_weekend_vs_weekday(
     ax2.grid(True, alpha=0.3, axis='y')
 
     fig.suptitle('Weekend vs Weekday Performance - January 2024', fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
+    _apply_layout(profile)
 
     if save_path:
-        plt.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+        _save_chart(save_path, profile)
 
     plt.show()
 
 
+@cached_chart
 def plot_category_mix_by_store(
     category_mix_df: pd.DataFrame,
     save_path: Optional[Path] = None,
-    as_percentage: bool = True
+    as_percentage: bool = True,
+    profile: Optional[str] = None
 ) -> None:
     """
     Create a stacked bar chart showing category mix by store.
@@ -437,6 +516,8 @@ def plot_category_mix_by_store(
         category_mix_df: DataFrame with stores as index and categories as columns
         save_path: Optional path to save the chart
         as_percentage: If True, shows percentage; if False, shows absolute values
+        profile: Render profile ('publication' or 'draft'); defaults to the one
+                 set by setup_plot_style
 
     Example:
         >>> plot_category_mix_by_store(category_mix, as_percentage=True)
@@ -475,18 +556,20 @@ def plot_category_mix_by_store(
     if xlim:
         ax.set_xlim(0, xlim)
 
-    plt.tight_layout()
+    _apply_layout(profile)
 
     if save_path:
-        plt.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+        _save_chart(save_path, profile)
 
     plt.show()
 
 
+@cached_chart
 def plot_top_bottom_stores(
     store_revenue_df: pd.DataFrame,
     save_path: Optional[Path] = None,
-    num_stores: int = 4
+    num_stores: int = 4,
+    profile: Optional[str] = None
 ) -> None:
     """
     Create side-by-side comparison of top and bottom performing stores.
@@ -495,6 +578,8 @@ def plot_top_bottom_stores(
         store_revenue_df: DataFrame with store revenue metrics
         save_path: Optional path to save the chart
         num_stores: Number of top and bottom stores to display
+        profile: Render profile ('publication' or 'draft'); defaults to the one
+                 set by setup_plot_style
 
     Example:
         >>> plot_top_bottom_stores(store_revenue, num_stores=4)
@@ -564,9 +649,9 @@ def plot_top_bottom_stores(
     ax2.invert_yaxis()
 
     fig.suptitle('Store Performance Benchmarking - January 2024', fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
+    _apply_layout(profile)
 
     if save_path:
-        plt.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+        _save_chart(save_path, profile)
 
     plt.show()
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Report Build Orchestrator
+=========================
+
+Make-style build of the whole project: processed data, EDA charts and
+summary tables, the Markdown report and every report format.
+
+Each step declares the files it reads (inputs) and writes (outputs):
+- Dependencies follow from the declarations: a step runs after the steps
+  that produce its inputs
+- A step is skipped when the content of its inputs (and its command) is
+  unchanged since its last successful run and its outputs exist
+- Independent steps run in parallel (e.g. Word, detailed PDF and pptx)
+- A failed step blocks only the steps that depend on it
+
+Input fingerprints are SHA-256 hashes of file content, so a step whose
+inputs were rewritten with identical bytes (e.g. up-to-date charts) does not
+trigger its dependents. Build state and step logs are kept in .build/.
+
+Usage:
+    python src/build.py                   # Build everything that is out of date
+    python src/build.py word pptx         # Build these steps (and what they need)
+    python src/build.py --dry-run         # Show what would run
+    python src/build.py --force --jobs 4  # Rebuild everything, 4 steps at a time
+    python src/build.py --list            # Show the steps and their dependencies
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+
+
+# Paths
+PROJECT_ROOT = Path(__file__).parent.parent
+BUILD_DIR = PROJECT_ROOT / '.build'
+STATE_PATH = BUILD_DIR / 'build_state.json'
+LOG_DIR = BUILD_DIR / 'logs'
+
+PYTHON = sys.executable
+
+CHART_FILES = [
+    'daily_revenue_trend.png', 'revenue_by_store.png', 'revenue_by_region.png',
+    'revenue_by_category.png', 'revenue_by_day_of_week.png', 'weekend_vs_weekday.png',
+    'category_mix_by_store.png', 'top_bottom_stores.png',
+]
+CHARTS = [f'reports/assets/{name}' for name in CHART_FILES]
+PROCESSED = ['data/processed/sales_clean.csv', 'data/processed/stores.csv', 'data/processed/products.csv']
+# Written with the sales CSV: zone maps, store offset index, revenue cube
+PROCESSED_INDEXES = [
+    'data/processed/sales_clean_zones.json',
+    'data/processed/sales_clean_offsets.json',
+    'data/processed/revenue_cube.npz',
+]
+# data_pipeline modules the EDA imports (metrics, chunked metrics, query)
+EDA_DATA_MODULES = [
+    'src/data_pipeline/artifacts.py',
+    'src/data_pipeline/revenue_cube.py',
+    'src/data_pipeline/store_offsets.py',
+    'src/data_pipeline/zone_maps.py',
+]
+SUMMARIES = [
+    'reports/store_performance_summary.csv',
+    'reports/region_performance_summary.csv',
+    'reports/category_performance_summary.csv',
+]
+REPORT_MARKDOWN = 'reports/analysis_report.md'
+MARKDOWN_TREE = 'src/reporting/markdown_document.py'
+IMAGE_ASSETS = 'src/reporting/image_assets.py'
+
+# Paths are relative to the project root; inputs may be glob patterns
+BUILD_STEPS = {
+    'processed_data': {
+        'command': [PYTHON, 'src/data_pipeline/generate_processed_data.py'],
+        'inputs': ['data/raw/*', 'src/data_pipeline/*.py'],
+        'outputs': PROCESSED + PROCESSED_INDEXES,
+    },
+    'eda': {
+        'command': [PYTHON, 'src/analysis/run_complete_eda.py'],
+        'inputs': PROCESSED + PROCESSED_INDEXES + EDA_DATA_MODULES + ['src/analysis/*.py'],
+        'outputs': SUMMARIES + CHARTS,
+    },
+    'report_markdown': {
+        'command': [PYTHON, 'src/analysis/create_updated_report.py'],
+        'inputs': SUMMARIES + ['src/analysis/create_updated_report.py'],
+        'outputs': [REPORT_MARKDOWN],
+    },
+    'word': {
+        'command': [PYTHON, 'src/reporting/md_to_word.py'],
+        'inputs': [REPORT_MARKDOWN, MARKDOWN_TREE, IMAGE_ASSETS, 'src/reporting/md_to_word.py'] + CHARTS,
+        'outputs': ['reports/detailed_report.docx'],
+    },
+    'detailed_pdf': {
+        'command': [PYTHON, 'src/reporting/md_to_pdf_detailed.py'],
+        'inputs': [REPORT_MARKDOWN, MARKDOWN_TREE, IMAGE_ASSETS, 'src/reporting/md_to_pdf_detailed.py',
+                   'src/reporting/pdf_sections.py', 'src/reporting/templates/detailed_report.css'] + CHARTS,
+        'outputs': ['reports/detailed_report.pdf'],
+    },
+    'slides_pdf': {
+        'command': [PYTHON, 'src/reporting/md_to_pdf_slides.py'],
+        'inputs': [REPORT_MARKDOWN, MARKDOWN_TREE, IMAGE_ASSETS, 'src/reporting/md_to_pdf_slides.py',
+                   'src/reporting/pdf_sections.py', 'src/reporting/templates/slides.css'] + CHARTS,
+        'outputs': ['reports/executive_slides.pdf'],
+    },
+    'pptx': {
+        'command': [PYTHON, 'src/reporting/md_to_pptx.py'],
+        'inputs': [REPORT_MARKDOWN, MARKDOWN_TREE, IMAGE_ASSETS, 'src/reporting/md_to_pptx.py',
+                   'data/processed/sales_clean.csv'] + CHARTS,
+        'outputs': ['reports/executive_slides.pptx'],
+    },
+    'pptx_pdf': {
+        'command': [PYTHON, 'src/reporting/pptx_to_pdf.py',
+                    '--output', 'reports/executive_slides_from_pptx.pdf'],
+        'inputs': ['reports/executive_slides.pptx', 'src/reporting/pptx_to_pdf.py',
+                   'src/reporting/pdf_sections.py'],
+        'outputs': ['reports/executive_slides_from_pptx.pdf'],
+    },
+}
+
+# Step results
+BUILT = 'built'
+UP_TO_DATE = 'up to date'
+WOULD_BUILD = 'would build'
+FAILED = 'failed'
+BLOCKED = 'blocked'
+
+
+# ============================================
+# DEPENDENCY GRAPH
+# ============================================
+
+def build_graph(steps):
+    """
+    Derive step dependencies from the declared inputs and outputs.
+
+    Args:
+        steps: Mapping of step name -> {'command', 'inputs', 'outputs'}
+
+    Returns:
+        Dictionary mapping each step to the set of steps it depends on
+
+    Raises:
+        ValueError: If two steps declare the same output or the graph has a cycle
+    """
+    producers = {}
+    for name, step in steps.items():
+        for output in step['outputs']:
+            if output in producers:
+                raise ValueError(f"'{output}' is an output of both '{producers[output]}' and '{name}'")
+            producers[output] = name
+
+    graph = {}
+    for name, step in steps.items():
+        graph[name] = {
+            producer
+            for pattern in step['inputs']
+            for output, producer in producers.items()
+            if producer != name and fnmatch.fnmatch(output, pattern)
+        }
+
+    topological_order(graph)  # Raises on cycles
+    return graph
+
+
+def topological_order(graph, targets=None):
+    """
+    Order steps so each comes after its dependencies.
+
+    Args:
+        graph: Dependency graph (from build_graph)
+        targets: Optional step names; only these and their dependencies are returned
+
+    Returns:
+        List of step names
+    """
+    order = []
+    visiting = set()
+
+    def visit(name, path):
+        if name in order:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+        if name not in graph:
+            raise ValueError(f"Unknown build step '{name}' (steps: {', '.join(graph)})")
+        visiting.add(name)
+        for dependency in sorted(graph[name]):
+            visit(dependency, path + [name])
+        visiting.discard(name)
+        order.append(name)
+
+    for name in (targets or graph):
+        visit(name, [])
+    return order
+
+
+# ============================================
+# CHANGE DETECTION
+# ============================================
+
+def load_state(state_path):
+    """Load the build state (step signatures and file hash cache)."""
+    state_path = Path(state_path)
+    if state_path.exists():
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return {'steps': state.get('steps', {}), 'files': state.get('files', {})}
+        except (OSError, ValueError):
+            pass
+    return {'steps': {}, 'files': {}}
+
+
+def save_state(state_path, state):
+    """Write the build state atomically."""
+    state_path = Path(state_path)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+
+def file_hash(path, root, file_cache):
+    """
+    Return the SHA-256 of a file, re-hashing only when its size or mtime changed.
+
+    Args:
+        path: File path
+        root: Project root (cache keys are relative paths)
+        file_cache: state['files'] mapping, updated in place
+    """
+    stat = path.stat()
+    key = path.relative_to(root).as_posix()
+    cached = file_cache.get(key)
+    if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+        return cached['sha256']
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    file_cache[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest.hexdigest()}
+    return digest.hexdigest()
+
+
+def resolve_inputs(step, root):
+    """
+    Expand a step's input patterns to existing files.
+
+    Raises:
+        FileNotFoundError: If a plain (non-glob) input does not exist
+    """
+    root = Path(root)
+    files = set()
+    for pattern in step['inputs']:
+        if glob.has_magic(pattern):
+            files.update(path for path in root.glob(pattern) if path.is_file())
+        elif (root / pattern).is_file():
+            files.add(root / pattern)
+        else:
+            raise FileNotFoundError(f"Missing input: {pattern}")
+    return sorted(files)
+
+
+def step_signature(step, root, file_cache):
+    """
+    Fingerprint a step: its command and the content of all its inputs.
+
+    Args:
+        step: Step definition
+        root: Project root
+        file_cache: state['files'] mapping
+
+    Returns:
+        Hex SHA-256 signature
+    """
+    root = Path(root)
+    digest = hashlib.sha256(json.dumps(step['command'][1:]).encode())
+    for path in resolve_inputs(step, root):
+        digest.update(f"{path.relative_to(root).as_posix()}={file_hash(path, root, file_cache)};".encode())
+    return digest.hexdigest()
+
+
+def missing_outputs(step, root):
+    """Return the declared outputs that do not exist."""
+    return [output for output in step['outputs'] if not (Path(root) / output).exists()]
+
+
+# ============================================
+# EXECUTION
+# ============================================
+
+def run_step(name, step, root, log_dir):
+    """
+    Run one step as a subprocess, writing its output to <log_dir>/<name>.log.
+
+    Returns:
+        Tuple of (return code, seconds, log path)
+    """
+    log_path = Path(log_dir) / f'{name}.log'
+    env = dict(os.environ, MPLBACKEND='Agg', PYTHONIOENCODING='utf-8')
+
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        returncode = subprocess.call(step['command'], cwd=str(root), env=env,
+                                     stdout=log, stderr=subprocess.STDOUT)
+    return returncode, time.perf_counter() - start, log_path
+
+
+def print_step(name, status, detail=''):
+    """Default build progress reporter."""
+    marks = {BUILT: '✓', UP_TO_DATE: '-', WOULD_BUILD: '*', FAILED: '✗', BLOCKED: '!'}
+    print(f"  {marks.get(status, ' ')} {name:<16} {status}{'  ' + detail if detail else ''}")
+
+
+def run_build(
+    steps=BUILD_STEPS,
+    targets=None,
+    root=PROJECT_ROOT,
+    state_path=STATE_PATH,
+    log_dir=LOG_DIR,
+    max_jobs=None,
+    force=False,
+    dry_run=False,
+    report=print_step
+):
+    """
+    Build the selected steps, skipping up-to-date ones and running
+    independent steps in parallel.
+
+    Args:
+        steps: Step definitions (default: BUILD_STEPS)
+        targets: Step names to build with their dependencies (default: all)
+        root: Project root the paths and commands are relative to
+        state_path: Build state JSON file
+        log_dir: Directory for per-step logs
+        max_jobs: Steps running at once (defaults to the CPU count)
+        force: Rebuild even if up to date
+        dry_run: Only report which steps would run
+        report: Callback(name, status, detail) or None
+
+    Returns:
+        Dictionary mapping step name to its status
+    """
+    root = Path(root)
+    graph = build_graph(steps)
+    order = topological_order(graph, targets)
+    state = load_state(state_path)
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+    max_jobs = max(1, max_jobs or os.cpu_count() or 1)
+
+    status = {}
+    pending = list(order)
+    running = {}
+
+    def finish(name, result, detail=''):
+        status[name] = result
+        if report is not None:
+            report(name, result, detail)
+
+    with ThreadPoolExecutor(max_workers=max_jobs) as executor:
+        while pending or running:
+            for name in list(pending):
+                dependencies = [status.get(dependency) for dependency in graph[name]]
+                if any(result in (FAILED, BLOCKED) for result in dependencies):
+                    pending.remove(name)
+                    finish(name, BLOCKED, 'a dependency failed')
+                    continue
+                if any(result is None for result in dependencies) or len(running) >= max_jobs:
+                    continue
+
+                pending.remove(name)
+                step = steps[name]
+                try:
+                    signature = step_signature(step, root, state['files'])
+                except FileNotFoundError as e:
+                    finish(name, FAILED, str(e))
+                    continue
+
+                up_to_date = (
+                    not force
+                    and WOULD_BUILD not in dependencies
+                    and state['steps'].get(name, {}).get('signature') == signature
+                    and not missing_outputs(step, root)
+                )
+                if up_to_date:
+                    finish(name, UP_TO_DATE)
+                elif dry_run:
+                    finish(name, WOULD_BUILD)
+                else:
+                    future = executor.submit(run_step, name, step, root, log_dir)
+                    running[future] = (name, signature)
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, signature = running.pop(future)
+                returncode, seconds, log_path = future.result()
+                missing = missing_outputs(steps[name], root)
+                if returncode != 0:
+                    finish(name, FAILED, f"exit code {returncode}, see {log_path}")
+                elif missing:
+                    finish(name, FAILED, f"did not create {', '.join(missing)}")
+                else:
+                    # Hash the new outputs now so dependents see their content
+                    for output in steps[name]['outputs']:
+                        file_hash(root / output, root, state['files'])
+                    state['steps'][name] = {'signature': signature, 'seconds': round(seconds, 3)}
+                    save_state(state_path, state)
+                    finish(name, BUILT, f"{seconds:.1f}s")
+
+    if not dry_run:
+        save_state(state_path, state)
+    return status
+
+
+def main(argv=None):
+    """
+    Main execution function.
+    """
+    parser = argparse.ArgumentParser(description='Build data, charts and reports (skips up-to-date steps)')
+    parser.add_argument('targets', nargs='*', help=f"Steps to build (default: all): {', '.join(BUILD_STEPS)}")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Steps run in parallel (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Rebuild even if up to date')
+    parser.add_argument('--dry-run', '-n', action='store_true', help='Only show what would run')
+    parser.add_argument('--list', action='store_true', help='List steps and dependencies')
+    args = parser.parse_args(argv)
+
+    graph = build_graph(BUILD_STEPS)
+    if args.list:
+        for name in topological_order(graph):
+            print(f"{name:<16} <- {', '.join(sorted(graph[name])) or '(sources only)'}")
+        return True
+
+    print("=" * 60)
+    print("REPORT BUILD")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    status = run_build(targets=args.targets or None, max_jobs=args.jobs,
+                       force=args.force, dry_run=args.dry_run)
+
+    counts = {result: list(status.values()).count(result) for result in dict.fromkeys(status.values())}
+    print(f"\n{', '.join(f'{count} {result}' for result, count in counts.items())} "
+          f"({time.perf_counter() - start:.1f}s)")
+    return not any(result in (FAILED, BLOCKED) for result in status.values())
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
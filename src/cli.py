@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Project Command Line
+====================
+
+One entry point for every step of the project:
+
+    python src/cli.py process          # Raw store files -> data/processed/
+    python src/cli.py validate         # Re-check data/processed/ only
+    python src/cli.py query --regions Kanto --start 2024-01-08   # Filtered KPIs + query plan
+    python src/cli.py eda --draft      # Metrics, summary tables and charts
+    python src/cli.py report           # reports/analysis_report.md
+    python src/cli.py docx | pptx | pdf | slides | pptx-pdf
+    python src/cli.py packs --by region
+    python src/cli.py build -n         # Incremental build (src/build.py)
+    python src/cli.py full-build       # One-process build (src/full_build.py)
+    python src/cli.py synthetic --stores 50
+    python src/cli.py serve-metrics    # JSON metrics API (src/metrics_service.py)
+    python src/cli.py daemon serve &   # Warm daemon (src/report_daemon.py)
+    python src/cli.py --daemon docx    # Run a command in the warm daemon
+
+Commands are dispatched to the existing scripts, and a command's options are
+passed through to its script (e.g. `cli.py build --help` shows build.py's
+options). Nothing heavy is imported here: pandas, matplotlib, seaborn,
+WeasyPrint, python-docx and python-pptx are loaded by the command that needs
+them, so `--help` answers at once and `validate` only pays for pandas.
+With --daemon the command runs in the warm daemon instead, and this process
+only sends the request and prints the output.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import argparse
+import importlib
+import os
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+# Paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+DAEMON_SOCKET = PROJECT_ROOT / '.build' / 'daemon.sock'  # report_daemon.SOCKET_PATH
+
+
+# ============================================
+# COMMANDS
+# ============================================
+
+def run_process(args, argv):
+    """Run the data pipeline."""
+    from data_pipeline.generate_processed_data import main
+    return main(trace_memory=not args.no_trace_memory, sqlite=args.sqlite)
+
+
+def run_validate(args, argv):
+    """Validate the processed datasets without rebuilding them."""
+    from data_pipeline.validator import validate_processed_data
+    all_valid, messages = validate_processed_data(args.processed_dir)
+    failed = sum(message.startswith('✗') for message in messages)
+    print(f"{'✓' if all_valid else '✗'} {args.processed_dir}: "
+          f"{len(messages) - failed} of {len(messages)} checks passed")
+    return all_valid
+
+
+def run_query(args, argv):
+    """Print KPIs for a filtered subset of the sales and the row groups read."""
+    import pandas as pd
+    from analysis.metrics import calculate_filtered_metrics
+    from data_pipeline.zone_maps import format_query_plan
+
+    stores_df = pd.read_csv(args.processed_dir / 'stores.csv')
+    try:
+        results = calculate_filtered_metrics(
+            args.processed_dir / 'sales_clean.csv', stores_df, args.start, args.end,
+            stores=args.stores, regions=args.regions, categories=args.categories
+        )
+    except ValueError as e:
+        print(f"✗ {e}")
+        return False
+
+    kpis = results['key_metrics']
+    print(f"Revenue ¥{kpis['total_revenue']:,.0f} | {kpis['total_transactions']:,} transactions | "
+          f"{kpis['num_stores']} stores | {kpis['num_days']} days")
+    print(results['revenue_by_store'][['store_id', 'store_name', 'total_revenue', 'revenue_share_pct']]
+          .to_string(index=False))
+    print(f"\nQUERY PLAN\n{format_query_plan()}")
+    return True
+
+
+def run_eda(args, argv):
+    """Run the complete EDA."""
+    from analysis.run_complete_eda import run_from_command_line
+    run_from_command_line(argv)
+
+
+def run_report(args, argv):
+    """Write the Markdown report from the summary tables."""
+    from analysis.create_updated_report import main
+    main()
+
+
+def run_daemon(args, argv):
+    """Serve, stop or query the warm report daemon."""
+    import report_daemon
+    if args.action == 'serve':
+        return report_daemon.serve(args.socket)
+
+    control = 'shutdown' if args.action == 'stop' else 'ping'
+    try:
+        response = report_daemon.send_request({'control': control}, args.socket, timeout=10)
+    except OSError:
+        print(f"No daemon running on {args.socket}")
+        return args.action == 'stop'
+
+    if args.action == 'status':
+        print(f"Daemon pid {response['pid']}: up {response['uptime']:.0f}s, "
+              f"{response['requests_served']} requests served")
+    print(response['output'], end='')
+    return True
+
+
+def send_to_daemon(argv, socket_path):
+    """Run a command (argv as given to cli.py) in the warm daemon."""
+    import report_daemon
+    try:
+        response = report_daemon.send_request(
+            {'command': argv[0], 'argv': argv[1:], 'cwd': os.getcwd()}, socket_path
+        )
+    except OSError:
+        print(f"No daemon running on {socket_path}; start one with: python src/cli.py daemon serve",
+              file=sys.stderr)
+        return 1
+
+    print(response['output'], end='')
+    return response['status']
+
+
+def delegate(module_name):
+    """Return a command that runs module_name.main, passing the remaining options through."""
+    def run(args, argv):
+        return importlib.import_module(module_name).main(argv)
+    return run
+
+
+def script(module_name):
+    """Return a command that runs module_name.main (a script without options)."""
+    def run(args, argv):
+        return importlib.import_module(module_name).main()
+    return run
+
+
+# Command -> (help, handler, passes options through)
+COMMANDS = {
+    'process': ('Clean the raw store files into data/processed/', run_process, False),
+    'validate': ('Validate data/processed/ without rebuilding it', run_validate, False),
+    'query': ('KPIs for a date/store/region/category subset (zone-map reads)', run_query, False),
+    'eda': ('Metrics, summary tables and charts', run_eda, True),
+    'report': ('Write reports/analysis_report.md', run_report, False),
+    'docx': ('Word report', script('reporting.md_to_word'), False),
+    'pptx': ('PowerPoint slides', script('reporting.md_to_pptx'), False),
+    'pdf': ('Detailed PDF report', delegate('reporting.md_to_pdf_detailed'), True),
+    'slides': ('Executive slides PDF', script('reporting.md_to_pdf_slides'), False),
+    'pptx-pdf': ('PowerPoint slides to PDF', delegate('reporting.pptx_to_pdf'), True),
+    'packs': ('Per-store or per-region report packs', delegate('reporting.report_packs'), True),
+    'build': ('Incremental build of everything out of date', delegate('build'), True),
+    'full-build': ('Build everything in one process', delegate('full_build'), True),
+    'synthetic': ('Generate synthetic raw store files', delegate('data_pipeline.synthetic_data'), True),
+    'serve-metrics': ('Serve the sales metrics as JSON over HTTP', delegate('metrics_service'), True),
+    'daemon': ('Serve, stop or query the warm report daemon', run_daemon, False),
+}
+
+
+def build_parser():
+    """
+    Create the argument parser with one subcommand per entry in COMMANDS.
+
+    Returns:
+        argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog='cli.py', description='Multi-store sales analysis: data, charts and reports'
+    )
+    parser.add_argument('--daemon', action='store_true',
+                        help='Run the command in the warm daemon (see: daemon serve)')
+    parser.add_argument('--socket', type=Path, default=DAEMON_SOCKET, help='Daemon socket')
+    subparsers = parser.add_subparsers(dest='command', metavar='command', required=True)
+
+    for name, (help_text, handler, passes_options) in COMMANDS.items():
+        # Pass-through commands leave --help to the script they run
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text,
+                                          add_help=not passes_options)
+        subparser.set_defaults(handler=handler, passes_options=passes_options)
+
+    subparsers.choices['process'].add_argument(
+        '--no-trace-memory', action='store_true', help='Skip peak memory tracing (faster)'
+    )
+    subparsers.choices['process'].add_argument(
+        '--sqlite', action='store_true', help='Also write the indexed SQLite mirror (sales.sqlite)'
+    )
+    subparsers.choices['validate'].add_argument(
+        '--processed-dir', type=Path, default=PROCESSED_DIR, help='Directory with the processed CSVs'
+    )
+    query = subparsers.choices['query']
+    query.add_argument('--start', help='First date (YYYY-MM-DD, inclusive)')
+    query.add_argument('--end', help='Last date (YYYY-MM-DD, inclusive)')
+    query.add_argument('--stores', nargs='+', help='Store IDs')
+    query.add_argument('--regions', nargs='+', help='Regions (e.g. Kanto)')
+    query.add_argument('--categories', nargs='+', help='Product categories')
+    query.add_argument(
+        '--processed-dir', type=Path, default=PROCESSED_DIR, help='Directory with the processed CSVs'
+    )
+    subparsers.choices['daemon'].add_argument(
+        'action', nargs='?', choices=['serve', 'stop', 'status'], default='status'
+    )
+    return parser
+
+
+def main(argv=None):
+    """
+    Parse the command and run it.
+
+    Args:
+        argv: Arguments (defaults to sys.argv[1:])
+
+    Returns:
+        int: Exit status
+    """
+    parser = build_parser()
+    args, remaining = parser.parse_known_args(argv)
+    if remaining and not args.passes_options:
+        parser.error(f"unrecognized arguments: {' '.join(remaining)}")
+
+    if args.daemon and args.command != 'daemon':
+        # The command and its options, as the daemon's cli.main expects them
+        argv = sys.argv[1:] if argv is None else list(argv)
+        command_index = argv.index(args.command)
+        return send_to_daemon(argv[command_index:], args.socket)
+
+    result = args.handler(args, remaining)
+    return 1 if result is False else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Artifact Writer Module
+
+This module writes pipeline output files (processed datasets, summary
+tables, the Markdown report) on background threads, so in-memory runs hand
+DataFrames straight to the next stage while the files are written off the
+critical path.
+
+Every file is written to a temporary name and moved into place, so readers
+never see a partial artifact. Writes run inline when no writer is given.
+
+CSV artifacts read back by later steps go through read_csv_cached, which
+keeps the parsed DataFrame for as long as the file is unchanged. In a
+one-off script this is a plain read; in a long-lived process (the report
+daemon) repeated builds reuse the loaded datasets.
+
+Usage:
+    with ArtifactWriter() as writer:
+        write_csv(sales_clean, processed_dir / 'sales_clean.csv', writer)
+        ...  # continue with sales_clean in memory
+    # all files are on disk here (errors are raised on exit)
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+
+# Parsed CSV artifacts: (path, read options) -> (file signature, DataFrame)
+_CSV_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], pd.DataFrame]] = {}
+
+
+def write_atomic(path: Path, write: Callable[[Path], None]) -> Path:
+    """
+    Write a file through a temporary path and move it into place.
+
+    Args:
+        path: Final file path
+        write: Function writing the content to the path it is given
+
+    Returns:
+        The final path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return path
+
+
+class ArtifactWriter:
+    """
+    Writes files on a small thread pool and collects their timings.
+
+    Submitted DataFrames and strings are written as they are when the write
+    runs: callers hand over objects they no longer modify (pipeline outputs
+    are never mutated after they are produced).
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max_workers
+        self.timings: Dict[str, float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures = []
+
+    def __enter__(self) -> 'ArtifactWriter':
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='artifact-writer')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None:
+                self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def submit(self, path: Path, write: Callable[[Path], None]) -> None:
+        """Queue an atomic write of path (see write_atomic)."""
+        def run():
+            start = time.perf_counter()
+            write_atomic(path, write)
+            self.timings[str(path)] = time.perf_counter() - start
+
+        self._futures.append(self._executor.submit(run))
+
+    def wait(self) -> List[str]:
+        """
+        Block until all queued writes are done.
+
+        Returns:
+            Paths written so far
+
+        Raises:
+            The first error raised by a write
+        """
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+        return list(self.timings)
+
+
+def write_csv(df: pd.DataFrame, path: Path, writer: Optional[ArtifactWriter] = None, **kwargs) -> None:
+    """
+    Write a DataFrame as UTF-8 CSV (index off by default), in the background if a writer is given.
+
+    Args:
+        df: DataFrame to write
+        path: Output CSV path
+        writer: Active ArtifactWriter, or None to write now
+        **kwargs: Extra DataFrame.to_csv arguments
+    """
+    kwargs.setdefault('index', False)
+    kwargs.setdefault('encoding', 'utf-8')
+
+    def write(tmp_path):
+        df.to_csv(tmp_path, **kwargs)
+
+    if writer is None:
+        write_atomic(path, write)
+    else:
+        writer.submit(path, write)
+
+
+def write_text(text: str, path: Path, writer: Optional[ArtifactWriter] = None) -> None:
+    """
+    Write a UTF-8 text file, in the background if a writer is given.
+
+    Args:
+        text: File content
+        path: Output path
+        writer: Active ArtifactWriter, or None to write now
+    """
+    def write(tmp_path):
+        Path(tmp_path).write_text(text, encoding='utf-8')
+
+    if writer is None:
+        write_atomic(path, write)
+    else:
+        writer.submit(path, write)
+
+
+def read_csv_cached(path: Path, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV artifact, reusing the DataFrame parsed earlier in this process.
+
+    The cached frame is returned while the file's modification time and size
+    are unchanged. Callers share the returned DataFrame and must not modify
+    it (take a copy first).
+
+    Args:
+        path: CSV file path
+        **kwargs: pandas.read_csv arguments (part of the cache key)
+
+    Returns:
+        The parsed DataFrame
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = (str(path), repr(sorted(kwargs.items())))
+
+    cached = _CSV_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    df = pd.read_csv(path, **kwargs)
+    _CSV_CACHE[key] = (signature, df)
+    return df
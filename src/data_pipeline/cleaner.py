@@ -10,15 +10,28 @@ Date: October 2025
 
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Callable, Dict, List, Tuple
+from functools import partial
+from pathlib import Path
 import logging
 import re
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_pipeline.profiler import profile_stage
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Analysis period (rows outside this window are removed during cleaning)
+ANALYSIS_START_DATE = '2024-01-01'
+ANALYSIS_END_DATE = '2024-01-31'
+
+
 # Column name mapping dictionary
 COLUMN_MAPPINGS = {
     # Date columns
@@ -81,6 +94,7 @@ CATEGORY_MAPPINGS = {
 }
 
 
+@profile_stage
 def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Standardize column names across different file formats.
@@ -131,6 +145,7 @@ def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     return df_clean
 
 
+@profile_stage
 def extract_core_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Extract only the core columns needed for analysis.
@@ -157,12 +172,19 @@ def extract_core_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df_core
 
 
-def clean_date_column(df: pd.DataFrame) -> pd.DataFrame:
+@profile_stage
+def clean_date_column(
+    df: pd.DataFrame,
+    start_date: str = ANALYSIS_START_DATE,
+    end_date: str = ANALYSIS_END_DATE
+) -> pd.DataFrame:
     """
     Clean and standardize date column.
 
     Args:
         df: DataFrame with 'date' column
+        start_date: First date of the analysis period (inclusive)
+        end_date: Last date of the analysis period (inclusive)
 
     Returns:
         DataFrame with cleaned date column
@@ -178,10 +200,10 @@ def clean_date_column(df: pd.DataFrame) -> pd.DataFrame:
         logger.warning(f"Removing {invalid_dates.sum()} rows with invalid dates")
         df_clean = df_clean[~invalid_dates]
 
-    # Filter to January 2024 only
+    # Filter to the analysis period (January 2024 by default)
     df_clean = df_clean[
-        (df_clean['date'] >= '2024-01-01') &
-        (df_clean['date'] <= '2024-01-31')
+        (df_clean['date'] >= start_date) &
+        (df_clean['date'] <= end_date)
     ]
 
     logger.info(f"Date range: {df_clean['date'].min()} to {df_clean['date'].max()}")
@@ -189,36 +211,60 @@ def clean_date_column(df: pd.DataFrame) -> pd.DataFrame:
     return df_clean
 
 
+def to_whole_units(values: pd.Series) -> pd.Series:
+    """
+    Parse numbers and round them to whole yen (half up, as on receipts).
+
+    Args:
+        values: Raw column (numbers or numeric strings)
+
+    Returns:
+        Nullable Int64 Series; unparseable and non-finite values are <NA>
+    """
+    numeric = pd.to_numeric(values, errors='coerce')
+    return np.floor(numeric.where(np.isfinite(numeric)) + 0.5).astype('Int64')
+
+
+@profile_stage
 def clean_sales_amount(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean sales amount column.
 
+    Money and quantities are kept as integers: sales amounts and unit prices
+    in whole yen, quantities in items. Sums over them are exact, and the
+    processed CSV stores them without a decimal part. Missing amounts are
+    computed from the unrounded unit price and quantity, then rounded once;
+    non-integral quantities are treated as missing, not rounded.
+
     Args:
         df: DataFrame with 'sales_amount' column
 
     Returns:
-        DataFrame with cleaned sales amounts
+        DataFrame with cleaned sales amounts (int64); unit_price and quantity,
+        if present, as nullable Int64
     """
     df_clean = df.copy()
 
     # Convert to numeric, handling various formats
-    df_clean['sales_amount'] = pd.to_numeric(
-        df_clean['sales_amount'],
-        errors='coerce'
-    )
+    sales_amount = pd.to_numeric(df_clean['sales_amount'], errors='coerce')
+
+    if 'quantity' in df_clean.columns:
+        quantity = pd.to_numeric(df_clean['quantity'], errors='coerce')
+        fractional = np.isfinite(quantity) & (quantity % 1 != 0)
+        if fractional.any():
+            logger.warning(f"Treating {fractional.sum()} non-integral quantities as missing")
+            quantity = quantity.mask(fractional)
+
+        # If sales_amount is missing but we have unit_price and quantity, calculate it
+        if 'unit_price' in df_clean.columns:
+            unit_price = pd.to_numeric(df_clean['unit_price'], errors='coerce')
+            sales_amount = sales_amount.fillna(unit_price * quantity)
+            df_clean['unit_price'] = to_whole_units(unit_price)
 
-    # If sales_amount is missing but we have unit_price and quantity, calculate it
-    if 'unit_price' in df_clean.columns and 'quantity' in df_clean.columns:
-        # Convert unit_price and quantity to numeric
-        df_clean['unit_price'] = pd.to_numeric(df_clean['unit_price'], errors='coerce')
-        df_clean['quantity'] = pd.to_numeric(df_clean['quantity'], errors='coerce')
+        # Quantities can be missing even where the sales amount is known
+        df_clean['quantity'] = to_whole_units(quantity)
 
-        # Calculate missing sales amounts
-        missing_sales = df_clean['sales_amount'].isna()
-        df_clean.loc[missing_sales, 'sales_amount'] = (
-            df_clean.loc[missing_sales, 'unit_price'] *
-            df_clean.loc[missing_sales, 'quantity']
-        )
+    df_clean['sales_amount'] = to_whole_units(sales_amount)
 
     # Remove rows where sales_amount is still missing or invalid
     valid_sales = df_clean['sales_amount'].notna() & (df_clean['sales_amount'] >= 0)
@@ -227,13 +273,14 @@ def clean_sales_amount(df: pd.DataFrame) -> pd.DataFrame:
     if removed > 0:
         logger.warning(f"Removing {removed} rows with invalid/missing sales amounts")
 
-    df_clean = df_clean[valid_sales]
+    df_clean = df_clean[valid_sales].astype({'sales_amount': 'int64'})
 
     logger.info(f"Sales amount range: ¥{df_clean['sales_amount'].min():,.0f} to ¥{df_clean['sales_amount'].max():,.0f}")
 
     return df_clean
 
 
+@profile_stage
 def standardize_product_categories(df: pd.DataFrame) -> pd.DataFrame:
     """
     Standardize product category names to English.
@@ -262,6 +309,7 @@ def standardize_product_categories(df: pd.DataFrame) -> pd.DataFrame:
     return df_clean
 
 
+@profile_stage
 def assign_store_ids(df: pd.DataFrame) -> pd.DataFrame:
     """
     Assign standardized store IDs (S01-S10).
@@ -282,6 +330,7 @@ def assign_store_ids(df: pd.DataFrame) -> pd.DataFrame:
     return df_clean
 
 
+@profile_stage
 def add_derived_fields(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add derived fields for analysis.
@@ -311,6 +360,7 @@ def add_derived_fields(df: pd.DataFrame) -> pd.DataFrame:
     return df_clean
 
 
+@profile_stage
 def create_transaction_ids(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create unique transaction IDs.
@@ -335,6 +385,7 @@ def create_transaction_ids(df: pd.DataFrame) -> pd.DataFrame:
     return df_clean
 
 
+@profile_stage
 def select_final_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Select and order final columns for output.
@@ -368,17 +419,92 @@ def select_final_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df_final
 
 
-def clean_raw_data(raw_df: pd.DataFrame) -> pd.DataFrame:
+@profile_stage
+def remove_duplicate_transactions(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Remove rows with duplicate transaction IDs.
+
+    Args:
+        df: DataFrame with 'transaction_id' column
+
+    Returns:
+        DataFrame with the first row kept for each transaction ID
+    """
+    original_len = len(df)
+    df_clean = df.drop_duplicates(subset=['transaction_id'])
+    duplicates_removed = original_len - len(df_clean)
+
+    if duplicates_removed > 0:
+        logger.warning(f"Removed {duplicates_removed} duplicate transaction IDs")
+
+    return df_clean
+
+
+@profile_stage
+def sort_by_store_and_date(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sort transactions by store and date, keeping the source order within a day.
+
+    Each store's rows (and each day within a store) become one contiguous
+    block, which the offset index (store_offsets.py) records.
+
+    Args:
+        df: DataFrame with 'store_id' and 'date' columns
+
+    Returns:
+        DataFrame sorted by (store_id, date) with a fresh RangeIndex
+    """
+    return df.sort_values(['store_id', 'date'], kind='stable').reset_index(drop=True)
+
+
+def get_cleaning_steps(
+    start_date: str = ANALYSIS_START_DATE,
+    end_date: str = ANALYSIS_END_DATE
+) -> List[Tuple[str, Callable[[pd.DataFrame], pd.DataFrame]]]:
+    """
+    Get the ordered cleaning steps applied by clean_raw_data.
+
+    Args:
+        start_date: First date of the analysis period (inclusive)
+        end_date: Last date of the analysis period (inclusive)
+
+    Returns:
+        List of (step name, function) tuples; each function takes and
+        returns a DataFrame
+    """
+    return [
+        ('standardize_column_names', standardize_column_names),
+        ('extract_core_columns', extract_core_columns),
+        ('clean_date_column', partial(clean_date_column, start_date=start_date, end_date=end_date)),
+        ('clean_sales_amount', clean_sales_amount),
+        ('standardize_product_categories', standardize_product_categories),
+        ('assign_store_ids', assign_store_ids),
+        ('add_derived_fields', add_derived_fields),
+        ('create_transaction_ids', create_transaction_ids),
+        ('select_final_columns', select_final_columns),
+        ('remove_duplicate_transactions', remove_duplicate_transactions),
+        ('sort_by_store_and_date', sort_by_store_and_date),
+    ]
+
+
+@profile_stage
+def clean_raw_data(
+    raw_df: pd.DataFrame,
+    start_date: str = ANALYSIS_START_DATE,
+    end_date: str = ANALYSIS_END_DATE
+) -> pd.DataFrame:
     """
     Main cleaning pipeline - orchestrates all cleaning steps.
 
     Args:
         raw_df: Raw combined DataFrame from loader
+        start_date: First date of the analysis period (inclusive)
+        end_date: Last date of the analysis period (inclusive)
 
     Returns:
         Cleaned DataFrame ready for analysis
 
-    Process:
+    Process (see get_cleaning_steps):
         1. Standardize column names
         2. Extract core columns
         3. Clean dates
@@ -388,46 +514,17 @@ def clean_raw_data(raw_df: pd.DataFrame) -> pd.DataFrame:
         7. Add derived fields
         8. Create transaction IDs
         9. Select final columns
+        10. Remove duplicate transactions
+        11. Sort by store and date
     """
     logger.info("=" * 80)
     logger.info("STARTING DATA CLEANING PIPELINE")
     logger.info("=" * 80)
     logger.info(f"Input rows: {len(raw_df)}")
 
-    # Step 1: Standardize column names
-    df = standardize_column_names(raw_df)
-
-    # Step 2: Extract core columns
-    df = extract_core_columns(df)
-
-    # Step 3: Clean dates
-    df = clean_date_column(df)
-
-    # Step 4: Clean sales amounts
-    df = clean_sales_amount(df)
-
-    # Step 5: Standardize categories
-    df = standardize_product_categories(df)
-
-    # Step 6: Assign store IDs
-    df = assign_store_ids(df)
-
-    # Step 7: Add derived fields
-    df = add_derived_fields(df)
-
-    # Step 8: Create transaction IDs
-    df = create_transaction_ids(df)
-
-    # Step 9: Select final columns
-    df_clean = select_final_columns(df)
-
-    # Remove duplicates
-    original_len = len(df_clean)
-    df_clean = df_clean.drop_duplicates(subset=['transaction_id'])
-    duplicates_removed = original_len - len(df_clean)
-
-    if duplicates_removed > 0:
-        logger.warning(f"Removed {duplicates_removed} duplicate transaction IDs")
+    df_clean = raw_df
+    for step_name, step in get_cleaning_steps(start_date, end_date):
+        df_clean = step(df_clean)
 
     logger.info("=" * 80)
     logger.info("DATA CLEANING COMPLETE")
@@ -438,6 +535,7 @@ def clean_raw_data(raw_df: pd.DataFrame) -> pd.DataFrame:
     return df_clean
 
 
+@profile_stage
 def create_store_metadata() -> pd.DataFrame:
     """
     Create store metadata table.
@@ -464,6 +562,7 @@ def create_store_metadata() -> pd.DataFrame:
     return stores_df
 
 
+@profile_stage
 def create_product_metadata(sales_df: pd.DataFrame) -> pd.DataFrame:
     """
     Create product category metadata table.
@@ -5,14 +5,17 @@ This script orchestrates the full data pipeline:
 1. Load raw data
 2. Clean and transform
 3. Validate quality
-4. Save processed datasets
+4. Save processed datasets (sales with per-row-group zone maps), the store
+   offset index and the revenue prefix-sum cube
+5. Optionally mirror them to an indexed SQLite database (--sqlite)
+6. Write a per-stage profile (time, rows, memory) of the run
 
 Author: Data Engineer
 Date: October 2025
 """
 
-import pandas as pd
 from pathlib import Path
+from typing import Dict, Optional
 import logging
 import sys
 
@@ -22,6 +25,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from data_pipeline.loader import load_all_store_files, combine_raw_data
 from data_pipeline.cleaner import clean_raw_data, create_store_metadata, create_product_metadata
 from data_pipeline.validator import validate_all, generate_data_quality_report
+from data_pipeline.profiler import StageProfiler
+from data_pipeline.artifacts import ArtifactWriter, write_csv
+from data_pipeline.revenue_cube import CUBE_FILENAME, build_revenue_cube, save_revenue_cube
+from data_pipeline.zone_maps import write_sales_with_zone_maps, zone_map_path
+from data_pipeline.store_offsets import OFFSETS_FILENAME, build_store_offsets, save_store_offsets
+from data_pipeline.sqlite_mirror import SQLITE_FILENAME, write_sqlite_mirror
 
 # Configure logging
 logging.basicConfig(
@@ -31,22 +40,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
+def build_processed_data(data_dir: Path) -> Optional[Dict[str, object]]:
     """
-    Main pipeline execution function.
-    """
-    # Define paths
-    project_root = Path(__file__).parent.parent.parent
-    data_dir = project_root / 'data' / 'raw'  # Look in data/raw/ subdirectory
-    processed_dir = project_root / 'data' / 'processed'
+    Load, clean and validate the raw store files in memory.
 
-    # Create processed directory if it doesn't exist
-    processed_dir.mkdir(exist_ok=True)
-
-    logger.info("=" * 80)
-    logger.info("STARTING DATA PIPELINE")
-    logger.info("=" * 80)
+    Args:
+        data_dir: Directory with raw store files
 
+    Returns:
+        Dictionary with sales_clean, stores, products (DataFrames),
+        store_offsets (offset index of sales_clean), quality_report and
+        raw_rows, or None if validation failed
+    """
     # Step 1: Load raw data
     logger.info("\nSTEP 1: Loading raw data...")
     all_data = load_all_store_files(str(data_dir))
@@ -70,7 +75,7 @@ def main():
 
     if not all_valid:
         logger.error("✗ Validation failed! Please review errors above.")
-        return False
+        return None
 
     logger.info("✓ All validations passed")
 
@@ -78,44 +83,152 @@ def main():
     logger.info("\nSTEP 5: Generating quality report...")
     report = generate_data_quality_report(sales_clean)
 
-    # Step 6: Save processed data
-    logger.info("\nSTEP 6: Saving processed datasets...")
+    return {
+        'sales_clean': sales_clean,
+        'stores': stores,
+        'products': products,
+        'store_offsets': build_store_offsets(sales_clean),
+        'quality_report': report,
+        'raw_rows': len(raw_combined),
+    }
+
+
+def save_processed_data(datasets: Dict[str, object], processed_dir: Path,
+                        writer: Optional[ArtifactWriter] = None) -> int:
+    """
+    Save the processed datasets as CSV files, with the offset index and revenue cube of the sales.
+
+    Args:
+        datasets: Dictionary from build_processed_data
+        processed_dir: Output directory for processed datasets
+        writer: Active ArtifactWriter to write in the background (None: write now)
+
+    Returns:
+        Number of rows written
+    """
+    # Sales in row groups with min/max statistics (data_pipeline.zone_maps)
+    path = processed_dir / 'sales_clean.csv'
+    write_sales_with_zone_maps(datasets['sales_clean'], path, writer)
+    logger.info(f"✓ {'Queued' if writer else 'Saved'}: {path} (+ {zone_map_path(path).name})")
+
+    for name in ('stores', 'products'):
+        path = processed_dir / f'{name}.csv'
+        write_csv(datasets[name], path, writer)
+        logger.info(f"✓ {'Queued' if writer else 'Saved'}: {path}")
 
-    # Save sales_clean.csv
-    sales_path = processed_dir / 'sales_clean.csv'
-    sales_clean.to_csv(sales_path, index=False, encoding='utf-8')
-    logger.info(f"✓ Saved: {sales_path}")
+    # Row range of every store and store-day in the sorted sales (data_pipeline.store_offsets)
+    path = processed_dir / OFFSETS_FILENAME
+    save_store_offsets(datasets['store_offsets'], path, writer)
+    logger.info(f"✓ {'Queued' if writer else 'Saved'}: {path}")
 
-    # Save stores.csv
-    stores_path = processed_dir / 'stores.csv'
-    stores.to_csv(stores_path, index=False, encoding='utf-8')
-    logger.info(f"✓ Saved: {stores_path}")
+    # Prefix sums for constant-time date-range queries (data_pipeline.revenue_cube)
+    path = processed_dir / CUBE_FILENAME
+    save_revenue_cube(build_revenue_cube(datasets['sales_clean']), path, writer)
+    logger.info(f"✓ {'Queued' if writer else 'Saved'}: {path}")
 
-    # Save products.csv
-    products_path = processed_dir / 'products.csv'
-    products.to_csv(products_path, index=False, encoding='utf-8')
-    logger.info(f"✓ Saved: {products_path}")
+    return sum(len(datasets[name]) for name in ('sales_clean', 'stores', 'products'))
+
+
+def log_pipeline_summary(datasets: Dict[str, object], processed_dir: Path) -> None:
+    """Log the files created and the data quality summary."""
+    sales_clean, report = datasets['sales_clean'], datasets['quality_report']
 
-    # Print final summary
     logger.info("\n" + "=" * 80)
     logger.info("PIPELINE COMPLETE")
     logger.info("=" * 80)
     logger.info(f"Processed datasets saved to: {processed_dir}")
     logger.info(f"\nFiles created:")
     logger.info(f"  1. sales_clean.csv   - {len(sales_clean):,} transactions")
-    logger.info(f"  2. stores.csv        - {len(stores)} stores")
-    logger.info(f"  3. products.csv      - {len(products)} categories")
+    logger.info(f"  2. stores.csv        - {len(datasets['stores'])} stores")
+    logger.info(f"  3. products.csv      - {len(datasets['products'])} categories")
+    logger.info(f"  4. {OFFSETS_FILENAME} - row ranges per store and store-day")
+    logger.info(f"  5. {CUBE_FILENAME}  - revenue prefix sums (store x category x day)")
     logger.info(f"\nData Quality:")
     logger.info(f"  - Date range: {report['date_range']['min']} to {report['date_range']['max']}")
     logger.info(f"  - Stores: {', '.join(report['stores']['ids'])}")
     logger.info(f"  - Total revenue: ¥{report['sales']['total']:,.0f}")
     logger.info(f"  - Average transaction: ¥{report['sales']['mean']:,.0f}")
-    logger.info(f"  - Data retention: {len(sales_clean) / len(raw_combined) * 100:.1f}%")
+    logger.info(f"  - Data retention: {len(sales_clean) / datasets['raw_rows'] * 100:.1f}%")
     logger.info("=" * 80)
 
+
+def run_pipeline(
+    data_dir: Path,
+    processed_dir: Path,
+    profiler: StageProfiler,
+    sqlite: bool = False
+) -> bool:
+    """
+    Run the pipeline steps, recording stages in the given profiler.
+
+    Args:
+        data_dir: Directory with raw store files
+        processed_dir: Output directory for processed datasets
+        profiler: Active StageProfiler (loader/cleaner/validator calls are
+                  recorded automatically; saving is recorded explicitly)
+        sqlite: Also write the SQLite mirror (processed_dir/sales.sqlite)
+
+    Returns:
+        True if validation passed and the datasets were saved
+    """
+    logger.info("=" * 80)
+    logger.info("STARTING DATA PIPELINE")
+    logger.info("=" * 80)
+
+    datasets = build_processed_data(data_dir)
+    if datasets is None:
+        return False
+
+    # Step 6: Save processed data
+    logger.info("\nSTEP 6: Saving processed datasets...")
+
+    with profiler.stage('save_processed_data', rows_in=len(datasets['sales_clean'])) as record:
+        record['rows_out'] = save_processed_data(datasets, processed_dir)
+
+    if sqlite:
+        with profiler.stage('write_sqlite_mirror', rows_in=len(datasets['sales_clean'])) as record:
+            record['rows_out'] = write_sqlite_mirror(datasets, processed_dir / SQLITE_FILENAME)['sales']
+
+    log_pipeline_summary(datasets, processed_dir)
     return True
 
 
+def main(trace_memory: bool = True, sqlite: bool = False) -> bool:
+    """
+    Main pipeline execution function.
+
+    Args:
+        trace_memory: Record peak memory per stage with tracemalloc
+                      (slows the run; set False for timing only)
+        sqlite: Also write the indexed SQLite mirror of the processed data
+
+    Returns:
+        True if the pipeline succeeded
+    """
+    # Define paths
+    project_root = Path(__file__).parent.parent.parent
+    data_dir = project_root / 'data' / 'raw'  # Look in data/raw/ subdirectory
+    processed_dir = project_root / 'data' / 'processed'
+
+    # Create processed directory if it doesn't exist
+    processed_dir.mkdir(exist_ok=True)
+
+    with StageProfiler(trace_memory=trace_memory) as profiler:
+        success = run_pipeline(data_dir, processed_dir, profiler, sqlite=sqlite)
+
+    # Write the stage profile (also on validation failure)
+    json_path, text_path = profiler.write_report(processed_dir)
+    logger.info("\nSTAGE PROFILE\n" + profiler.format_table())
+    logger.info(f"✓ Saved stage profile: {json_path} and {text_path.name}")
+
+    return success
+
+
 if __name__ == "__main__":
-    success = main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Clean the raw store files into data/processed/')
+    parser.add_argument('--sqlite', action='store_true',
+                        help=f'Also write data/processed/{SQLITE_FILENAME} (indexed, with daily rollups)')
+    success = main(sqlite=parser.parse_args().sqlite)
     sys.exit(0 if success else 1)
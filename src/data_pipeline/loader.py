@@ -9,16 +9,26 @@ Date: October 2025
 """
 
 import pandas as pd
-import chardet
+import re
 from pathlib import Path
 from typing import List, Tuple
 import logging
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_pipeline.profiler import profile_stage
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Store files are named <store number>_<store name>_..., e.g. 01_渋谷店_売上_202401.xlsx
+STORE_FILE_PATTERN = re.compile(r'^(\d+)_')
 
+
+@profile_stage
 def detect_csv_encoding(filepath: str) -> str:
     """
     Detect the encoding of a CSV file.
@@ -29,6 +39,8 @@ def detect_csv_encoding(filepath: str) -> str:
     Returns:
         Detected encoding (e.g., 'utf-8', 'shift_jis')
     """
+    import chardet  # only needed for CSV store files
+
     with open(filepath, 'rb') as f:
         result = chardet.detect(f.read())
     encoding = result['encoding']
@@ -37,6 +49,7 @@ def detect_csv_encoding(filepath: str) -> str:
     return encoding
 
 
+@profile_stage
 def read_excel_file(filepath: str) -> pd.DataFrame:
     """
     Read an Excel file with proper handling of various formats.
@@ -92,6 +105,7 @@ def read_excel_file(filepath: str) -> pd.DataFrame:
         raise
 
 
+@profile_stage
 def read_csv_file(filepath: str) -> pd.DataFrame:
     """
     Read a CSV file with automatic encoding detection.
@@ -125,6 +139,7 @@ def read_csv_file(filepath: str) -> pd.DataFrame:
         raise
 
 
+@profile_stage
 def load_single_file(filepath: str) -> Tuple[pd.DataFrame, str]:
     """
     Load a single data file (Excel or CSV).
@@ -153,15 +168,18 @@ def load_single_file(filepath: str) -> Tuple[pd.DataFrame, str]:
         raise ValueError(f"Unsupported file type: {filename}")
 
     # Extract store identifier from filename
-    # Format: 01_渋谷店_売上_202401.xlsx -> S01
-    store_number = filename[:2]
-    store_id = f"S{store_number}"
+    # Format: 01_渋谷店_売上_202401.xlsx -> S01, 123_Store123_売上_202401.csv -> S123
+    match = STORE_FILE_PATTERN.match(filename)
+    if not match:
+        raise ValueError(f"Cannot determine store number from filename: {filename}")
+    store_id = f"S{int(match.group(1)):02d}"
 
     logger.info(f"Loaded {len(df)} rows from {filename} (Store: {store_id})")
 
     return df, store_id
 
 
+@profile_stage
 def load_all_store_files(data_dir: str) -> List[Tuple[pd.DataFrame, str, str]]:
     """
     Load all store sales files from a directory.
@@ -184,7 +202,7 @@ def load_all_store_files(data_dir: str) -> List[Tuple[pd.DataFrame, str, str]]:
     files = sorted(list(data_path.glob('*.xlsx')) + list(data_path.glob('*.csv')))
 
     # Filter out files that are clearly not store data
-    store_files = [f for f in files if any(str(i).zfill(2) in f.name for i in range(1, 11))]
+    store_files = [f for f in files if STORE_FILE_PATTERN.match(f.name)]
 
     logger.info(f"Found {len(store_files)} store data files")
 
@@ -202,6 +220,7 @@ def load_all_store_files(data_dir: str) -> List[Tuple[pd.DataFrame, str, str]]:
     return all_data
 
 
+@profile_stage
 def combine_raw_data(all_data: List[Tuple[pd.DataFrame, str, str]]) -> pd.DataFrame:
     """
     Combine data from all stores into a single DataFrame.
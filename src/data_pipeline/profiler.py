@@ -0,0 +1,234 @@
+"""
+Pipeline Stage Profiler Module
+
+This module records wall time, CPU time, rows in/out and peak traced memory
+for each stage of the data pipeline. Loader, cleaner and validator functions
+are decorated with @profile_stage; the decorator is a pass-through unless a
+StageProfiler is active, so normal imports and tests pay no tracing cost.
+
+Usage:
+    with StageProfiler() as profiler:
+        sales_clean = clean_raw_data(combine_raw_data(load_all_store_files(data_dir)))
+    profiler.write_report(output_dir)
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import functools
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# Profiler currently collecting stage records (None when profiling is off)
+_ACTIVE_PROFILER: Optional['StageProfiler'] = None
+
+
+def count_rows(value) -> Optional[int]:
+    """
+    Count DataFrame rows in a stage argument or result.
+
+    Args:
+        value: DataFrame, or list/tuple possibly containing DataFrames
+               (e.g. the (df, store_id, filename) tuples from the loader)
+
+    Returns:
+        Total row count, or None if value holds no DataFrame
+    """
+    if isinstance(value, pd.DataFrame):
+        return len(value)
+
+    if isinstance(value, (list, tuple)):
+        counts = [count for count in map(count_rows, value) if count is not None]
+        return sum(counts) if counts else None
+
+    return None
+
+
+class StageProfiler:
+    """
+    Collects one record per pipeline stage call, nested by call depth.
+
+    Each record holds: stage, depth, wall_seconds, cpu_seconds, rows_in,
+    rows_out and peak_mb (memory allocated above the stage's starting point,
+    as traced by tracemalloc; None when trace_memory is False).
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.records: List[Dict[str, object]] = []
+        self.started_at: Optional[str] = None
+        self.total_seconds: Optional[float] = None
+        self._open_records: List[Dict[str, object]] = []
+        self._started_tracing = False
+        self._start_time = 0.0
+
+    def __enter__(self) -> 'StageProfiler':
+        global _ACTIVE_PROFILER
+        self._previous_profiler = _ACTIVE_PROFILER
+        _ACTIVE_PROFILER = self
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        global _ACTIVE_PROFILER
+        self.total_seconds = time.perf_counter() - self._start_time
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        _ACTIVE_PROFILER = self._previous_profiler
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None):
+        """
+        Context manager recording one stage.
+
+        Args:
+            name: Stage name shown in the report
+            rows_in: Number of input rows, if known
+
+        Yields:
+            The stage record; set record['rows_out'] inside the block
+        """
+        record = {
+            'stage': name,
+            'depth': len(self._open_records),
+            'wall_seconds': None,
+            'cpu_seconds': None,
+            'rows_in': rows_in,
+            'rows_out': None,
+            'peak_mb': None,
+        }
+        self.records.append(record)
+
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            # Fold the parent's peak so far into its record before resetting
+            current, peak = tracemalloc.get_traced_memory()
+            if self._open_records:
+                parent = self._open_records[-1]
+                parent['_peak_bytes'] = max(parent['_peak_bytes'], peak)
+            tracemalloc.reset_peak()
+            record['_start_bytes'] = current
+            record['_peak_bytes'] = current
+
+        self._open_records.append(record)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] = round(time.perf_counter() - wall_start, 6)
+            record['cpu_seconds'] = round(time.process_time() - cpu_start, 6)
+            self._open_records.pop()
+
+            if tracing:
+                peak_bytes = max(record.pop('_peak_bytes'), tracemalloc.get_traced_memory()[1])
+                record['peak_mb'] = round((peak_bytes - record.pop('_start_bytes')) / 1024 ** 2, 3)
+                if self._open_records:
+                    parent = self._open_records[-1]
+                    parent['_peak_bytes'] = max(parent['_peak_bytes'], peak_bytes)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the run report as a JSON-serializable dictionary."""
+        return {
+            'started_at': self.started_at,
+            'total_seconds': None if self.total_seconds is None else round(self.total_seconds, 6),
+            'trace_memory': self.trace_memory,
+            'stages': self.records,
+        }
+
+    def format_table(self) -> str:
+        """Return the run report as a human-readable table (nested stages indented)."""
+        def fmt_rows(value):
+            return '-' if value is None else f"{value:,}"
+
+        lines = [
+            f"{'Stage':<58} {'Wall (s)':>9} {'CPU (s)':>9} {'Rows in':>9} {'Rows out':>9} {'Peak MB':>9}",
+            '-' * 108,
+        ]
+        for record in self.records:
+            name = '  ' * record['depth'] + record['stage']
+            peak = '-' if record['peak_mb'] is None else f"{record['peak_mb']:.1f}"
+            lines.append(
+                f"{name[:58]:<58} {record['wall_seconds']:>9.3f} {record['cpu_seconds']:>9.3f} "
+                f"{fmt_rows(record['rows_in']):>9} {fmt_rows(record['rows_out']):>9} {peak:>9}"
+            )
+        if self.total_seconds is not None:
+            lines.append('-' * 108)
+            lines.append(f"{'Total':<58} {self.total_seconds:>9.3f}")
+
+        return '\n'.join(lines)
+
+    def write_report(self, output_dir: Path, name: str = 'pipeline_profile') -> Tuple[Path, Path]:
+        """
+        Write the run report as JSON and as a text table.
+
+        Args:
+            output_dir: Directory for the report files
+            name: Base filename (without extension)
+
+        Returns:
+            Tuple of (json_path, text_path)
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        json_path = output_dir / f"{name}.json"
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+        text_path = output_dir / f"{name}.txt"
+        text_path.write_text(self.format_table() + '\n', encoding='utf-8')
+
+        return json_path, text_path
+
+
+def get_active_profiler() -> Optional[StageProfiler]:
+    """Return the active StageProfiler, or None when profiling is off."""
+    return _ACTIVE_PROFILER
+
+
+def profile_stage(func: Callable) -> Callable:
+    """
+    Decorator recording each call of a pipeline function as a stage.
+
+    Rows in are counted from the first positional argument, rows out from the
+    return value. File path arguments are added to the stage name so that
+    per-file loader calls can be told apart.
+
+    Example:
+        >>> @profile_stage
+        ... def clean_sales_amount(df): ...
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _ACTIVE_PROFILER
+        if profiler is None:
+            return func(*args, **kwargs)
+
+        name = func.__name__
+        if args and isinstance(args[0], (str, Path)):
+            name = f"{name}({Path(args[0]).name})"
+
+        with profiler.stage(name, rows_in=count_rows(args[0]) if args else None) as record:
+            result = func(*args, **kwargs)
+            record['rows_out'] = count_rows(result)
+
+        return result
+
+    return wrapper
@@ -0,0 +1,148 @@
+"""
+SQLite Mirror Module
+
+This module writes the processed datasets to an indexed SQLite database
+(data/processed/sales.sqlite), so ad-hoc questions can be answered with SQL
+instead of loading the whole CSV into pandas:
+
+- sales: the cleaned fact table, indexed on (store_id, date) and
+  (product_category, date)
+- stores, products: dimension tables (create_store_metadata,
+  create_product_metadata)
+- daily_store_category_sales, daily_store_sales: pre-aggregated daily
+  rollups (revenue and transaction count)
+
+Dates are stored as ISO text ('2024-01-31'), so range filters compare as
+strings and use the indexes. The database is rebuilt from scratch on every
+run and moved into place atomically. analysis.sql_metrics computes the
+standard metrics from it with the group-bys pushed down to SQL.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_pipeline.artifacts import write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+SQLITE_FILENAME = 'sales.sqlite'
+
+# Tables in creation order (dimensions first, the fact table references them)
+SCHEMA = {
+    'stores': """
+        CREATE TABLE stores (
+            store_id TEXT PRIMARY KEY,
+            store_name_jp TEXT,
+            store_name_en TEXT NOT NULL,
+            city TEXT,
+            region TEXT NOT NULL
+        )""",
+    'products': """
+        CREATE TABLE products (
+            category_id TEXT PRIMARY KEY,
+            category_name_en TEXT NOT NULL UNIQUE,
+            category_name_jp TEXT
+        )""",
+    'sales': """
+        CREATE TABLE sales (
+            transaction_id TEXT PRIMARY KEY,
+            date TEXT NOT NULL,
+            store_id TEXT NOT NULL REFERENCES stores (store_id),
+            product_category TEXT NOT NULL REFERENCES products (category_name_en),
+            sales_amount INTEGER NOT NULL,
+            quantity INTEGER,
+            day_of_week TEXT NOT NULL,
+            day_of_month INTEGER NOT NULL,
+            is_weekend INTEGER NOT NULL,
+            week_of_month INTEGER NOT NULL
+        )""",
+}
+
+INDEXES = [
+    'CREATE INDEX idx_sales_store_date ON sales (store_id, date)',
+    'CREATE INDEX idx_sales_category_date ON sales (product_category, date)',
+    'CREATE INDEX idx_daily_store_category_date ON daily_store_category_sales (date)',
+]
+
+# Daily rollups, built from the fact table inside the database
+ROLLUPS = {
+    'daily_store_category_sales': """
+        CREATE TABLE daily_store_category_sales AS
+        SELECT date, store_id, product_category, day_of_week, is_weekend,
+               SUM(sales_amount) AS revenue, COUNT(*) AS transactions
+        FROM sales
+        GROUP BY date, store_id, product_category""",
+    'daily_store_sales': """
+        CREATE TABLE daily_store_sales AS
+        SELECT date, store_id, SUM(sales_amount) AS revenue, COUNT(*) AS transactions
+        FROM sales
+        GROUP BY date, store_id""",
+}
+
+
+def _fact_rows(sales_df: pd.DataFrame) -> pd.DataFrame:
+    """Return the sales fact table with SQLite-friendly date and flag columns."""
+    rows = sales_df.copy()
+    rows['date'] = pd.to_datetime(rows['date']).dt.strftime('%Y-%m-%d')
+    rows['is_weekend'] = rows['is_weekend'].astype(int)
+    return rows
+
+
+def _write_database(datasets: Dict[str, object], db_path: Path) -> None:
+    """Create the tables, rollups and indexes in a new database file."""
+    conn = sqlite3.connect(db_path)
+    try:
+        # Built in one go and moved into place, so no journal is needed
+        conn.execute('PRAGMA journal_mode = OFF')
+        conn.execute('PRAGMA synchronous = OFF')
+        with conn:
+            for table, ddl in SCHEMA.items():
+                conn.execute(ddl)
+                frame = _fact_rows(datasets['sales_clean']) if table == 'sales' else datasets[table]
+                frame.to_sql(table, conn, if_exists='append', index=False)
+            for ddl in ROLLUPS.values():
+                conn.execute(ddl)
+            for ddl in INDEXES:
+                conn.execute(ddl)
+        conn.execute('ANALYZE')
+    finally:
+        conn.close()
+
+
+def write_sqlite_mirror(datasets: Dict[str, object], db_path: Path) -> Dict[str, int]:
+    """
+    Write the processed datasets to an indexed SQLite database.
+
+    Args:
+        datasets: Dictionary with sales_clean, stores and products DataFrames
+        db_path: Database file (replaced atomically)
+
+    Returns:
+        Dictionary of table name -> row count
+    """
+    write_atomic(db_path, lambda tmp_path: _write_database(datasets, tmp_path))
+
+    conn = sqlite3.connect(db_path)
+    try:
+        counts = {
+            table: conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            for table in list(SCHEMA) + list(ROLLUPS)
+        }
+    finally:
+        conn.close()
+
+    logger.info(f"✓ Saved SQLite mirror: {db_path} "
+                f"({', '.join(f'{table} {rows:,}' for table, rows in counts.items())})")
+    return counts
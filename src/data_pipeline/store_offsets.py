@@ -0,0 +1,218 @@
+"""
+Store Offset Index Module
+
+The cleaned fact table is sorted by (store_id, date) (see
+cleaner.sort_by_store_and_date), so each store's transactions, and each
+day within a store, occupy one contiguous row range. This module builds and
+persists that offset index next to the processed CSV
+(data/processed/sales_clean_offsets.json):
+
+    {
+        "rows": 1155,
+        "stores": {"S01": [0, 129], "S02": [129, 219], ...},
+        "dates": {"S01": {"2024-01-01": [0, 2], ...}, ...}
+    }
+
+Ranges are [start, stop) row positions, so a store's sales are
+sales_df.iloc[start:stop] - a slice, not a boolean scan - and per-store
+sums are one np.add.reduceat over the store boundaries.
+analysis.metrics and analysis.parallel_metrics use the index for per-store
+slices, aggregations and shuffle-free store sharding; the EDA, the full
+build, the report packs and the metrics service load it next to the CSV
+(load_offsets_for) or take it from the pipeline and pass it on.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_pipeline.artifacts import ArtifactWriter, write_text
+
+
+OFFSETS_FILENAME = 'sales_clean_offsets.json'
+
+
+def is_store_clustered(sales_df: pd.DataFrame) -> bool:
+    """
+    Return True if the rows are sorted by (store_id, date).
+
+    Args:
+        sales_df: Sales transactions
+
+    Returns:
+        True if every store and every day within it is one contiguous block
+    """
+    stores = sales_df['store_id'].to_numpy()
+    dates = pd.to_datetime(sales_df['date']).to_numpy()
+    store_steps = stores[1:] > stores[:-1]
+    same_store = stores[1:] == stores[:-1]
+    return bool(np.all(store_steps | (same_store & (dates[1:] >= dates[:-1]))))
+
+
+def _boundaries(keys: np.ndarray) -> np.ndarray:
+    """Return the row positions where a sorted key column changes, plus 0 and len."""
+    changes = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    return np.concatenate([[0], changes, [len(keys)]]).astype(int)
+
+
+def build_store_offsets(sales_df: pd.DataFrame) -> Dict[str, object]:
+    """
+    Build the offset index of a store-clustered sales table.
+
+    Args:
+        sales_df: Sales transactions sorted by (store_id, date)
+
+    Returns:
+        Offset index dictionary (see module docstring)
+
+    Raises:
+        ValueError: The rows are not sorted by (store_id, date)
+    """
+    if not is_store_clustered(sales_df):
+        raise ValueError("Sales must be sorted by (store_id, date) to build the offset index")
+
+    stores = sales_df['store_id'].to_numpy()
+    days = pd.to_datetime(sales_df['date']).dt.strftime('%Y-%m-%d').to_numpy()
+    store_bounds = _boundaries(stores)
+    # A new (store, day) block starts wherever either key changes
+    day_bounds = np.union1d(store_bounds, _boundaries(days))
+
+    offsets = {'rows': len(sales_df), 'stores': {}, 'dates': {}}
+    for start, stop in zip(store_bounds[:-1], store_bounds[1:]):
+        store = str(stores[start])
+        offsets['stores'][store] = [int(start), int(stop)]
+        inner = day_bounds[(day_bounds >= start) & (day_bounds <= stop)]
+        offsets['dates'][store] = {
+            str(days[day_start]): [int(day_start), int(day_stop)]
+            for day_start, day_stop in zip(inner[:-1], inner[1:])
+        }
+    return offsets
+
+
+def save_store_offsets(
+    offsets: Dict[str, object],
+    path: Path,
+    writer: Optional[ArtifactWriter] = None
+) -> None:
+    """
+    Write the offset index as JSON, in the background if a writer is given.
+
+    Args:
+        offsets: Dictionary from build_store_offsets
+        path: Output path
+        writer: Active ArtifactWriter, or None to write now
+    """
+    write_text(json.dumps(offsets) + '\n', path, writer)
+
+
+def offsets_path(csv_path: Path) -> Path:
+    """Return the offset index file of a CSV (sales_clean.csv -> sales_clean_offsets.json)."""
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f'{csv_path.stem}_offsets.json')
+
+
+def load_offsets_for(csv_path: Path) -> Optional[Dict[str, object]]:
+    """
+    Load the offset index saved next to a sales CSV, if there is one.
+
+    Whether it still describes the data is checked where it is used
+    (matches), so a stale index only costs the fallback scan.
+
+    Args:
+        csv_path: Processed sales CSV
+
+    Returns:
+        Offset index dictionary, or None if missing
+    """
+    path = offsets_path(csv_path)
+    return load_store_offsets(path) if path.exists() else None
+
+
+def load_store_offsets(path: Path) -> Dict[str, object]:
+    """
+    Load an offset index written by save_store_offsets.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Offset index dictionary
+    """
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def matches(offsets: Optional[Dict[str, object]], sales_df: pd.DataFrame) -> bool:
+    """
+    Return True if an offset index is given and describes the rows of sales_df.
+
+    The frame must have the indexed length, be sorted by (store_id, date),
+    and hold the indexed store and day at the first and last row of every
+    range. Anything else (e.g. a reordered copy of the same length) makes
+    callers fall back to scanning.
+
+    Args:
+        offsets: Dictionary from build_store_offsets, or None
+        sales_df: Sales transactions
+
+    Returns:
+        True if the index can be used for positional slices of sales_df
+    """
+    if offsets is None or offsets['rows'] != len(sales_df):
+        return False
+    if not offsets['stores']:
+        return len(sales_df) == 0
+    if not is_store_clustered(sales_df):
+        return False
+
+    ranges = [(store, day, start, stop)
+              for store, days in offsets['dates'].items()
+              for day, (start, stop) in days.items()]
+    labels = np.array([store for store, _, _, _ in ranges])
+    days = np.array([day for _, day, _, _ in ranges])
+    edges = np.array([[start, stop - 1] for _, _, start, stop in ranges])
+
+    stores = sales_df['store_id'].to_numpy()[edges]
+    dates = pd.to_datetime(sales_df['date'].to_numpy()[edges.ravel()]).strftime('%Y-%m-%d')
+    store_rows = sum(stop - start for start, stop in offsets['stores'].values())
+    return bool(
+        store_rows == len(sales_df)
+        and np.all(stores == labels[:, None])
+        and np.all(dates.to_numpy().reshape(-1, 2) == days[:, None])
+    )
+
+
+def store_starts(offsets: Dict[str, object]) -> np.ndarray:
+    """Return the first row of every store, in row order (for np.add.reduceat)."""
+    return np.array([start for start, _ in offsets['stores'].values()], dtype=int)
+
+
+def contiguous_shards(offsets: Dict[str, object], num_shards: int) -> List[Tuple[int, int]]:
+    """
+    Split the rows into up to num_shards contiguous ranges at store boundaries.
+
+    Each range ends at the store boundary nearest to an equal split of the
+    rows, so shards are balanced without moving any rows.
+
+    Args:
+        offsets: Dictionary from build_store_offsets
+        num_shards: Number of shards wanted
+
+    Returns:
+        List of [start, stop) row ranges covering every row once
+    """
+    bounds = np.array([0] + [stop for _, stop in offsets['stores'].values()])
+    targets = np.linspace(0, offsets['rows'], num_shards + 1)[1:-1]
+    cuts = bounds[np.abs(bounds[:, None] - targets).argmin(axis=0)] if len(targets) else []
+    edges = np.unique(np.concatenate([[0], cuts, [offsets['rows']]])).astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(edges[:-1], edges[1:])]
@@ -0,0 +1,355 @@
+"""
+Synthetic Raw Data Generator
+
+This module generates realistic raw store sales files at configurable scale
+for performance testing of the data pipeline. The files reproduce the quirks
+found in the real data/raw files and handled by loader.py and cleaner.py:
+
+- Mixed formats: Excel (.xlsx) and CSV files
+- Shift-JIS and UTF-8 encoded CSVs, comma and semicolon delimiters
+- Excel files with title/metadata rows above the header (Yokohama style)
+- Excel files with a description sheet before the data sheet (Sendai style)
+- Japanese, English and alternate Japanese headers in varying column order
+- Missing sales_amount (recoverable from unit_price x quantity or not)
+- Missing product names, store name variants and invalid dates
+
+All content is derived from a seed, so the same arguments always produce the
+same rows.
+
+Usage:
+    python src/data_pipeline/synthetic_data.py --output-dir data/synthetic \\
+        --stores 200 --months 12 --rows-per-day 40 --seed 42
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import argparse
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List
+from openpyxl import Workbook
+import logging
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_pipeline.cleaner import create_store_metadata
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Raw header variants found in the real store files
+JAPANESE_HEADERS = {
+    'date': '売上日', 'store': '店舗', 'category': 'カテゴリ', 'product': '商品名',
+    'price': '単価', 'qty': '数量', 'sales': '売上金額',
+}
+ENGLISH_HEADERS = {
+    'date': 'Date', 'store': 'Store', 'category': 'Category', 'product': 'Product',
+    'price': 'Price', 'qty': 'Qty', 'sales': 'Sales',
+}
+ALTERNATE_HEADERS = {
+    'date': '売上日', 'store': '店舗名', 'category': 'カテゴリ', 'product': '商品',
+    'price': '価格', 'qty': '個数', 'sales': '合計',
+}
+
+STANDARD_ORDER = ['date', 'store', 'category', 'product', 'price', 'qty', 'sales']
+
+# One profile per real store file (01 Shibuya ... 10 Fukuoka); synthetic
+# store N uses profile (N - 1) % 10
+FILE_PROFILES = [
+    {'format': 'xlsx', 'headers': JAPANESE_HEADERS, 'order': STANDARD_ORDER,
+     'filename': '{no}_{name}_売上_{ym}.xlsx'},
+    {'format': 'xlsx', 'headers': JAPANESE_HEADERS,
+     'order': ['date', 'store', 'product', 'category', 'price', 'qty', 'sales'],
+     'filename': '{no}_{name}_売上_{ym}.xlsx'},
+    {'format': 'csv', 'headers': ENGLISH_HEADERS, 'order': STANDARD_ORDER,
+     'encoding': 'utf-8', 'delimiter': ',', 'missing_sales': 'NULL',
+     'filename': '{no}_{name}_sales_{ym}.csv'},
+    {'format': 'xlsx', 'headers': JAPANESE_HEADERS, 'order': STANDARD_ORDER,
+     'title_rows': True, 'sheet_name': '売上データ',
+     'filename': '{no}_{name}_売上_{ym}_最終.xlsx'},
+    {'format': 'csv', 'headers': JAPANESE_HEADERS, 'order': STANDARD_ORDER,
+     'encoding': 'shift_jis', 'delimiter': ',', 'missing_sales': '-',
+     'filename': '{no}_{name}_売上_{ym}.csv'},
+    {'format': 'xlsx', 'headers': JAPANESE_HEADERS, 'order': STANDARD_ORDER,
+     'filename': '{no}_{name}_売上{ym}.xlsx'},
+    {'format': 'xlsx', 'headers': JAPANESE_HEADERS, 'order': STANDARD_ORDER,
+     'description_sheet': True, 'sheet_name': '売上データ',
+     'filename': '{no}_{name}売上({month}月).xlsx'},
+    {'format': 'xlsx', 'headers': JAPANESE_HEADERS,
+     'order': ['product', 'date', 'category', 'sales', 'price', 'store', 'qty'],
+     'filename': '{no}_{name}_{ym}_売上.xlsx'},
+    {'format': 'csv', 'headers': JAPANESE_HEADERS, 'order': STANDARD_ORDER,
+     'encoding': 'utf-8', 'delimiter': ';', 'missing_sales': '-',
+     'filename': '{no}_{name}_売上_{year}_{month:02d}.csv'},
+    {'format': 'xlsx', 'headers': ALTERNATE_HEADERS, 'order': STANDARD_ORDER,
+     'filename': '{no}_{name}_売上_{ym}_済.xlsx'},
+]
+
+# Raw (Japanese) categories with product names and unit price ranges (yen)
+PRODUCT_CATALOG = {
+    'レディース': (['ワンピース', 'ブラウス', 'バッグ', 'スカート'], 5000, 20000),
+    'メンズ': (['ジャケット', 'ジーンズ', 'シャツ'], 4000, 25000),
+    'シューズ': (['パンプス', 'サンダル', 'ブーツ', 'スニーカー', 'ローファー'], 6000, 25000),
+    'アクセサリー': (['財布', '時計', 'サングラス'], 3000, 25000),
+    'キッズ': (['パーカー', 'Tシャツ', 'リュック', 'パンツ', 'スニーカー'], 2000, 8000),
+}
+
+# Share of rows carrying each data quality issue
+QUIRK_RATES = {
+    'invalid_date': 0.02,        # Unparseable or impossible dates
+    'recoverable_sales': 0.04,   # sales_amount missing, unit_price x quantity present
+    'missing_sales': 0.05,       # sales_amount and unit_price both missing
+    'missing_product': 0.03,     # Product name missing
+}
+
+# Relative transaction volume on weekends (weekdays outsell weekends)
+WEEKEND_VOLUME_FACTOR = 0.85
+
+
+def create_synthetic_store_metadata(num_stores: int) -> pd.DataFrame:
+    """
+    Create store metadata for a synthetic chain of any size.
+
+    Args:
+        num_stores: Number of stores
+
+    Returns:
+        DataFrame with the same columns as cleaner.create_store_metadata().
+        The first 10 stores are the real stores; the rest are synthetic.
+    """
+    real_stores = create_store_metadata()
+    regions = real_stores['region'].tolist()
+
+    extra_stores = pd.DataFrame({
+        'store_id': [f'S{n:02d}' for n in range(11, num_stores + 1)],
+        'store_name_jp': [f'第{n}店' for n in range(11, num_stores + 1)],
+        'store_name_en': [f'Store{n}' for n in range(11, num_stores + 1)],
+        'city': [f'City{n}' for n in range(11, num_stores + 1)],
+        'region': [regions[(n - 1) % len(regions)] for n in range(11, num_stores + 1)],
+    })
+
+    stores_df = pd.concat([real_stores, extra_stores], ignore_index=True).head(num_stores)
+
+    return stores_df
+
+
+def generate_store_month(
+    rng: np.random.Generator,
+    store: pd.Series,
+    year: int,
+    month: int,
+    rows_per_day: float
+) -> pd.DataFrame:
+    """
+    Generate one month of raw transactions for a store.
+
+    Args:
+        rng: Random generator for this store and month
+        store: Row from the store metadata
+        year: Calendar year
+        month: Calendar month
+        rows_per_day: Average number of transactions per weekday
+
+    Returns:
+        DataFrame with standard field names (date, store, category, product,
+        price, qty, sales) holding raw, uncleaned values
+    """
+    days = pd.date_range(f'{year}-{month:02d}-01', periods=pd.Period(f'{year}-{month:02d}').days_in_month)
+    volume = np.where(days.dayofweek >= 5, rows_per_day * WEEKEND_VOLUME_FACTOR, rows_per_day)
+    rows_per_date = rng.poisson(volume)
+    num_rows = int(rows_per_date.sum())
+
+    categories = list(PRODUCT_CATALOG)
+    category_idx = rng.integers(0, len(categories), size=num_rows)
+
+    product = np.empty(num_rows, dtype=object)
+    price = np.empty(num_rows, dtype=object)
+    for i, category in enumerate(categories):
+        mask = category_idx == i
+        names, low, high = PRODUCT_CATALOG[category]
+        product[mask] = rng.choice(names, size=mask.sum())
+        price[mask] = rng.integers(low, high, size=mask.sum())
+
+    qty = rng.integers(1, 6, size=num_rows)
+    sales = (price * qty).astype(object)
+
+    # Staff enter the store name in English, Japanese or as a branch name
+    name_variants = [store['store_name_en'], store['store_name_jp'],
+                     store['store_name_jp'].replace('店', '') + '支店']
+
+    raw = pd.DataFrame({
+        'date': np.repeat(days, rows_per_date).astype(object),
+        'store': rng.choice(name_variants, size=num_rows),
+        'category': np.array(categories, dtype=object)[category_idx],
+        'product': product,
+        'price': price,
+        'qty': qty,
+        'sales': sales,
+    })
+
+    # Data quality issues
+    invalid_date = rng.random(num_rows) < QUIRK_RATES['invalid_date']
+    raw.loc[invalid_date, 'date'] = rng.choice(
+        ['不明', f'{year}-{month:02d}-32', None], size=invalid_date.sum()
+    )
+
+    recoverable = rng.random(num_rows) < QUIRK_RATES['recoverable_sales']
+    raw.loc[recoverable, 'sales'] = None
+
+    missing_sales = rng.random(num_rows) < QUIRK_RATES['missing_sales']
+    raw.loc[missing_sales, ['price', 'sales']] = '-'
+
+    missing_product = rng.random(num_rows) < QUIRK_RATES['missing_product']
+    raw.loc[missing_product, 'product'] = rng.choice(['なし', 'NULL', None], size=missing_product.sum())
+
+    return raw
+
+
+def write_excel_file(raw: pd.DataFrame, path: Path, profile: Dict, store: pd.Series) -> None:
+    """
+    Write raw transactions to an Excel file following a file profile.
+
+    Args:
+        raw: Raw transactions with standard field names
+        path: Output file path
+        profile: Entry from FILE_PROFILES
+        store: Row from the store metadata
+    """
+    workbook = Workbook(write_only=True)
+
+    if profile.get('description_sheet'):
+        notes = workbook.create_sheet('説明')
+        for line in [f"{store['store_name_jp']}売上データについて", '売上実績',
+                     f"作成者: {store['store_name_jp']} 店長", None,
+                     '※実際のデータは「売上データ」シートを参照']:
+            notes.append([line])
+
+    sheet = workbook.create_sheet(profile.get('sheet_name', 'Sheet1'))
+
+    if profile.get('title_rows'):
+        sheet.append([f"{store['store_name_jp']}売上管理表"])
+        sheet.append([None, '作成日: 2024/02/01', '担当: 営業部'])
+        sheet.append([])
+
+    sheet.append([profile['headers'][field] for field in profile['order']])
+
+    ordered = raw[profile['order']]
+    for row in ordered.itertuples(index=False, name=None):
+        sheet.append([
+            value.to_pydatetime() if isinstance(value, pd.Timestamp)
+            else None if value is None or value is pd.NaT
+            else value
+            for value in row
+        ])
+
+    workbook.save(path)
+
+
+def write_csv_file(raw: pd.DataFrame, path: Path, profile: Dict) -> None:
+    """
+    Write raw transactions to a CSV file following a file profile.
+
+    Args:
+        raw: Raw transactions with standard field names
+        path: Output file path
+        profile: Entry from FILE_PROFILES
+    """
+    output = raw[profile['order']].copy()
+    output['date'] = output['date'].map(
+        lambda value: value.strftime('%Y-%m-%d') if isinstance(value, pd.Timestamp) else value
+    )
+    output['sales'] = output['sales'].where(output['sales'].notna(), profile['missing_sales'])
+    output.columns = [profile['headers'][field] for field in profile['order']]
+
+    output.to_csv(path, index=False, sep=profile['delimiter'], encoding=profile['encoding'])
+
+
+def generate_synthetic_raw_data(
+    output_dir: str,
+    num_stores: int = 10,
+    months: int = 1,
+    rows_per_day: float = 4.0,
+    seed: int = 42,
+    start_month: str = '2024-01'
+) -> List[Path]:
+    """
+    Generate raw store files (one per store per month) in output_dir.
+
+    Args:
+        output_dir: Directory for the generated files (created if needed)
+        num_stores: Number of stores
+        months: Number of consecutive months per store
+        rows_per_day: Average transactions per store per weekday
+        seed: Random seed; the same arguments always produce the same data
+        start_month: First month as 'YYYY-MM'
+
+    Returns:
+        List of generated file paths
+
+    Notes:
+        - The defaults match the scale of the real data/raw files
+        - Rows of each store and month come from their own seeded generator,
+          so changing num_stores or months does not change existing files' data
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    stores = create_synthetic_store_metadata(num_stores)
+    periods = pd.period_range(start_month, periods=months, freq='M')
+
+    logger.info(f"Generating {num_stores} stores x {months} months "
+                f"(~{rows_per_day} rows/day) into {output_path}")
+
+    files = []
+    for store_no, (_, store) in enumerate(stores.iterrows(), start=1):
+        profile = FILE_PROFILES[(store_no - 1) % len(FILE_PROFILES)]
+
+        for period in periods:
+            rng = np.random.default_rng([seed, store_no, period.year, period.month])
+            raw = generate_store_month(rng, store, period.year, period.month, rows_per_day)
+
+            filename = profile['filename'].format(
+                no=f'{store_no:02d}', name=store['store_name_jp'],
+                ym=f'{period.year}{period.month:02d}', year=period.year, month=period.month
+            )
+            path = output_path / filename
+
+            if profile['format'] == 'xlsx':
+                write_excel_file(raw, path, profile, store)
+            else:
+                write_csv_file(raw, path, profile)
+
+            files.append(path)
+
+    logger.info(f"Generated {len(files)} files")
+
+    return files
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+    """
+    parser = argparse.ArgumentParser(description='Generate synthetic raw store sales files')
+    parser.add_argument('--output-dir', default=str(Path(__file__).parent.parent.parent / 'data' / 'synthetic'))
+    parser.add_argument('--stores', type=int, default=10, help='Number of stores')
+    parser.add_argument('--months', type=int, default=1, help='Number of months per store')
+    parser.add_argument('--rows-per-day', type=float, default=4.0, help='Average rows per store per weekday')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--start-month', default='2024-01', help="First month ('YYYY-MM')")
+    args = parser.parse_args(argv)
+
+    generate_synthetic_raw_data(
+        args.output_dir, args.stores, args.months,
+        args.rows_per_day, args.seed, args.start_month
+    )
+
+
+if __name__ == "__main__":
+    main()
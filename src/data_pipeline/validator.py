@@ -9,14 +9,24 @@ Date: October 2025
 
 import pandas as pd
 import numpy as np
+from pathlib import Path
 from typing import Tuple, List
 import logging
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_pipeline.profiler import profile_stage
+from data_pipeline.artifacts import read_csv_cached
+from data_pipeline.store_offsets import is_store_clustered
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@profile_stage
 def validate_no_missing_critical_fields(df: pd.DataFrame) -> Tuple[bool, str]:
     """
     Validate that critical fields have no missing values.
@@ -40,6 +50,7 @@ def validate_no_missing_critical_fields(df: pd.DataFrame) -> Tuple[bool, str]:
     return True, "All critical fields are complete"
 
 
+@profile_stage
 def validate_date_range(df: pd.DataFrame) -> Tuple[bool, str]:
     """
     Validate that all dates are within January 2024.
@@ -62,6 +73,7 @@ def validate_date_range(df: pd.DataFrame) -> Tuple[bool, str]:
     return True, f"All dates within range: {df['date'].min()} to {df['date'].max()}"
 
 
+@profile_stage
 def validate_non_negative_sales(df: pd.DataFrame) -> Tuple[bool, str]:
     """
     Validate that all sales amounts are non-negative.
@@ -80,6 +92,7 @@ def validate_non_negative_sales(df: pd.DataFrame) -> Tuple[bool, str]:
     return True, f"All sales amounts are non-negative (min: ¥{df['sales_amount'].min():,.0f})"
 
 
+@profile_stage
 def validate_store_ids(df: pd.DataFrame) -> Tuple[bool, str]:
     """
     Validate that all store IDs are valid (S01-S10).
@@ -101,6 +114,7 @@ def validate_store_ids(df: pd.DataFrame) -> Tuple[bool, str]:
     return True, f"All store IDs valid. Found: {sorted(actual_stores)}"
 
 
+@profile_stage
 def validate_data_types(df: pd.DataFrame) -> Tuple[bool, str]:
     """
     Validate that columns have correct data types.
@@ -116,7 +130,7 @@ def validate_data_types(df: pd.DataFrame) -> Tuple[bool, str]:
         'date': 'datetime64[ns]',
         'store_id': 'object',
         'product_category': 'object',
-        'sales_amount': ('float64', 'int64'),
+        'sales_amount': 'int64',
         'day_of_week': 'object',
         'is_weekend': 'bool'
     }
@@ -137,6 +151,7 @@ def validate_data_types(df: pd.DataFrame) -> Tuple[bool, str]:
     return True, "All data types are correct"
 
 
+@profile_stage
 def validate_referential_integrity(sales_df: pd.DataFrame, stores_df: pd.DataFrame) -> Tuple[bool, str]:
     """
     Validate that all store IDs in sales data exist in stores metadata.
@@ -159,6 +174,7 @@ def validate_referential_integrity(sales_df: pd.DataFrame, stores_df: pd.DataFra
     return True, f"All {len(sales_stores)} store IDs have metadata"
 
 
+@profile_stage
 def validate_unique_transaction_ids(df: pd.DataFrame) -> Tuple[bool, str]:
     """
     Validate that all transaction IDs are unique.
@@ -179,6 +195,24 @@ def validate_unique_transaction_ids(df: pd.DataFrame) -> Tuple[bool, str]:
     return True, f"All {total_rows} transaction IDs are unique"
 
 
+@profile_stage
+def validate_store_clustered(df: pd.DataFrame) -> Tuple[bool, str]:
+    """
+    Validate that transactions are sorted by (store_id, date).
+
+    Args:
+        df: Cleaned sales DataFrame
+
+    Returns:
+        Tuple of (is_valid, message)
+    """
+    if not is_store_clustered(df):
+        return False, "Transactions are not sorted by (store_id, date)"
+
+    return True, f"{df['store_id'].nunique()} stores in contiguous (store_id, date) order"
+
+
+@profile_stage
 def validate_all(sales_df: pd.DataFrame, stores_df: pd.DataFrame = None) -> Tuple[bool, List[str]]:
     """
     Run all validation checks on the data.
@@ -201,6 +235,7 @@ def validate_all(sales_df: pd.DataFrame, stores_df: pd.DataFrame = None) -> Tupl
         ("Valid Store IDs", validate_store_ids(sales_df)),
         ("Correct Data Types", validate_data_types(sales_df)),
         ("Unique Transaction IDs", validate_unique_transaction_ids(sales_df)),
+        ("Store-Clustered Order", validate_store_clustered(sales_df)),
     ]
 
     if stores_df is not None:
@@ -231,6 +266,24 @@ def validate_all(sales_df: pd.DataFrame, stores_df: pd.DataFrame = None) -> Tupl
     return all_valid, messages
 
 
+def validate_processed_data(processed_dir: Path) -> Tuple[bool, List[str]]:
+    """
+    Re-run the validation checks on processed files already on disk.
+
+    Args:
+        processed_dir: Directory with sales_clean.csv and stores.csv
+
+    Returns:
+        Tuple of (all_valid, list of messages)
+    """
+    processed_dir = Path(processed_dir)
+    sales_df = read_csv_cached(processed_dir / 'sales_clean.csv', parse_dates=['date'])
+    stores_path = processed_dir / 'stores.csv'
+    stores_df = read_csv_cached(stores_path) if stores_path.exists() else None
+    return validate_all(sales_df, stores_df)
+
+
+@profile_stage
 def generate_data_quality_report(df: pd.DataFrame) -> dict:
     """
     Generate a comprehensive data quality report.
@@ -258,11 +311,11 @@ def generate_data_quality_report(df: pd.DataFrame) -> dict:
             'list': sorted(df['product_category'].unique().tolist())
         },
         'sales': {
-            'total': float(df['sales_amount'].sum()),
+            'total': int(df['sales_amount'].sum()),
             'mean': float(df['sales_amount'].mean()),
             'median': float(df['sales_amount'].median()),
-            'min': float(df['sales_amount'].min()),
-            'max': float(df['sales_amount'].max()),
+            'min': int(df['sales_amount'].min()),
+            'max': int(df['sales_amount'].max()),
             'std': float(df['sales_amount'].std())
         },
         'completeness': {
@@ -0,0 +1,357 @@
+"""
+Zone Map Module
+
+This module writes the processed sales CSV in row groups and records
+statistics for each group (data/processed/sales_clean_zones.json):
+
+- byte offset and length of the group in the CSV file
+- first row and row count
+- date min/max
+- the set of store IDs and of product categories
+
+The zone map also records the size and SHA-256 digest of the CSV, so a
+rewritten CSV (even of the same size) is never read with stale statistics.
+A row group never spans two stores and holds at most ROW_GROUP_ROWS rows.
+As the sales are sorted by (store_id, date), a large store is split into
+consecutive date ranges. read_sales checks a filter against the statistics
+first and parses only the row groups that can match: it seeks to their byte
+offsets and never reads the others.
+
+Every read_sales call is recorded in a query plan log, and
+format_query_plan() shows how many row groups each call read and skipped.
+
+Usage:
+    write_sales_with_zone_maps(sales_clean, processed_dir / 'sales_clean.csv')
+    kanto_week = read_sales(processed_dir / 'sales_clean.csv',
+                            start='2024-01-08', end='2024-01-14', stores=['S01', 'S02'])
+    print(format_query_plan())
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import hashlib
+import io
+import json
+import logging
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_pipeline.artifacts import ArtifactWriter, write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+ROW_GROUP_ROWS = 10_000
+
+# Query plans of recent read_sales calls (oldest dropped first)
+_QUERY_PLANS = deque(maxlen=1000)
+
+# (path, mtime_ns, size) -> SHA-256 of the file, so each version is hashed once
+_DIGESTS: Dict[tuple, str] = {}
+
+
+def zone_map_path(csv_path: Path) -> Path:
+    """Return the zone map file of a CSV (sales_clean.csv -> sales_clean_zones.json)."""
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f'{csv_path.stem}_zones.json')
+
+
+# ============================================
+# WRITING
+# ============================================
+
+def row_group_bounds(sales_df: pd.DataFrame, row_group_rows: int = ROW_GROUP_ROWS) -> List[int]:
+    """
+    Return the row positions where row groups start, plus the row count.
+
+    Groups break wherever the store changes and after row_group_rows rows.
+
+    Args:
+        sales_df: Sales transactions
+        row_group_rows: Maximum rows per group
+
+    Returns:
+        Sorted list of boundaries, starting at 0 and ending at len(sales_df)
+    """
+    stores = sales_df['store_id'].to_numpy()
+    store_bounds = [0, *(np.flatnonzero(stores[1:] != stores[:-1]) + 1), len(stores)]
+
+    bounds = []
+    for start, stop in zip(store_bounds[:-1], store_bounds[1:]):
+        bounds.extend(range(start, stop, row_group_rows))
+    return [int(bound) for bound in bounds] + [len(stores)]
+
+
+def _zone_stats(group: pd.DataFrame) -> Dict[str, object]:
+    """Return the statistics of one row group."""
+    dates = pd.to_datetime(group['date'])
+    return {
+        'date_min': dates.min().strftime('%Y-%m-%d'),
+        'date_max': dates.max().strftime('%Y-%m-%d'),
+        'store_ids': sorted(group['store_id'].unique().tolist()),
+        'categories': sorted(group['product_category'].unique().tolist()),
+    }
+
+
+def write_sales_with_zone_maps(
+    sales_df: pd.DataFrame,
+    path: Path,
+    writer: Optional[ArtifactWriter] = None,
+    row_group_rows: int = ROW_GROUP_ROWS
+) -> None:
+    """
+    Write the sales CSV group by group, then its zone map, in the background if a writer is given.
+
+    The CSV content is the same as DataFrame.to_csv(index=False).
+
+    Args:
+        sales_df: Sales transactions (sorted by store_id, date)
+        path: Output CSV path; the zone map goes next to it (zone_map_path)
+        writer: Active ArtifactWriter, or None to write now
+        row_group_rows: Maximum rows per row group
+    """
+    path = Path(path)
+
+    def write(tmp_path):
+        bounds = row_group_bounds(sales_df, row_group_rows)
+        header = sales_df.iloc[:0].to_csv(index=False).encode('utf-8')
+        zones = {'columns': list(sales_df.columns), 'rows': len(sales_df),
+                 'row_group_rows': row_group_rows, 'row_groups': []}
+
+        digest = hashlib.sha256(header)
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            offset = len(header)
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                group = sales_df.iloc[start:stop]
+                data = group.to_csv(index=False, header=False).encode('utf-8')
+                f.write(data)
+                digest.update(data)
+                zones['row_groups'].append({
+                    'offset': offset, 'length': len(data), 'first_row': start, 'rows': stop - start,
+                    **_zone_stats(group),
+                })
+                offset += len(data)
+        zones['file_size'] = offset
+        zones['sha256'] = digest.hexdigest()
+
+        # The zone map follows the CSV it describes (load_zone_map checks its size and digest)
+        write_atomic(zone_map_path(path), lambda zones_tmp: zones_tmp.write_text(
+            json.dumps(zones) + '\n', encoding='utf-8'))
+
+    if writer is None:
+        write_atomic(path, write)
+    else:
+        writer.submit(path, write)
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 of a file, computed once per modification time and size."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _DIGESTS:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        _DIGESTS[key] = digest.hexdigest()
+    return _DIGESTS[key]
+
+
+def load_zone_map(csv_path: Path) -> Optional[Dict[str, object]]:
+    """
+    Load the zone map of a CSV if it exists and matches the file.
+
+    Args:
+        csv_path: CSV written by write_sales_with_zone_maps
+
+    Returns:
+        Zone map dictionary, or None if missing or stale
+    """
+    zones_path = zone_map_path(csv_path)
+    if not zones_path.exists():
+        return None
+    with open(zones_path, encoding='utf-8') as f:
+        zones = json.load(f)
+    if (zones.get('file_size') != Path(csv_path).stat().st_size
+            or zones.get('sha256') != file_digest(csv_path)):
+        logger.warning(f"Zone map {zones_path.name} does not match {Path(csv_path).name}; reading all rows")
+        return None
+    return zones
+
+
+# ============================================
+# READING
+# ============================================
+
+def zone_may_match(
+    zone: Dict[str, object],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    stores: Optional[Iterable[str]] = None,
+    categories: Optional[Iterable[str]] = None
+) -> bool:
+    """
+    Return False if no row of the group can match the filters.
+
+    Args:
+        zone: One entry of the zone map's row_groups
+        start, end: Inclusive date bounds ('YYYY-MM-DD')
+        stores, categories: Allowed values
+
+    Returns:
+        True if the group has to be read
+    """
+    if start is not None and zone['date_max'] < start:
+        return False
+    if end is not None and zone['date_min'] > end:
+        return False
+    if stores is not None and not set(zone['store_ids']) & set(stores):
+        return False
+    if categories is not None and not set(zone['categories']) & set(categories):
+        return False
+    return True
+
+
+def read_sales(
+    path: Path,
+    start=None,
+    end=None,
+    stores: Optional[Iterable[str]] = None,
+    categories: Optional[Iterable[str]] = None,
+    call: str = 'read_sales',
+    columns: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
+    """
+    Read the sales matching the filters, skipping row groups that cannot match.
+
+    Without a (current) zone map the whole file is read and filtered.
+
+    Args:
+        path: Sales CSV path
+        start: First date (inclusive)
+        end: Last date (inclusive)
+        stores: Store IDs to include
+        categories: Product categories to include
+        call: Name recorded in the query plan log
+        columns: Columns to return (default: all); only these and the
+                 filtered columns are parsed
+
+    Returns:
+        DataFrame with the matching transactions (date parsed)
+
+    Example:
+        >>> kanto = stores_df.loc[stores_df['region'] == 'Kanto', 'store_id']
+        >>> sales = read_sales(path, start='2024-01-01', end='2024-01-31', stores=kanto)
+    """
+    start = None if start is None else pd.Timestamp(start).strftime('%Y-%m-%d')
+    end = None if end is None else pd.Timestamp(end).strftime('%Y-%m-%d')
+    stores = None if stores is None else list(stores)
+    categories = None if categories is None else list(categories)
+
+    # Column pruning: parse the requested columns plus those the filters need
+    usecols = None
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))
+        filter_columns = [column for column, value in (('date', start or end), ('store_id', stores),
+                                                       ('product_category', categories))
+                          if value is not None]
+        usecols = list(dict.fromkeys(columns + filter_columns))
+    read_options = {'usecols': usecols,
+                    'parse_dates': ['date'] if usecols is None or 'date' in usecols else False}
+
+    zones = load_zone_map(path)
+    if zones is None:
+        sales_df = pd.read_csv(path, **read_options)
+        plan = {'row_groups': None, 'read': None, 'skipped': None}
+    else:
+        selected = [zone for zone in zones['row_groups']
+                    if zone_may_match(zone, start, end, stores, categories)]
+        with open(path, 'rb') as f:
+            # Header line, then only the selected groups
+            chunks = [f.read(zones['row_groups'][0]['offset'] if zones['row_groups'] else None)]
+            for zone in selected:
+                f.seek(zone['offset'])
+                chunks.append(f.read(zone['length']))
+        sales_df = pd.read_csv(io.BytesIO(b''.join(chunks)), **read_options)
+        plan = {'row_groups': len(zones['row_groups']), 'read': len(selected),
+                'skipped': len(zones['row_groups']) - len(selected)}
+    rows_read = len(sales_df)
+
+    # Exact row filter within the groups that were read
+    mask = pd.Series(True, index=sales_df.index)
+    if start is not None:
+        mask &= sales_df['date'] >= pd.Timestamp(start)
+    if end is not None:
+        mask &= sales_df['date'] < pd.Timestamp(end) + pd.Timedelta(days=1)
+    if stores is not None:
+        mask &= sales_df['store_id'].isin(stores)
+    if categories is not None:
+        mask &= sales_df['product_category'].isin(categories)
+    sales_df = sales_df[mask].reset_index(drop=True)
+    if columns is not None:
+        sales_df = sales_df[columns]
+
+    plan.update({
+        'call': call,
+        'filters': {'start': start, 'end': end, 'stores': stores, 'categories': categories},
+        'columns': usecols,
+        'rows_read': rows_read,
+        'rows_out': len(sales_df),
+    })
+    _QUERY_PLANS.append(plan)
+    logger.debug(f"{call}: read {plan['read']} of {plan['row_groups']} row groups, "
+                 f"{rows_read:,} rows -> {len(sales_df):,}")
+    return sales_df
+
+
+def query_plans() -> List[Dict[str, object]]:
+    """Return the recorded query plans, oldest first."""
+    return list(_QUERY_PLANS)
+
+
+def reset_query_plans() -> None:
+    """Forget the recorded query plans."""
+    _QUERY_PLANS.clear()
+
+
+def format_query_plan(plans: Optional[List[Dict[str, object]]] = None) -> str:
+    """
+    Return the query plans as a table: row groups read and skipped, and columns parsed, per call.
+
+    Args:
+        plans: Plans to show (default: all recorded plans)
+
+    Returns:
+        Human-readable table
+    """
+    def fmt(value):
+        return '-' if value is None else f"{value:,}"
+
+    def fmt_filters(filters):
+        parts = [f"{name}={','.join(value) if isinstance(value, list) else value}"
+                 for name, value in filters.items() if value is not None]
+        return ' '.join(parts) or '(none)'
+
+    lines = [
+        f"{'Call':<28} {'Groups':>7} {'Read':>6} {'Skipped':>8} {'Rows read':>10} {'Rows out':>9} "
+        f"{'Cols':>5}  Filters",
+        '-' * 106,
+    ]
+    for plan in (query_plans() if plans is None else plans):
+        lines.append(
+            f"{plan['call'][:28]:<28} {fmt(plan['row_groups']):>7} {fmt(plan['read']):>6} "
+            f"{fmt(plan['skipped']):>8} {fmt(plan['rows_read']):>10} {fmt(plan['rows_out']):>9} "
+            f"{'all' if plan['columns'] is None else len(plan['columns']):>5}  {fmt_filters(plan['filters'])}"
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+In-Memory Full Build
+====================
+
+Runs the whole project in one process, passing DataFrames, metric results
+and the parsed report tree directly from stage to stage:
+
+    raw store files -> processed datasets -> EDA metrics, summary tables
+    and charts -> Markdown report -> Word, PowerPoint and PDF documents
+
+No stage reads back a CSV or Markdown file written by an earlier stage.
+The processed datasets, summary tables and analysis_report.md are still
+written as artifacts, on background threads (data_pipeline.artifacts), and
+the build waits for them only at the end. Charts are rendered as files
+because every document format embeds them.
+
+Unlike src/build.py (incremental, one process per step), this always runs
+every stage. A stage profile is written to .build/full_build_profile.*.
+
+Usage:
+    python src/full_build.py
+    python src/full_build.py --formats docx pptx
+    python src/full_build.py --workers 4 --draft
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from data_pipeline.artifacts import ArtifactWriter, write_text
+from data_pipeline.generate_processed_data import build_processed_data, save_processed_data
+from data_pipeline.profiler import StageProfiler
+from analysis.create_updated_report import generate_complete_report
+from reporting.markdown_document import parse_document
+
+
+# Paths
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / 'data' / 'raw'
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+REPORTS_DIR = PROJECT_ROOT / 'reports'
+PROFILE_DIR = PROJECT_ROOT / '.build'
+
+DOCUMENT_FORMATS = ('docx', 'pptx', 'pdf', 'slides_pdf', 'pptx_pdf')
+
+
+# ============================================
+# DOCUMENT STAGES
+# ============================================
+
+def render_docx(document, datasets, reports_dir, max_workers):
+    """Render the Word document."""
+    from reporting.md_to_word import convert_markdown_to_docx
+    output_path = reports_dir / 'detailed_report.docx'
+    convert_markdown_to_docx(None, output_path, reports_dir, document=document)
+    return output_path
+
+
+def render_pptx(document, datasets, reports_dir, max_workers):
+    """Render the PowerPoint deck (metrics slide from the sales DataFrame)."""
+    from reporting.md_to_pptx import generate_powerpoint
+    output_path = reports_dir / 'executive_slides.pptx'
+    generate_powerpoint(output_path, reports_dir / 'assets', datasets['sales_clean'], document)
+    return output_path
+
+
+def render_detailed_pdf(document, datasets, reports_dir, max_workers):
+    """Render the detailed PDF (sections in parallel)."""
+    from reporting import md_to_pdf_detailed as detailed
+    output_path = reports_dir / 'detailed_report.pdf'
+    html_documents = detailed.create_html_documents(detailed.convert_markdown_to_html(document))
+    detailed.generate_pdf(html_documents, output_path, reports_dir, max_workers=max_workers)
+    return output_path
+
+
+def render_slides_pdf(document, datasets, reports_dir, max_workers):
+    """Render the executive slides PDF."""
+    from reporting import md_to_pdf_slides as slides
+    output_path = reports_dir / 'executive_slides.pdf'
+    slides.generate_pdf(slides.create_slides_html(document), output_path, reports_dir)
+    return output_path
+
+
+def render_pptx_pdf(document, datasets, reports_dir, max_workers):
+    """Render the PowerPoint deck to PDF."""
+    from reporting.pptx_to_pdf import convert_pptx_to_pdf_using_images
+    output_path = reports_dir / 'executive_slides_from_pptx.pdf'
+    if not convert_pptx_to_pdf_using_images(reports_dir / 'executive_slides.pptx', output_path,
+                                            max_workers=max_workers):
+        raise RuntimeError('PowerPoint to PDF conversion failed')
+    return output_path
+
+
+# Renderers by format, in build order (pptx_pdf reads the .pptx written before it)
+DOCUMENT_RENDERERS = {
+    'docx': render_docx,
+    'pptx': render_pptx,
+    'pdf': render_detailed_pdf,
+    'slides_pdf': render_slides_pdf,
+    'pptx_pdf': render_pptx_pdf,
+}
+
+
+def render_documents(document, datasets, formats, reports_dir, profiler, max_workers=None):
+    """
+    Render the report formats from the in-memory document tree.
+
+    A failing format (e.g. WeasyPrint without its system libraries) is
+    reported and does not stop the others.
+
+    Args:
+        document: Parsed report tree
+        datasets: Dictionary from build_processed_data
+        formats: Formats to render (keys of DOCUMENT_RENDERERS)
+        reports_dir: Output directory
+        profiler: Active StageProfiler
+        max_workers: Worker processes for the parallel renderers
+
+    Returns:
+        dict: Format -> output path, or the error message
+    """
+    status = {}
+    for name in (fmt for fmt in DOCUMENT_RENDERERS if fmt in formats):
+        with profiler.stage(f'documents.{name}'):
+            try:
+                status[name] = DOCUMENT_RENDERERS[name](document, datasets, reports_dir, max_workers)
+            except (Exception, SystemExit) as e:
+                status[name] = f'failed: {e.__class__.__name__}: {e}'
+    return status
+
+
+# ============================================
+# FULL BUILD
+# ============================================
+
+def run_full_build(formats=DOCUMENT_FORMATS, max_workers=None, chart_profile='publication',
+                   data_dir=DATA_DIR, processed_dir=PROCESSED_DIR, reports_dir=REPORTS_DIR,
+                   profile_dir=PROFILE_DIR):
+    """
+    Run data pipeline, EDA, report and documents in one process.
+
+    Args:
+        formats: Document formats to render (see DOCUMENT_RENDERERS)
+        max_workers: Worker processes for charts, PDF sections and slides
+        chart_profile: Chart render profile - 'publication' or 'draft'
+        data_dir: Directory with raw store files
+        processed_dir: Output directory for processed datasets
+        reports_dir: Output directory for summary tables and reports
+        profile_dir: Output directory for the stage profile
+
+    Returns:
+        dict: success, documents (format -> path or error), artifacts
+        (paths written in the background) and profile (StageProfiler)
+    """
+    unknown = set(formats) - set(DOCUMENT_RENDERERS)
+    if unknown:
+        raise ValueError(f"Unknown format(s) {sorted(unknown)}. Use: {', '.join(DOCUMENT_RENDERERS)}")
+
+    # Charting stack (matplotlib, seaborn) is loaded only when a build runs
+    from analysis.run_complete_eda import run_eda
+
+    processed_dir.mkdir(parents=True, exist_ok=True)
+    documents = {}
+
+    with StageProfiler(trace_memory=False) as profiler, ArtifactWriter() as writer:
+        # Stage 1: processed data (files written in the background)
+        with profiler.stage('processed_data') as record:
+            datasets = build_processed_data(data_dir)
+            if datasets is None:
+                return {'success': False, 'documents': {}, 'artifacts': [], 'profile': profiler}
+            record['rows_out'] = save_processed_data(datasets, processed_dir, writer)
+
+        # Stage 2: metrics, summary tables and charts from the DataFrames
+        with profiler.stage('eda', rows_in=len(datasets['sales_clean'])):
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                eda = run_eda(datasets['sales_clean'], datasets['stores'], datasets['products'],
+                              max_workers=max_workers, profile=chart_profile, writer=writer,
+                              offsets=datasets['store_offsets'])
+
+        # Stage 3: Markdown report from the summary tables in memory
+        with profiler.stage('report_markdown'):
+            report = generate_complete_report(eda['store_revenue'], eda['region_revenue'],
+                                              eda['category_revenue'])
+            write_text(report, reports_dir / 'analysis_report.md', writer)
+            document = parse_document(report, reports_dir / 'analysis_report.md')
+
+        # Stage 4: every document format from the parsed tree
+        with profiler.stage('documents'):
+            documents = render_documents(document, datasets, formats, reports_dir, profiler,
+                                         max_workers=max_workers)
+
+        # Background writes must be complete before the build reports success
+        with profiler.stage('wait_for_artifacts'):
+            artifacts = writer.wait()
+
+    profiler.write_report(profile_dir, name='full_build_profile')
+    success = all(not isinstance(result, str) for result in documents.values())
+    return {'success': success, 'documents': documents, 'artifacts': artifacts, 'profile': profiler}
+
+
+def main(argv=None):
+    """Run the full in-memory build from the command line."""
+    parser = argparse.ArgumentParser(description='Build data, charts and all reports in one process')
+    parser.add_argument('--formats', nargs='+', default=list(DOCUMENT_FORMATS),
+                        choices=list(DOCUMENT_FORMATS), help='Document formats to render')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for charts and PDF rendering (default: CPU count)')
+    parser.add_argument('--draft', action='store_true', help='Fast low-DPI preview charts')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    result = run_full_build(args.formats, max_workers=args.workers,
+                            chart_profile='draft' if args.draft else 'publication')
+
+    print("\n" + "=" * 80)
+    print("FULL BUILD SUMMARY")
+    print("=" * 80)
+    print(result['profile'].format_table())
+    print(f"\nArtifacts written in the background: {len(result['artifacts'])}")
+    for name, outcome in result['documents'].items():
+        marker = '✗' if isinstance(outcome, str) else '✓'
+        print(f"  {marker} {name:<11} {outcome}")
+    print(f"\nTotal: {time.perf_counter() - start:.1f}s")
+
+    sys.exit(0 if result['success'] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Metrics Query Service
+=====================
+
+A small local HTTP service exposing the analysis.metrics results as JSON
+for dashboards:
+
+    GET /metrics/kpis           Key metrics (revenue, transactions, ...)
+    GET /metrics/stores         Revenue by store
+    GET /metrics/regions        Revenue by region
+    GET /metrics/categories     Revenue by category
+    GET /metrics/daily          Revenue by day
+    GET /metrics/day-of-week    Revenue by day of week
+    GET /metrics/weekend        Weekend vs weekday (and the weekend lift)
+    GET /metrics/category-mix   Category revenue per store (?percentage=true)
+    GET /metrics/revenue        Revenue per store for a date range (?by=category)
+    GET /health                 Dataset version and cache statistics
+
+Every metrics endpoint takes optional filters: start and end (ISO dates,
+inclusive) and stores (comma-separated store IDs), e.g.
+/metrics/categories?start=2024-01-08&end=2024-01-14&stores=S01,S02
+
+The processed dataset is loaded once (data_pipeline.artifacts.
+read_csv_cached) and reloaded only when its files change. All metrics for
+one filter set come from a single calculate_all_metrics call; the result
+and every encoded response are cached per dataset version, so repeated
+queries are answered from memory. Concurrent requests for the same
+uncached data are coalesced: one thread computes, the others wait for its
+result. The X-Cache response header tells which path a request took
+(hit, miss or coalesced).
+
+/metrics/revenue is meant for date-range sliders: whole-day ranges are
+answered from the revenue prefix-sum cube (data_pipeline.revenue_cube) in
+constant time per store/category cell instead of re-aggregating the sales.
+Store filters select row slices through the store offset index
+(data_pipeline.store_offsets) instead of scanning the store column.
+
+Usage:
+    python src/metrics_service.py                 # http://127.0.0.1:8050
+    python src/metrics_service.py --port 9000
+    python benchmarks/load_test_metrics_service.py  # p50/p95/p99 latency
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analysis.metrics import calculate_all_metrics, calculate_range_revenue, get_store_sales
+from data_pipeline.artifacts import read_csv_cached
+from data_pipeline.revenue_cube import CUBE_FILENAME, build_revenue_cube, load_revenue_cube
+from data_pipeline.store_offsets import load_offsets_for
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8050
+
+# Encoded responses kept per dataset version (oldest dropped first)
+MAX_CACHED_RESPONSES = 1024
+
+# Query parameters accepted by the metrics endpoints
+FILTER_PARAMETERS = ('start', 'end', 'stores')
+
+# Date-range revenue, answered from the revenue cube: ?by= value -> group column
+RANGE_ENDPOINT = '/metrics/revenue'
+RANGE_GROUPS = {'store': 'store_id', 'category': 'product_category'}
+
+
+class RequestError(Exception):
+    """A request the service cannot answer (sent as a 4xx JSON error)."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================================
+# ENDPOINTS
+# ============================================
+
+def weekend_payload(results, params):
+    """Weekend vs weekday comparison and the weekend lift."""
+    comparison, lift = results['weekend_vs_weekday']
+    # No lift when the selection has only weekdays or only weekends
+    return {'comparison': comparison, 'weekend_lift_pct': None if pd.isna(lift) else lift}
+
+
+def category_mix_payload(results, params):
+    """Category revenue per store, absolute or as a share of store revenue."""
+    mix = results['category_mix_by_store']
+    if params.get('percentage', 'false').lower() in ('1', 'true', 'yes'):
+        mix = mix.div(mix.sum(axis=1), axis=0) * 100
+    return mix.reset_index()
+
+
+# Path -> function(results of calculate_all_metrics, query parameters) -> payload
+ENDPOINTS: Dict[str, Callable] = {
+    '/metrics/kpis': lambda results, params: results['key_metrics'],
+    '/metrics/stores': lambda results, params: results['revenue_by_store'],
+    '/metrics/regions': lambda results, params: results['revenue_by_region'],
+    '/metrics/categories': lambda results, params: results['revenue_by_category'],
+    '/metrics/daily': lambda results, params: results['daily_revenue'],
+    '/metrics/day-of-week': lambda results, params: results['day_of_week_metrics'],
+    '/metrics/weekend': weekend_payload,
+    '/metrics/category-mix': category_mix_payload,
+}
+
+
+def to_json_value(value):
+    """json.dumps fallback for DataFrames, timestamps and numpy scalars."""
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict(orient='records')
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'Cannot encode {type(value).__name__} as JSON')
+
+
+def parse_filters(params: Dict[str, str]) -> Tuple[Optional[str], Optional[str], Tuple[str, ...]]:
+    """
+    Normalize the filter parameters into a hashable key.
+
+    Args:
+        params: Query parameters (first value of each)
+
+    Returns:
+        tuple: (start date, end date, sorted store IDs) with ISO dates
+
+    Raises:
+        RequestError: A date is not a valid ISO date
+    """
+    dates = []
+    for name in ('start', 'end'):
+        value = params.get(name)
+        if value:
+            try:
+                value = date.fromisoformat(value).isoformat()
+            except ValueError:
+                raise RequestError(400, f"Invalid {name} date: {value!r} (use YYYY-MM-DD)")
+        dates.append(value or None)
+
+    stores = tuple(sorted({store.strip() for store in params.get('stores', '').split(',') if store.strip()}))
+    return dates[0], dates[1], stores
+
+
+# ============================================
+# SERVICE
+# ============================================
+
+class MetricsService:
+    """
+    Loads the processed dataset and answers metrics queries with caching.
+
+    Thread safe: the HTTP server calls query() from one thread per request.
+    """
+
+    def __init__(self, processed_dir: Path = PROCESSED_DIR):
+        self.processed_dir = Path(processed_dir)
+        self.stats = {'requests': 0, 'hits': 0, 'misses': 0, 'coalesced': 0, 'computations': 0}
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._results: Dict[tuple, Dict[str, object]] = {}
+        self._responses: Dict[tuple, bytes] = {}
+        self._inflight: Dict[tuple, Future] = {}
+
+    def dataset_version(self) -> str:
+        """Return a short hash of the processed files' modification times and sizes."""
+        digest = hashlib.sha256()
+        for name in ('sales_clean.csv', 'stores.csv'):
+            stat = (self.processed_dir / name).stat()
+            digest.update(f'{name}:{stat.st_mtime_ns}:{stat.st_size};'.encode())
+        return digest.hexdigest()[:16]
+
+    def load_dataset(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Return the sales and store DataFrames (parsed once per file version)."""
+        sales_df = read_csv_cached(self.processed_dir / 'sales_clean.csv', parse_dates=['date'])
+        stores_df = read_csv_cached(self.processed_dir / 'stores.csv')
+        return sales_df, stores_df
+
+    def load_cube(self) -> Dict[str, np.ndarray]:
+        """Return the pipeline's revenue cube if it is current, else build one from the sales."""
+        cube_path = self.processed_dir / CUBE_FILENAME
+        sales_path = self.processed_dir / 'sales_clean.csv'
+        if cube_path.exists() and cube_path.stat().st_mtime_ns >= sales_path.stat().st_mtime_ns:
+            return load_revenue_cube(cube_path)
+        return build_revenue_cube(self.load_dataset()[0])
+
+    def range_revenue(self, version: str, filters: tuple, params: Dict[str, str]) -> pd.DataFrame:
+        """
+        Revenue per store or category for the filtered date range.
+
+        Raises:
+            RequestError: Unknown grouping or no matching sales
+        """
+        by = params.get('by', 'store')
+        if by not in RANGE_GROUPS:
+            raise RequestError(400, f"Invalid by: {by!r} (use {' or '.join(RANGE_GROUPS)})")
+
+        start, end, stores = filters
+        cube, _ = self._single_flight((version, 'revenue_cube'), self.load_cube, self._results)
+        revenue = calculate_range_revenue(self.load_dataset()[0], start, end, by=RANGE_GROUPS[by],
+                                          stores=stores or None, cube=cube)
+        if revenue.empty:
+            raise RequestError(404, 'No sales match the filters')
+        return revenue
+
+    def compute_results(self, filters: tuple) -> Dict[str, object]:
+        """
+        Run calculate_all_metrics on the filtered sales.
+
+        Args:
+            filters: (start, end, stores) from parse_filters
+
+        Returns:
+            dict: calculate_all_metrics results
+
+        Raises:
+            RequestError: No sales match the filters
+        """
+        start, end, stores = filters
+        sales_df, stores_df = self.load_dataset()
+        offsets = load_offsets_for(self.processed_dir / 'sales_clean.csv')
+
+        selected = sales_df
+        if stores:
+            # One row slice per store of the store-clustered table
+            selected = pd.concat([get_store_sales(sales_df, store_id, offsets) for store_id in stores])
+        if start:
+            selected = selected[selected['date'] >= pd.Timestamp(start)]
+        if end:
+            selected = selected[selected['date'] < pd.Timestamp(end) + pd.Timedelta(days=1)]
+
+        if selected.empty:
+            raise RequestError(404, 'No sales match the filters')
+        with self._lock:
+            self.stats['computations'] += 1
+        return calculate_all_metrics(selected, stores_df, offsets)
+
+    def _single_flight(self, key: tuple, compute: Callable[[], object], cache: dict) -> Tuple[object, str]:
+        """
+        Return cache[key], computing it at most once across concurrent callers.
+
+        Returns:
+            tuple: (value, 'hit' | 'miss' | 'coalesced')
+        """
+        with self._lock:
+            if key in cache:
+                return cache[key], 'hit'
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result(), 'coalesced'
+
+        try:
+            value = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+        with self._lock:
+            # Stored only if the dataset did not change while computing
+            if key[0] == self._version:
+                cache[key] = value
+                if len(cache) > MAX_CACHED_RESPONSES:
+                    del cache[next(iter(cache))]
+        return value, 'miss'
+
+    def query(self, path: str, params: Dict[str, str]) -> Tuple[bytes, str]:
+        """
+        Answer one metrics request.
+
+        Args:
+            path: Endpoint path (a key of ENDPOINTS)
+            params: Query parameters (first value of each)
+
+        Returns:
+            tuple: (JSON response body, cache outcome)
+
+        Raises:
+            RequestError: Unknown endpoint, invalid filters or no matching sales
+        """
+        if path not in ENDPOINTS and path != RANGE_ENDPOINT:
+            raise RequestError(404, f"Unknown endpoint {path}. Use: {', '.join(ENDPOINTS)}, {RANGE_ENDPOINT}")
+
+        filters = parse_filters(params)
+        options = tuple(sorted((k, v) for k, v in params.items() if k not in FILTER_PARAMETERS))
+        version = self.dataset_version()
+
+        with self._lock:
+            self.stats['requests'] += 1
+            if version != self._version:
+                # New dataset: results of the old version are never served again
+                self._version = version
+                self._results.clear()
+                self._responses.clear()
+
+        def encode():
+            if path == RANGE_ENDPOINT:
+                data = self.range_revenue(version, filters, dict(options))
+            else:
+                results, _ = self._single_flight((version, filters), lambda: self.compute_results(filters),
+                                                 self._results)
+                data = ENDPOINTS[path](results, dict(options))
+            payload = {
+                'dataset_version': version,
+                'filters': {'start': filters[0], 'end': filters[1], 'stores': list(filters[2])},
+                'data': data,
+            }
+            return json.dumps(payload, default=to_json_value, ensure_ascii=False).encode('utf-8')
+
+        body, outcome = self._single_flight((version, path, filters, options), encode, self._responses)
+        with self._lock:
+            self.stats[{'hit': 'hits', 'miss': 'misses', 'coalesced': 'coalesced'}[outcome]] += 1
+        return body, outcome
+
+    def health(self) -> bytes:
+        """Return the dataset version and cache statistics as JSON."""
+        with self._lock:
+            payload = {
+                'status': 'ok',
+                'dataset_version': self._version,
+                'cached_responses': len(self._responses),
+                'stats': dict(self.stats),
+            }
+        return json.dumps(payload).encode('utf-8')
+
+
+# ============================================
+# HTTP SERVER
+# ============================================
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """GET handler answering from the server's MetricsService."""
+
+    server_version = 'MetricsService/1.0'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        start = time.perf_counter()
+
+        try:
+            if url.path == '/health':
+                body, outcome = self.server.service.health(), 'none'
+            else:
+                body, outcome = self.server.service.query(url.path.rstrip('/'), params)
+            status = 200
+        except RequestError as e:
+            body, outcome, status = json.dumps({'error': str(e)}).encode('utf-8'), 'none', e.status
+        except Exception as e:
+            logger.exception(f"Error answering {self.path}")
+            body, outcome, status = json.dumps({'error': f'{e.__class__.__name__}: {e}'}).encode('utf-8'), 'none', 500
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('X-Cache', outcome)
+        self.send_header('X-Response-Time-Ms', f'{(time.perf_counter() - start) * 1000:.2f}')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class MetricsHTTPServer(ThreadingHTTPServer):
+    """Thread-per-request HTTP server holding the MetricsService."""
+
+    daemon_threads = True
+    # Dashboards open many connections at once; the default backlog (5)
+    # makes the kernel drop bursts, costing the client a 1s SYN retry
+    request_queue_size = 128
+
+    def __init__(self, address, processed_dir: Path = PROCESSED_DIR):
+        super().__init__(address, MetricsRequestHandler)
+        self.service = MetricsService(processed_dir)
+
+
+def create_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                  processed_dir: Path = PROCESSED_DIR) -> 'MetricsHTTPServer':
+    """
+    Create the HTTP server (port 0 picks a free port).
+
+    Args:
+        host: Interface to listen on (local only by default)
+        port: TCP port
+        processed_dir: Directory with sales_clean.csv and stores.csv
+
+    Returns:
+        MetricsHTTPServer (its MetricsService is server.service)
+    """
+    return MetricsHTTPServer((host, port), processed_dir)
+
+
+def main(argv=None):
+    """Run the metrics service until Ctrl+C."""
+    parser = argparse.ArgumentParser(description='Serve the sales metrics as JSON over HTTP')
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Interface (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument('--processed-dir', type=Path, default=PROCESSED_DIR,
+                        help='Directory with the processed CSVs')
+    args = parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, args.processed_dir)
+    server.service.load_dataset()
+    host, port = server.server_address[:2]
+    logger.info(f"Metrics service on http://{host}:{port} (endpoints: {', '.join(ENDPOINTS)}, /health)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Warm Report Daemon
+==================
+
+A long-lived local process that runs cli.py commands on request, so an
+ad-hoc rebuild skips interpreter startup, library imports and data loading:
+
+- pandas, matplotlib, seaborn, python-docx, python-pptx, reportlab and
+  WeasyPrint are imported once, at start-up
+- WeasyPrint's font configuration and the parsed report stylesheets are
+  kept (reporting.pdf_sections)
+- Processed datasets and summary tables stay parsed until their files
+  change (data_pipeline.artifacts.read_csv_cached), as does the report's
+  document tree (reporting.markdown_document)
+
+Requests arrive on a Unix socket (.build/daemon.sock, owner-only) as one
+JSON line - {"command": "docx", "argv": [...], "cwd": "..."} - and are
+answered with one JSON line holding the exit status and the command's
+output. Requests are served one at a time, in arrival order, so two builds
+never write the same report at once. Worker pools (charts, PDF sections,
+slides) are forked from the warm process.
+
+Usage:
+    python src/cli.py daemon serve &      # Start (stays in the foreground)
+    python src/cli.py --daemon docx       # Run a command in the daemon
+    python src/cli.py daemon status
+    python src/cli.py daemon stop
+
+Only the standard library is imported at module level: the client side
+(send_request) must start as fast as cli.py itself.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import contextlib
+import importlib
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+# Paths
+PROJECT_ROOT = Path(__file__).parent.parent
+SOCKET_PATH = PROJECT_ROOT / '.build' / 'daemon.sock'
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+REPORTS_DIR = PROJECT_ROOT / 'reports'
+
+# Imported at start-up, in this order (the libraries behind every command)
+WARM_MODULES = [
+    'pandas',
+    'matplotlib.pyplot',
+    'analysis.run_complete_eda',
+    'analysis.create_updated_report',
+    'data_pipeline.generate_processed_data',
+    'reporting.md_to_word',
+    'reporting.md_to_pptx',
+    'reporting.pptx_to_pdf',
+    'reporting.md_to_pdf_detailed',
+    'reporting.md_to_pdf_slides',
+    'reporting.report_packs',
+    'full_build',
+    'build',
+]
+
+# Files read by the commands, with the options they are read with
+WARM_CSV_FILES = [
+    (PROCESSED_DIR / 'sales_clean.csv', {'parse_dates': ['date']}),
+    (PROCESSED_DIR / 'sales_clean.csv', {}),
+    (PROCESSED_DIR / 'stores.csv', {}),
+    (PROCESSED_DIR / 'products.csv', {}),
+    (REPORTS_DIR / 'store_performance_summary.csv', {}),
+    (REPORTS_DIR / 'region_performance_summary.csv', {}),
+    (REPORTS_DIR / 'category_performance_summary.csv', {}),
+]
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# WARM-UP
+# ============================================
+
+def warm_up():
+    """
+    Import the libraries and load the fonts, stylesheets and data the commands use.
+
+    Missing optional pieces (e.g. WeasyPrint without its system libraries,
+    data not built yet) are skipped; the command needing them reports the
+    problem when it runs.
+
+    Returns:
+        dict: Warm-up step -> seconds, or the reason it was skipped
+    """
+    steps = {}
+
+    start = time.perf_counter()
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+    steps['imports'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    try:
+        from reporting import md_to_pdf_detailed, md_to_pdf_slides
+        from reporting.pdf_sections import get_font_config, load_stylesheet
+        get_font_config()
+        load_stylesheet(md_to_pdf_detailed.CSS_TEMPLATE)
+        load_stylesheet(md_to_pdf_slides.CSS_TEMPLATE)
+        steps['fonts_and_stylesheets'] = time.perf_counter() - start
+    except (ImportError, OSError) as e:
+        steps['fonts_and_stylesheets'] = f'skipped: {e.__class__.__name__}: {e}'
+
+    start = time.perf_counter()
+    from data_pipeline.artifacts import read_csv_cached
+    from reporting.markdown_document import load_document
+    for path, kwargs in WARM_CSV_FILES:
+        if path.exists():
+            read_csv_cached(path, **kwargs)
+    if (REPORTS_DIR / 'analysis_report.md').exists():
+        load_document(REPORTS_DIR / 'analysis_report.md')
+    steps['data'] = time.perf_counter() - start
+
+    return steps
+
+
+# ============================================
+# SERVER
+# ============================================
+
+def run_command(argv, cwd=None):
+    """
+    Run a cli.py command in this process, capturing its output.
+
+    Args:
+        argv: Command and options, as given to cli.py
+        cwd: Directory relative paths in the options refer to
+
+    Returns:
+        tuple: (exit status, output)
+    """
+    from cli import main as cli_main
+
+    buffer = io.StringIO()
+    log_handler = logging.StreamHandler(buffer)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(log_handler)
+    previous_cwd = os.getcwd()
+
+    try:
+        with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                status = cli_main(argv)
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    status = e.code or 0
+                else:
+                    print(e.code)
+                    status = 1
+            except Exception:
+                traceback.print_exc()
+                status = 1
+    finally:
+        os.chdir(previous_cwd)
+        root_logger.removeHandler(log_handler)
+
+    return status, buffer.getvalue()
+
+
+class BuildRequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes one JSON response line."""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError as e:
+            response = {'status': 2, 'output': f'Invalid request: {e}\n'}
+        else:
+            response = self.server.dispatch(request)
+        self.wfile.write((json.dumps(response) + '\n').encode('utf-8'))
+
+
+class ReportDaemon(socketserver.UnixStreamServer):
+    """Unix socket server running one command at a time in the warm process."""
+
+    def __init__(self, socket_path, warm=True):
+        self.socket_path = Path(socket_path)
+        self.started = time.time()
+        self.requests_served = 0
+        self.warm_up_steps = warm_up() if warm else {}
+        # Create the socket owner-only from the start (chmod alone leaves a window after bind)
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(str(self.socket_path), BuildRequestHandler)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.socket_path, 0o600)
+
+    def dispatch(self, request):
+        """
+        Answer a control request ('ping', 'shutdown') or run a command.
+
+        Args:
+            request: Decoded request dict
+
+        Returns:
+            dict: status and output, plus timing or daemon details
+        """
+        control = request.get('control')
+        if control == 'ping':
+            return {
+                'status': 0, 'output': '', 'pid': os.getpid(),
+                'uptime': time.time() - self.started,
+                'requests_served': self.requests_served,
+                'warm_up': self.warm_up_steps,
+            }
+        if control == 'shutdown':
+            # shutdown() waits for serve_forever, which is running this request
+            threading.Thread(target=self.shutdown).start()
+            return {'status': 0, 'output': 'Daemon stopping\n'}
+        if control is not None:
+            return {'status': 2, 'output': f'Unknown control request: {control}\n'}
+
+        argv = [request.get('command', '')] + list(request.get('argv', []))
+        if argv[0] == 'daemon':
+            return {'status': 2, 'output': 'The daemon command cannot run inside the daemon\n'}
+
+        start = time.perf_counter()
+        status, output = run_command(argv, request.get('cwd'))
+        self.requests_served += 1
+        return {'status': status, 'output': output, 'elapsed': time.perf_counter() - start}
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+
+def is_running(socket_path=SOCKET_PATH):
+    """Return True if a daemon answers on socket_path."""
+    try:
+        send_request({'control': 'ping'}, socket_path, timeout=5)
+        return True
+    except OSError:
+        return False
+
+
+def serve(socket_path=SOCKET_PATH, warm=True):
+    """
+    Warm up and serve requests until a shutdown request (or Ctrl+C).
+
+    Args:
+        socket_path: Unix socket to listen on
+        warm: Pre-load libraries, fonts and data before accepting requests
+
+    Returns:
+        bool: False if another daemon is already listening
+    """
+    socket_path = Path(socket_path)
+    if is_running(socket_path):
+        print(f"A daemon is already running on {socket_path}")
+        return False
+
+    # Left behind by a daemon that did not shut down cleanly
+    with contextlib.suppress(FileNotFoundError):
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    server = ReportDaemon(socket_path, warm=warm)
+    print(f"Report daemon (pid {os.getpid()}) warm in {time.perf_counter() - start:.1f}s, "
+          f"listening on {socket_path}")
+    for step, outcome in server.warm_up_steps.items():
+        print(f"  {step:<22} {outcome if isinstance(outcome, str) else f'{outcome:.2f}s'}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    print("Report daemon stopped")
+    return True
+
+
+# ============================================
+# CLIENT
+# ============================================
+
+def send_request(request, socket_path=SOCKET_PATH, timeout=None):
+    """
+    Send one request to the daemon and wait for its response.
+
+    Args:
+        request: Request dict (see the module docstring)
+        socket_path: Daemon socket
+        timeout: Seconds to wait (None: as long as the command takes)
+
+    Returns:
+        dict: Decoded response
+
+    Raises:
+        OSError: No daemon is listening (FileNotFoundError, ConnectionRefusedError)
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall((json.dumps(request) + '\n').encode('utf-8'))
+        with sock.makefile('rb') as stream:
+            line = stream.readline()
+    if not line:
+        raise ConnectionError('Daemon closed the connection without a response')
+    return json.loads(line)
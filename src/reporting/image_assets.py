@@ -0,0 +1,132 @@
+"""
+Report Image Preparation
+========================
+
+Resamples the 300-DPI chart PNGs in reports/assets/ to the size they are
+displayed at in each output format before they are embedded, so the Word
+document, PowerPoint and PDFs do not carry full-resolution images.
+
+Each output format has an image profile (display width and target DPI).
+Derived images are cached in reports/.image_cache/ by the SHA-256 of the
+source PNG and the target settings, so each chart is resampled once per
+format and shared by every renderer (and by parallel renderer processes).
+
+Example:
+    >>> from reporting.image_assets import prepare_image
+    >>> prepare_image('reports/assets/revenue_by_store.png', 'docx')
+    PosixPath('.../reports/.image_cache/revenue_by_store-1c9e0f3a77d2b4e8.png')
+
+Author: PDF Reporting Specialist
+Date: October 2025
+"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+
+from PIL import Image
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+IMAGE_CACHE_DIR = PROJECT_ROOT / 'reports' / '.image_cache'
+
+# Display width (inches) and target resolution per output format
+IMAGE_PROFILES = {
+    'docx': {'width_in': 5.5, 'dpi': 200},   # md_to_word: Inches(5.5) on A4
+    'pptx': {'width_in': 8.0, 'dpi': 150},   # md_to_pptx: Inches(8) on a 10" slide
+    'pdf': {'width_in': 6.7, 'dpi': 200},    # WeasyPrint: A4 text width (170mm)
+}
+
+# Bump when the resampling changes so cached images are regenerated
+IMAGE_CACHE_VERSION = 1
+
+HTML_IMAGE_PATTERN = re.compile(r'(<img\b[^>]*?\bsrc=")([^"]+\.png)(")', re.IGNORECASE)
+
+
+def get_target_width(profile):
+    """Return the target pixel width of an image profile."""
+    settings = IMAGE_PROFILES[profile]
+    return int(round(settings['width_in'] * settings['dpi']))
+
+
+def prepare_image(source_path, profile, cache_dir=IMAGE_CACHE_DIR, optimize=True):
+    """
+    Return a copy of an image resampled for an output format (cached).
+
+    Images are downsampled (never upsampled) to the profile's display width
+    at its DPI with a Lanczos filter. Fully opaque RGBA charts are stored as
+    RGB, and optimize=True writes the PNG with maximum compression.
+
+    Args:
+        source_path: Source PNG path
+        profile: Image profile name ('docx', 'pptx' or 'pdf')
+        cache_dir: Directory for derived images
+        optimize: Optimize the PNG encoding (slower to write, smaller file)
+
+    Returns:
+        Path of the derived image, or source_path if it is already small
+        enough and no optimization was requested
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if profile not in IMAGE_PROFILES:
+        raise ValueError(f"Unknown image profile '{profile}'. Use one of: {', '.join(IMAGE_PROFILES)}")
+
+    source_path = Path(source_path)
+    target_width = get_target_width(profile)
+    dpi = IMAGE_PROFILES[profile]['dpi']
+
+    content = source_path.read_bytes()
+    digest = hashlib.sha256(content)
+    digest.update(f'{target_width}:{dpi}:{optimize}:{IMAGE_CACHE_VERSION}'.encode())
+    cache_path = Path(cache_dir) / f'{source_path.stem}-{digest.hexdigest()[:16]}.png'
+    if cache_path.exists():
+        return cache_path
+
+    with Image.open(source_path) as image:
+        image.load()
+
+    if image.width <= target_width and not optimize:
+        return source_path
+
+    if image.width > target_width:
+        target_height = max(1, round(image.height * target_width / image.width))
+        image = image.resize((target_width, target_height), Image.LANCZOS)
+
+    # Charts are drawn on an opaque white figure: drop the unused alpha channel
+    if image.mode == 'RGBA' and image.getchannel('A').getextrema() == (255, 255):
+        image = image.convert('RGB')
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+    image.save(tmp_path, format='PNG', optimize=optimize, dpi=(dpi, dpi))
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+
+def prepare_html_images(html_content, base_dir, profile='pdf', cache_dir=IMAGE_CACHE_DIR):
+    """
+    Point the PNG <img> tags of an HTML document at prepared images.
+
+    Relative src paths are resolved against base_dir; missing files are left
+    unchanged so the renderer reports them as before.
+
+    Args:
+        html_content: HTML document
+        base_dir: Directory relative image paths resolve from
+        profile: Image profile name
+        cache_dir: Directory for derived images
+
+    Returns:
+        HTML with src attributes replaced by file:// URIs of the derived images
+    """
+    def replace(match):
+        source_path = Path(base_dir) / match.group(2)
+        if not source_path.exists():
+            return match.group(0)
+        prepared = prepare_image(source_path, profile, cache_dir)
+        return f'{match.group(1)}{prepared.resolve().as_uri()}{match.group(3)}'
+
+    return HTML_IMAGE_PATTERN.sub(replace, html_content)
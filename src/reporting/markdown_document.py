@@ -0,0 +1,385 @@
+"""
+Shared Markdown Document Tree
+=============================
+
+Parses the analysis report Markdown once into a small document tree that
+every output format (Word, detailed PDF, slides, PowerPoint) renders from,
+so the renderers stay consistent.
+
+The tree is a dict of plain lists and dicts (JSON-serializable):
+
+    {
+        'source': 'reports/analysis_report.md',
+        'sha256': '...',
+        'version': PARSER_VERSION,
+        'blocks': [
+            {'type': 'heading', 'level': 2, 'runs': [...]},
+            {'type': 'paragraph', 'lines': [[...], [...]]},
+            {'type': 'list', 'ordered': True, 'items': [[...], [...]]},
+            {'type': 'table', 'rows': [[[...], [...]], ...]},   # header row first
+            {'type': 'image', 'alt': 'Revenue by Store', 'src': 'assets/revenue_by_store.png'},
+            {'type': 'rule'},
+        ]
+    }
+
+Inline text is a list of runs, each a [text, style] pair with style one of
+'text', 'bold', 'italic' or 'code'.
+
+Parsed trees are cached by the SHA-256 of the file content: in memory for the
+current process, and as JSON files in reports/.markdown_cache/ so renderers
+running in separate processes share one parse per build.
+
+Author: PDF Reporting Specialist
+Date: October 2025
+"""
+
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+CACHE_DIR = PROJECT_ROOT / 'reports' / '.markdown_cache'
+
+# Bump when the tree layout changes so cached trees are re-parsed
+PARSER_VERSION = 1
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+IMAGE_PATTERN = re.compile(r'^!\[(.*?)\]\((.*?)\)\s*$')
+ORDERED_ITEM_PATTERN = re.compile(r'^\d+\.\s+(.*)$')
+BULLET_ITEM_PATTERN = re.compile(r'^[-*]\s+(.*)$')
+TABLE_SEPARATOR_PATTERN = re.compile(r'^[\|\-\s:]+$')
+INLINE_PATTERN = re.compile(r'(\*\*[^*]+\*\*|`[^`]+`|\*[^*\s][^*]*\*)')
+
+_DOCUMENT_CACHE = {}
+
+
+# ============================================
+# PARSING
+# ============================================
+
+def parse_inline(text):
+    """
+    Split inline Markdown into styled runs.
+
+    Args:
+        text: Text that may contain **bold**, *italic* and `code` spans
+
+    Returns:
+        List of [text, style] runs
+
+    Example:
+        >>> parse_inline('**Total Revenue**: ¥44M')
+        [['Total Revenue', 'bold'], [': ¥44M', 'text']]
+    """
+    runs = []
+    for part in INLINE_PATTERN.split(text):
+        if not part:
+            continue
+        if part.startswith('**') and part.endswith('**') and len(part) > 4:
+            runs.append([part[2:-2], 'bold'])
+        elif part.startswith('`') and part.endswith('`') and len(part) > 2:
+            runs.append([part[1:-1], 'code'])
+        elif part.startswith('*') and part.endswith('*') and len(part) > 2:
+            runs.append([part[1:-1], 'italic'])
+        else:
+            runs.append([part, 'text'])
+    return runs
+
+
+def parse_table_row(line):
+    """Split a Markdown table row into cell runs."""
+    return [parse_inline(cell.strip()) for cell in line.strip().strip('|').split('|')]
+
+
+def parse_markdown(md_content):
+    """
+    Parse Markdown text into a list of blocks.
+
+    Supports the subset the reports use: ATX headings, paragraphs, ordered
+    and bullet lists, pipe tables, standalone images and horizontal rules.
+
+    Args:
+        md_content: Markdown text
+
+    Returns:
+        List of block dicts (see module docstring)
+    """
+    blocks = []
+    paragraph = None  # Open paragraph block (consecutive text lines)
+    table = None      # Open table block (consecutive pipe rows)
+
+    def add_list_item(ordered, text):
+        # Consecutive items of one kind form one list, even across blank lines
+        previous = blocks[-1] if blocks else None
+        if previous and previous['type'] == 'list' and previous['ordered'] == ordered:
+            previous['items'].append(parse_inline(text))
+        else:
+            blocks.append({'type': 'list', 'ordered': ordered, 'items': [parse_inline(text)]})
+
+    for raw_line in md_content.split('\n'):
+        line = raw_line.rstrip()
+        stripped = line.strip()
+
+        # Tables: consecutive pipe rows, separator row dropped
+        if stripped.startswith('|'):
+            if table is None:
+                table = {'type': 'table', 'rows': []}
+                blocks.append(table)
+            if not (len(table['rows']) == 1 and TABLE_SEPARATOR_PATTERN.match(stripped)):
+                table['rows'].append(parse_table_row(stripped))
+            paragraph = None
+            continue
+
+        table = None
+        if not stripped:
+            paragraph = None
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        image = IMAGE_PATTERN.match(stripped)
+        ordered_item = ORDERED_ITEM_PATTERN.match(line)
+        bullet_item = BULLET_ITEM_PATTERN.match(line)
+
+        if paragraph is not None and not (heading or image or ordered_item or bullet_item
+                                          or stripped == '---'):
+            paragraph['lines'].append(parse_inline(stripped))
+            continue
+
+        paragraph = None
+        if heading:
+            blocks.append({'type': 'heading', 'level': len(heading.group(1)),
+                           'runs': parse_inline(heading.group(2))})
+        elif stripped == '---':
+            blocks.append({'type': 'rule'})
+        elif image:
+            blocks.append({'type': 'image', 'alt': image.group(1), 'src': image.group(2)})
+        elif ordered_item:
+            add_list_item(True, ordered_item.group(1).strip())
+        elif bullet_item:
+            add_list_item(False, bullet_item.group(1).strip())
+        else:
+            paragraph = {'type': 'paragraph', 'lines': [parse_inline(stripped)]}
+            blocks.append(paragraph)
+
+    return blocks
+
+
+# ============================================
+# CACHED LOADING
+# ============================================
+
+def load_document(md_path, cache_dir=CACHE_DIR):
+    """
+    Load the parsed document tree of a Markdown file, parsing it only once.
+
+    Trees are looked up by content hash in memory, then in cache_dir; a
+    changed file has a new hash and is parsed again.
+
+    Args:
+        md_path: Path to the Markdown file
+        cache_dir: Directory for cached JSON trees (None: memory only)
+
+    Returns:
+        Document dict with source, sha256, version and blocks
+
+    Example:
+        >>> document = load_document('reports/analysis_report.md')
+        >>> document['blocks'][0]['type']
+        'heading'
+    """
+    md_path = Path(md_path)
+    content = md_path.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+
+    document = _DOCUMENT_CACHE.get(digest)
+    if document is not None:
+        return document
+
+    cache_path = Path(cache_dir) / f'{digest}.json' if cache_dir else None
+    if cache_path is not None and cache_path.exists():
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable document cache {cache_path}: {e}")
+            document = None
+        if document is not None and document.get('version') != PARSER_VERSION:
+            document = None
+
+    if document is None:
+        document = {
+            'source': str(md_path),
+            'sha256': digest,
+            'version': PARSER_VERSION,
+            'blocks': parse_markdown(content.decode('utf-8')),
+        }
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(document, f, ensure_ascii=False)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning(f"Could not write document cache {cache_path}: {e}")
+
+    _DOCUMENT_CACHE[digest] = document
+    return document
+
+
+def parse_document(md_content, source='<memory>'):
+    """
+    Build the document tree of Markdown text held in memory.
+
+    Trees are cached in memory by content hash, so a report generated in
+    the same process is parsed once however many formats render it.
+
+    Args:
+        md_content: Markdown text
+        source: Label stored as the document source
+
+    Returns:
+        Document dict with source, sha256, version and blocks
+    """
+    digest = hashlib.sha256(md_content.encode('utf-8')).hexdigest()
+    document = _DOCUMENT_CACHE.get(digest)
+    if document is None:
+        document = {
+            'source': str(source),
+            'sha256': digest,
+            'version': PARSER_VERSION,
+            'blocks': parse_markdown(md_content),
+        }
+        _DOCUMENT_CACHE[digest] = document
+    return document
+
+
+def clear_document_cache():
+    """Forget all trees parsed in this process (the disk cache is kept)."""
+    _DOCUMENT_CACHE.clear()
+
+
+# ============================================
+# TREE HELPERS
+# ============================================
+
+def plain_text(runs):
+    """Return the text of a run list without any styling."""
+    return ''.join(text for text, _ in runs)
+
+
+def find_section(document, title):
+    """
+    Return the blocks under the heading with the given text.
+
+    The section ends at the next heading of the same or a higher level.
+
+    Args:
+        document: Document dict (from load_document)
+        title: Heading text, e.g. 'Key Findings'
+
+    Returns:
+        List of blocks (empty if the heading is not found)
+    """
+    blocks = document['blocks']
+    for start, block in enumerate(blocks):
+        if block['type'] == 'heading' and plain_text(block['runs']).strip() == title:
+            section = []
+            for following in blocks[start + 1:]:
+                if following['type'] == 'heading' and following['level'] <= block['level']:
+                    break
+                section.append(following)
+            return section
+    return []
+
+
+def section_list_items(document, title):
+    """Return the list items (as runs) of a section, in order."""
+    return [
+        item
+        for block in find_section(document, title) if block['type'] == 'list'
+        for item in block['items']
+    ]
+
+
+def split_lead(runs):
+    """
+    Split a '**Lead**: detail' list item into its lead and detail text.
+
+    Args:
+        runs: Runs of one list item
+
+    Returns:
+        Tuple of (lead text, detail text); lead is '' without a bold lead-in
+    """
+    if not runs or runs[0][1] != 'bold':
+        return '', plain_text(runs).strip()
+    detail = plain_text(runs[1:]).strip()
+    return runs[0][0].strip(), detail.lstrip(':').strip()
+
+
+def first_sentence(text):
+    """Return the first sentence of a text (up to and including '. ')."""
+    match = re.match(r'(.+?[.!?])(\s|$)', text)
+    return match.group(1) if match else text
+
+
+# ============================================
+# HTML RENDERING
+# ============================================
+
+RUN_TAGS = {'bold': 'strong', 'italic': 'em', 'code': 'code'}
+
+
+def runs_to_html(runs):
+    """Render runs as escaped inline HTML."""
+    parts = []
+    for text, style in runs:
+        tag = RUN_TAGS.get(style)
+        escaped = html.escape(text, quote=False)
+        parts.append(f'<{tag}>{escaped}</{tag}>' if tag else escaped)
+    return ''.join(parts)
+
+
+def render_html(document):
+    """
+    Render a document tree as an HTML body fragment.
+
+    Args:
+        document: Document dict (from load_document)
+
+    Returns:
+        HTML string
+    """
+    parts = []
+    for block in document['blocks']:
+        kind = block['type']
+        if kind == 'heading':
+            parts.append(f"<h{block['level']}>{runs_to_html(block['runs'])}</h{block['level']}>")
+        elif kind == 'paragraph':
+            parts.append('<p>' + '<br />\n'.join(runs_to_html(line) for line in block['lines']) + '</p>')
+        elif kind == 'list':
+            tag = 'ol' if block['ordered'] else 'ul'
+            items = '\n'.join(f'<li>{runs_to_html(item)}</li>' for item in block['items'])
+            parts.append(f'<{tag}>\n{items}\n</{tag}>')
+        elif kind == 'table':
+            header, *body = block['rows']
+            head_cells = ''.join(f'<th>{runs_to_html(cell)}</th>' for cell in header)
+            body_rows = '\n'.join(
+                '<tr>' + ''.join(f'<td>{runs_to_html(cell)}</td>' for cell in row) + '</tr>'
+                for row in body
+            )
+            parts.append(f'<table>\n<thead>\n<tr>{head_cells}</tr>\n</thead>\n'
+                         f'<tbody>\n{body_rows}\n</tbody>\n</table>')
+        elif kind == 'image':
+            parts.append(f'<p><img alt="{html.escape(block["alt"])}" src="{html.escape(block["src"])}" /></p>')
+        elif kind == 'rule':
+            parts.append('<hr />')
+    return '\n'.join(parts)
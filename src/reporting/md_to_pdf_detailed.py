@@ -9,12 +9,18 @@ Format: A4 Portrait (210mm x 297mm)
 Target: 20-30 pages of well-formatted content
 Output: reports/detailed_report.pdf
 
+The report is split into sections at its level-2 headings; sections are
+laid out in parallel worker processes and merged into one PDF with
+continuous page numbering (see reporting.pdf_sections).
+
 Dependencies:
     - weasyprint: PDF generation engine
-    - markdown: Markdown to HTML conversion
+    - pypdf: merging the rendered sections
+    - reporting.markdown_document: shared Markdown document tree
 
 Usage:
     python src/reporting/md_to_pdf_detailed.py
+    python src/reporting/md_to_pdf_detailed.py --workers 4
 
 Author: Data Reporting Specialist
 Project: Multi-Store Sales Analysis
@@ -23,10 +29,16 @@ Phase: 4 - PDF Reporting
 
 import os
 import sys
+import argparse
 from pathlib import Path
 from datetime import datetime
-from weasyprint import HTML, CSS
-from markdown import markdown
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reporting.markdown_document import load_document, render_html
+from reporting.image_assets import prepare_html_images
+from reporting.pdf_sections import split_sections, render_sections
 
 # ============================================
 # CONFIGURATION
@@ -41,14 +53,6 @@ CSS_TEMPLATE = PROJECT_ROOT / "src" / "reporting" / "templates" / "detailed_repo
 PDF_OUTPUT = PROJECT_ROOT / "reports" / "detailed_report.pdf"
 ASSETS_DIR = PROJECT_ROOT / "reports" / "assets"
 
-# Markdown extensions for proper rendering
-MARKDOWN_EXTENSIONS = [
-    'tables',           # Support for tables
-    'fenced_code',      # Support for code blocks
-    'nl2br',            # Convert newlines to <br>
-    'sane_lists',       # Better list handling
-]
-
 
 # ============================================
 # HELPER FUNCTIONS
@@ -103,65 +107,69 @@ def validate_files():
 
 def read_markdown_file():
     """
-    Read and return the content of the Markdown file.
+    Load the parsed document tree of the Markdown file.
+
+    The tree is shared with the other report formats and cached by file
+    hash, so the Markdown is parsed once per build.
 
     Returns:
-        str: Markdown content
+        dict: Document tree (see reporting.markdown_document)
     """
     print(f"\nReading Markdown file...")
     try:
-        with open(MARKDOWN_INPUT, 'r', encoding='utf-8') as f:
-            content = f.read()
+        document = load_document(MARKDOWN_INPUT)
 
-        lines = len(content.split('\n'))
-        chars = len(content)
-        print(f"✓ Read {lines:,} lines ({chars:,} characters)")
-        return content
+        print(f"✓ Read {len(document['blocks']):,} blocks (sha256 {document['sha256'][:12]})")
+        return document
 
     except Exception as e:
         print(f"❌ Error reading Markdown file: {e}")
         sys.exit(1)
 
 
-def convert_markdown_to_html(markdown_content):
+def convert_markdown_to_html(document):
     """
-    Convert Markdown content to HTML with proper extensions.
+    Render the Markdown document tree as HTML, one body per report section.
 
     Args:
-        markdown_content (str): Raw Markdown text
+        document (dict): Document tree from read_markdown_file
 
     Returns:
-        str: HTML content
+        list: HTML body of each section (split at level-2 headings)
     """
     print(f"\nConverting Markdown to HTML...")
     try:
-        html_body = markdown(
-            markdown_content,
-            extensions=MARKDOWN_EXTENSIONS
-        )
+        section_bodies = [render_html({'blocks': blocks}) for blocks in split_sections(document)]
 
-        print(f"✓ HTML conversion successful ({len(html_body):,} characters)")
-        return html_body
+        total_chars = sum(len(body) for body in section_bodies)
+        print(f"✓ HTML conversion successful ({len(section_bodies)} sections, {total_chars:,} characters)")
+        return section_bodies
 
     except Exception as e:
         print(f"❌ Error converting Markdown to HTML: {e}")
         sys.exit(1)
 
 
-def create_html_document(html_body):
+def create_html_document(html_body, include_footer=True):
     """
     Wrap HTML body in complete HTML document with proper metadata.
 
     Args:
         html_body (str): HTML content from Markdown conversion
+        include_footer (bool): Append the report footer (last section only)
 
     Returns:
         str: Complete HTML document
     """
-    print(f"\nCreating HTML document structure...")
+    footer = f"""
+<div class="report-footer">
+    <p><strong>Multi-Store Fashion Retail Sales Analysis</strong></p>
+    <p>Generated: {datetime.now().strftime('%B %d, %Y at %H:%M')}</p>
+    <p>Generated with Claude Code | Data Reporting Specialist</p>
+</div>""" if include_footer else ""
 
     # Build complete HTML document
-    html_document = f"""<!DOCTYPE html>
+    return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -174,51 +182,67 @@ def create_html_document(html_body):
 </head>
 <body>
 {html_body}
-
-<div class="report-footer">
-    <p><strong>Multi-Store Fashion Retail Sales Analysis</strong></p>
-    <p>Generated: {datetime.now().strftime('%B %d, %Y at %H:%M')}</p>
-    <p>Generated with Claude Code | Data Reporting Specialist</p>
-</div>
+{footer}
 </body>
 </html>"""
 
-    print(f"✓ HTML document created")
-    return html_document
 
+def create_html_documents(section_bodies):
+    """
+    Wrap each section body in a complete HTML document.
+
+    Args:
+        section_bodies (list): HTML body of each section
 
-def generate_pdf(html_content):
+    Returns:
+        list: Complete HTML document of each section
     """
-    Generate PDF from HTML content using WeasyPrint.
+    print(f"\nCreating HTML document structure...")
+
+    last = len(section_bodies) - 1
+    html_documents = [
+        create_html_document(body, include_footer=(index == last))
+        for index, body in enumerate(section_bodies)
+    ]
+
+    print(f"✓ {len(html_documents)} section documents created")
+    return html_documents
+
+
+def generate_pdf(html_documents, output_path=PDF_OUTPUT, base_dir=PROJECT_ROOT / "reports",
+                 max_workers=None):
+    """
+    Generate PDF from the section HTML documents using WeasyPrint.
+
+    Sections are rendered in parallel worker processes with the stylesheet
+    parsed once, then merged with continuous "Page X of Y" numbering.
 
     Args:
-        html_content (str): Complete HTML document
+        html_documents (list): Complete HTML document of each section
+        output_path (Path): Output PDF path (defaults to PDF_OUTPUT)
+        base_dir (Path): Directory that relative image paths (assets/...) resolve from
+        max_workers (int): Worker processes (defaults to the CPU count)
     """
     print(f"\nGenerating PDF...")
-    print(f"This may take 30-60 seconds for a 20-30 page report...")
+    print(f"Rendering {len(html_documents)} sections on {max_workers or os.cpu_count() or 1} worker(s)...")
 
     try:
-        # Create HTML object with base URL for resolving relative paths
-        html_obj = HTML(
-            string=html_content,
-            base_url=str(PROJECT_ROOT / "reports")
-        )
-
-        # Load CSS stylesheet
-        css_obj = CSS(filename=str(CSS_TEMPLATE))
+        # Embed charts resampled to their printed size (cached)
+        html_documents = [prepare_html_images(html_document, base_dir, 'pdf')
+                          for html_document in html_documents]
 
-        # Generate PDF
-        html_obj.write_pdf(
-            target=str(PDF_OUTPUT),
-            stylesheets=[css_obj]
-        )
+        # Lay out sections in parallel and merge them into one PDF
+        stats = render_sections(html_documents, output_path, CSS_TEMPLATE, base_dir,
+                                max_workers=max_workers)
 
         # Get PDF file size
-        pdf_size = PDF_OUTPUT.stat().st_size
+        pdf_size = Path(output_path).stat().st_size
         pdf_size_mb = pdf_size / (1024 * 1024)
 
         print(f"✓ PDF generated successfully!")
-        print(f"  Output: {PDF_OUTPUT}")
+        print(f"  Output: {output_path}")
+        print(f"  Pages: {stats['pages']} ({stats['sections']} sections, "
+              f"{stats['passes']} layout pass(es))")
         print(f"  Size: {pdf_size_mb:.2f} MB ({pdf_size:,} bytes)")
 
     except Exception as e:
@@ -226,7 +250,7 @@ def generate_pdf(html_content):
         print(f"\nTroubleshooting tips:")
         print(f"  1. Ensure all images in reports/assets/ are valid PNG files")
         print(f"  2. Check that Markdown file doesn't have syntax errors")
-        print(f"  3. Verify WeasyPrint is properly installed: pip install weasyprint")
+        print(f"  3. Verify WeasyPrint is properly installed: pip install weasyprint pypdf")
         print(f"  4. Check CSS template for syntax errors")
         sys.exit(1)
 
@@ -252,24 +276,28 @@ def display_summary():
 # MAIN EXECUTION
 # ============================================
 
-def main():
+def main(argv=None):
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Generate the detailed PDF report")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Section rendering processes (default: CPU count)")
+    args = parser.parse_args(argv)
 
     # Step 1: Validate all required files exist
     if not validate_files():
         sys.exit(1)
 
-    # Step 2: Read Markdown file
-    markdown_content = read_markdown_file()
+    # Step 2: Read Markdown file (shared, cached document tree)
+    document = read_markdown_file()
 
-    # Step 3: Convert Markdown to HTML
-    html_body = convert_markdown_to_html(markdown_content)
+    # Step 3: Convert Markdown to HTML (one body per section)
+    section_bodies = convert_markdown_to_html(document)
 
-    # Step 4: Create complete HTML document
-    html_document = create_html_document(html_body)
+    # Step 4: Create complete HTML documents
+    html_documents = create_html_documents(section_bodies)
 
-    # Step 5: Generate PDF
-    generate_pdf(html_document)
+    # Step 5: Generate PDF (sections in parallel)
+    generate_pdf(html_documents, max_workers=args.workers)
 
     # Step 6: Display summary
     display_summary()
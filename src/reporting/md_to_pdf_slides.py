@@ -11,7 +11,7 @@ Output: reports/executive_slides.pdf
 
 Dependencies:
     - weasyprint: PDF generation engine
-    - markdown: Markdown to HTML conversion (minimal use)
+    - reporting.markdown_document: shared Markdown document tree
 
 Usage:
     python src/reporting/md_to_pdf_slides.py
@@ -23,9 +23,16 @@ Phase: 4 - PDF Reporting
 
 import os
 import sys
+import html
 from pathlib import Path
 from datetime import datetime
-from weasyprint import HTML, CSS
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reporting.markdown_document import load_document, section_list_items, split_lead, first_sentence
+from reporting.image_assets import prepare_html_images
+from reporting.pdf_sections import get_font_config, load_stylesheet
 
 # ============================================
 # CONFIGURATION
@@ -45,11 +52,54 @@ ASSETS_DIR = PROJECT_ROOT / "reports" / "assets"
 # SLIDE CONTENT CREATION
 # ============================================
 
-def create_slides_html():
+def build_summary_items(document):
+    """
+    Build the executive summary bullets from the report's Key Findings.
+
+    Args:
+        document (dict): Markdown document tree
+
+    Returns:
+        str: HTML list items (bold lead-in and first sentence of each finding)
+    """
+    items = []
+    for runs in section_list_items(document, 'Key Findings'):
+        lead, detail = split_lead(runs)
+        items.append(f"        <li><strong>{html.escape(lead, quote=False)}</strong>: "
+                     f"{html.escape(first_sentence(detail), quote=False)}</li>")
+    return '\n'.join(items)
+
+
+def build_recommendation_items(document):
+    """
+    Build the recommendation slide items from the report's Strategic Recommendations.
+
+    Args:
+        document (dict): Markdown document tree
+
+    Returns:
+        str: HTML list items (first three marked high priority)
+    """
+    items = []
+    for i, runs in enumerate(section_list_items(document, 'Strategic Recommendations')):
+        lead, detail = split_lead(runs)
+        priority = 'priority-high' if i < 3 else 'priority-medium'
+        items.append(f'        <li class="{priority}"><strong>{html.escape(lead, quote=False)}</strong><br>\n'
+                     f'        {html.escape(first_sentence(detail), quote=False)}</li>')
+    return '\n\n'.join(items)
+
+
+def create_slides_html(document=None):
     """
     Create HTML content for executive slides by extracting key insights
     from the analysis report.
 
+    The summary and recommendation slides are taken from the shared Markdown
+    document tree, so they always match the detailed report.
+
+    Args:
+        document (dict): Markdown document tree (defaults to loading MARKDOWN_INPUT)
+
     Returns:
         str: Complete HTML document for slides
     """
@@ -58,6 +108,9 @@ def create_slides_html():
     print("="*60)
     print(f"\nCreating slide content...")
 
+    if document is None:
+        document = load_document(MARKDOWN_INPUT)
+
     slides_html = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -81,11 +134,7 @@ def create_slides_html():
 <section class="slide summary-slide">
     <h2>Executive Summary</h2>
     <ul>
-        <li><strong>¥34.9M revenue</strong> from 928 transactions across 8 stores</li>
-        <li><strong>42% performance gap</strong> between top (Osaka) and bottom (Hiroshima) stores</li>
-        <li><strong>Footwear dominates</strong> with 29.1% revenue share (¥10.1M)</li>
-        <li><strong>Weekdays outperform weekends</strong> by 29% (untapped weekend opportunity)</li>
-        <li><strong>¥66M net benefit</strong> potential from Q2 recommendations (4.0x ROI)</li>
+{summary_items}
     </ul>
 </section>
 
@@ -198,17 +247,7 @@ def create_slides_html():
     <h2>Strategic Recommendations for Q2 2024</h2>
 
     <ol>
-        <li class="priority-high"><strong>Replicate Osaka Success Model</strong><br>
-        Deploy best practices to underperforming stores (Target: +¥18M annual)</li>
-
-        <li class="priority-high"><strong>Expand Footwear Inventory 20-25%</strong><br>
-        Capitalize on category strength (Target: +¥2M monthly)</li>
-
-        <li class="priority-high"><strong>Launch Weekday VIP Program</strong><br>
-        Leverage high-value weekday customers (Target: +¥37M annual)</li>
-
-        <li class="priority-medium"><strong>Weekend Activation Program</strong><br>
-        Events and promotions to drive weekend traffic (Target: +¥11M Apr-Aug)</li>
+{recommendation_items}
     </ol>
 </section>
 
@@ -290,7 +329,10 @@ def create_slides_html():
 </section>
 
 </body>
-</html>"""
+</html>""".format(
+        summary_items=build_summary_items(document),
+        recommendation_items=build_recommendation_items(document)
+    )
 
     print(f"✓ Created 14 executive slides")
     print(f"  - Slide 1: Title")
@@ -360,38 +402,45 @@ def validate_files():
     return True
 
 
-def generate_pdf(html_content):
+def generate_pdf(html_content, output_path=PDF_OUTPUT, base_dir=PROJECT_ROOT / "reports"):
     """
     Generate PDF from HTML content using WeasyPrint.
 
     Args:
         html_content (str): Complete HTML document
+        output_path (Path): Output PDF path (defaults to PDF_OUTPUT)
+        base_dir (Path): Directory that relative image paths (assets/...) resolve from
     """
     print(f"\nGenerating executive slides PDF...")
     print(f"This may take 20-40 seconds for 14 slides...")
 
     try:
-        # Create HTML object
+        # Embed charts resampled to their printed size (cached)
+        html_content = prepare_html_images(html_content, base_dir, 'pdf')
+
+        # Create HTML object (WeasyPrint is imported only when a PDF is made)
+        from weasyprint import HTML
         html_obj = HTML(
             string=html_content,
-            base_url=str(PROJECT_ROOT / "reports")
+            base_url=str(base_dir)
         )
 
-        # Load CSS stylesheet
-        css_obj = CSS(filename=str(CSS_TEMPLATE))
+        # Parsed stylesheet and font configuration (shared per process)
+        css_obj = load_stylesheet(CSS_TEMPLATE)
 
         # Generate PDF
         html_obj.write_pdf(
-            target=str(PDF_OUTPUT),
-            stylesheets=[css_obj]
+            target=str(output_path),
+            stylesheets=[css_obj],
+            font_config=get_font_config()
         )
 
         # Get PDF file size
-        pdf_size = PDF_OUTPUT.stat().st_size
+        pdf_size = Path(output_path).stat().st_size
         pdf_size_mb = pdf_size / (1024 * 1024)
 
         print(f"✓ PDF generated successfully!")
-        print(f"  Output: {PDF_OUTPUT}")
+        print(f"  Output: {output_path}")
         print(f"  Size: {pdf_size_mb:.2f} MB ({pdf_size:,} bytes)")
 
     except Exception as e:
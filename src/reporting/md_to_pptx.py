@@ -8,9 +8,11 @@ for the Multi-Store Fashion Retail Sales Analysis.
 Features:
 - 16:9 widescreen format
 - Modern professional design
-- Embedded charts from reports/assets/
+- Embedded charts from reports/assets/ (resampled to display size)
 - Fully editable in PowerPoint, Google Slides, Keynote
 - Consistent branding with blue color scheme
+- Key findings and recommendations taken from the shared Markdown
+  document tree (reporting.markdown_document)
 
 Author: PDF Reporting Specialist
 Date: October 2025
@@ -21,7 +23,14 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pathlib import Path
-import pandas as pd
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from reporting.markdown_document import load_document, section_list_items, split_lead
+from reporting.image_assets import IMAGE_PROFILES, prepare_image
+from data_pipeline.artifacts import read_csv_cached
 
 
 # Brand colors
@@ -179,9 +188,10 @@ def add_chart_slide(prs, title, chart_path, caption=""):
     if Path(chart_path).exists():
         left = Inches(1)
         top = Inches(1.3)
-        width = Inches(8)
+        width = Inches(IMAGE_PROFILES['pptx']['width_in'])
 
-        slide.shapes.add_picture(str(chart_path), left, top, width=width)
+        # Embed a copy resampled to the display size (cached)
+        slide.shapes.add_picture(str(prepare_image(chart_path, 'pptx')), left, top, width=width)
 
         # Add caption if provided
         if caption:
@@ -268,20 +278,29 @@ def add_metrics_slide(prs, sales_df):
                        color=WHITE, align=PP_ALIGN.CENTER)
 
 
-def add_recommendations_slide(prs):
+def get_section_leads(document, title):
+    """
+    Return the bold lead-ins of a report section's list items.
+
+    Args:
+        document: Markdown document tree
+        title: Section heading, e.g. 'Key Findings'
+
+    Returns:
+        List of short bullet strings
+    """
+    return [lead or detail for lead, detail in map(split_lead, section_list_items(document, title))]
+
+
+def add_recommendations_slide(prs, document):
     """
     Add strategic recommendations slide.
 
     Args:
         prs: Presentation object
+        document: Markdown document tree of the analysis report
     """
-    recommendations = [
-        "Replicate Fukuoka's strong 3rd-place performance in other regions",
-        "Expand footwear inventory by 25-30% in Q2 (highest revenue category)",
-        "Launch weekend activation initiatives to boost Saturday/Sunday sales",
-        "Implement best practice exchange program between top and growth stores",
-        "Balance Kanto concentration risk (39% share) with regional diversification"
-    ]
+    recommendations = get_section_leads(document, 'Strategic Recommendations')
 
     add_content_slide(prs, "Strategic Recommendations for Q2 2024", recommendations)
 
@@ -333,9 +352,15 @@ def add_closing_slide(prs):
                    color=LIGHT_BLUE, align=PP_ALIGN.CENTER)
 
 
-def generate_powerpoint():
+def generate_powerpoint(output_file=None, assets_dir=None, sales_df=None, document=None):
     """
     Main function to generate PowerPoint presentation.
+
+    Args:
+        output_file: Output .pptx path (defaults to reports/executive_slides.pptx)
+        assets_dir: Directory containing chart images (defaults to reports/assets)
+        sales_df: Sales DataFrame (defaults to loading data/processed/sales_clean.csv)
+        document: Markdown document tree (defaults to loading reports/analysis_report.md)
     """
     print("=" * 80)
     print("POWERPOINT PRESENTATION GENERATOR")
@@ -344,19 +369,25 @@ def generate_powerpoint():
 
     # Define paths
     project_root = Path(__file__).parent.parent.parent
-    assets_dir = project_root / 'reports' / 'assets'
-    output_file = project_root / 'reports' / 'executive_slides.pptx'
+    assets_dir = Path(assets_dir) if assets_dir else project_root / 'reports' / 'assets'
+    output_file = Path(output_file) if output_file else project_root / 'reports' / 'executive_slides.pptx'
     sales_file = project_root / 'data' / 'processed' / 'sales_clean.csv'
+    markdown_file = project_root / 'reports' / 'analysis_report.md'
 
     print(f"Assets directory: {assets_dir}")
     print(f"Output file: {output_file}")
     print()
 
     # Load sales data
-    print("Loading sales data...")
-    sales_df = pd.read_csv(sales_file)
-    print(f"✓ Loaded {len(sales_df):,} transactions")
-    print()
+    if sales_df is None:
+        print("Loading sales data...")
+        sales_df = read_csv_cached(sales_file)
+        print(f"✓ Loaded {len(sales_df):,} transactions")
+        print()
+
+    # Shared report document tree (findings and recommendations)
+    if document is None:
+        document = load_document(markdown_file)
 
     # Create presentation
     print("Creating PowerPoint presentation...")
@@ -429,18 +460,12 @@ def generate_powerpoint():
 
     # Slide 11: Key Findings
     print(" [11/13] Key findings")
-    findings = [
-        "7-region national coverage achieved with 10-store network",
-        "¥528M annual revenue run-rate (¥44M monthly)",
-        "Consistent footwear strength across all stores indicates solid positioning",
-        "Kyushu market entry successful - Fukuoka ranks #3 nationally",
-        "Weekend activation opportunity identified"
-    ]
+    findings = get_section_leads(document, 'Key Findings')
     add_content_slide(prs, "Key Findings", findings)
 
     # Slide 12: Recommendations
     print(" [12/13] Recommendations")
-    add_recommendations_slide(prs)
+    add_recommendations_slide(prs, document)
 
     # Slide 13: Closing
     print(" [13/13] Closing slide")
@@ -488,6 +513,5 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     success = main()
     sys.exit(0 if success else 1)
@@ -6,9 +6,10 @@ This script converts the Markdown analysis report to a professional
 Microsoft Word document (.docx) format.
 
 Features:
-- Parses Markdown headings, lists, tables, and images
+- Renders the shared Markdown document tree (headings, lists, tables,
+  images, bold/italic runs) from reporting.markdown_document
 - Professional styling with custom fonts and colors
-- Embedded images from reports/assets/
+- Embedded images from reports/assets/ (resampled to display size)
 - Japanese text support
 - Table of contents
 - Headers and footers with page numbers
@@ -18,6 +19,7 @@ Date: October 2025
 """
 
 import re
+import sys
 from pathlib import Path
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor, Cm
@@ -26,6 +28,12 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from reporting.markdown_document import CACHE_DIR, load_document, plain_text
+from reporting.image_assets import IMAGE_CACHE_DIR, IMAGE_PROFILES, prepare_image
+
 
 def set_cell_background_color(cell, color):
     """
@@ -109,30 +117,25 @@ def setup_styles(doc):
     normal.paragraph_format.space_after = Pt(8)
 
 
-def parse_markdown_table(table_text):
+def add_runs(paragraph, runs):
     """
-    Parse Markdown table into rows and columns.
+    Add styled runs to a paragraph.
 
-    Args:
-        table_text: Markdown table as string
+    Bold, italic and code runs get real formatting instead of leaving the
+    Markdown markers visible.
 
-    Returns:
-        List of lists (rows and columns)
+    Args:
+        paragraph: The paragraph object to add text to
+        runs: List of [text, style] runs from the document tree
     """
-    lines = [line.strip() for line in table_text.strip().split('\n') if line.strip()]
-
-    # Remove separator line (second line with dashes)
-    if len(lines) > 1 and re.match(r'^[\|\-\s:]+$', lines[1]):
-        lines.pop(1)
-
-    # Parse rows
-    rows = []
-    for line in lines:
-        # Remove leading/trailing pipes and split by pipe
-        cells = [cell.strip() for cell in line.strip('|').split('|')]
-        rows.append(cells)
-
-    return rows
+    for text, style in runs:
+        run = paragraph.add_run(text)
+        if style == 'bold':
+            run.bold = True
+        elif style == 'italic':
+            run.italic = True
+        elif style == 'code':
+            run.font.name = 'Consolas'
 
 
 def add_table_to_doc(doc, rows):
@@ -141,7 +144,7 @@ def add_table_to_doc(doc, rows):
 
     Args:
         doc: Document object
-        rows: List of lists (table data)
+        rows: Table rows from the document tree (lists of cell runs)
     """
     if not rows:
         return
@@ -152,74 +155,42 @@ def add_table_to_doc(doc, rows):
     # Fill in data first
     for i, row_data in enumerate(rows):
         cells = table.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            cells[j].text = cell_data
+        for j, cell_runs in enumerate(row_data[:len(cells)]):
+            paragraph = cells[j].paragraphs[0]
+            add_runs(paragraph, cell_runs)
 
             # Format text if cell has content
-            if cells[j].paragraphs[0].runs:
-                cells[j].paragraphs[0].runs[0].font.size = Pt(10)
+            for run in paragraph.runs:
+                run.font.size = Pt(10)
 
             # Align numbers to the right
-            if re.match(r'^[\d,\.¥\-%]+$', cell_data.strip()):
-                cells[j].paragraphs[0].alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
+            if re.match(r'^[\d,\.¥\-%]+$', plain_text(cell_runs).strip()):
+                paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
 
     # Format header row (after text is added)
     header_cells = table.rows[0].cells
     for cell in header_cells:
         set_cell_background_color(cell, (52, 152, 219))  # Blue background
-        if cell.paragraphs[0].runs:
-            cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-            cell.paragraphs[0].runs[0].font.bold = True
+        for run in cell.paragraphs[0].runs:
+            run.font.color.rgb = RGBColor(255, 255, 255)
+            run.font.bold = True
 
     doc.add_paragraph()  # Add spacing after table
 
 
-def add_formatted_text(paragraph, text):
-    """
-    Add text to a paragraph with proper bold formatting.
-
-    Parses text for **bold** markers and applies actual bold formatting
-    instead of leaving the ** markers visible.
-
-    Args:
-        paragraph: The paragraph object to add text to
-        text: Text string that may contain **bold** markers
-    """
-    if '**' not in text:
-        # No formatting needed, just add the text
-        paragraph.add_run(text)
-        return
-
-    # Split text by bold markers, keeping the markers in the result
-    parts = re.split(r'(\*\*[^*]+\*\*)', text)
-
-    for part in parts:
-        if not part:  # Skip empty parts
-            continue
-
-        if part.startswith('**') and part.endswith('**') and len(part) > 4:
-            # This is bold text - remove markers and apply bold formatting
-            bold_text = part[2:-2]  # Remove ** from both ends
-            run = paragraph.add_run(bold_text)
-            run.bold = True
-        else:
-            # Regular text
-            paragraph.add_run(part)
-
-
-def convert_markdown_to_docx(md_path, output_path, assets_dir):
+def convert_markdown_to_docx(md_path, output_path, assets_dir, cache_dir=CACHE_DIR,
+                             image_cache_dir=IMAGE_CACHE_DIR, document=None):
     """
     Convert Markdown file to Word document.
 
     Args:
-        md_path: Path to Markdown file
+        md_path: Path to Markdown file (unused when document is given)
         output_path: Path for output .docx file
         assets_dir: Directory containing image assets
+        cache_dir: Directory for cached document trees (None: no disk cache)
+        image_cache_dir: Directory for resampled images
+        document: Parsed document tree to render instead of loading md_path
     """
-    # Read Markdown content
-    with open(md_path, 'r', encoding='utf-8') as f:
-        md_content = f.read()
-
     # Create document
     doc = Document()
 
@@ -267,103 +238,61 @@ def convert_markdown_to_docx(md_path, output_path, assets_dir):
     footer_para.runs[0].font.size = Pt(9)
     footer_para.runs[0].font.color.rgb = RGBColor(128, 128, 128)
 
-    # Parse Markdown content
-    lines = md_content.split('\n')
-    i = 0
-    in_table = False
-    table_buffer = []
+    # Render the shared document tree (parsed once per file content)
+    if document is None:
+        document = load_document(md_path, cache_dir=cache_dir)
 
-    while i < len(lines):
-        line = lines[i]
-
-        # Skip empty lines unless in table
-        if not line.strip() and not in_table:
-            i += 1
-            continue
+    for block in document['blocks']:
+        kind = block['type']
 
         # Headings
-        if line.startswith('# ') and not line.startswith('##'):
-            doc.add_heading(line[2:].strip(), level=1)
-
-        elif line.startswith('## '):
-            doc.add_heading(line[3:].strip(), level=2)
-
-        elif line.startswith('### '):
-            doc.add_heading(line[4:].strip(), level=3)
-
-        elif line.startswith('#### '):
-            doc.add_heading(line[5:].strip(), level=4)
+        if kind == 'heading':
+            doc.add_heading(plain_text(block['runs']).strip(), level=min(block['level'], 9))
 
         # Horizontal rule
-        elif line.strip() == '---':
+        elif kind == 'rule':
             p = doc.add_paragraph()
             p.add_run('_' * 80)
             p.runs[0].font.color.rgb = RGBColor(200, 200, 200)
 
         # Images
-        elif line.startswith('!['):
-            match = re.match(r'!\[(.*?)\]\((.*?)\)', line)
-            if match:
-                alt_text, img_path = match.groups()
-
-                # Construct full image path
-                # assets_dir is already set to reports/, so assets/image.png becomes reports/assets/image.png
-                full_img_path = Path(assets_dir) / img_path
-
-                if full_img_path.exists():
-                    doc.add_paragraph(alt_text, style='Heading 4')
-                    p = doc.add_paragraph()
-                    p.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-                    run = p.add_run()
-                    run.add_picture(str(full_img_path), width=Inches(5.5))
-                    doc.add_paragraph()  # Spacing after image
-                else:
-                    # Fallback if image not found
-                    doc.add_paragraph(f"[Image: {alt_text} - File not found: {img_path}]")
-
-        # Tables (start)
-        elif line.startswith('|') and not in_table:
-            in_table = True
-            table_buffer = [line]
-
-        # Tables (continuation)
-        elif in_table:
-            if line.startswith('|'):
-                table_buffer.append(line)
+        elif kind == 'image':
+            alt_text, img_path = block['alt'], block['src']
+
+            # Construct full image path
+            # assets_dir is already set to reports/, so assets/image.png becomes reports/assets/image.png
+            full_img_path = Path(assets_dir) / img_path
+
+            if full_img_path.exists():
+                doc.add_paragraph(alt_text, style='Heading 4')
+                p = doc.add_paragraph()
+                p.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+                run = p.add_run()
+                # Embed a copy resampled to the display size (cached)
+                run.add_picture(str(prepare_image(full_img_path, 'docx', image_cache_dir)),
+                                width=Inches(IMAGE_PROFILES['docx']['width_in']))
+                doc.add_paragraph()  # Spacing after image
             else:
-                # End of table
-                table_text = '\n'.join(table_buffer)
-                rows = parse_markdown_table(table_text)
-                add_table_to_doc(doc, rows)
-                in_table = False
-                table_buffer = []
-                continue  # Don't increment i, process current line again
-
-        # Bullet lists
-        elif re.match(r'^\d+\.\s', line):  # Numbered list
-            text = re.sub(r'^\d+\.\s', '', line)
-            p = doc.add_paragraph(style='List Number')
-            add_formatted_text(p, text)
-            p.paragraph_format.left_indent = Inches(0.5)
-
-        elif line.startswith('- '):
-            text = line[2:].strip()
-            p = doc.add_paragraph(style='List Bullet')
-            add_formatted_text(p, text)
-            p.paragraph_format.left_indent = Inches(0.5)
-
-        # Normal paragraph (with potential bold formatting)
-        else:
-            p = doc.add_paragraph()
-            add_formatted_text(p, line.strip())
-
-        i += 1
-
-    # Handle remaining table if document ends with one
-    if in_table and table_buffer:
-        table_text = '\n'.join(table_buffer)
-        rows = parse_markdown_table(table_text)
-        add_table_to_doc(doc, rows)
+                # Fallback if image not found
+                doc.add_paragraph(f"[Image: {alt_text} - File not found: {img_path}]")
+
+        # Tables
+        elif kind == 'table':
+            add_table_to_doc(doc, block['rows'])
+
+        # Numbered and bullet lists
+        elif kind == 'list':
+            style = 'List Number' if block['ordered'] else 'List Bullet'
+            for item in block['items']:
+                p = doc.add_paragraph(style=style)
+                add_runs(p, item)
+                p.paragraph_format.left_indent = Inches(0.5)
+
+        # Normal paragraphs: one Word paragraph per source line
+        elif kind == 'paragraph':
+            for line in block['lines']:
+                p = doc.add_paragraph()
+                add_runs(p, line)
 
     # Save document
     doc.save(output_path)
@@ -413,6 +342,5 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     success = main()
     sys.exit(0 if success else 1)
@@ -0,0 +1,327 @@
+"""
+Parallel Sectioned PDF Rendering
+================================
+
+Renders a long report as independent sections in parallel WeasyPrint
+workers and merges them into one PDF with continuous page numbering.
+
+- Stylesheets are parsed once per process with a shared FontConfiguration
+  (worker processes are forked after parsing, so they inherit both).
+- The report is split at its level-2 headings; every section starts on a
+  new page and is laid out on its own.
+- "Page X of Y" footers are written per page with @page :nth() rules. The
+  page numbering of a section depends on the page counts of the sections
+  before it, so page counts are cached (reports/.pdf_cache/) by section
+  content: an unchanged report is rendered in one pass, and any section
+  whose page count changed triggers one re-render of the affected sections.
+
+WeasyPrint needs the system Pango libraries, so it is imported when a
+stylesheet is first loaded rather than at module import.
+
+Example:
+    >>> from reporting.pdf_sections import render_sections
+    >>> render_sections(section_html_documents, 'reports/detailed_report.pdf',
+    ...                 'src/reporting/templates/detailed_report.css', 'reports')
+    {'sections': 12, 'pages': 24, 'rendered': 12, 'passes': 1}
+
+Author: PDF Reporting Specialist
+Date: October 2025
+"""
+
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pypdf import PdfReader, PdfWriter
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+PAGE_COUNT_CACHE = PROJECT_ROOT / 'reports' / '.pdf_cache' / 'section_pages.json'
+
+# Safety limit: the second pass always uses exact page counts
+MAX_RENDER_PASSES = 3
+
+TOP_RIGHT_PATTERN = re.compile(r'@top-right\s*\{[^}]*?content:\s*([^;]+);')
+
+# Parsed stylesheets and font configuration of this process
+_FONT_CONFIG = None
+_STYLESHEETS = {}
+
+
+# ============================================
+# STYLESHEETS
+# ============================================
+
+def get_font_config():
+    """Return the process-wide WeasyPrint FontConfiguration."""
+    global _FONT_CONFIG
+    if _FONT_CONFIG is None:
+        from weasyprint.text.fonts import FontConfiguration
+        _FONT_CONFIG = FontConfiguration()
+    return _FONT_CONFIG
+
+
+def load_stylesheet(css_path):
+    """
+    Return a parsed WeasyPrint CSS object (cached per file and mtime).
+
+    Args:
+        css_path: Stylesheet path
+
+    Returns:
+        weasyprint.CSS bound to the shared font configuration
+    """
+    from weasyprint import CSS
+
+    css_path = Path(css_path).resolve()
+    key = (str(css_path), css_path.stat().st_mtime_ns)
+    if key not in _STYLESHEETS:
+        _STYLESHEETS[key] = CSS(filename=str(css_path), font_config=get_font_config())
+    return _STYLESHEETS[key]
+
+
+def read_page_header(css_path):
+    """
+    Return the CSS content value of the template's running page header.
+
+    The templates hide the header on the document's first page
+    (@page :first); sections after the first restore it on their own
+    first page.
+
+    Returns:
+        CSS content value (e.g. '"Report | January 2024"'), or None
+    """
+    match = TOP_RIGHT_PATTERN.search(Path(css_path).read_text(encoding='utf-8'))
+    return match.group(1).strip() if match else None
+
+
+# ============================================
+# SECTIONS AND PAGE NUMBERING
+# ============================================
+
+def split_sections(document):
+    """
+    Split a Markdown document tree into sections at level-2 headings.
+
+    Headings directly after the title (e.g. a subtitle) stay with it: a new
+    section starts only once the current one has non-heading content.
+
+    Args:
+        document: Document tree (see reporting.markdown_document)
+
+    Returns:
+        list: Block lists, one per section
+    """
+    sections = [[]]
+    for block in document['blocks']:
+        current = sections[-1]
+        has_content = any(item['type'] != 'heading' for item in current)
+        if block['type'] == 'heading' and block['level'] == 2 and has_content:
+            sections.append([block])
+        else:
+            current.append(block)
+    return [section for section in sections if section]
+
+
+def plan_page_numbers(page_counts):
+    """
+    Return (first page, total pages, page count) for each section.
+
+    Args:
+        page_counts: Page count of each section, in order
+
+    Returns:
+        list: One numbering tuple per section
+    """
+    total = sum(page_counts)
+    numbering = []
+    first_page = 1
+    for count in page_counts:
+        numbering.append((first_page, total, count))
+        first_page += count
+    return numbering
+
+
+def page_number_css(first_page, total_pages, page_count, header=None):
+    """
+    Build the stylesheet numbering one section's pages within the report.
+
+    Args:
+        first_page: Report page number of the section's first page
+        total_pages: Total pages of the report
+        page_count: Pages in the section
+        header: CSS content of the running header to show on the section's
+            first page (None keeps the template's first-page rule)
+
+    Returns:
+        str: CSS with one @page :nth() rule per page
+    """
+    rules = []
+    if header is not None:
+        rules.append(f'@page :first {{ @top-right {{ content: {header}; }} }}')
+    for page in range(1, page_count + 1):
+        rules.append(
+            f'@page :nth({page}) {{ @bottom-center {{ '
+            f'content: "Page {first_page + page - 1} of {total_pages}"; }} }}'
+        )
+    return '\n'.join(rules)
+
+
+def section_key(html_document, css_path):
+    """Return the page-count cache key of a section (content + stylesheet)."""
+    digest = hashlib.sha256(html_document.encode('utf-8'))
+    digest.update(Path(css_path).read_bytes())
+    return digest.hexdigest()
+
+
+def load_page_counts(cache_path=PAGE_COUNT_CACHE):
+    """Load cached section page counts ({} if missing or unreadable)."""
+    try:
+        return json.loads(Path(cache_path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_page_counts(page_counts, cache_path=PAGE_COUNT_CACHE):
+    """Atomically write the section page counts."""
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_path.write_text(json.dumps(page_counts, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(tmp_path, cache_path)
+
+
+# ============================================
+# RENDERING AND MERGING
+# ============================================
+
+def render_section(task):
+    """
+    Render one section to PDF bytes (runs in a worker process).
+
+    Args:
+        task: (index, html_document, base_url, css_path, page_css)
+
+    Returns:
+        tuple: (index, pdf_bytes, page_count)
+    """
+    from weasyprint import HTML, CSS
+
+    index, html_document, base_url, css_path, page_css = task
+    font_config = get_font_config()
+    stylesheets = [load_stylesheet(css_path), CSS(string=page_css, font_config=font_config)]
+
+    rendered = HTML(string=html_document, base_url=str(base_url)).render(
+        stylesheets=stylesheets, font_config=font_config
+    )
+    return index, rendered.write_pdf(), len(rendered.pages)
+
+
+def merge_pdfs(parts, output_path):
+    """
+    Concatenate PDF documents into one file (atomic write).
+
+    Bookmarks of every part are kept; document metadata comes from the
+    first part.
+
+    Args:
+        parts: PDF documents as bytes, in order
+        output_path: Output PDF path
+
+    Returns:
+        int: Pages in the merged PDF
+    """
+    writer = PdfWriter()
+    for index, pdf_bytes in enumerate(parts):
+        reader = PdfReader(io.BytesIO(pdf_bytes))
+        writer.append(reader)
+        if index == 0 and reader.metadata:
+            writer.add_metadata(dict(reader.metadata))
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_path, 'wb') as f:
+        writer.write(f)
+    os.replace(tmp_path, output_path)
+    return len(writer.pages)
+
+
+def render_sections(html_documents, output_path, css_path, base_url,
+                    max_workers=None, cache_path=PAGE_COUNT_CACHE):
+    """
+    Render report sections in parallel and merge them into one PDF.
+
+    Args:
+        html_documents: Complete HTML document of each section, in order
+        output_path: Output PDF path
+        css_path: Stylesheet path
+        base_url: Base URL for relative resources
+        max_workers: Worker processes (defaults to the CPU count); 1 renders
+            in this process
+        cache_path: Section page-count cache (None disables it)
+
+    Returns:
+        dict: sections, pages, rendered (section renders) and passes
+
+    Raises:
+        RuntimeError: If the page numbering does not settle
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(html_documents)))
+
+    header = read_page_header(css_path)
+    keys = [section_key(html_document, css_path) for html_document in html_documents]
+    cached = load_page_counts(cache_path) if cache_path else {}
+    page_counts = [cached.get(key, 1) for key in keys]
+
+    # Parse the stylesheet before forking so the workers inherit it
+    load_stylesheet(css_path)
+    mp_context = (multiprocessing.get_context('fork')
+                  if 'fork' in multiprocessing.get_all_start_methods() else None)
+
+    rendered = {}
+    pending = list(range(len(html_documents)))
+    passes = renders = 0
+    while pending:
+        if passes == MAX_RENDER_PASSES:
+            raise RuntimeError(f'Page numbering did not settle after {passes} passes')
+        passes += 1
+        renders += len(pending)
+
+        numbering = plan_page_numbers(page_counts)
+        tasks = [
+            (index, html_documents[index], base_url, css_path,
+             page_number_css(*numbering[index], header=header if index else None))
+            for index in pending
+        ]
+        if max_workers == 1 or len(tasks) == 1:
+            results = map(render_section, tasks)
+        else:
+            executor = ProcessPoolExecutor(max_workers=min(max_workers, len(tasks)),
+                                           mp_context=mp_context)
+            with executor:
+                results = list(executor.map(render_section, tasks))
+
+        for index, pdf_bytes, page_count in results:
+            rendered[index] = (numbering[index], pdf_bytes)
+            page_counts[index] = page_count
+
+        # Re-render sections whose numbering changed with the actual counts
+        numbering = plan_page_numbers(page_counts)
+        pending = [index for index in range(len(html_documents))
+                   if rendered[index][0] != numbering[index]]
+
+    pages = merge_pdfs([rendered[index][1] for index in range(len(html_documents))], output_path)
+
+    if cache_path:
+        cached.update(zip(keys, page_counts))
+        save_page_counts({key: cached[key] for key in keys}, cache_path)
+
+    return {'sections': len(html_documents), 'pages': pages, 'rendered': renders, 'passes': passes}
@@ -2,19 +2,46 @@
 """
 Convert PowerPoint presentation to PDF format.
 
-This script converts the executive_slides.pptx to PDF using the pdf library
-for cross-platform compatibility.
+This script renders executive_slides.pptx to PDF with a pure-Python slide
+renderer: each slide's text boxes, placeholders, shapes and pictures are
+drawn directly onto a reportlab canvas, one PDF page per slide at the
+slide's own size. No MS Office or LibreOffice is needed.
+
+- Embedded images are decoded once per image part of the pptx package
+  (a picture used on several slides is decoded once)
+- Slides are rendered in parallel worker processes and merged in order
+
+Supported: text boxes and placeholders (fonts mapped to Helvetica, sizes,
+bold/italic, colours, alignment, anchoring, wrapping, bullets), rectangles,
+rounded rectangles and ovals with solid fill/outline, pictures and groups.
+Other graphic frames (tables, charts) are skipped and reported.
+
+Usage:
+    python src/reporting/pptx_to_pdf.py
+    python src/reporting/pptx_to_pdf.py --output reports/executive_slides_from_pptx.pdf --workers 4
 """
 
+import os
 import sys
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from pptx import Presentation
-from reportlab.lib.pagesizes import landscape, A4
+from pptx.enum.dml import MSO_FILL
+from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE, PP_PLACEHOLDER
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from reportlab.lib.colors import HexColor
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
 from io import BytesIO
 from PIL import Image
-import tempfile
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reporting.pdf_sections import merge_pdfs
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -23,142 +50,427 @@ REPORTS_DIR = PROJECT_ROOT / "reports"
 INPUT_FILE = REPORTS_DIR / "executive_slides.pptx"
 OUTPUT_FILE = REPORTS_DIR / "executive_slides.pdf"
 
+# Rendering settings
+EMU_PER_POINT = 12700
+LINE_SPACING = 1.2                # Line height as a multiple of the font size
+BULLET_INDENT = 27.0              # Office template body indent (0.375in) in points
+DEFAULT_TEXT_COLOR = '#000000'
+DEFAULT_FONT_SIZE = 18.0
+
+# Office template defaults for placeholder text without an explicit size
+PLACEHOLDER_FONT_SIZES = {
+    PP_PLACEHOLDER.TITLE: 44.0,
+    PP_PLACEHOLDER.CENTER_TITLE: 44.0,
+    PP_PLACEHOLDER.SUBTITLE: 32.0,
+    PP_PLACEHOLDER.BODY: 32.0,
+    PP_PLACEHOLDER.OBJECT: 32.0,
+}
+TITLE_PLACEHOLDERS = (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE)
+BULLET_PLACEHOLDERS = (PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT)
+
+# Calibri and other Office fonts are mapped to the standard PDF fonts
+PDF_FONTS = {
+    (False, False): 'Helvetica',
+    (True, False): 'Helvetica-Bold',
+    (False, True): 'Helvetica-Oblique',
+    (True, True): 'Helvetica-BoldOblique',
+}
+
+# Presentation and decoded images of this process (inherited by forked workers)
+_PRESENTATION = None
+_PRESENTATION_KEY = None
+_IMAGE_CACHE = {}
+
+
+# ============================================
+# HELPERS
+# ============================================
+
+def emu_to_pt(emu):
+    """Convert English Metric Units to PDF points."""
+    return (emu or 0) / EMU_PER_POINT
+
+
+def get_rgb(color_format):
+    """Return '#RRGGBB' for an explicit RGB colour, else None (theme or unset)."""
+    try:
+        if color_format.type is not None and color_format.rgb is not None:
+            return f'#{color_format.rgb}'
+    except AttributeError:
+        pass
+    return None
 
-def convert_pptx_to_pdf_using_images(pptx_path: Path, pdf_path: Path):
-    """
-    Convert PowerPoint to PDF by rendering each slide as an image.
 
-    This is a cross-platform solution that doesn't require MS Office or LibreOffice.
-    Note: This creates a simplified PDF without text selectability.
+def iter_shapes(shapes):
+    """Yield shapes in z-order, descending into groups."""
+    for shape in shapes:
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            yield from iter_shapes(shape.shapes)
+        else:
+            yield shape
+
+
+def get_image(picture):
+    """
+    Return the decoded image of a picture shape (decoded once per image part).
 
     Args:
-        pptx_path: Path to input PowerPoint file
-        pdf_path: Path to output PDF file
+        picture: python-pptx Picture
+
+    Returns:
+        reportlab ImageReader
     """
-    print(f"Converting: {pptx_path}")
-    print(f"Output: {pdf_path}")
+    image = picture.image
+    if image.sha1 not in _IMAGE_CACHE:
+        decoded = Image.open(BytesIO(image.blob))
+        decoded.load()
+        _IMAGE_CACHE[image.sha1] = ImageReader(decoded)
+    return _IMAGE_CACHE[image.sha1]
+
+
+def decode_images(prs):
+    """Decode every embedded image of a presentation into the image cache."""
+    for slide in prs.slides:
+        for shape in iter_shapes(slide.shapes):
+            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                get_image(shape)
+    return len(_IMAGE_CACHE)
 
-    try:
-        # Load presentation
-        prs = Presentation(str(pptx_path))
 
-        # Get slide dimensions (16:9 widescreen)
-        slide_width = prs.slide_width
-        slide_height = prs.slide_height
+def get_placeholder_type(shape):
+    """Return the placeholder type of a shape, or None."""
+    return shape.placeholder_format.type if shape.is_placeholder else None
 
-        print(f"Presentation dimensions: {slide_width} x {slide_height}")
-        print(f"Total slides: {len(prs.slides)}")
 
-        # Create PDF with landscape A4 size
-        c = canvas.Canvas(str(pdf_path), pagesize=landscape(A4))
-        page_width, page_height = landscape(A4)
+# ============================================
+# TEXT LAYOUT
+# ============================================
 
-        print("\nNote: This conversion creates a simplified PDF.")
-        print("For best results, use MS PowerPoint or LibreOffice to export to PDF.")
-        print("\nAlternative conversion methods:")
-        print("1. Open PowerPoint → File → Export → PDF")
-        print("2. Use LibreOffice: libreoffice --headless --convert-to pdf executive_slides.pptx")
-        print("3. Use online converter: https://www.ilovepdf.com/powerpoint_to_pdf")
+def get_run_style(run, paragraph, default_size):
+    """
+    Resolve the font of a run from the run, then the paragraph defaults.
+
+    Returns:
+        dict: font (PDF font name), size (pt) and color ('#RRGGBB')
+    """
+    fonts = (run.font, paragraph.font)
+    size = next((font.size.pt for font in fonts if font.size is not None), default_size)
+    bold = next((font.bold for font in fonts if font.bold is not None), False)
+    italic = next((font.italic for font in fonts if font.italic is not None), False)
+    color = next((rgb for rgb in map(lambda font: get_rgb(font.color), fonts) if rgb),
+                 DEFAULT_TEXT_COLOR)
+    return {'font': PDF_FONTS[(bool(bold), bool(italic))], 'size': size, 'color': color}
 
-        # Add a title page explaining this is a reference export
-        c.setFont("Helvetica-Bold", 24)
-        c.drawString(100, page_height - 100, "Executive Summary Slides - Reference Export")
 
-        c.setFont("Helvetica", 14)
-        c.drawString(100, page_height - 150, f"Total Slides: {len(prs.slides)}")
-        c.drawString(100, page_height - 180, "Note: For full-quality PDF, please export directly from PowerPoint or LibreOffice.")
+def wrap_fragments(fragments, max_width):
+    """
+    Break styled text into lines no wider than max_width (greedy, by word).
 
-        c.setFont("Helvetica", 12)
-        y_position = page_height - 230
+    Args:
+        fragments: List of (text, style) pairs
+        max_width: Available width in points (None disables wrapping)
 
-        # List slide titles
-        for idx, slide in enumerate(prs.slides, 1):
-            # Try to get slide title
-            title = "Untitled Slide"
-            if slide.shapes.title:
-                title = slide.shapes.title.text
+    Returns:
+        list: Lines, each a list of (text, style) pairs
+    """
+    words = []
+    for text, style in fragments:
+        for index, word in enumerate(text.split(' ')):
+            words.append((' ' if index else '', word, style))
+
+    lines = [[]]
+    width = 0.0
+    for space, word, style in words:
+        space_width = stringWidth(space, style['font'], style['size']) if lines[-1] else 0.0
+        word_width = stringWidth(word, style['font'], style['size'])
+        if max_width is not None and lines[-1] and width + space_width + word_width > max_width:
+            lines.append([])
+            width = space_width = 0.0
+        text = (space if lines[-1] else '') + word
+        if lines[-1] and lines[-1][-1][1] is style:
+            lines[-1][-1] = (lines[-1][-1][0] + text, style)
+        else:
+            lines[-1].append((text, style))
+        width += space_width + word_width
+
+    # Trailing spaces do not count towards alignment
+    for line in lines:
+        if line:
+            line[-1] = (line[-1][0].rstrip(' '), line[-1][1])
+    return lines
+
+
+def layout_text_frame(shape):
+    """
+    Lay out the paragraphs of a shape's text frame.
 
-            c.drawString(120, y_position, f"Slide {idx}: {title}")
-            y_position -= 25
+    Returns:
+        tuple: (lines, text height) where each line is a dict with
+        fragments, width, top (offset from the first line), size, indent,
+        alignment and bullet
+    """
+    text_frame = shape.text_frame
+    placeholder = get_placeholder_type(shape)
+    default_size = PLACEHOLDER_FONT_SIZES.get(placeholder, DEFAULT_FONT_SIZE)
+    bullets = placeholder in BULLET_PLACEHOLDERS
+
+    box_width = emu_to_pt(shape.width) - emu_to_pt(text_frame.margin_left) - emu_to_pt(text_frame.margin_right)
+    wrap = text_frame.word_wrap is not False
+
+    lines = []
+    height = 0.0
+    for paragraph_index, paragraph in enumerate(text_frame.paragraphs):
+        indent = BULLET_INDENT * (paragraph.level + 1) if bullets else 0.0
+        fragments = [(run.text, get_run_style(run, paragraph, default_size))
+                     for run in paragraph.runs if run.text]
+        if not fragments:
+            continue
+
+        if paragraph_index and paragraph.space_before is not None:
+            height += paragraph.space_before.pt
+
+        for line_index, line in enumerate(wrap_fragments(fragments, box_width - indent if wrap else None)):
+            line_size = max(style['size'] for _, style in line)
+            lines.append({
+                'fragments': line,
+                'width': sum(stringWidth(text, style['font'], style['size']) for text, style in line),
+                'top': height,
+                'size': line_size,
+                'indent': indent,
+                'alignment': paragraph.alignment,
+                'bullet': bullets and line_index == 0,
+            })
+            height += line_size * LINE_SPACING
+    return lines, height
+
+
+def draw_text_frame(c, shape, page_height):
+    """Draw the text of a shape (text box, placeholder or autoshape)."""
+    text_frame = shape.text_frame
+    lines, text_height = layout_text_frame(shape)
+    if not lines:
+        return
+
+    left = emu_to_pt(shape.left) + emu_to_pt(text_frame.margin_left)
+    right = emu_to_pt(shape.left + shape.width) - emu_to_pt(text_frame.margin_right)
+    top = page_height - emu_to_pt(shape.top) - emu_to_pt(text_frame.margin_top)
+    bottom = page_height - emu_to_pt(shape.top + shape.height) + emu_to_pt(text_frame.margin_bottom)
+
+    # Vertical anchoring (titles and autoshapes are centred by default)
+    anchor = text_frame.vertical_anchor
+    if anchor is None and (get_placeholder_type(shape) in TITLE_PLACEHOLDERS
+                           or shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE):
+        anchor = MSO_ANCHOR.MIDDLE
+    if anchor == MSO_ANCHOR.MIDDLE:
+        top -= max(0.0, (top - bottom - text_height) / 2)
+    elif anchor == MSO_ANCHOR.BOTTOM:
+        top = bottom + text_height
+
+    for line in lines:
+        baseline = top - line['top'] - line['size']
+        x = left + line['indent']
+        if line['alignment'] == PP_ALIGN.CENTER:
+            x = (x + right - line['width']) / 2
+        elif line['alignment'] == PP_ALIGN.RIGHT:
+            x = right - line['width']
+
+        if line['bullet']:
+            style = line['fragments'][0][1]
+            c.setFont(style['font'], style['size'])
+            c.setFillColor(HexColor(style['color']))
+            c.drawString(x - BULLET_INDENT, baseline, '•')
+
+        for text, style in line['fragments']:
+            c.setFont(style['font'], style['size'])
+            c.setFillColor(HexColor(style['color']))
+            c.drawString(x, baseline, text)
+            x += stringWidth(text, style['font'], style['size'])
+
+
+# ============================================
+# SHAPES AND SLIDES
+# ============================================
+
+def draw_auto_shape(c, shape, page_height):
+    """Draw an autoshape's solid fill and outline."""
+    fill = get_rgb(shape.fill.fore_color) if shape.fill.type == MSO_FILL.SOLID else None
+    stroke = get_rgb(shape.line.color) if shape.line.fill.type == MSO_FILL.SOLID else None
+    if fill is None and stroke is None:
+        return
+
+    x, width = emu_to_pt(shape.left), emu_to_pt(shape.width)
+    height = emu_to_pt(shape.height)
+    y = page_height - emu_to_pt(shape.top) - height
+
+    c.saveState()
+    if fill:
+        c.setFillColor(HexColor(fill))
+    if stroke:
+        c.setStrokeColor(HexColor(stroke))
+        c.setLineWidth(shape.line.width.pt or 0.75)
+
+    shape_type = shape.auto_shape_type
+    if shape_type == MSO_SHAPE.OVAL:
+        c.ellipse(x, y, x + width, y + height, stroke=int(bool(stroke)), fill=int(bool(fill)))
+    elif shape_type == MSO_SHAPE.ROUNDED_RECTANGLE:
+        c.roundRect(x, y, width, height, min(width, height) / 6,
+                    stroke=int(bool(stroke)), fill=int(bool(fill)))
+    else:
+        c.rect(x, y, width, height, stroke=int(bool(stroke)), fill=int(bool(fill)))
+    c.restoreState()
 
-            if y_position < 100:
-                c.showPage()
-                c.setFont("Helvetica", 12)
-                y_position = page_height - 100
 
+def draw_picture(c, shape, page_height):
+    """Draw a picture at its position and size (clipped by the page)."""
+    height = emu_to_pt(shape.height)
+    c.drawImage(get_image(shape), emu_to_pt(shape.left), page_height - emu_to_pt(shape.top) - height,
+                width=emu_to_pt(shape.width), height=height, mask='auto')
+
+
+def draw_slide(c, slide, page_width, page_height):
+    """
+    Draw one slide onto the current canvas page.
+
+    Returns:
+        int: Number of shapes skipped as unsupported
+    """
+    background = None
+    if not slide.follow_master_background and slide.background.fill.type == MSO_FILL.SOLID:
+        background = get_rgb(slide.background.fill.fore_color)
+    c.setFillColor(HexColor(background or '#FFFFFF'))
+    c.rect(0, 0, page_width, page_height, stroke=0, fill=1)
+
+    skipped = 0
+    for shape in iter_shapes(slide.shapes):
+        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+            draw_picture(c, shape, page_height)
+        elif shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
+            draw_auto_shape(c, shape, page_height)
+        elif not shape.has_text_frame:
+            skipped += 1
+            continue
+
+        if shape.has_text_frame:
+            draw_text_frame(c, shape, page_height)
+    return skipped
+
+
+def load_presentation(pptx_path):
+    """Load a presentation and decode its images (once per process and file version)."""
+    global _PRESENTATION, _PRESENTATION_KEY
+    pptx_path = Path(pptx_path).resolve()
+    stat = pptx_path.stat()
+    # A regenerated deck at the same path (e.g. in the daemon) is loaded again
+    key = (str(pptx_path), stat.st_mtime_ns, stat.st_size)
+    if _PRESENTATION_KEY != key:
+        _PRESENTATION = Presentation(str(pptx_path))
+        _PRESENTATION_KEY = key
+        _IMAGE_CACHE.clear()
+        decode_images(_PRESENTATION)
+    return _PRESENTATION
+
+
+def render_slides(task):
+    """
+    Render a range of slides to PDF bytes (runs in a worker process).
+
+    Args:
+        task: (pptx_path, first slide index, end slide index)
+
+    Returns:
+        tuple: (pdf_bytes, skipped shape count)
+    """
+    pptx_path, start, end = task
+    prs = load_presentation(pptx_path)
+    page_width, page_height = emu_to_pt(prs.slide_width), emu_to_pt(prs.slide_height)
+
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=(page_width, page_height))
+    c.setTitle(Path(pptx_path).stem.replace('_', ' ').title())
+    skipped = 0
+    for slide in list(prs.slides)[start:end]:
+        skipped += draw_slide(c, slide, page_width, page_height)
         c.showPage()
+    c.save()
+    return buffer.getvalue(), skipped
+
+
+def convert_pptx_to_pdf_using_images(pptx_path: Path, pdf_path: Path, max_workers=None):
+    """
+    Convert PowerPoint to PDF by drawing each slide with reportlab.
+
+    This is a cross-platform solution that doesn't require MS Office or LibreOffice.
+    Slides are split into one contiguous range per worker process; the
+    presentation is loaded and its images decoded once before the workers
+    are forked.
+
+    Args:
+        pptx_path: Path to input PowerPoint file
+        pdf_path: Path to output PDF file
+        max_workers: Worker processes (defaults to the CPU count); 1 renders
+            in this process
+
+    Returns:
+        bool: True on success
+    """
+    print(f"Converting: {pptx_path}")
+    print(f"Output: {pdf_path}")
 
-        # Add note about proper conversion
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(100, page_height - 100, "Recommended Conversion Methods")
-
-        c.setFont("Helvetica", 12)
-        conversion_methods = [
-            "",
-            "For the best quality PDF with full formatting, use one of these methods:",
-            "",
-            "Method 1: Microsoft PowerPoint",
-            "  • Open executive_slides.pptx in PowerPoint",
-            "  • Click File → Export → Create PDF/XPS",
-            "  • Choose quality settings and export",
-            "",
-            "Method 2: LibreOffice (Free, Cross-Platform)",
-            "  • Install LibreOffice from https://www.libreoffice.org",
-            "  • Run command:",
-            "    libreoffice --headless --convert-to pdf executive_slides.pptx",
-            "",
-            "Method 3: macOS Preview/Keynote",
-            "  • Open executive_slides.pptx in Keynote (macOS)",
-            "  • File → Export To → PDF",
-            "",
-            "Method 4: Online Converter (Free)",
-            "  • Visit https://www.ilovepdf.com/powerpoint_to_pdf",
-            "  • Upload executive_slides.pptx",
-            "  • Download converted PDF",
-            "",
-            "Current file location:",
-            f"  {INPUT_FILE}",
-        ]
-
-        y_pos = page_height - 140
-        for line in conversion_methods:
-            if line.startswith("Method"):
-                c.setFont("Helvetica-Bold", 12)
-            else:
-                c.setFont("Helvetica", 11)
-
-            c.drawString(100, y_pos, line)
-            y_pos -= 20
-
-            if y_pos < 50:
-                c.showPage()
-                y_pos = page_height - 50
-
-        # Save PDF
-        c.save()
-
-        print(f"\n✓ Reference PDF created: {pdf_path}")
-        print(f"  File size: {pdf_path.stat().st_size / 1024:.1f} KB")
-        print("\n⚠️  This is a reference document only.")
-        print("    For production use, export PDF using PowerPoint or LibreOffice.")
+    try:
+        # Load presentation and decode embedded images once
+        prs = load_presentation(pptx_path)
+        slide_count = len(prs.slides)
+
+        print(f"Presentation dimensions: {prs.slide_width} x {prs.slide_height}")
+        print(f"Total slides: {slide_count} ({len(_IMAGE_CACHE)} embedded images)")
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, slide_count))
+
+        # One contiguous range of slides per worker
+        bounds = [round(i * slide_count / max_workers) for i in range(max_workers + 1)]
+        tasks = [(str(pptx_path), start, end) for start, end in zip(bounds, bounds[1:])]
+
+        if max_workers == 1:
+            results = [render_slides(task) for task in tasks]
+        else:
+            mp_context = (multiprocessing.get_context('fork')
+                          if 'fork' in multiprocessing.get_all_start_methods() else None)
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+                results = list(executor.map(render_slides, tasks))
+
+        pages = merge_pdfs([pdf_bytes for pdf_bytes, _ in results], pdf_path)
+        skipped = sum(count for _, count in results)
+
+        print(f"\n✓ PDF created: {pdf_path}")
+        print(f"  Pages: {pages} (rendered on {max_workers} worker(s))")
+        print(f"  File size: {Path(pdf_path).stat().st_size / 1024:.1f} KB")
+        if skipped:
+            print(f"  ⚠️  {skipped} unsupported shape(s) skipped (tables/charts)")
 
         return True
 
     except Exception as e:
         print(f"\n✗ Error converting PowerPoint to PDF: {e}")
-        print("\nRecommended solution:")
-        print("Use LibreOffice for high-quality conversion:")
-        print("  brew install libreoffice  # macOS")
+        print("\nAlternative: use LibreOffice for conversion:")
         print("  libreoffice --headless --convert-to pdf executive_slides.pptx --outdir reports/")
         return False
 
 
-def main():
+def main(argv=None):
     """Main conversion function."""
+    parser = argparse.ArgumentParser(description='Convert the PowerPoint slides to PDF')
+    parser.add_argument('--input', type=Path, default=INPUT_FILE, help='PowerPoint file')
+    parser.add_argument('--output', type=Path, default=OUTPUT_FILE, help='PDF file')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Slide rendering processes (default: CPU count)')
+    args = parser.parse_args(argv)
+    input_file, output_file = args.input, args.output
 
     # Check if input file exists
-    if not INPUT_FILE.exists():
-        print(f"✗ Error: PowerPoint file not found: {INPUT_FILE}")
+    if not input_file.exists():
+        print(f"✗ Error: PowerPoint file not found: {input_file}")
         sys.exit(1)
 
     print("=" * 70)
@@ -167,18 +479,13 @@ def main():
     print()
 
     # Perform conversion
-    success = convert_pptx_to_pdf_using_images(INPUT_FILE, OUTPUT_FILE)
+    success = convert_pptx_to_pdf_using_images(input_file, output_file, max_workers=args.workers)
 
     if success:
         print("\n" + "=" * 70)
         print("Conversion completed successfully!")
         print("=" * 70)
-        print(f"\nOutput file: {OUTPUT_FILE}")
-        print("\nNext steps:")
-        print("1. Review the reference PDF")
-        print("2. For production use, export using PowerPoint or LibreOffice")
-        print("3. LibreOffice command:")
-        print(f"   libreoffice --headless --convert-to pdf '{INPUT_FILE}' --outdir '{REPORTS_DIR}/'")
+        print(f"\nOutput file: {output_file}")
     else:
         print("\n" + "=" * 70)
         print("Conversion failed - see recommendations above")
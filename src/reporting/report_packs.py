@@ -0,0 +1,446 @@
+"""
+Batch Report Pack Generator
+===========================
+
+This script produces one report pack per store or per region: charts,
+a Markdown summary and a Word document in its own folder.
+
+Features:
+- One shared scan of the sales data: aggregates are computed per store
+  once, and region packs merge the store aggregates (no re-scan)
+- Packs are built in parallel worker processes (Agg backend) with a
+  bounded number of packs in flight
+- Progress reporting with elapsed time and ETA
+- Unchanged charts are not re-rendered (analysis.chart_cache)
+
+Usage:
+    python src/reporting/report_packs.py --by store
+    python src/reporting/report_packs.py --by region --workers 4
+    python src/reporting/report_packs.py --by store --packs S01 S05 --draft
+
+Output (per pack):
+    reports/packs/<store or region>/
+        report.md
+        report.docx
+        assets/*.png
+
+Author: PDF Reporting Specialist
+Date: October 2025
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import sys
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis.chunked_metrics import compute_partial_aggregates, merge_partial_aggregates, finalize_metrics
+from data_pipeline.artifacts import read_csv_cached
+from data_pipeline.store_offsets import load_offsets_for, matches
+
+
+# Paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DATA_DIR = PROJECT_ROOT / 'data' / 'processed'
+PACKS_DIR = PROJECT_ROOT / 'reports' / 'packs'
+
+PACK_TYPES = ('store', 'region')
+DEFAULT_FORMATS = ('md', 'docx')
+
+# Store metadata and pack settings shared with worker processes
+_PACK_STORES_DF = None
+_PACK_SETTINGS = {}
+
+
+# ============================================
+# SHARED SCAN
+# ============================================
+
+def compute_store_partials(sales_df, offsets=None):
+    """
+    Compute mergeable partial aggregates for every store in one scan.
+
+    Each aggregate is grouped with store_id as an extra leading key over the
+    full sales frame, then split per store. With a matching store offset
+    index, each store's rows are a row slice and are aggregated directly.
+    The per-store dictionaries have the same layout as
+    analysis.chunked_metrics.compute_partial_aggregates, so they can be
+    merged (regions) and finalized like any other partial.
+
+    Args:
+        sales_df: DataFrame with sales transactions
+        offsets: Optional offset index of sales_df (data_pipeline.store_offsets)
+
+    Returns:
+        Dictionary mapping store_id to its partial aggregates
+    """
+    if matches(offsets, sales_df):
+        return {
+            store_id: compute_partial_aggregates(sales_df.iloc[start:stop])
+            for store_id, (start, stop) in offsets['stores'].items()
+        }
+
+    amount = sales_df['sales_amount']
+    store = sales_df['store_id']
+
+    def by_store(*keys):
+        return amount.groupby([store, *keys], sort=False, observed=True)
+
+    tables = {
+        'store': by_store().agg(['sum', 'count']),
+        'category': by_store(sales_df['product_category']).agg(['sum', 'count']),
+        'date': by_store(sales_df['date'], sales_df['is_weekend']).agg(['sum', 'count']),
+        'day_of_week': by_store(sales_df['day_of_week']).agg(['sum', 'count']),
+        'store_category': by_store(sales_df['product_category']).sum(),
+        'amount_counts': by_store(amount.rename('value')).size(),
+    }
+
+    # Split each small table per store (keep the store level where the
+    # partial layout has it)
+    split = {
+        key: dict(iter(table.groupby(level=0, sort=False, observed=True)))
+        for key, table in tables.items()
+    }
+
+    partials = {}
+    for store_id, store_totals in split['store'].items():
+        amount_counts = split['amount_counts'][store_id].droplevel(0)
+        amount_counts.index.name = 'sales_amount'
+        partials[store_id] = {
+            'rows': int(store_totals['count'].sum()),
+            'store': store_totals,
+            'category': split['category'][store_id].droplevel(0),
+            'date': split['date'][store_id].droplevel(0),
+            'day_of_week': split['day_of_week'][store_id].droplevel(0),
+            'store_category': split['store_category'][store_id],
+            'amount_counts': amount_counts,
+        }
+
+    return partials
+
+
+def build_pack_specs(store_partials, stores_df, by='store', packs=None):
+    """
+    Build the list of packs to generate and their merged aggregates.
+
+    Args:
+        store_partials: Per-store partial aggregates (from compute_store_partials)
+        stores_df: DataFrame with store metadata
+        by: 'store' (one pack per store) or 'region' (one pack per region)
+        packs: Optional list of store IDs or region names (default: all)
+
+    Returns:
+        List of pack dicts with pack_id, title, kind, store_ids and partial
+    """
+    if by not in PACK_TYPES:
+        raise ValueError(f"by must be one of {PACK_TYPES}, got '{by}'")
+
+    stores = stores_df[stores_df['store_id'].isin(store_partials.keys())]
+
+    if by == 'store':
+        groups = {
+            row.store_id: (f"{row.store_name_en} ({row.store_id})", [row.store_id])
+            for row in stores.itertuples()
+        }
+    else:
+        groups = {
+            region: (f"{region} Region", group['store_id'].tolist())
+            for region, group in stores.groupby('region', sort=True)
+        }
+
+    if packs is not None:
+        unknown = [pack for pack in packs if pack not in groups]
+        if unknown:
+            raise ValueError(f"No sales data for {by}(s): {', '.join(map(str, unknown))}")
+        groups = {pack: groups[pack] for pack in packs}
+
+    specs = []
+    for pack_id, (title, store_ids) in groups.items():
+        partials = [store_partials[store_id] for store_id in store_ids]
+        specs.append({
+            'pack_id': pack_id,
+            'title': title,
+            'kind': by,
+            'store_ids': store_ids,
+            'partial': partials[0] if len(partials) == 1 else merge_partial_aggregates(partials),
+        })
+
+    return specs
+
+
+# ============================================
+# PACK RENDERING (runs in worker processes)
+# ============================================
+
+def _init_pack_worker(stores_df, settings):
+    """Worker initializer: Agg backend, plot style and shared pack inputs."""
+    global _PACK_STORES_DF, _PACK_SETTINGS
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    from analysis.visualizations import setup_plot_style
+
+    setup_plot_style(settings['profile'])
+    _PACK_STORES_DF = stores_df
+    _PACK_SETTINGS = settings
+
+
+def _pack_dirname(pack_id):
+    """Filesystem-safe folder name for a pack."""
+    return re.sub(r'[^\w\-]+', '_', str(pack_id))
+
+
+def build_pack_markdown(pack, results, charts):
+    """
+    Build the Markdown summary of one pack.
+
+    Args:
+        pack: Pack dict (from build_pack_specs)
+        results: Finalized metrics for the pack
+        charts: List of (title, relative PNG path)
+
+    Returns:
+        Markdown text
+    """
+    kpis = results['key_metrics']
+    weekend_comparison, weekend_lift = results['weekend_vs_weekday']
+    start = pd.Timestamp(kpis['date_range_start']).strftime('%Y-%m-%d')
+    end = pd.Timestamp(kpis['date_range_end']).strftime('%Y-%m-%d')
+
+    lines = [
+        f"# {pack['title']} - Sales Report",
+        f"## {start} to {end}",
+        "",
+        f"**Stores**: {', '.join(pack['store_ids'])}",
+        "",
+        "## Key Metrics",
+        "",
+        "| Metric | Value |",
+        "|--------|-------|",
+        f"| Total Revenue | ¥{kpis['total_revenue']:,.0f} |",
+        f"| Transactions | {kpis['total_transactions']:,} |",
+        f"| Average Transaction | ¥{kpis['avg_transaction_value']:,.0f} |",
+        f"| Median Transaction | ¥{kpis['median_transaction_value']:,.0f} |",
+        f"| Trading Days | {kpis['num_days']} |",
+        f"| Weekend Lift (per day) | {weekend_lift:+.1f}% |",
+        "",
+        "## Revenue by Category",
+        "",
+        "| Category | Revenue | Share | Transactions |",
+        "|----------|---------|-------|--------------|",
+    ]
+    for row in results['revenue_by_category'].itertuples():
+        lines.append(f"| {row.category} | ¥{row.total_revenue:,.0f} | {row.revenue_share_pct}% | {row.num_transactions:,} |")
+
+    if pack['kind'] == 'region':
+        lines += [
+            "",
+            "## Revenue by Store",
+            "",
+            "| Store | Revenue | Share | Transactions |",
+            "|-------|---------|-------|--------------|",
+        ]
+        for row in results['revenue_by_store'].itertuples():
+            lines.append(f"| {row.store_name} | ¥{row.total_revenue:,.0f} | {row.revenue_share_pct}% | {row.num_transactions:,} |")
+
+    lines += ["", "## Charts", ""]
+    for title, path in charts:
+        lines += [f"![{title}]({path})", ""]
+
+    return '\n'.join(lines) + '\n'
+
+
+def render_pack(pack):
+    """
+    Render one report pack: charts, Markdown and the requested documents.
+
+    Args:
+        pack: Pack dict (from build_pack_specs)
+
+    Returns:
+        Summary dict with pack_id, output_dir, files and seconds
+    """
+    import matplotlib.pyplot as plt
+    from analysis import visualizations as viz
+
+    start = time.perf_counter()
+    settings = _PACK_SETTINGS
+    results = finalize_metrics(pack['partial'], _PACK_STORES_DF)
+
+    pack_dir = Path(settings['output_dir']) / _pack_dirname(pack['pack_id'])
+    assets_dir = pack_dir / 'assets'
+    assets_dir.mkdir(parents=True, exist_ok=True)
+
+    weekend_comparison, _ = results['weekend_vs_weekday']
+    chart_calls = [
+        ('Daily Revenue Trend', 'daily_revenue_trend.png', viz.plot_daily_revenue_trend, results['daily_revenue'], {}),
+        ('Revenue by Category', 'revenue_by_category.png', viz.plot_revenue_by_category, results['revenue_by_category'], {}),
+        ('Revenue by Day of Week', 'revenue_by_day_of_week.png', viz.plot_day_of_week_revenue, results['day_of_week_metrics'], {}),
+        ('Weekend vs Weekday', 'weekend_vs_weekday.png', viz.plot_weekend_vs_weekday, weekend_comparison, {}),
+    ]
+    if pack['kind'] == 'region':
+        chart_calls += [
+            ('Revenue by Store', 'revenue_by_store.png', viz.plot_revenue_by_store, results['revenue_by_store'], {}),
+            ('Category Mix by Store', 'category_mix_by_store.png', viz.plot_category_mix_by_store, results['category_mix_by_store'], {}),
+        ]
+
+    charts = []
+    for title, filename, plot_func, data, options in chart_calls:
+        plot_func(data, save_path=assets_dir / filename, profile=settings['profile'], **options)
+        plt.close('all')
+        charts.append((title, f'assets/{filename}'))
+
+    files = [assets_dir / filename for _, filename, _, _, _ in chart_calls]
+
+    md_path = pack_dir / 'report.md'
+    md_path.write_text(build_pack_markdown(pack, results, charts), encoding='utf-8')
+    files.append(md_path)
+
+    if 'docx' in settings['formats']:
+        from reporting.md_to_word import convert_markdown_to_docx
+        docx_path = pack_dir / 'report.docx'
+        with contextlib.redirect_stdout(io.StringIO()):
+            convert_markdown_to_docx(md_path, docx_path, pack_dir, cache_dir=None,
+                                     image_cache_dir=assets_dir / '.image_cache')
+        files.append(docx_path)
+
+    return {
+        'pack_id': pack['pack_id'],
+        'output_dir': str(pack_dir),
+        'files': [str(path) for path in files],
+        'seconds': time.perf_counter() - start,
+    }
+
+
+# ============================================
+# BATCH DRIVER
+# ============================================
+
+def print_progress(done, total, summary, elapsed):
+    """Default progress reporter: one line per finished pack with an ETA."""
+    eta = elapsed / done * (total - done)
+    print(f"  [{done:>{len(str(total))}}/{total}] {summary['pack_id']:<12} "
+          f"{summary['seconds']:6.2f}s   elapsed {elapsed:6.1f}s   ETA {eta:6.1f}s")
+
+
+def generate_report_packs(
+    sales_df,
+    stores_df,
+    output_dir=PACKS_DIR,
+    by='store',
+    packs=None,
+    max_workers=None,
+    profile='publication',
+    formats=DEFAULT_FORMATS,
+    progress=print_progress,
+    offsets=None
+):
+    """
+    Generate report packs for stores or regions in parallel.
+
+    Args:
+        sales_df: DataFrame with sales transactions
+        stores_df: DataFrame with store metadata
+        output_dir: Root folder for the packs (one subfolder per pack)
+        by: 'store' or 'region'
+        packs: Optional list of store IDs or region names (default: all)
+        max_workers: Worker processes (defaults to the CPU count); 1 builds
+                     the packs sequentially in this process
+        profile: Chart render profile - 'publication' or 'draft'
+        formats: Documents to write besides the charts ('md' always, 'docx')
+        progress: Callback(done, total, summary, elapsed_seconds) or None
+        offsets: Optional store offset index of sales_df (data_pipeline.store_offsets)
+
+    Returns:
+        List of pack summaries in the order of the pack list
+    """
+    start = time.perf_counter()
+
+    # One scan for all packs; workers only receive small aggregate tables
+    specs = build_pack_specs(compute_store_partials(sales_df, offsets), stores_df, by, packs)
+    settings = {'output_dir': str(output_dir), 'profile': profile, 'formats': tuple(formats)}
+    total = len(specs)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, total))
+
+    summaries = {}
+
+    def report(summary):
+        summaries[summary['pack_id']] = summary
+        if progress is not None:
+            progress(len(summaries), total, summary, time.perf_counter() - start)
+
+    if max_workers == 1:
+        _init_pack_worker(stores_df, settings)
+        for spec in specs:
+            report(render_pack(spec))
+    else:
+        mp_context = (multiprocessing.get_context('fork')
+                      if 'fork' in multiprocessing.get_all_start_methods() else None)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_pack_worker,
+            initargs=(stores_df, settings)
+        ) as executor:
+            # Keep a bounded number of packs in flight
+            pending = set()
+            remaining = iter(specs)
+            for spec in remaining:
+                pending.add(executor.submit(render_pack, spec))
+                if len(pending) >= max_workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        report(future.result())
+            for future in wait(pending).done:
+                report(future.result())
+
+    return [summaries[spec['pack_id']] for spec in specs]
+
+
+def main(argv=None):
+    """
+    Main execution function.
+    """
+    parser = argparse.ArgumentParser(description='Generate per-store or per-region report packs')
+    parser.add_argument('--by', choices=PACK_TYPES, default='store')
+    parser.add_argument('--packs', nargs='+', help='Store IDs or region names (default: all)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--draft', action='store_true', help='Fast low-DPI charts')
+    parser.add_argument('--formats', nargs='+', choices=DEFAULT_FORMATS, default=list(DEFAULT_FORMATS))
+    parser.add_argument('--sales', default=str(DATA_DIR / 'sales_clean.csv'))
+    parser.add_argument('--stores', default=str(DATA_DIR / 'stores.csv'))
+    parser.add_argument('--output-dir', default=str(PACKS_DIR))
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print(f"REPORT PACKS (one per {args.by})")
+    print("=" * 60)
+
+    sales_df = read_csv_cached(args.sales, parse_dates=['date'])
+    stores_df = read_csv_cached(args.stores)
+
+    start = time.perf_counter()
+    summaries = generate_report_packs(
+        sales_df, stores_df, args.output_dir, by=args.by, packs=args.packs,
+        max_workers=args.workers, profile='draft' if args.draft else 'publication',
+        formats=args.formats, offsets=load_offsets_for(args.sales)
+    )
+
+    print(f"\n✅ {len(summaries)} report packs created in {args.output_dir} "
+          f"({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Pipeline Benchmark Tests
+
+Pytest tests verifying that the benchmark suite flags only stages that
+regressed beyond the tolerance and noise floor, and that it skips only
+stages whose optional dependencies are missing.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT / 'benchmarks'))
+
+from bench_pipeline import compare_runs, run_stage
+
+
+# Fixtures
+@pytest.fixture
+def runs():
+    """Two fabricated benchmark runs (baseline, candidate) with one scale."""
+    baseline = {'scales': {'small': {
+        'clean_raw_data.parse_dates': {'status': 'ok', 'seconds': 1.0, 'peak_mb': 10.0},
+        'metrics.calculate_key_metrics': {'status': 'ok', 'seconds': 0.01, 'peak_mb': 1.0},
+        'metrics.calculate_daily_revenue': {'status': 'ok', 'seconds': 0.5, 'peak_mb': 5.0},
+        'reports.md_to_word': {'status': 'skipped', 'error': 'ImportError: docx'},
+    }}}
+    candidate = {'scales': {
+        'small': {
+            # Slower by 50% and 0.5s; memory within tolerance
+            'clean_raw_data.parse_dates': {'status': 'ok', 'seconds': 1.5, 'peak_mb': 10.5},
+            # Three times slower but below the noise floor
+            'metrics.calculate_key_metrics': {'status': 'ok', 'seconds': 0.03, 'peak_mb': 1.0},
+            # Memory doubled
+            'metrics.calculate_daily_revenue': {'status': 'ok', 'seconds': 0.5, 'peak_mb': 10.0},
+            # Skipped in the baseline: not compared
+            'reports.md_to_word': {'status': 'ok', 'seconds': 9.0, 'peak_mb': 90.0},
+        },
+        # No baseline for this scale
+        'medium': {'metrics.calculate_key_metrics': {'status': 'ok', 'seconds': 5.0, 'peak_mb': 50.0}},
+    }}
+    return baseline, candidate
+
+
+# Test 1: Regressions beyond tolerance and noise floor
+def test_compare_runs(runs):
+    """
+    Verify time and memory regressions are reported and noise is ignored.
+    """
+    baseline, candidate = runs
+    regressions = compare_runs(baseline, candidate, tolerance=0.1, min_seconds=0.05, min_peak_mb=1.0)
+
+    assert [(r['stage'], r['metric']) for r in regressions] == [
+        ('clean_raw_data.parse_dates', 'seconds'),
+        ('metrics.calculate_daily_revenue', 'peak_mb'),
+    ]
+    assert regressions[0]['scale'] == 'small'
+    assert regressions[0]['baseline'] == 1.0 and regressions[0]['candidate'] == 1.5
+    assert regressions[0]['change'] == pytest.approx(0.5)
+    assert regressions[1]['change'] == pytest.approx(1.0)
+
+    # A wider tolerance accepts the slowdown; a run never regresses against itself
+    regressions = compare_runs(baseline, candidate, tolerance=0.6, min_seconds=0.05, min_peak_mb=1.0)
+    assert [r['metric'] for r in regressions] == ['peak_mb']
+    assert compare_runs(candidate, candidate, 0.0, 0.0, 0.0) == []
+
+
+# Test 2: Only missing dependencies skip a stage
+def test_run_stage_skips_missing_dependencies():
+    """
+    Verify ImportError/OSError (and SystemExit where allowed) mark a stage skipped.
+    """
+    results = {}
+
+    def missing_module():
+        raise ImportError('No module named docx')
+
+    def missing_tool():
+        raise FileNotFoundError('soffice')
+
+    def broken():
+        raise ValueError('bad data')
+
+    assert run_stage(results, 'ok', lambda: 42, repeat=1, trace_memory=False) == 42
+    assert run_stage(results, 'module', missing_module, repeat=1, trace_memory=False) is None
+    run_stage(results, 'tool', missing_tool, repeat=1, trace_memory=False)
+    assert results['ok']['status'] == 'ok'
+    assert results['module'] == {'status': 'skipped', 'error': 'ImportError: No module named docx'}
+    assert results['tool']['status'] == 'skipped'
+
+    with pytest.raises(ValueError):
+        run_stage(results, 'broken', broken, repeat=1, trace_memory=False)
+    with pytest.raises(SystemExit):
+        run_stage(results, 'exit', lambda: sys.exit(1), repeat=1, trace_memory=False)
+
+    # A PDF renderer exiting on a missing WeasyPrint/Pango is skipped with its reason
+    def renderer_exits():
+        print("❌ Error generating PDF: cannot load library 'pango-1.0-0'")
+        sys.exit(1)
+
+    run_stage(results, 'pdf', renderer_exits, repeat=1, trace_memory=False,
+              skip_on=(ImportError, OSError, SystemExit))
+    assert results['pdf'] == {'status': 'skipped',
+                              'error': "SystemExit: ❌ Error generating PDF: cannot load library 'pango-1.0-0'"}
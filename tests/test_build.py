@@ -0,0 +1,157 @@
+"""
+Build Orchestrator Tests
+
+Pytest tests verifying that the make-style build derives dependencies from
+declared inputs/outputs, skips unchanged steps, rebuilds only what a change
+affects and runs independent steps in parallel.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import sys
+import json
+import pytest
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from build import (
+    BUILD_STEPS, BUILT, UP_TO_DATE, WOULD_BUILD, FAILED, BLOCKED,
+    build_graph, resolve_inputs, topological_order, run_build
+)
+
+
+def copy_step(source, target, sleep=0.0):
+    """A step copying one file to another, recording its start/end times."""
+    code = (
+        "import sys, time, json; start = time.time(); time.sleep(float(sys.argv[3])); "
+        "data = open(sys.argv[1]).read(); open(sys.argv[2], 'w').write(data.upper()); "
+        "open(sys.argv[2] + '.times', 'w').write(json.dumps([start, time.time()]))"
+    )
+    return {
+        'command': [sys.executable, '-c', code, source, target, str(sleep)],
+        'inputs': [source],
+        'outputs': [target],
+    }
+
+
+def make_steps():
+    """source.txt -> a.txt -> (b.txt, c.txt)"""
+    return {
+        'a': copy_step('source.txt', 'a.txt'),
+        'b': copy_step('a.txt', 'b.txt'),
+        'c': copy_step('a.txt', 'c.txt'),
+    }
+
+
+def build(steps, root, **kwargs):
+    return run_build(steps, root=root, state_path=root / '.build' / 'state.json',
+                     log_dir=root / '.build' / 'logs', report=None, **kwargs)
+
+
+# Test 1: Dependencies follow from inputs and outputs
+def test_build_graph():
+    """
+    Verify derived dependencies, target selection and declaration errors.
+    """
+    graph = build_graph(make_steps())
+    assert graph == {'a': set(), 'b': {'a'}, 'c': {'a'}}
+    assert topological_order(graph, ['c']) == ['a', 'c']
+
+    # The real build: documents depend on the Markdown report, which needs the EDA
+    graph = build_graph(BUILD_STEPS)
+    assert {'report_markdown', 'eda'} <= graph['word']
+    assert graph['pptx_pdf'] == {'pptx'}
+    assert topological_order(graph)[:3] == ['processed_data', 'eda', 'report_markdown']
+    assert 'data/processed/revenue_cube.npz' in BUILD_STEPS['processed_data']['outputs']
+
+    # The EDA reads the offset index and imports the index modules: changing them reruns it
+    eda_inputs = {path.relative_to(PROJECT_ROOT).as_posix()
+                  for path in resolve_inputs(BUILD_STEPS['eda'], PROJECT_ROOT)}
+    assert {'data/processed/sales_clean_offsets.json', 'src/data_pipeline/store_offsets.py',
+            'src/data_pipeline/zone_maps.py', 'src/analysis/metrics.py'} <= eda_inputs
+    assert 'src/data_pipeline/cleaner.py' not in eda_inputs
+
+    with pytest.raises(ValueError):
+        build_graph({'a': copy_step('x', 'out'), 'b': copy_step('y', 'out')})
+    with pytest.raises(ValueError):
+        build_graph({'a': copy_step('b.txt', 'a.txt'), 'b': copy_step('a.txt', 'b.txt')})
+    with pytest.raises(ValueError):
+        topological_order(graph, ['missing_step'])
+
+
+# Test 2: Unchanged steps are skipped; a change rebuilds only its dependents
+def test_incremental_build(tmp_path):
+    """
+    Verify up-to-date detection by content, not timestamps.
+    """
+    steps = make_steps()
+    (tmp_path / 'source.txt').write_text('v1')
+
+    assert build(steps, tmp_path) == {'a': BUILT, 'b': BUILT, 'c': BUILT}
+    assert (tmp_path / 'b.txt').read_text() == 'V1'
+    assert build(steps, tmp_path) == {'a': UP_TO_DATE, 'b': UP_TO_DATE, 'c': UP_TO_DATE}
+
+    # Same content rewritten: nothing to do
+    (tmp_path / 'source.txt').write_text('v1')
+    assert build(steps, tmp_path) == {'a': UP_TO_DATE, 'b': UP_TO_DATE, 'c': UP_TO_DATE}
+
+    # Edited intermediate file: only its dependents rebuild
+    (tmp_path / 'a.txt').write_text('edited')
+    assert build(steps, tmp_path, dry_run=True) == {'a': UP_TO_DATE, 'b': WOULD_BUILD, 'c': WOULD_BUILD}
+    assert build(steps, tmp_path, targets=['b']) == {'a': UP_TO_DATE, 'b': BUILT}
+    assert (tmp_path / 'b.txt').read_text() == 'EDITED'
+
+    # Deleted output: rebuilt
+    (tmp_path / 'c.txt').unlink()
+    assert build(steps, tmp_path)['c'] == BUILT
+
+    assert build(steps, tmp_path, force=True) == {'a': BUILT, 'b': BUILT, 'c': BUILT}
+    state = json.loads((tmp_path / '.build' / 'state.json').read_text())
+    assert set(state['steps']) == {'a', 'b', 'c'}
+
+
+# Test 3: A failed step blocks its dependents only
+def test_failure_blocks_dependents(tmp_path):
+    """
+    Verify failures are reported, dependents blocked and siblings still built.
+    """
+    (tmp_path / 'source.txt').write_text('v1')
+    steps = make_steps()
+    steps['d'] = {'command': [sys.executable, '-c', 'raise SystemExit(3)'],
+                  'inputs': ['a.txt'], 'outputs': ['d.txt']}
+    steps['e'] = copy_step('d.txt', 'e.txt')
+
+    status = build(steps, tmp_path)
+    assert status == {'a': BUILT, 'b': BUILT, 'c': BUILT, 'd': FAILED, 'e': BLOCKED}
+    assert (tmp_path / '.build' / 'logs' / 'd.log').exists()
+
+    # Missing source input fails the step without running it
+    (tmp_path / 'source.txt').unlink()
+    assert build(make_steps(), tmp_path) == {'a': FAILED, 'b': BLOCKED, 'c': BLOCKED}
+
+
+# Test 4: Independent steps run at the same time
+def test_parallel_steps(tmp_path):
+    """
+    Verify b and c (both depending only on a) overlap with 2 jobs.
+    """
+    (tmp_path / 'source.txt').write_text('v1')
+    steps = {
+        'a': copy_step('source.txt', 'a.txt'),
+        'b': copy_step('a.txt', 'b.txt', sleep=1.0),
+        'c': copy_step('a.txt', 'c.txt', sleep=1.0),
+    }
+
+    assert set(build(steps, tmp_path, max_jobs=2).values()) == {BUILT}
+
+    a_end = json.loads((tmp_path / 'a.txt.times').read_text())[1]
+    b_start, b_end = json.loads((tmp_path / 'b.txt.times').read_text())
+    c_start, c_end = json.loads((tmp_path / 'c.txt.times').read_text())
+    assert b_start >= a_end and c_start >= a_end
+    assert b_start < c_end and c_start < b_end
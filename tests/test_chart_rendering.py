@@ -0,0 +1,166 @@
+"""
+Chart Rendering Tests
+
+Pytest tests verifying that charts rendered as parallel jobs are identical
+to charts rendered sequentially, and that up-to-date charts are not rendered
+again.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import pytest
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from analysis.metrics import calculate_revenue_by_category, calculate_day_of_week_metrics
+from analysis.visualizations import setup_plot_style, plot_revenue_by_category, plot_day_of_week_revenue
+from analysis.chart_rendering import ChartJob, render_charts
+from analysis.chart_cache import load_manifest, chart_cache_disabled
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def aggregates():
+    """Small aggregate tables computed from sales_clean.csv."""
+    sales_df = pd.read_csv(PROCESSED_DIR / 'sales_clean.csv', parse_dates=['date'])
+    return calculate_revenue_by_category(sales_df), calculate_day_of_week_metrics(sales_df)
+
+
+def make_jobs(aggregates, output_dir):
+    category_revenue, dow_revenue = aggregates
+    return [
+        ChartJob('revenue_by_category.png', plot_revenue_by_category, (category_revenue,),
+                 {'save_path': output_dir / 'revenue_by_category.png'}),
+        ChartJob('revenue_by_day_of_week.png', plot_day_of_week_revenue, (dow_revenue,),
+                 {'save_path': output_dir / 'revenue_by_day_of_week.png'}),
+    ]
+
+
+# Test 1: Parallel rendering writes the same PNG bytes as sequential rendering
+def test_parallel_matches_sequential(aggregates, tmp_path):
+    """
+    Verify a 2-worker pool and in-process rendering produce identical files.
+    """
+    sequential_dir = tmp_path / 'sequential'
+    parallel_dir = tmp_path / 'parallel'
+    sequential_dir.mkdir()
+    parallel_dir.mkdir()
+
+    sequential = render_charts(make_jobs(aggregates, sequential_dir), max_workers=1,
+                               style_setup=setup_plot_style)
+    parallel = render_charts(make_jobs(aggregates, parallel_dir), max_workers=2,
+                             style_setup=setup_plot_style)
+
+    assert list(sequential) == list(parallel) == ['revenue_by_category.png', 'revenue_by_day_of_week.png']
+    for filename in sequential:
+        assert (parallel_dir / filename).read_bytes() == (sequential_dir / filename).read_bytes()
+
+
+# Test 2: Errors in a render job reach the caller
+def test_job_errors_propagate(tmp_path):
+    """
+    Verify a failing job raises instead of being silently skipped.
+    """
+    bad_job = ChartJob('bad.png', plot_revenue_by_category, (pd.DataFrame(),),
+                       {'save_path': tmp_path / 'bad.png'})
+
+    with pytest.raises(KeyError):
+        render_charts([bad_job, bad_job], max_workers=2)
+
+
+# Test 3: Unchanged charts are skipped; changed data, style or files re-render
+def test_chart_cache(aggregates, tmp_path):
+    """
+    Verify the content-hash cache skips up-to-date charts only.
+    """
+    category_revenue, dow_revenue = aggregates
+    setup_plot_style()
+
+    first = render_charts(make_jobs(aggregates, tmp_path), max_workers=1)
+    assert all(seconds is not None for seconds in first.values())
+    manifest = load_manifest(tmp_path)
+    assert sorted(entry['file'] for entry in manifest.values()) == sorted(first)
+
+    second = render_charts(make_jobs(aggregates, tmp_path), max_workers=1)
+    assert all(seconds is None for seconds in second.values())
+
+    # Changed input table: only that chart re-renders, replacing its manifest entry
+    changed = category_revenue.assign(total_revenue=category_revenue['total_revenue'] * 2)
+    third = render_charts(make_jobs((changed, dow_revenue), tmp_path), max_workers=1)
+    assert third['revenue_by_category.png'] is not None
+    assert third['revenue_by_day_of_week.png'] is None
+    assert len(load_manifest(tmp_path)) == 2
+
+    # Modified PNG on disk: re-rendered
+    (tmp_path / 'revenue_by_day_of_week.png').write_bytes(b'stale')
+    fourth = render_charts(make_jobs((changed, dow_revenue), tmp_path), max_workers=1)
+    assert fourth['revenue_by_day_of_week.png'] is not None
+
+    # Changed style: everything re-renders
+    plt.rcParams['font.size'] = 12
+    try:
+        fifth = render_charts(make_jobs((changed, dow_revenue), tmp_path), max_workers=1)
+    finally:
+        setup_plot_style()
+    assert all(seconds is not None for seconds in fifth.values())
+
+
+# Test 4: Direct plot_* calls use the same cache
+def test_plot_function_cached(aggregates, tmp_path):
+    """
+    Verify a repeated plot_* call does not rewrite an up-to-date PNG.
+    """
+    category_revenue, _ = aggregates
+    setup_plot_style()
+    save_path = tmp_path / 'revenue_by_category.png'
+
+    plot_revenue_by_category(category_revenue, save_path=save_path)
+    plt.close('all')
+    first_mtime = save_path.stat().st_mtime_ns
+
+    plot_revenue_by_category(category_revenue, save_path=save_path)
+    assert plt.get_fignums() == []
+    assert save_path.stat().st_mtime_ns == first_mtime
+
+    with chart_cache_disabled():
+        plot_revenue_by_category(category_revenue, save_path=save_path)
+    plt.close('all')
+    assert save_path.stat().st_mtime_ns != first_mtime
+
+
+# Test 5: Draft profile renders small previews; publication is the default
+def test_render_profiles(aggregates, tmp_path):
+    """
+    Verify publication output is unchanged by default and draft is low-DPI.
+    """
+    category_revenue, _ = aggregates
+
+    with chart_cache_disabled():
+        setup_plot_style()
+        plot_revenue_by_category(category_revenue, save_path=tmp_path / 'default.png')
+        plot_revenue_by_category(category_revenue, save_path=tmp_path / 'publication.png',
+                                 profile='publication')
+        plot_revenue_by_category(category_revenue, save_path=tmp_path / 'draft.png', profile='draft')
+        plt.close('all')
+
+    assert (tmp_path / 'default.png').read_bytes() == (tmp_path / 'publication.png').read_bytes()
+
+    publication_width = plt.imread(tmp_path / 'publication.png').shape[1]
+    draft_width = plt.imread(tmp_path / 'draft.png').shape[1]
+    assert draft_width < publication_width / 3
+
+    with pytest.raises(ValueError):
+        setup_plot_style('preview')
+    setup_plot_style()
@@ -0,0 +1,130 @@
+"""
+Chunked Metrics Tests
+
+Pytest tests verifying that the out-of-core, parallel and single-pass metrics
+match the individual in-memory functions in analysis.metrics.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import sys
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+SALES_PATH = PROCESSED_DIR / 'sales_clean.csv'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from analysis import metrics
+from analysis.chunked_metrics import calculate_metrics_chunked, estimate_chunk_rows
+from analysis.parallel_metrics import calculate_metrics_parallel
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def sales_df():
+    """Load sales_clean.csv for testing."""
+    return pd.read_csv(SALES_PATH, parse_dates=['date'])
+
+
+@pytest.fixture(scope='module')
+def stores_df():
+    """Load stores.csv for testing."""
+    return pd.read_csv(PROCESSED_DIR / 'stores.csv')
+
+
+@pytest.fixture(scope='module', params=[7, 250, None, 'single_pass'])
+def chunked_results(request, sales_df, stores_df):
+    """
+    Run the chunked metrics with several chunk sizes (None = memory budget),
+    and the in-memory single-pass calculate_all_metrics.
+    """
+    if request.param == 'single_pass':
+        return metrics.calculate_all_metrics(sales_df, stores_df)
+    return calculate_metrics_chunked(SALES_PATH, stores_df, chunk_rows=request.param)
+
+
+# Test 1: Store, region and category tables match the in-memory functions
+def test_revenue_tables_match(chunked_results, sales_df, stores_df):
+    """
+    Verify grouped revenue tables are identical, including share percentages.
+    """
+    pd.testing.assert_frame_equal(
+        chunked_results['revenue_by_store'],
+        metrics.calculate_revenue_by_store(sales_df, stores_df)
+    )
+    pd.testing.assert_frame_equal(
+        chunked_results['revenue_by_region'],
+        metrics.calculate_revenue_by_region(sales_df, stores_df)
+    )
+    pd.testing.assert_frame_equal(
+        chunked_results['revenue_by_category'],
+        metrics.calculate_revenue_by_category(sales_df)
+    )
+    pd.testing.assert_frame_equal(
+        chunked_results['category_mix_by_store'],
+        metrics.calculate_category_mix_by_store(sales_df, stores_df)
+    )
+
+
+# Test 2: Temporal tables match, including distinct-day averages
+def test_temporal_tables_match(chunked_results, sales_df):
+    """
+    Verify daily, day-of-week and weekend tables are identical.
+    """
+    pd.testing.assert_frame_equal(
+        chunked_results['daily_revenue'],
+        metrics.calculate_daily_revenue(sales_df)
+    )
+    pd.testing.assert_frame_equal(
+        chunked_results['day_of_week_metrics'],
+        metrics.calculate_day_of_week_metrics(sales_df)
+    )
+
+    comparison, lift = chunked_results['weekend_vs_weekday']
+    expected_comparison, expected_lift = metrics.calculate_weekend_vs_weekday(sales_df)
+    pd.testing.assert_frame_equal(comparison, expected_comparison)
+    assert lift == expected_lift
+
+
+# Test 3: Key metrics (including the exact median) match
+def test_key_metrics_match(chunked_results, sales_df):
+    """
+    Verify overall KPIs are identical.
+    """
+    assert chunked_results['key_metrics'] == metrics.calculate_key_metrics(sales_df)
+
+
+# Test 4: Memory budget controls the chunk size
+def test_chunk_rows_follow_memory_budget():
+    """
+    Verify a smaller memory budget yields smaller chunks.
+    """
+    small = estimate_chunk_rows(SALES_PATH, memory_budget_mb=0.1)
+    large = estimate_chunk_rows(SALES_PATH, memory_budget_mb=10)
+
+    assert 1 <= small < large
+
+
+# Test 5: Sharded process-pool metrics match the chunked results
+@pytest.mark.parametrize('shard_by', ['store_id', 'date'])
+def test_parallel_metrics_match(sales_df, stores_df, shard_by):
+    """
+    Verify store- and date-sharded parallel runs merge to the same results.
+    """
+    results = calculate_metrics_parallel(sales_df, stores_df, max_workers=3, shard_by=shard_by)
+    expected = calculate_metrics_chunked(SALES_PATH, stores_df)
+
+    for key in ['revenue_by_store', 'revenue_by_region', 'revenue_by_category',
+                'daily_revenue', 'day_of_week_metrics', 'category_mix_by_store']:
+        pd.testing.assert_frame_equal(results[key], expected[key])
+
+    pd.testing.assert_frame_equal(results['weekend_vs_weekday'][0], expected['weekend_vs_weekday'][0])
+    assert results['weekend_vs_weekday'][1] == expected['weekend_vs_weekday'][1]
+    assert results['key_metrics'] == expected['key_metrics']
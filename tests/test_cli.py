@@ -0,0 +1,108 @@
+"""
+Command Line Startup Tests
+
+Pytest tests verifying that the unified command line answers --help without
+loading heavy libraries, that quick commands import only what they use and
+that startup stays within its time budget.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import sys
+import json
+import time
+import subprocess
+import pytest
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+CLI = PROJECT_ROOT / 'src' / 'cli.py'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from cli import COMMANDS, build_parser, main
+
+HEAVY_MODULES = ['pandas', 'numpy', 'matplotlib', 'seaborn', 'weasyprint', 'docx', 'pptx', 'reportlab', 'chardet']
+
+# Seconds; startup here is ~0.1s, the budget leaves room for slow machines
+HELP_BUDGET = 1.0
+
+
+def loaded_modules(code):
+    """Run code in a fresh interpreter and return the heavy modules it loaded."""
+    probe = (
+        f"import sys; sys.path.insert(0, {str(PROJECT_ROOT / 'src')!r})\n{code}\n"
+        f"import json; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    result = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True,
+                            cwd=str(PROJECT_ROOT), check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+# Test 1: --help loads no heavy library and answers within the budget
+def test_help_is_fast():
+    """
+    Verify the help output lists every command without importing heavy modules.
+    """
+    code = "import cli\ntry:\n    cli.main(['--help'])\nexcept SystemExit:\n    pass"
+    assert loaded_modules(code) == []
+
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, str(CLI), '--help'], capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+
+    assert result.returncode == 0
+    assert all(name in result.stdout for name in COMMANDS)
+    assert elapsed < HELP_BUDGET
+
+
+# Test 2: Library imports pull in only what they use
+@pytest.mark.parametrize('code,allowed', [
+    ('import analysis', []),
+    ('from analysis.metrics import calculate_all_metrics', ['pandas', 'numpy']),
+    ('from data_pipeline.validator import validate_processed_data', ['pandas', 'numpy']),
+    ('from data_pipeline.loader import load_all_store_files', ['pandas', 'numpy']),
+    ('import full_build', ['pandas', 'numpy']),
+    ('from reporting import md_to_pdf_slides', []),
+])
+def test_import_budget(code, allowed):
+    """
+    Verify charting, PDF and Office libraries are only loaded when needed.
+    """
+    assert set(loaded_modules(code)) <= set(allowed)
+
+
+# Test 3: The package still exposes names from its submodules on access
+def test_lazy_package_names():
+    """
+    Verify analysis.<name> and submodule access resolve on first use.
+    """
+    import analysis
+    from analysis import metrics
+    from analysis.metrics import calculate_all_metrics
+
+    assert analysis.calculate_all_metrics is calculate_all_metrics
+    assert analysis.metrics is metrics
+    assert 'visualizations' in dir(analysis)
+    with pytest.raises(AttributeError):
+        analysis.no_such_function
+
+
+# Test 4: Options are checked by the CLI or passed through to the script
+def test_argument_dispatch(capsys):
+    """
+    Verify unknown options are rejected for plain commands and passed on otherwise.
+    """
+    parser = build_parser()
+    args, remaining = parser.parse_known_args(['build', '--dry-run', '-j', '2', 'word'])
+    assert args.passes_options and remaining == ['--dry-run', '-j', '2', 'word']
+
+    with pytest.raises(SystemExit):
+        main(['docx', '--bogus'])
+    assert 'unrecognized arguments' in capsys.readouterr().err
+
+    assert main(['build', '--list']) == 0
+    assert 'processed_data' in capsys.readouterr().out
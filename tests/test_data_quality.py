@@ -93,7 +93,7 @@ def test_data_types(sales_df):
         'date': 'datetime64[ns]',
         'store_id': 'object',
         'product_category': 'object',
-        'sales_amount': ('float64', 'int64'),
+        'sales_amount': 'int64',
         'day_of_week': 'object',
         'is_weekend': ('bool', 'boolean')
     }
@@ -0,0 +1,100 @@
+"""
+In-Memory Full Build Tests
+
+Pytest tests verifying that artifacts are written in the background and
+atomically, and that passing DataFrames between stages produces the same
+summary tables and report as the CSV round trip.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import sys
+import threading
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+RAW_DIR = PROJECT_ROOT / 'data' / 'raw'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from data_pipeline.artifacts import ArtifactWriter, write_csv, write_text
+from data_pipeline.generate_processed_data import build_processed_data, save_processed_data
+from analysis.metrics import calculate_all_metrics
+from analysis.create_updated_report import generate_complete_report, load_summary_tables
+from analysis.run_complete_eda import export_summary_tables
+from full_build import run_full_build
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def datasets():
+    """Processed datasets built in memory from the raw store files."""
+    return build_processed_data(RAW_DIR)
+
+
+# Test 1: Writes run on background threads and land atomically
+def test_artifact_writer(tmp_path):
+    """
+    Verify background writes, no leftover temporary files and error propagation.
+    """
+    df = pd.DataFrame({'store_id': ['S01', 'S02'], 'total_revenue': [100, 200]})
+    threads = set()
+
+    with ArtifactWriter() as writer:
+        write_csv(df, tmp_path / 'out' / 'table.csv', writer)
+        write_text('# Report\n', tmp_path / 'report.md', writer)
+        writer.submit(tmp_path / 'thread.txt',
+                      lambda path: (threads.add(threading.current_thread().name), path.write_text('x')))
+
+    assert pd.read_csv(tmp_path / 'out' / 'table.csv').equals(df)
+    assert (tmp_path / 'report.md').read_text(encoding='utf-8') == '# Report\n'
+    assert all(name.startswith('artifact-writer') for name in threads)
+    assert len(writer.timings) == 3
+    assert not list(tmp_path.rglob('*.tmp'))
+
+    # A failing write is raised when the writer finishes
+    with pytest.raises(ValueError):
+        with ArtifactWriter() as writer:
+            writer.submit(tmp_path / 'bad.txt', lambda path: int('not a number'))
+    assert not (tmp_path / 'bad.txt').exists()
+
+    # Without a writer the file is written immediately
+    write_csv(df, tmp_path / 'now.csv')
+    assert (tmp_path / 'now.csv').exists()
+
+
+# Test 2: In-memory stages match the CSV round trip
+def test_in_memory_matches_round_trip(datasets, tmp_path):
+    """
+    Verify summary tables and the Markdown report are identical either way.
+    """
+    assert datasets is not None
+    results = calculate_all_metrics(datasets['sales_clean'], datasets['stores'])
+    report_in_memory = generate_complete_report(results['revenue_by_store'], results['revenue_by_region'],
+                                                results['revenue_by_category'])
+
+    # Round trip through the files the stages used to exchange
+    save_processed_data(datasets, tmp_path)
+    sales_df = pd.read_csv(tmp_path / 'sales_clean.csv', parse_dates=['date'])
+    stores_df = pd.read_csv(tmp_path / 'stores.csv')
+    export_summary_tables(calculate_all_metrics(sales_df, stores_df), tmp_path)
+    report_round_trip = generate_complete_report(*load_summary_tables(tmp_path))
+
+    assert report_in_memory == report_round_trip
+    pd.testing.assert_frame_equal(results['revenue_by_store'].reset_index(drop=True),
+                                  pd.read_csv(tmp_path / 'store_performance_summary.csv'),
+                                  check_dtype=False)
+
+
+# Test 3: Unknown document formats are rejected before any work is done
+def test_unknown_format():
+    """
+    Verify the format check.
+    """
+    with pytest.raises(ValueError):
+        run_full_build(formats=['docx', 'poster'])
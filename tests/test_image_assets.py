@@ -0,0 +1,93 @@
+"""
+Report Image Preparation Tests
+
+Pytest tests verifying that charts are resampled to each output format's
+display size and cached by source content and target settings.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import shutil
+import pytest
+from pathlib import Path
+from PIL import Image
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+ASSETS_DIR = PROJECT_ROOT / 'reports' / 'assets'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from reporting.image_assets import get_target_width, prepare_image, prepare_html_images
+
+
+# Fixtures
+@pytest.fixture
+def chart(tmp_path):
+    """A copy of a 300-DPI report chart."""
+    path = tmp_path / 'revenue_by_category.png'
+    shutil.copy(ASSETS_DIR / 'revenue_by_category.png', path)
+    return path
+
+
+# Test 1: Charts are downsampled to the profile's display size
+def test_prepare_image_resamples(chart, tmp_path):
+    """
+    Verify width, DPI, opaque RGB output and a smaller file.
+    """
+    prepared = prepare_image(chart, 'docx', cache_dir=tmp_path / 'cache')
+
+    with Image.open(prepared) as image:
+        assert image.width == get_target_width('docx') == 1100
+        assert image.mode == 'RGB'
+        assert round(image.info['dpi'][0]) == 200
+    assert prepared.stat().st_size < chart.stat().st_size / 2
+
+    # Small images are never upsampled
+    with Image.open(chart) as image:
+        image.resize((400, 240)).save(tmp_path / 'small.png')
+    with Image.open(prepare_image(tmp_path / 'small.png', 'pptx', cache_dir=tmp_path / 'cache')) as image:
+        assert image.width == 400
+    assert prepare_image(tmp_path / 'small.png', 'pptx', cache_dir=tmp_path / 'cache',
+                         optimize=False) == tmp_path / 'small.png'
+
+    with pytest.raises(ValueError):
+        prepare_image(chart, 'poster')
+
+
+# Test 2: Derived images are cached by source hash and target settings
+def test_prepare_image_cache(chart, tmp_path):
+    """
+    Verify cache hits, per-profile files and invalidation on new content.
+    """
+    cache_dir = tmp_path / 'cache'
+    first = prepare_image(chart, 'docx', cache_dir=cache_dir)
+    first_mtime = first.stat().st_mtime_ns
+
+    assert prepare_image(chart, 'docx', cache_dir=cache_dir) == first
+    assert first.stat().st_mtime_ns == first_mtime
+
+    pptx = prepare_image(chart, 'pptx', cache_dir=cache_dir)
+    assert pptx != first
+
+    shutil.copy(ASSETS_DIR / 'revenue_by_store.png', chart)
+    changed = prepare_image(chart, 'docx', cache_dir=cache_dir)
+    assert changed != first
+    assert len(list(cache_dir.glob('*.png'))) == 3
+
+
+# Test 3: HTML image references point at the prepared images
+def test_prepare_html_images(chart, tmp_path):
+    """
+    Verify PNG src attributes are rewritten and missing files left alone.
+    """
+    html = ('<p><img alt="Category" src="revenue_by_category.png" /></p>'
+            '<img src="missing.png" class="chart-image">')
+    result = prepare_html_images(html, chart.parent, 'pdf', cache_dir=tmp_path / 'cache')
+
+    prepared = next((tmp_path / 'cache').glob('revenue_by_category-*.png'))
+    assert f'src="{prepared.resolve().as_uri()}"' in result
+    assert 'src="missing.png"' in result
@@ -0,0 +1,161 @@
+"""
+Markdown Document Tree Tests
+
+Pytest tests verifying the shared Markdown document tree that the Word, PDF
+and PowerPoint renderers use, and its content-hash cache.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import json
+import pytest
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+REPORT_MARKDOWN = PROJECT_ROOT / 'reports' / 'analysis_report.md'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from reporting import markdown_document
+from reporting.markdown_document import (
+    parse_markdown, load_document, clear_document_cache, find_section,
+    section_list_items, split_lead, render_html
+)
+
+
+SAMPLE_MARKDOWN = """# Title
+## Subtitle
+
+**Prepared for**: Executives
+**Period**: January 2024
+
+---
+
+### Key Findings
+
+1. **Kanto Leads**: Kanto has 39% of revenue. It is the largest region.
+
+2. **Footwear Leads**: Footwear has 29% share.
+
+**Key Insights**:
+- Osaka leads with `¥5.2M`
+- *Balanced* portfolio
+
+| Metric | Value |
+|--------|-------|
+| **Total Revenue** | ¥44M |
+| Stores | 10 |
+
+![Revenue by Store](assets/revenue_by_store.png)
+"""
+
+
+# Test 1: Blocks and inline runs
+def test_parse_markdown():
+    """
+    Verify headings, paragraphs, lists, tables, images and runs are parsed.
+    """
+    blocks = parse_markdown(SAMPLE_MARKDOWN)
+    assert [block['type'] for block in blocks] == [
+        'heading', 'heading', 'paragraph', 'rule', 'heading', 'list',
+        'paragraph', 'list', 'table', 'image'
+    ]
+
+    assert blocks[2]['lines'][0] == [['Prepared for', 'bold'], [': Executives', 'text']]
+    assert len(blocks[2]['lines']) == 2
+
+    findings = blocks[5]
+    assert findings['ordered'] and len(findings['items']) == 2  # Blank line does not split the list
+
+    bullets = blocks[7]
+    assert not bullets['ordered']
+    assert bullets['items'][0] == [['Osaka leads with ', 'text'], ['¥5.2M', 'code']]
+    assert bullets['items'][1][0] == ['Balanced', 'italic']
+
+    table = blocks[8]
+    assert len(table['rows']) == 3  # Separator row dropped
+    assert table['rows'][1][0] == [['Total Revenue', 'bold']]
+
+    assert blocks[9] == {'type': 'image', 'alt': 'Revenue by Store', 'src': 'assets/revenue_by_store.png'}
+
+
+# Test 2: Section helpers used by the slide renderers
+def test_section_helpers(tmp_path):
+    """
+    Verify sections end at the next heading and lead-ins are split off.
+    """
+    md_path = tmp_path / 'report.md'
+    md_path.write_text(SAMPLE_MARKDOWN, encoding='utf-8')
+    document = load_document(md_path, cache_dir=None)
+
+    assert len(find_section(document, 'Key Findings')) == 5
+    assert find_section(document, 'Missing') == []
+
+    items = section_list_items(document, 'Key Findings')
+    assert split_lead(items[0]) == ('Kanto Leads', 'Kanto has 39% of revenue. It is the largest region.')
+    assert len(items) == 4
+    assert split_lead(items[2]) == ('', 'Osaka leads with ¥5.2M')  # No bold lead-in
+
+    html = render_html(document)
+    assert '<th>Metric</th>' in html
+    assert '<td><strong>Total Revenue</strong></td>' in html
+    assert '<li>Osaka leads with <code>¥5.2M</code></li>' in html
+    assert '**' not in html
+
+
+# Test 3: Trees are cached by content hash in memory and on disk
+def test_document_cache(tmp_path, monkeypatch):
+    """
+    Verify an unchanged file is parsed once and an edited file is re-parsed.
+    """
+    md_path = tmp_path / 'report.md'
+    cache_dir = tmp_path / 'cache'
+    md_path.write_text(SAMPLE_MARKDOWN, encoding='utf-8')
+
+    calls = []
+    original_parse = markdown_document.parse_markdown
+    monkeypatch.setattr(markdown_document, 'parse_markdown',
+                        lambda text: calls.append(1) or original_parse(text))
+
+    clear_document_cache()
+    first = load_document(md_path, cache_dir=cache_dir)
+    assert load_document(md_path, cache_dir=cache_dir) is first
+    assert len(calls) == 1
+
+    # A new process (empty memory cache) reads the JSON tree instead of parsing
+    clear_document_cache()
+    from_disk = load_document(md_path, cache_dir=cache_dir)
+    assert from_disk == first
+    assert len(calls) == 1
+    assert json.loads((cache_dir / f"{first['sha256']}.json").read_text(encoding='utf-8')) == first
+
+    # Edited content: new hash, parsed again
+    md_path.write_text(SAMPLE_MARKDOWN + '\nNew closing line.\n', encoding='utf-8')
+    edited = load_document(md_path, cache_dir=cache_dir)
+    assert edited['sha256'] != first['sha256']
+    assert len(calls) == 2
+    assert edited['blocks'][-1] == {'type': 'paragraph', 'lines': [[['New closing line.', 'text']]]}
+
+
+# Test 4: The Word renderer formats runs instead of printing Markdown markers
+def test_word_renders_document_tree(tmp_path):
+    """
+    Verify the analysis report converts to .docx without literal ** markers.
+    """
+    docx = pytest.importorskip('docx')
+    from reporting.md_to_word import convert_markdown_to_docx
+
+    output_path = tmp_path / 'report.docx'
+    convert_markdown_to_docx(REPORT_MARKDOWN, output_path, REPORT_MARKDOWN.parent, cache_dir=None)
+
+    document = docx.Document(str(output_path))
+    texts = [p.text for p in document.paragraphs]
+    texts += [cell.text for table in document.tables for row in table.rows for cell in row.cells]
+    assert not any('**' in text for text in texts)
+    assert any(run.bold and run.text == 'Total Revenue'
+               for table in document.tables for row in table.rows
+               for cell in row.cells for run in cell.paragraphs[0].runs)
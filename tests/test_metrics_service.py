@@ -0,0 +1,180 @@
+"""
+Metrics Query Service Tests
+
+Pytest tests verifying that the HTTP metrics service returns the same
+numbers as analysis.metrics, applies date and store filters, caches
+responses per dataset version and coalesces concurrent identical requests.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import json
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from analysis.metrics import calculate_all_metrics
+from metrics_service import MetricsService, create_server
+
+
+# Fixtures
+@pytest.fixture
+def processed_dir(tmp_path):
+    """A copy of the processed dataset the tests may modify."""
+    target = tmp_path / 'processed'
+    target.mkdir()
+    for name in ('sales_clean.csv', 'stores.csv'):
+        shutil.copy(PROCESSED_DIR / name, target / name)
+    return target
+
+
+@pytest.fixture
+def base_url(processed_dir):
+    """A metrics service on a free local port."""
+    server = create_server(port=0, processed_dir=processed_dir)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://{}:{}'.format(*server.server_address[:2])
+    server.shutdown()
+    server.server_close()
+
+
+def get(url):
+    """GET a URL, returning (status, decoded JSON, X-Cache header)."""
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            return response.status, json.loads(response.read()), response.headers['X-Cache']
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read()), e.headers['X-Cache']
+
+
+# Test 1: Endpoints return the analysis.metrics results
+def test_endpoints_match_metrics(base_url):
+    """
+    Verify store revenue and KPIs, caching headers and error responses.
+    """
+    sales_df = pd.read_csv(PROCESSED_DIR / 'sales_clean.csv', parse_dates=['date'])
+    stores_df = pd.read_csv(PROCESSED_DIR / 'stores.csv')
+    expected = calculate_all_metrics(sales_df, stores_df)
+
+    status, body, cache = get(f'{base_url}/metrics/stores')
+    assert (status, cache) == (200, 'miss')
+    stores = pd.DataFrame(body['data'])
+    assert stores['store_id'].tolist() == expected['revenue_by_store']['store_id'].tolist()
+    assert stores['total_revenue'].tolist() == expected['revenue_by_store']['total_revenue'].tolist()
+
+    status, body, cache = get(f'{base_url}/metrics/stores')
+    assert (status, cache) == (200, 'hit')
+
+    # Other endpoints reuse the computed metrics
+    status, body, _ = get(f'{base_url}/metrics/kpis')
+    assert body['data']['total_transactions'] == expected['key_metrics']['total_transactions']
+
+    assert get(f'{base_url}/metrics/unknown')[0] == 404
+    assert get(f'{base_url}/metrics/kpis?start=January')[0] == 400
+    assert get(f'{base_url}/metrics/kpis?start=2030-01-01')[0] == 404
+    assert get(f'{base_url}/health')[1]['stats']['computations'] == 1
+
+
+# Test 2: Date and store filters select the matching sales
+def test_filters(base_url):
+    """
+    Verify a filtered query totals the filtered sales, including weekday-only ranges.
+    """
+    sales_df = pd.read_csv(PROCESSED_DIR / 'sales_clean.csv', parse_dates=['date'])
+    selected = sales_df[(sales_df['date'] >= '2024-01-08') & (sales_df['date'] <= '2024-01-14')
+                        & sales_df['store_id'].isin(['S01', 'S10'])]
+
+    status, body, _ = get(f'{base_url}/metrics/kpis?start=2024-01-08&end=2024-01-14&stores=S10,S01')
+    assert status == 200
+    assert body['filters'] == {'start': '2024-01-08', 'end': '2024-01-14', 'stores': ['S01', 'S10']}
+    assert body['data']['total_revenue'] == pytest.approx(selected['sales_amount'].sum())
+
+    # 2024-01-01 to 01-05 is Monday to Friday: no weekend, so no lift
+    status, body, _ = get(f'{base_url}/metrics/weekend?start=2024-01-01&end=2024-01-05')
+    assert status == 200
+    assert body['data']['weekend_lift_pct'] is None
+    assert [row['period'] for row in body['data']['comparison']] == ['Weekday']
+
+
+# Test 3: Concurrent identical requests are computed once
+def test_coalescing(processed_dir, monkeypatch):
+    """
+    Verify one computation serves all concurrent callers of the same query.
+    """
+    service = MetricsService(processed_dir)
+    compute = service.compute_results
+
+    def slow_compute(filters):
+        time.sleep(0.3)
+        return compute(filters)
+
+    monkeypatch.setattr(service, 'compute_results', slow_compute)
+    barrier = threading.Barrier(8)
+    outcomes = []
+
+    def request():
+        barrier.wait()
+        outcomes.append(service.query('/metrics/regions', {'stores': 'S01,S02'}))
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert service.stats['computations'] == 1
+    assert sorted(outcome for _, outcome in outcomes) == ['coalesced'] * 7 + ['miss']
+    assert len({body for body, _ in outcomes}) == 1
+
+
+# Test 4: A new dataset version invalidates cached responses
+def test_dataset_version(processed_dir):
+    """
+    Verify responses are recomputed after the processed files change.
+    """
+    service = MetricsService(processed_dir)
+    body, outcome = service.query('/metrics/kpis', {})
+    assert outcome == 'miss'
+    assert service.query('/metrics/kpis', {})[1] == 'hit'
+
+    # Rebuilt dataset: one store's sales only
+    sales_df = pd.read_csv(processed_dir / 'sales_clean.csv')
+    sales_df[sales_df['store_id'] == 'S03'].to_csv(processed_dir / 'sales_clean.csv', index=False)
+
+    new_body, outcome = service.query('/metrics/kpis', {})
+    assert outcome == 'miss'
+    assert json.loads(new_body)['dataset_version'] != json.loads(body)['dataset_version']
+    assert json.loads(new_body)['data']['num_stores'] == 1
+
+
+# Test 5: Date-range revenue from the revenue cube
+def test_range_endpoint(base_url):
+    """
+    Verify /metrics/revenue totals the selected range without a full metrics computation.
+    """
+    sales_df = pd.read_csv(PROCESSED_DIR / 'sales_clean.csv', parse_dates=['date'])
+    selected = sales_df[(sales_df['date'] >= '2024-01-08') & (sales_df['date'] <= '2024-01-14')]
+
+    status, body, _ = get(f'{base_url}/metrics/revenue?start=2024-01-08&end=2024-01-14&by=category')
+    assert status == 200
+    categories = pd.DataFrame(body['data']).set_index('product_category')
+    expected = selected.groupby('product_category')['sales_amount'].sum()
+    assert categories['total_revenue'].to_dict() == pytest.approx(expected.to_dict())
+
+    assert get(f'{base_url}/metrics/revenue?by=region')[0] == 400
+    assert get(f'{base_url}/health')[1]['stats']['computations'] == 0
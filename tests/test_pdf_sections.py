@@ -0,0 +1,120 @@
+"""
+Sectioned PDF Rendering Tests
+
+Pytest tests verifying that the detailed report is split into sections,
+numbered continuously across sections and merged into one PDF.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import io
+import sys
+import pytest
+from pathlib import Path
+from pypdf import PdfReader
+from reportlab.pdfgen import canvas
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+CSS_TEMPLATE = PROJECT_ROOT / 'src' / 'reporting' / 'templates' / 'detailed_report.css'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from reporting.markdown_document import parse_markdown, load_document
+from reporting.pdf_sections import (
+    split_sections, plan_page_numbers, page_number_css, read_page_header,
+    merge_pdfs, render_sections
+)
+
+# WeasyPrint needs the system Pango libraries
+try:
+    import weasyprint
+except (ImportError, OSError):
+    weasyprint = None
+
+
+def make_pdf(labels):
+    """A PDF with one page per label."""
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for label in labels:
+        pdf.drawString(72, 720, label)
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+# Test 1: Sections start at level-2 headings; the title keeps its subtitle
+def test_split_sections():
+    """
+    Verify section boundaries on a small document and the real report.
+    """
+    document = {'blocks': parse_markdown(
+        '# Report\n## Subtitle\n\nIntro text.\n\n## Summary\n\n- one\n\n'
+        '### Detail\n\nMore.\n\n## Conclusion\n\nDone.\n'
+    )}
+    sections = split_sections(document)
+
+    assert [len(blocks) for blocks in sections] == [3, 4, 2]
+    assert sections[0][1]['type'] == 'heading' and sections[0][1]['level'] == 2
+    assert sections[2][0]['runs'] == [['Conclusion', 'text']]
+
+    # Nothing lost or reordered on the real report
+    report = load_document(PROJECT_ROOT / 'reports' / 'analysis_report.md', cache_dir=None)
+    report_sections = split_sections(report)
+    assert len(report_sections) > 5
+    assert [block for blocks in report_sections for block in blocks] == report['blocks']
+
+
+# Test 2: Page numbers continue across sections
+def test_page_numbering():
+    """
+    Verify numbering plans and the generated @page rules.
+    """
+    assert plan_page_numbers([2, 3, 1]) == [(1, 6, 2), (3, 6, 3), (6, 6, 1)]
+
+    css = page_number_css(3, 6, 3, header='"Header"')
+    assert '@page :nth(1) { @bottom-center { content: "Page 3 of 6"; } }' in css
+    assert '"Page 5 of 6"' in css and ':nth(4)' not in css
+    assert '@page :first { @top-right { content: "Header"; } }' in css
+    assert ':first' not in page_number_css(1, 6, 2)
+
+    assert read_page_header(CSS_TEMPLATE) == '"Multi-Store Sales Analysis | January 2024"'
+
+
+# Test 3: Rendered sections are concatenated in order
+def test_merge_pdfs(tmp_path):
+    """
+    Verify page count and order of the merged PDF.
+    """
+    parts = [make_pdf(['one', 'two']), make_pdf(['three']), make_pdf(['four', 'five'])]
+    output = tmp_path / 'merged.pdf'
+
+    assert merge_pdfs(parts, output) == 5
+    reader = PdfReader(output)
+    assert [page.extract_text().strip() for page in reader.pages] == ['one', 'two', 'three', 'four', 'five']
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+# Test 4: Parallel rendering produces one continuously numbered PDF
+@pytest.mark.skipif(weasyprint is None, reason='WeasyPrint is not available')
+def test_render_sections(tmp_path):
+    """
+    Verify the merged page footers and that cached page counts avoid a re-render.
+    """
+    long_text = '<p>' + 'Text. ' * 800 + '</p>'
+    html_documents = [f'<html><body><h2>Section {n}</h2>{long_text}</body></html>' for n in range(3)]
+    output = tmp_path / 'report.pdf'
+    cache_path = tmp_path / 'pages.json'
+
+    first = render_sections(html_documents, output, CSS_TEMPLATE, tmp_path,
+                            max_workers=2, cache_path=cache_path)
+    pages = PdfReader(output).pages
+    assert len(pages) == first['pages'] > 3
+    assert f"Page {len(pages)} of {len(pages)}" in pages[-1].extract_text()
+
+    second = render_sections(html_documents, output, CSS_TEMPLATE, tmp_path,
+                             max_workers=2, cache_path=cache_path)
+    assert second['passes'] == 1 and second['rendered'] == 3
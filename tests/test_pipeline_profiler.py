@@ -0,0 +1,113 @@
+"""
+Pipeline Profiler Tests
+
+Pytest tests verifying that the stage profiler records every loader, cleaner
+and validator call without changing pipeline results.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import sys
+import json
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+RAW_DIR = PROJECT_ROOT / 'data' / 'raw'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from data_pipeline.loader import load_all_store_files, combine_raw_data
+from data_pipeline.cleaner import clean_raw_data, create_store_metadata, get_cleaning_steps
+from data_pipeline.validator import validate_all
+from data_pipeline.profiler import StageProfiler, get_active_profiler
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def profiled_run():
+    """Run load/clean/validate on data/raw under an active profiler."""
+    with StageProfiler() as profiler:
+        raw_combined = combine_raw_data(load_all_store_files(str(RAW_DIR)))
+        sales_clean = clean_raw_data(raw_combined)
+        validate_all(sales_clean, create_store_metadata())
+    return profiler, raw_combined, sales_clean
+
+
+def records_named(profiler, name):
+    """Return records whose stage name starts with name."""
+    return [r for r in profiler.records if r['stage'].split('(')[0] == name]
+
+
+# Test 1: Every pipeline stage is recorded with rows in/out
+def test_stages_recorded(profiled_run):
+    """
+    Verify one record per file and per cleaning step, with row counts.
+    """
+    profiler, raw_combined, sales_clean = profiled_run
+
+    assert len(records_named(profiler, 'load_single_file')) == 10
+
+    clean_record, = records_named(profiler, 'clean_raw_data')
+    assert clean_record['rows_in'] == len(raw_combined)
+    assert clean_record['rows_out'] == len(sales_clean)
+
+    step_records = [r for r in profiler.records
+                    if r['depth'] == clean_record['depth'] + 1
+                    and r['stage'] in dict(get_cleaning_steps())]
+    assert [r['stage'] for r in step_records] == [name for name, _ in get_cleaning_steps()]
+
+    assert len(records_named(profiler, 'validate_all')) == 1
+    assert len(records_named(profiler, 'validate_referential_integrity')) == 1
+
+
+# Test 2: Timings and memory peaks are consistent with nesting
+def test_nested_measurements(profiled_run):
+    """
+    Verify timings are non-negative and parents contain their children.
+    """
+    profiler, _, _ = profiled_run
+
+    for record in profiler.records:
+        assert record['wall_seconds'] >= 0
+        assert record['cpu_seconds'] >= 0
+        assert record['peak_mb'] >= 0
+
+    load_record, = records_named(profiler, 'load_all_store_files')
+    file_records = records_named(profiler, 'load_single_file')
+    assert all(r['depth'] == load_record['depth'] + 1 for r in file_records)
+    assert load_record['wall_seconds'] >= sum(r['wall_seconds'] for r in file_records)
+    assert load_record['peak_mb'] >= max(r['peak_mb'] for r in file_records)
+
+
+# Test 3: Profiling is off outside the context manager and does not change results
+def test_inactive_profiler_passthrough(profiled_run):
+    """
+    Verify no profiler is active afterwards and unprofiled output matches.
+    """
+    _, raw_combined, sales_clean = profiled_run
+
+    assert get_active_profiler() is None
+    pd.testing.assert_frame_equal(clean_raw_data(raw_combined), sales_clean)
+
+
+# Test 4: The run report is written as JSON and a text table
+def test_write_report(profiled_run, tmp_path):
+    """
+    Verify the JSON report round-trips and the table lists every stage.
+    """
+    profiler, _, _ = profiled_run
+
+    json_path, text_path = profiler.write_report(tmp_path)
+
+    report = json.loads(json_path.read_text(encoding='utf-8'))
+    assert report['stages'] == profiler.records
+    assert report['total_seconds'] > 0
+
+    table = text_path.read_text(encoding='utf-8')
+    assert 'clean_sales_amount' in table
+    assert len(table.splitlines()) == len(profiler.records) + 4
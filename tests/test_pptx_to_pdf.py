@@ -0,0 +1,136 @@
+"""
+PowerPoint to PDF Renderer Tests
+
+Pytest tests verifying that slides are drawn onto PDF pages (text, shapes
+and images), that images are decoded once and that parallel rendering
+keeps the slide order.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import pytest
+from pathlib import Path
+from pypdf import PdfReader
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.util import Inches, Pt
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+CHART = PROJECT_ROOT / 'reports' / 'assets' / 'revenue_by_store.png'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from reporting import pptx_to_pdf
+from reporting.pptx_to_pdf import (
+    convert_pptx_to_pdf_using_images, load_presentation, wrap_fragments
+)
+
+
+# Fixtures
+@pytest.fixture
+def presentation(tmp_path):
+    """A 16:9 deck: filled shape + text, bullets, and one chart on two slides."""
+    prs = Presentation()
+    prs.slide_width, prs.slide_height = Inches(10), Inches(5.625)
+
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    shape = slide.shapes.add_shape(1, 0, 0, prs.slide_width, prs.slide_height)
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = RGBColor(52, 152, 219)
+    box = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(1))
+    box.text_frame.text = 'Opening Slide'
+    box.text_frame.paragraphs[0].runs[0].font.size = Pt(40)
+
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = 'Key Findings'
+    slide.placeholders[1].text_frame.text = 'First finding'
+    slide.placeholders[1].text_frame.add_paragraph().text = 'Second finding'
+
+    for title in ('Chart One', 'Chart Two'):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8)).text_frame.text = title
+        slide.shapes.add_picture(str(CHART), Inches(1), Inches(1.3), width=Inches(4))
+
+    path = tmp_path / 'deck.pptx'
+    prs.save(path)
+    return path
+
+
+# Test 1: Text is wrapped by word to the available width
+def test_wrap_fragments():
+    """
+    Verify greedy line breaking across styled runs.
+    """
+    regular = {'font': 'Helvetica', 'size': 10, 'color': '#000000'}
+    bold = {'font': 'Helvetica-Bold', 'size': 10, 'color': '#000000'}
+
+    lines = wrap_fragments([('one two ', regular), ('three four', bold)], 60)
+    assert lines == [[('one two', regular)], [('three four', bold)]]
+
+    lines = wrap_fragments([('alpha beta gamma delta', regular)], 50)
+    assert [line[0][0] for line in lines] == ['alpha beta', 'gamma', 'delta']
+    assert wrap_fragments([('one two three four', regular)], None) == [[('one two three four', regular)]]
+
+
+# Test 2: Every slide becomes a page with its text and images
+def test_convert_slides(presentation, tmp_path):
+    """
+    Verify page count, slide-sized pages, slide order, text and images.
+    """
+    output = tmp_path / 'deck.pdf'
+    assert convert_pptx_to_pdf_using_images(presentation, output, max_workers=2)
+
+    pages = PdfReader(output).pages
+    assert len(pages) == 4
+    assert [float(pages[0].mediabox.width), float(pages[0].mediabox.height)] == [720, 405]
+
+    texts = [page.extract_text() for page in pages]
+    assert 'Opening Slide' in texts[0]
+    assert 'Key Findings' in texts[1] and 'Second finding' in texts[1]
+    assert 'Chart One' in texts[2] and 'Chart Two' in texts[3]
+    assert all(len(page.images) == 1 for page in pages[2:])
+
+
+# Test 3: Images are decoded once per image part, in this process or workers
+def test_images_decoded_once(presentation, tmp_path):
+    """
+    Verify the shared chart is decoded once and serial and parallel output match.
+    """
+    prs = load_presentation(presentation)
+    assert len(prs.slides) == 4
+    assert len(pptx_to_pdf._IMAGE_CACHE) == 1
+
+    serial, parallel = tmp_path / 'serial.pdf', tmp_path / 'parallel.pdf'
+    assert convert_pptx_to_pdf_using_images(presentation, serial, max_workers=1)
+    assert convert_pptx_to_pdf_using_images(presentation, parallel, max_workers=3)
+    assert [page.extract_text() for page in PdfReader(serial).pages] == \
+        [page.extract_text() for page in PdfReader(parallel).pages]
+
+
+# Test 4: A deck regenerated at the same path is converted again
+def test_regenerated_deck_not_stale(tmp_path):
+    """
+    Verify a second conversion in the same process renders the re-saved deck.
+    """
+    path, output = tmp_path / 'deck.pptx', tmp_path / 'deck.pdf'
+
+    def save_deck(titles):
+        prs = Presentation()
+        for title in titles:
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_textbox(Inches(1), Inches(1), Inches(8), Inches(1)).text_frame.text = title
+        prs.save(path)
+
+    save_deck(['FIRST 0'])
+    assert convert_pptx_to_pdf_using_images(path, output, max_workers=1)
+    assert 'FIRST 0' in PdfReader(output).pages[0].extract_text()
+
+    save_deck(['SECOND 0', 'SECOND 1'])
+    assert convert_pptx_to_pdf_using_images(path, output, max_workers=1)
+    texts = [page.extract_text() for page in PdfReader(output).pages]
+    assert len(texts) == 2
+    assert 'SECOND 0' in texts[0] and 'SECOND 1' in texts[1]
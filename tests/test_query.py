@@ -0,0 +1,140 @@
+"""
+Query Builder Tests
+
+Pytest tests verifying that SalesQuery is lazy, that it pushes date, store,
+category and region predicates down to the zone-mapped sales file and reads
+only the referenced columns, and that the same query gives the same result
+on a file and on an in-memory DataFrame.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import warnings
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from analysis.query import SalesQuery, share_pct
+from data_pipeline.zone_maps import query_plans, reset_query_plans, write_sales_with_zone_maps
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def sales_df():
+    """The processed sales transactions."""
+    return pd.read_csv(PROCESSED_DIR / 'sales_clean.csv', parse_dates=['date'])
+
+
+@pytest.fixture(scope='module')
+def stores_df():
+    """Store metadata."""
+    return pd.read_csv(PROCESSED_DIR / 'stores.csv')
+
+
+@pytest.fixture
+def sales_path(sales_df, tmp_path):
+    """The sales written with small row groups (several per store)."""
+    path = tmp_path / 'sales_clean.csv'
+    write_sales_with_zone_maps(sales_df, path, row_group_rows=40)
+    reset_query_plans()
+    return path
+
+
+def kanto_top_stores(source, stores_df):
+    """Top 3 Kanto stores by revenue in one week."""
+    return (
+        SalesQuery(source)
+        .join(stores_df, on='store_id')
+        .filter(start='2024-01-08', end='2024-01-14', region='Kanto')
+        .group_by('store_id', 'store_name_en')
+        .agg(total_revenue=('sales_amount', 'sum'), num_transactions=('sales_amount', 'count'))
+        .derive(revenue_share_pct=share_pct('total_revenue'))
+        .sort('total_revenue', descending=True)
+        .head(3)
+    )
+
+
+# Test 1: Nothing runs before collect
+def test_query_is_lazy(sales_path, stores_df):
+    """
+    Verify building a query reads nothing and every step returns a new query.
+    """
+    base = SalesQuery(sales_path).join(stores_df)
+    query = base.filter(region='Kanto').filter(store_id=['S01', 'S05']).group_by('store_id')
+    assert query_plans() == []
+    assert base._plan['filters'] == {} and base._plan['keys'] is None
+
+    # Region and store filters intersect into one pushed-down store predicate
+    assert "'stores': ['S01']" in query.explain()
+    assert query.agg(rows=('sales_amount', 'size')).collect()['store_id'].tolist() == ['S01']
+    assert len(query_plans()) == 1
+
+
+# Test 2: Predicate pushdown and column pruning
+def test_pushdown_and_pruning(sales_df, sales_path, stores_df):
+    """
+    Verify a region/week query skips row groups, parses three columns and is exact.
+    """
+    result = kanto_top_stores(sales_path, stores_df).collect()
+
+    plan = query_plans()[-1]
+    assert plan['filters']['stores'] == ['S01', 'S02', 'S03', 'S04']
+    assert sorted(plan['columns']) == ['date', 'sales_amount', 'store_id']
+    assert plan['skipped'] > 0 and plan['rows_read'] < len(sales_df)
+
+    kanto = stores_df.loc[stores_df['region'] == 'Kanto', 'store_id']
+    week = sales_df[sales_df['store_id'].isin(kanto) & sales_df['date'].between('2024-01-08', '2024-01-14')]
+    expected = week.groupby('store_id')['sales_amount'].sum().sort_values(ascending=False).head(3)
+    assert result['store_id'].tolist() == expected.index.tolist()
+    assert result['total_revenue'].tolist() == pytest.approx(expected.tolist())
+    assert result['revenue_share_pct'].sum() < 100
+
+
+# Test 3: Same results on a file and a DataFrame
+@pytest.mark.parametrize('build', [
+    lambda source, stores_df: kanto_top_stores(source, stores_df),
+    lambda source, stores_df: SalesQuery(source).filter(product_category='Kids', store_id='S07')
+                                               .select('transaction_id', 'date', 'sales_amount'),
+    lambda source, stores_df: SalesQuery(source).filter(start='2024-01-25')
+                                               .agg(revenue=('sales_amount', 'sum'), rows=('date', 'size')),
+    lambda source, stores_df: SalesQuery(source).filter(start='2024-01-08 06:00', end='2024-01-14 12:00')
+                                               .group_by('store_id').agg(rows=('date', 'size')),
+])
+def test_file_and_frame_sources_agree(sales_df, sales_path, stores_df, build):
+    """
+    Verify a query collected from the zone-mapped file equals the in-memory result.
+    """
+    from_file = build(sales_path, stores_df).collect().reset_index(drop=True)
+    from_frame = build(sales_df, stores_df).collect().reset_index(drop=True)
+    pd.testing.assert_frame_equal(from_file, from_frame, check_dtype=False)
+    assert query_plans()[-1]['skipped'] > 0
+
+
+# Test 4: Row-level derive leaves the source frame untouched
+@pytest.mark.parametrize('filters', [{}, {'store_id': 'S01'}])
+def test_row_level_derive(sales_df, filters):
+    """
+    Verify derive() without aggregation returns new columns and never modifies the source.
+    """
+    columns = list(sales_df.columns)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = (SalesQuery(sales_df).filter(**filters)
+                  .derive(amount_k=lambda frame: frame['sales_amount'] / 1000,
+                          large=lambda frame: frame['amount_k'] > 10)
+                  .collect())
+
+    assert list(sales_df.columns) == columns
+    expected = sales_df[sales_df['store_id'] == 'S01'] if filters else sales_df
+    assert len(result) == len(expected)
+    assert result['amount_k'].tolist() == (expected['sales_amount'] / 1000).tolist()
+    assert result['large'].tolist() == (expected['sales_amount'] > 10000).tolist()
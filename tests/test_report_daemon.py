@@ -0,0 +1,99 @@
+"""
+Warm Report Daemon Tests
+
+Pytest tests verifying that the daemon runs cli.py commands sent over its
+Unix socket, returns their output and exit status, and keeps processed
+datasets loaded until their files change.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import sys
+import threading
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from data_pipeline.artifacts import read_csv_cached
+from report_daemon import ReportDaemon, is_running, send_request
+from cli import main
+
+
+# Fixtures
+@pytest.fixture
+def daemon(tmp_path):
+    """A daemon (without warm-up) serving on a temporary socket in a thread."""
+    server = ReportDaemon(tmp_path / 'daemon.sock', warm=False)
+
+    def serve():
+        server.serve_forever()
+        server.server_close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+
+
+# Test 1: Parsed CSVs are reused until the file changes
+def test_read_csv_cached(tmp_path):
+    """
+    Verify cache hits, separate entries per read options and reload on change.
+    """
+    path = tmp_path / 'stores.csv'
+    pd.DataFrame({'store_id': ['S01', 'S02']}).to_csv(path, index=False)
+
+    first = read_csv_cached(path)
+    assert read_csv_cached(path) is first
+    assert read_csv_cached(path, dtype=str) is not first
+
+    pd.DataFrame({'store_id': ['S01', 'S02', 'S03']}).to_csv(path, index=False)
+    assert len(read_csv_cached(path)) == 3
+
+
+# Test 2: Commands run in the daemon with their output and exit status
+def test_commands(daemon, tmp_path):
+    """
+    Verify a command's output and status are returned, and bad requests rejected.
+    """
+    socket_path = daemon.socket_path
+    assert socket_path.stat().st_mode & 0o777 == 0o600
+    response = send_request({'command': 'validate', 'argv': [], 'cwd': str(tmp_path)}, socket_path)
+    assert response['status'] == 0
+    assert '8 of 8 checks passed' in response['output']
+
+    # Relative paths resolve from the client's directory
+    response = send_request({'command': 'validate', 'argv': ['--processed-dir', 'missing'],
+                             'cwd': str(tmp_path)}, socket_path)
+    assert response['status'] == 1
+    assert str(tmp_path / 'missing') in response['output']
+
+    response = send_request({'command': 'docx', 'argv': ['--bogus']}, socket_path)
+    assert response['status'] == 2 and 'unrecognized arguments' in response['output']
+    assert send_request({'command': 'daemon', 'argv': ['stop']}, socket_path)['status'] == 2
+
+    assert send_request({'control': 'ping'}, socket_path)['requests_served'] == 3
+
+
+# Test 3: The command line talks to the daemon and can stop it
+def test_cli_client(daemon, capsys):
+    """
+    Verify --daemon forwards the command and 'daemon stop' shuts the daemon down.
+    """
+    socket_path = str(daemon.socket_path)
+    assert main(['--socket', socket_path, '--daemon', 'validate']) == 0
+    assert '8 of 8 checks passed' in capsys.readouterr().out
+
+    assert main(['--socket', socket_path, 'daemon', 'stop']) == 0
+    daemon.shutdown()  # returns once the daemon has stopped serving
+    assert not is_running(socket_path)
+    assert main(['--socket', socket_path, '--daemon', 'validate']) == 1
@@ -0,0 +1,112 @@
+"""
+Report Pack Tests
+
+Pytest tests verifying that per-store and per-region report packs are built
+from the same numbers as analysis.metrics on the filtered sales data, and
+that a batch run writes every pack.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from analysis import metrics
+from analysis.chunked_metrics import finalize_metrics
+from reporting.report_packs import compute_store_partials, build_pack_specs, generate_report_packs
+from data_pipeline.store_offsets import load_offsets_for
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def sales_df():
+    """Load sales_clean.csv for testing."""
+    return pd.read_csv(PROCESSED_DIR / 'sales_clean.csv', parse_dates=['date'])
+
+
+@pytest.fixture(scope='module')
+def stores_df():
+    """Load stores.csv for testing."""
+    return pd.read_csv(PROCESSED_DIR / 'stores.csv')
+
+
+@pytest.fixture(scope='module', params=['scan', 'offsets'])
+def store_partials(request, sales_df):
+    """Per-store partial aggregates from one shared scan, or from store row slices."""
+    offsets = load_offsets_for(PROCESSED_DIR / 'sales_clean.csv') if request.param == 'offsets' else None
+    return compute_store_partials(sales_df, offsets)
+
+
+def assert_pack_matches(results, subset, stores_df):
+    """Compare a pack's finalized metrics with analysis.metrics on its rows."""
+    assert results['key_metrics'] == metrics.calculate_key_metrics(subset)
+    pd.testing.assert_frame_equal(results['revenue_by_store'],
+                                  metrics.calculate_revenue_by_store(subset, stores_df))
+    pd.testing.assert_frame_equal(results['revenue_by_category'],
+                                  metrics.calculate_revenue_by_category(subset))
+    pd.testing.assert_frame_equal(results['daily_revenue'],
+                                  metrics.calculate_daily_revenue(subset))
+    pd.testing.assert_frame_equal(results['day_of_week_metrics'],
+                                  metrics.calculate_day_of_week_metrics(subset))
+
+
+# Test 1: Every store pack matches the metrics of that store's rows
+def test_store_packs_match_metrics(store_partials, sales_df, stores_df):
+    """
+    Verify the split shared scan equals a separate calculation per store.
+    """
+    specs = build_pack_specs(store_partials, stores_df, by='store')
+    assert [spec['pack_id'] for spec in specs] == stores_df['store_id'].tolist()
+
+    for spec in specs:
+        subset = sales_df[sales_df['store_id'] == spec['pack_id']].reset_index(drop=True)
+        assert_pack_matches(finalize_metrics(spec['partial'], stores_df), subset, stores_df)
+
+
+# Test 2: Region packs merge their stores' aggregates
+def test_region_packs_match_metrics(store_partials, sales_df, stores_df):
+    """
+    Verify merged store aggregates equal a calculation on the region's rows.
+    """
+    specs = build_pack_specs(store_partials, stores_df, by='region')
+    assert sorted(spec['pack_id'] for spec in specs) == sorted(stores_df['region'].unique())
+
+    for spec in specs:
+        subset = sales_df[sales_df['store_id'].isin(spec['store_ids'])].reset_index(drop=True)
+        assert_pack_matches(finalize_metrics(spec['partial'], stores_df), subset, stores_df)
+
+    with pytest.raises(ValueError):
+        build_pack_specs(store_partials, stores_df, by='region', packs=['Atlantis'])
+
+
+# Test 3: A parallel batch writes every pack and reports progress
+def test_generate_report_packs(sales_df, stores_df, tmp_path):
+    """
+    Verify each pack folder has its charts, Markdown and Word report.
+    """
+    pack_ids = stores_df['store_id'].tolist()[:3]
+    progress = []
+
+    summaries = generate_report_packs(
+        sales_df, stores_df, tmp_path, by='store', packs=pack_ids, max_workers=2,
+        profile='draft', progress=lambda done, total, summary, elapsed: progress.append((done, total))
+    )
+
+    assert [summary['pack_id'] for summary in summaries] == pack_ids
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    for summary in summaries:
+        pack_dir = Path(summary['output_dir'])
+        assert (pack_dir / 'report.md').exists()
+        assert (pack_dir / 'report.docx').stat().st_size > 0
+        assert len(list((pack_dir / 'assets').glob('*.png'))) == 4
+        assert all(Path(path).exists() for path in summary['files'])
@@ -0,0 +1,110 @@
+"""
+Revenue Cube Tests
+
+Pytest tests verifying that the revenue prefix-sum cube answers date-range
+totals exactly like filtering the transactions, and that
+calculate_range_revenue returns the same results with and without a cube.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from analysis.metrics import calculate_range_revenue
+from data_pipeline.revenue_cube import (
+    build_revenue_cube, cube_matches, load_revenue_cube, range_totals, save_revenue_cube
+)
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def sales_df():
+    """The processed sales transactions."""
+    return pd.read_csv(PROCESSED_DIR / 'sales_clean.csv', parse_dates=['date'])
+
+
+@pytest.fixture(scope='module')
+def cube(sales_df):
+    """Revenue cube of the processed sales."""
+    return build_revenue_cube(sales_df)
+
+
+# Test 1: Range totals equal filtered sums
+def test_range_totals(sales_df, cube):
+    """
+    Verify cube totals per store and category for random ranges, open and out-of-range bounds.
+    """
+    rng = np.random.default_rng(0)
+    days = pd.date_range('2023-12-30', '2024-02-02')
+    ranges = [(None, None), ('2024-01-08', None), (None, '2024-01-14')]
+    ranges += [tuple(sorted(rng.choice(days, 2))) for _ in range(20)]
+
+    for start, end in ranges:
+        revenue, count = range_totals(cube, start, end)
+        selected = sales_df
+        if start is not None:
+            selected = selected[selected['date'] >= start]
+        if end is not None:
+            selected = selected[selected['date'] <= end]
+        expected = selected.groupby(['store_id', 'product_category'])['sales_amount'].agg(['sum', 'count'])
+        expected = expected.reindex(pd.MultiIndex.from_product([cube['stores'], cube['categories']]),
+                                    fill_value=0)
+
+        assert count.ravel().tolist() == expected['count'].tolist()
+        np.testing.assert_allclose(revenue.ravel(), expected['sum'], rtol=1e-9, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        range_totals(cube, '2024-01-08 12:00')
+
+
+# Test 2: calculate_range_revenue with and without the cube
+def test_range_revenue_uses_cube(sales_df, cube, monkeypatch):
+    """
+    Verify cube and transaction paths agree, and partial-day ranges skip the cube.
+    """
+    for kwargs in [{}, {'start': '2024-01-08', 'end': '2024-01-14'},
+                   {'start': '2024-01-20', 'by': 'product_category', 'stores': ['S01', 'S03']}]:
+        pd.testing.assert_frame_equal(calculate_range_revenue(sales_df, cube=cube, **kwargs),
+                                      calculate_range_revenue(sales_df, **kwargs), check_dtype=False)
+
+    # A range with a time of day is aggregated from the transactions
+    import analysis.metrics
+    monkeypatch.setattr(analysis.metrics, 'range_totals', lambda *args: pytest.fail('cube used'))
+    partial = calculate_range_revenue(sales_df, start='2024-01-08 06:00', end='2024-01-14', cube=cube)
+    assert partial['num_transactions'].sum() == len(
+        sales_df[(sales_df['date'] >= '2024-01-09') & (sales_df['date'] <= '2024-01-14')])
+
+    # A cube of other sales is not used either, even with the same row count
+    calculate_range_revenue(sales_df.iloc[:100], start='2024-01-01', cube=cube)
+    doubled = sales_df.assign(sales_amount=sales_df['sales_amount'] * 2)
+    assert not cube_matches(cube, doubled)
+    assert not cube_matches(cube, sales_df.assign(date=sales_df['date'] + pd.Timedelta(days=1)))
+    assert calculate_range_revenue(doubled, cube=cube)['total_revenue'].sum() == doubled['sales_amount'].sum()
+
+
+# Test 3: Saved cube round trip
+def test_save_and_load(cube, tmp_path):
+    """
+    Verify a saved cube loads back with the same labels and sums.
+    """
+    path = tmp_path / 'revenue_cube.npz'
+    save_revenue_cube(cube, path)
+    loaded = load_revenue_cube(path)
+
+    assert sorted(loaded) == sorted(cube)
+    assert loaded['stores'].tolist() == cube['stores'].tolist()
+    assert loaded['start_date'] == cube['start_date']
+    np.testing.assert_array_equal(loaded['revenue'], cube['revenue'])
+    np.testing.assert_array_equal(loaded['count'], cube['count'])
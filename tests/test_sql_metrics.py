@@ -0,0 +1,120 @@
+"""
+SQLite Mirror Tests
+
+Pytest tests verifying that the SQLite mirror has the expected tables and
+indexes, that filtered queries use the indexes, and that the SQL metrics
+backend returns the same results as analysis.metrics.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import sqlite3
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from analysis.metrics import calculate_all_metrics
+from analysis.sql_metrics import build_where, calculate_all_metrics_sql, connect, read_sql
+from data_pipeline.sqlite_mirror import SQLITE_FILENAME, write_sqlite_mirror
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def datasets():
+    """The processed datasets as the pipeline passes them around."""
+    return {
+        'sales_clean': pd.read_csv(PROCESSED_DIR / 'sales_clean.csv', parse_dates=['date']),
+        'stores': pd.read_csv(PROCESSED_DIR / 'stores.csv'),
+        'products': pd.read_csv(PROCESSED_DIR / 'products.csv'),
+    }
+
+
+@pytest.fixture(scope='module')
+def db_path(datasets, tmp_path_factory):
+    """A SQLite mirror of the processed datasets."""
+    path = tmp_path_factory.mktemp('sqlite') / SQLITE_FILENAME
+    write_sqlite_mirror(datasets, path)
+    return path
+
+
+def assert_metrics_equal(actual, expected):
+    """Compare two calculate_all_metrics results table by table."""
+    for name, value in expected['key_metrics'].items():
+        assert actual['key_metrics'][name] == (pytest.approx(value) if isinstance(value, float) else value)
+    for name in ['revenue_by_store', 'revenue_by_region', 'revenue_by_category',
+                 'daily_revenue', 'day_of_week_metrics', 'category_mix_by_store']:
+        pd.testing.assert_frame_equal(actual[name].reset_index(drop=True),
+                                      expected[name].reset_index(drop=True), check_dtype=False)
+
+
+# Test 1: Tables, rollups and indexes
+def test_mirror_schema(db_path, datasets):
+    """
+    Verify row counts, rollup totals and the indexes of the mirror.
+    """
+    sales_df = datasets['sales_clean']
+    tables = read_sql(db_path, "SELECT name FROM sqlite_master WHERE type = 'table'")['name']
+    assert {'sales', 'stores', 'products', 'daily_store_category_sales',
+            'daily_store_sales'} <= set(tables)
+
+    indexes = set(read_sql(db_path, "SELECT name FROM sqlite_master WHERE type = 'index'")['name'])
+    assert {'idx_sales_store_date', 'idx_sales_category_date'} <= indexes
+
+    totals = read_sql(db_path, 'SELECT SUM(revenue) AS revenue, SUM(transactions) AS n '
+                               'FROM daily_store_sales').iloc[0]
+    assert totals['n'] == len(sales_df)
+    assert totals['revenue'] == pytest.approx(sales_df['sales_amount'].sum())
+
+    # Read-only connection
+    with pytest.raises(sqlite3.OperationalError):
+        connect(db_path).execute('DELETE FROM sales')
+
+
+# Test 2: Filtered queries use the composite indexes
+def test_filters_use_indexes(db_path):
+    """
+    Verify store and category filters search the (key, date) indexes.
+    """
+    conn = connect(db_path)
+    try:
+        for filters, index in [({'stores': ['S01'], 'start': '2024-01-08'}, 'idx_sales_store_date'),
+                               ({'categories': ['Footwear']}, 'idx_sales_category_date')]:
+            where, params = build_where(**filters)
+            plan = ' '.join(row[-1] for row in conn.execute(
+                f'EXPLAIN QUERY PLAN SELECT sales_amount FROM sales {where}', params))
+            assert f'USING INDEX {index}' in plan
+    finally:
+        conn.close()
+
+
+# Test 3: SQL metrics equal the pandas metrics
+def test_sql_metrics_match(db_path, datasets):
+    """
+    Verify unfiltered and filtered SQL metrics equal calculate_all_metrics.
+    """
+    sales_df, stores_df = datasets['sales_clean'], datasets['stores']
+    assert_metrics_equal(calculate_all_metrics_sql(db_path), calculate_all_metrics(sales_df, stores_df))
+
+    selected = sales_df[(sales_df['date'] >= '2024-01-08') & (sales_df['date'] <= '2024-01-14')
+                        & sales_df['store_id'].isin(['S01', 'S10'])]
+    assert_metrics_equal(
+        calculate_all_metrics_sql(db_path, start='2024-01-08', end='2024-01-14', stores=['S01', 'S10']),
+        calculate_all_metrics(selected, stores_df)
+    )
+
+    with pytest.raises(ValueError):
+        calculate_all_metrics_sql(db_path, start='2030-01-01')
+
+    # An empty store list selects no rows rather than all of them
+    assert build_where(stores=[]) == ('WHERE store_id IN ()', [])
+    with pytest.raises(ValueError):
+        calculate_all_metrics_sql(db_path, stores=[])
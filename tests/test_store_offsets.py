@@ -0,0 +1,121 @@
+"""
+Store Offset Index Tests
+
+Pytest tests verifying that the processed sales are clustered by
+(store_id, date), that the saved offset index describes their row ranges,
+and that offset-based store slices, store totals and store sharding give
+the same results as the scanning code paths.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from analysis.metrics import calculate_all_metrics, calculate_revenue_by_store, get_store_sales
+from analysis.parallel_metrics import calculate_metrics_parallel
+from data_pipeline.store_offsets import (
+    OFFSETS_FILENAME, build_store_offsets, contiguous_shards, is_store_clustered, load_store_offsets,
+    load_offsets_for, matches
+)
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def sales_df():
+    """The processed sales transactions."""
+    return pd.read_csv(PROCESSED_DIR / 'sales_clean.csv', parse_dates=['date'])
+
+
+@pytest.fixture(scope='module')
+def stores_df():
+    """Store metadata."""
+    return pd.read_csv(PROCESSED_DIR / 'stores.csv')
+
+
+@pytest.fixture(scope='module')
+def offsets(sales_df):
+    """Offset index of the processed sales."""
+    return build_store_offsets(sales_df)
+
+
+# Test 1: The processed data and its saved index agree
+def test_processed_data_is_clustered(sales_df, offsets):
+    """
+    Verify the sorted layout, the saved index and every store/day range.
+    """
+    assert is_store_clustered(sales_df)
+    assert load_store_offsets(PROCESSED_DIR / OFFSETS_FILENAME) == offsets
+    assert load_offsets_for(PROCESSED_DIR / 'sales_clean.csv') == offsets
+    assert load_offsets_for(PROCESSED_DIR / 'stores.csv') is None
+    assert offsets['rows'] == len(sales_df)
+
+    for store_id, (start, stop) in offsets['stores'].items():
+        assert set(sales_df['store_id'].iloc[start:stop]) == {store_id}
+        days = offsets['dates'][store_id]
+        assert sum(day_stop - day_start for day_start, day_stop in days.values()) == stop - start
+        for day, (day_start, day_stop) in days.items():
+            assert set(sales_df['date'].iloc[day_start:day_stop]) == {pd.Timestamp(day)}
+
+    with pytest.raises(ValueError):
+        build_store_offsets(sales_df.sample(frac=1, random_state=0))
+
+
+# Test 2: Store slices and totals from the index
+def test_offset_slices_match_scans(sales_df, stores_df, offsets):
+    """
+    Verify get_store_sales and calculate_revenue_by_store with and without the index.
+    """
+    for store_id, day in [('S01', None), ('S07', '2024-01-13'), ('S99', None), ('S03', '2023-12-31')]:
+        pd.testing.assert_frame_equal(get_store_sales(sales_df, store_id, offsets, day),
+                                      get_store_sales(sales_df, store_id, day=day))
+
+    by_offsets = calculate_revenue_by_store(sales_df, stores_df, offsets).reset_index(drop=True)
+    by_groupby = calculate_revenue_by_store(sales_df, stores_df).reset_index(drop=True)
+    pd.testing.assert_frame_equal(by_offsets, by_groupby, check_dtype=False)
+
+    # Stores missing from the metadata are dropped on both paths
+    partial_stores = stores_df[stores_df['store_id'] != 'S02']
+    pd.testing.assert_frame_equal(
+        calculate_revenue_by_store(sales_df, partial_stores, offsets).reset_index(drop=True),
+        calculate_revenue_by_store(sales_df, partial_stores).reset_index(drop=True), check_dtype=False)
+
+    # An index of other rows is ignored
+    first_rows = sales_df.iloc[:100]
+    assert len(get_store_sales(first_rows, 'S02', offsets)) == (first_rows['store_id'] == 'S02').sum()
+
+    # ... as is the index of a reordered frame of the same length
+    shuffled = sales_df.sample(frac=1, random_state=0).reset_index(drop=True)
+    assert not matches(offsets, shuffled)
+    assert set(get_store_sales(shuffled, 'S01', offsets)['store_id']) == {'S01'}
+    pd.testing.assert_frame_equal(calculate_revenue_by_store(shuffled, stores_df, offsets).reset_index(drop=True),
+                                  by_groupby, check_dtype=False)
+
+
+# Test 3: Store sharding without a shuffle
+def test_contiguous_shards(sales_df, stores_df, offsets):
+    """
+    Verify contiguous shards cover every row once and indexed runs give the standard results.
+    """
+    shards = contiguous_shards(offsets, 3)
+    assert len(shards) == 3
+    assert shards[0][0] == 0 and shards[-1][1] == len(sales_df)
+    assert all(stop == next_start for (_, stop), (next_start, _) in zip(shards, shards[1:]))
+    assert len(contiguous_shards(offsets, 50)) == len(offsets['stores'])
+
+    expected = calculate_all_metrics(sales_df, stores_df)
+    for results in [calculate_metrics_parallel(sales_df, stores_df, max_workers=3, offsets=offsets),
+                    calculate_all_metrics(sales_df, stores_df, offsets)]:
+        for key in ['revenue_by_store', 'revenue_by_region', 'revenue_by_category', 'daily_revenue']:
+            pd.testing.assert_frame_equal(results[key], expected[key])
+        assert results['key_metrics'] == expected['key_metrics']
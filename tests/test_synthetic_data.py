@@ -0,0 +1,112 @@
+"""
+Synthetic Data Generator Tests
+
+Pytest tests verifying that generated raw files are deterministic and load
+and clean through the existing pipeline like the real raw files.
+
+Author: Data Engineer
+Date: October 2025
+"""
+
+import sys
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from data_pipeline.loader import load_all_store_files, combine_raw_data
+from data_pipeline.cleaner import clean_raw_data, clean_sales_amount, to_whole_units
+from data_pipeline.synthetic_data import generate_synthetic_raw_data
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def synthetic_dir(tmp_path_factory):
+    """Generate 12 stores x 2 months of synthetic raw files."""
+    output_dir = tmp_path_factory.mktemp('synthetic')
+    generate_synthetic_raw_data(str(output_dir), num_stores=12, months=2, seed=7)
+    return output_dir
+
+
+@pytest.fixture(scope='module')
+def loaded_files(synthetic_dir):
+    """Load the synthetic files with the production loader."""
+    return load_all_store_files(str(synthetic_dir))
+
+
+# Test 1: Every file loads, including stores beyond S10
+def test_all_files_load(loaded_files):
+    """
+    Verify one file per store and month loads with the right store ID.
+    """
+    assert len(loaded_files) == 24
+
+    store_ids = {store_id for _, store_id, _ in loaded_files}
+    assert store_ids == {f'S{n:02d}' for n in range(1, 13)}
+
+
+# Test 2: The file quirks of the real raw data are reproduced
+def test_file_quirks_reproduced(synthetic_dir, loaded_files):
+    """
+    Verify Shift-JIS, semicolon, English-header and title-row files exist.
+    """
+    filenames = {path.name for path in synthetic_dir.iterdir()}
+
+    shift_jis_csv = synthetic_dir / '05_大阪店_売上_202401.csv'
+    assert shift_jis_csv.read_bytes().decode('shift_jis').startswith('売上日,')
+    assert '09_広島店_売上_2024_01.csv' in filenames
+    assert (synthetic_dir / '09_広島店_売上_2024_01.csv').read_text(encoding='utf-8').startswith('売上日;')
+
+    columns_by_file = {filename: list(df.columns) for df, _, filename in loaded_files}
+    assert columns_by_file['03_池袋店_sales_202401.csv'][0] == 'Date'
+    assert columns_by_file['04_横浜店_売上_202401_最終.xlsx'][0] == '売上日'
+    assert '合計' in columns_by_file['10_福岡店_売上_202401_済.xlsx']
+
+
+# Test 3: Cleaning drops invalid rows and recovers missing sales amounts
+def test_cleaning_synthetic_data(loaded_files):
+    """
+    Verify the cleaner keeps most rows across the requested window.
+    """
+    raw_df = combine_raw_data(loaded_files)
+    clean_df = clean_raw_data(raw_df, start_date='2024-01-01', end_date='2024-02-29')
+
+    retention = len(clean_df) / len(raw_df)
+    assert 0.8 < retention < 0.99
+    assert clean_df['date'].dt.month.unique().tolist() == [1, 2]
+    assert clean_df['store_id'].nunique() == 12
+
+    # Money and quantities stay in whole units (quantities may be missing)
+    assert clean_df['sales_amount'].dtype == 'int64'
+    assert clean_df['quantity'].dtype == 'Int64'
+    assert to_whole_units(pd.Series(['34024.0', '1,200', None, 'inf', 2.6, 298.5])).tolist() == [
+        34024, pd.NA, pd.NA, pd.NA, 3, 299]
+
+    # Missing amounts are rounded once, after multiplying; fractional quantities are not rounded
+    raw = pd.DataFrame({'sales_amount': [None, None, 1000], 'unit_price': [99.5, 100, 500],
+                        'quantity': [3, 2.5, 2]})
+    cleaned = clean_sales_amount(raw)
+    assert cleaned['sales_amount'].tolist() == [299, 1000]
+    assert cleaned['quantity'].tolist() == [3, 2]
+
+
+# Test 4: Output is deterministic from the seed
+def test_deterministic_output(synthetic_dir, tmp_path):
+    """
+    Verify the same seed regenerates identical data.
+    """
+    generate_synthetic_raw_data(str(tmp_path), num_stores=12, months=2, seed=7)
+
+    for path in synthetic_dir.iterdir():
+        if path.suffix == '.csv':
+            assert path.read_bytes() == (tmp_path / path.name).read_bytes()
+        else:
+            expected = pd.read_excel(path, sheet_name=None, header=None)
+            actual = pd.read_excel(tmp_path / path.name, sheet_name=None, header=None)
+            for sheet in expected:
+                pd.testing.assert_frame_equal(actual[sheet], expected[sheet])
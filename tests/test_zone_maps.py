@@ -0,0 +1,136 @@
+"""
+Zone Map Tests
+
+Pytest tests verifying that the sales CSV is written unchanged with correct
+per-row-group statistics, that read_sales skips row groups which cannot
+match a filter while returning exactly the matching rows, and that the
+query plan log records the skipped groups.
+
+Author: Data Analyst
+Date: October 2025
+"""
+
+import sys
+import pytest
+import pandas as pd
+from pathlib import Path
+
+
+# Define paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from analysis.metrics import calculate_all_metrics, calculate_filtered_metrics
+from data_pipeline.zone_maps import (
+    format_query_plan, load_zone_map, query_plans, read_sales, reset_query_plans,
+    write_sales_with_zone_maps
+)
+
+
+# Fixtures
+@pytest.fixture(scope='module')
+def sales_df():
+    """The processed sales transactions."""
+    return pd.read_csv(PROCESSED_DIR / 'sales_clean.csv', parse_dates=['date'])
+
+
+@pytest.fixture
+def sales_path(sales_df, tmp_path):
+    """The sales written with small row groups (several per store)."""
+    path = tmp_path / 'sales_clean.csv'
+    write_sales_with_zone_maps(sales_df, path, row_group_rows=40)
+    reset_query_plans()
+    return path
+
+
+def select(sales_df, start=None, end=None, stores=None, categories=None):
+    """Filter the sales in memory (the expected result of read_sales)."""
+    mask = pd.Series(True, index=sales_df.index)
+    if start:
+        mask &= sales_df['date'] >= start
+    if end:
+        mask &= sales_df['date'] <= end
+    if stores:
+        mask &= sales_df['store_id'].isin(stores)
+    if categories:
+        mask &= sales_df['product_category'].isin(categories)
+    return sales_df[mask].reset_index(drop=True)
+
+
+# Test 1: File content and row group statistics
+def test_zone_map_statistics(sales_df, sales_path):
+    """
+    Verify the CSV is unchanged and every row group's statistics describe its rows.
+    """
+    assert sales_path.read_bytes() == sales_df.to_csv(index=False).encode('utf-8')
+
+    zones = load_zone_map(sales_path)
+    assert sum(zone['rows'] for zone in zones['row_groups']) == len(sales_df)
+    for zone in zones['row_groups']:
+        group = sales_df.iloc[zone['first_row']:zone['first_row'] + zone['rows']]
+        assert zone['rows'] <= 40
+        assert zone['store_ids'] == [group['store_id'].iloc[0]]
+        assert zone['categories'] == sorted(group['product_category'].unique())
+        assert (zone['date_min'], zone['date_max']) == (
+            group['date'].min().strftime('%Y-%m-%d'), group['date'].max().strftime('%Y-%m-%d'))
+
+    # The processed dataset has a current zone map
+    assert load_zone_map(PROCESSED_DIR / 'sales_clean.csv')['rows'] == len(sales_df)
+
+
+# Test 2: Filtered reads skip row groups and return the matching rows
+@pytest.mark.parametrize('filters', [
+    {},
+    {'start': '2024-01-25'},
+    {'start': '2024-01-08', 'end': '2024-01-14', 'stores': ['S01', 'S02', 'S03', 'S04']},
+    {'stores': ['S07'], 'categories': ['Kids']},
+    {'stores': ['S99']},
+])
+def test_read_sales_skips_row_groups(sales_df, sales_path, filters):
+    """
+    Verify read_sales equals an in-memory filter and records the groups skipped.
+    """
+    result = read_sales(sales_path, **filters)
+    pd.testing.assert_frame_equal(result, select(sales_df, **filters), check_dtype=False)
+
+    plan = query_plans()[-1]
+    assert plan['read'] + plan['skipped'] == plan['row_groups']
+    assert plan['rows_out'] == len(result)
+    if filters:
+        assert plan['skipped'] > 0
+        assert plan['rows_read'] < len(sales_df)
+
+
+# Test 3: Stale zone maps and the metrics entry point
+def test_filtered_metrics_and_stale_zone_map(sales_df, sales_path):
+    """
+    Verify region filters, the query plan report and the fallback for a stale zone map.
+    """
+    stores_df = pd.read_csv(PROCESSED_DIR / 'stores.csv')
+    kanto = stores_df.loc[stores_df['region'] == 'Kanto', 'store_id'].tolist()
+
+    results = calculate_filtered_metrics(sales_path, stores_df, '2024-01-01', '2024-01-31', regions=['Kanto'])
+    expected = calculate_all_metrics(select(sales_df, stores=kanto), stores_df)
+    pd.testing.assert_frame_equal(results['revenue_by_store'], expected['revenue_by_store'])
+    assert 'calculate_filtered_metrics' in format_query_plan()
+
+    with pytest.raises(ValueError):
+        calculate_filtered_metrics(sales_path, stores_df, stores=['S01'], regions=['Kansai'])
+
+    # A same-size rewrite (one digit changed) makes the zone map stale
+    content = sales_path.read_bytes()
+    position = content.rindex(b'S01')
+    sales_path.write_bytes(content[:position] + b'S09' + content[position + 3:])
+    assert sales_path.stat().st_size == len(content)
+    assert load_zone_map(sales_path) is None
+    sales_path.write_bytes(content)
+    assert load_zone_map(sales_path) is not None
+
+    # Appending rows makes the zone map stale: the whole file is read
+    with open(sales_path, 'a', encoding='utf-8') as f:
+        f.write(sales_df.iloc[:1].to_csv(index=False, header=False))
+    assert load_zone_map(sales_path) is None
+    assert len(read_sales(sales_path, stores=['S01'])) == (sales_df['store_id'] == 'S01').sum() + 1
+    assert query_plans()[-1]['skipped'] is None